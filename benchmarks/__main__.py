@@ -0,0 +1,131 @@
+"""Run the hueify benchmark suite and print (or save) the results as JSON.
+
+    python -m benchmarks                      # full run, JSON to stdout
+    python -m benchmarks --quick -o new.json  # smaller sizes, save to file
+    python -m benchmarks --only connect,http
+    python -m benchmarks compare old.json new.json --threshold 0.2
+
+Every benchmark runs against in-process stand-ins (see
+``hueify.testing.FakeHueBridge``), so no bridge is needed.
+"""
+
+import argparse
+import json
+import platform
+import sys
+from datetime import UTC, datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from benchmarks import (
+    bench_connect,
+    bench_daemon,
+    bench_entertainment,
+    bench_events,
+    bench_http,
+    bench_import,
+    bench_lookup,
+)
+from benchmarks._harness import Benchmark, run_benchmark
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "connect": bench_connect.run,
+    "lookup": bench_lookup.run,
+    "http": bench_http.run,
+    "events": bench_events.run,
+    "import": bench_import.run,
+    "entertainment": bench_entertainment.run,
+    "daemon": bench_daemon.run,
+}
+
+
+def _hueify_version() -> str:
+    try:
+        return metadata.version("hueify")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def run(selected: list[str], quick: bool) -> dict[str, Any]:
+    results = []
+    for name in selected:
+        print(f"running {name}...", file=sys.stderr)
+        results += [
+            result.to_dict() for result in run_benchmark(BENCHMARKS[name], quick)
+        ]
+
+    return {
+        "hueify_version": _hueify_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def _result_key(result: dict[str, Any]) -> str:
+    params = ",".join(
+        f"{key}={value}" for key, value in sorted(result["params"].items())
+    )
+    return f"{result['name']}[{params}]" if params else result["name"]
+
+
+def compare(baseline_path: Path, candidate_path: Path, threshold: float) -> int:
+    """Print median ratios candidate/baseline; return 1 if any exceeds ``1 + threshold``."""
+    baseline = {
+        _result_key(result): result
+        for result in json.loads(baseline_path.read_text())["results"]
+    }
+    candidate = json.loads(candidate_path.read_text())["results"]
+
+    regressions = 0
+    for result in candidate:
+        key = _result_key(result)
+        if key not in baseline:
+            print(f"{key:<60} new")
+            continue
+        ratio = result["median"] / baseline[key]["median"]
+        marker = "REGRESSION" if ratio > 1 + threshold else ""
+        regressions += bool(marker)
+        print(f"{key:<60} {ratio:6.2f}x {marker}")
+
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    subparsers = parser.add_subparsers(dest="command")
+
+    compare_parser = subparsers.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("candidate", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    parser.add_argument(
+        "--quick", action="store_true", help="smaller sizes and repeats"
+    )
+    parser.add_argument(
+        "--only", help=f"comma-separated subset of {', '.join(BENCHMARKS)}"
+    )
+    parser.add_argument("-o", "--output", type=Path, help="write JSON here")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        sys.exit(compare(args.baseline, args.candidate, args.threshold))
+
+    selected = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = set(selected) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    report = json.dumps(run(selected, args.quick), indent=2)
+    if args.output:
+        args.output.write_text(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+
+@dataclass
+class BenchmarkResult:
+    """One measured quantity. Timings are in seconds unless ``unit`` says otherwise."""
+
+    name: str
+    unit: str
+    samples: list[float]
+    params: dict[str, Any] = field(default_factory=dict)
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    def to_dict(self) -> dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            **asdict(self),
+            "min": ordered[0],
+            "median": self.median,
+            "mean": statistics.fmean(ordered),
+            "p95": ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))],
+            "max": ordered[-1],
+        }
+
+
+type Benchmark = Callable[[bool], Awaitable[list[BenchmarkResult]]]
+
+
+def measure(fn: Callable[[], object], *, repeat: int, number: int = 1) -> list[float]:
+    """Run ``fn`` ``number`` times per sample and return per-call seconds."""
+    samples = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - started_at) / number)
+    return samples
+
+
+async def measure_async(
+    fn: Callable[[], Awaitable[object]], *, repeat: int, number: int = 1
+) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for _ in range(number):
+            await fn()
+        samples.append((time.perf_counter() - started_at) / number)
+    return samples
+
+
+def run_benchmark(benchmark: Benchmark, quick: bool) -> list[BenchmarkResult]:
+    return asyncio.run(benchmark(quick))
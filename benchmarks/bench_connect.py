@@ -0,0 +1,33 @@
+from benchmarks._harness import BenchmarkResult, measure_async
+from hueify import Hueify
+from hueify.testing import FakeHueBridge
+
+
+async def run(quick: bool) -> list[BenchmarkResult]:
+    """``Hueify.connect()`` wall time against a fake bridge of growing size."""
+    sizes = [10, 100] if quick else [10, 100, 500]
+    results = []
+
+    for lights in sizes:
+        async with FakeHueBridge.with_synthetic_home(
+            lights=lights, rooms=max(1, lights // 10), scenes_per_room=4
+        ) as bridge:
+
+            async def connect(bridge: FakeHueBridge = bridge) -> None:
+                hue = Hueify(
+                    bridge_ip=bridge.host, app_key=bridge.app_key, bridge_url=bridge.url
+                )
+                await hue.connect()
+                await hue.close()
+
+            samples = await measure_async(connect, repeat=3 if quick else 10)
+            results.append(
+                BenchmarkResult(
+                    "connect",
+                    "s",
+                    samples,
+                    params={"lights": lights, "resources": len(bridge.resources())},
+                )
+            )
+
+    return results
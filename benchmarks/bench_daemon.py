@@ -0,0 +1,75 @@
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks._harness import BenchmarkResult, measure_async
+from hueify import Hueify
+from hueify.cli.client import SOCKET_ENV_VAR, run_via_daemon
+from hueify.cli.server import _serve_daemon
+from hueify.testing import FakeHueBridge
+
+_CLI = "from hueify.cli.client import main; main()"
+
+
+async def _run_cli(socket_path: Path) -> None:
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        _CLI,
+        "lights",
+        "list",
+        stdout=asyncio.subprocess.DEVNULL,
+        env={**os.environ, SOCKET_ENV_VAR: str(socket_path)},
+    )
+    if await process.wait() != 0:
+        raise RuntimeError("hueify lights list failed")
+
+
+async def run(quick: bool) -> list[BenchmarkResult]:
+    """``hueify lights list`` served by ``hueify daemon``.
+
+    ``daemon.round_trip`` is the socket request alone; ``daemon.cli_end_to_end``
+    also includes starting the ``hueify`` process.
+    """
+    number = 20 if quick else 200
+    repeat = 3 if quick else 10
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = Path(tmp) / "hueify.sock"
+        async with (
+            FakeHueBridge.with_synthetic_home(lights=50) as bridge,
+            Hueify(bridge.host, bridge.app_key, bridge_url=bridge.url) as hueify,
+        ):
+            ready = asyncio.Event()
+            server = asyncio.create_task(_serve_daemon(hueify, socket_path, ready))
+            await ready.wait()
+
+            async def round_trip() -> None:
+                await asyncio.to_thread(run_via_daemon, ["lights", "list"], socket_path)
+
+            with open(os.devnull, "w") as devnull:
+                stdout, sys.stdout = sys.stdout, devnull
+                try:
+                    await round_trip()
+                    round_trip_samples = await measure_async(
+                        round_trip, repeat=5, number=number
+                    )
+                finally:
+                    sys.stdout = stdout
+
+            cli_samples = []
+            for _ in range(repeat):
+                started_at = time.perf_counter()
+                await _run_cli(socket_path)
+                cli_samples.append(time.perf_counter() - started_at)
+
+            server.cancel()
+            await asyncio.gather(server, return_exceptions=True)
+
+    return [
+        BenchmarkResult("daemon.round_trip", "s", round_trip_samples),
+        BenchmarkResult("daemon.cli_end_to_end", "s", cli_samples),
+    ]
@@ -0,0 +1,49 @@
+import socket
+from uuid import uuid4
+
+from benchmarks._harness import BenchmarkResult, measure
+from hueify.entertainment import HueStreamEncoder, UdpDatagramTransport
+
+
+async def run(quick: bool) -> list[BenchmarkResult]:
+    """HueStream encode + send cost against a loopback UDP receiver."""
+    frames = 1_000 if quick else 10_000
+    channels = 20
+
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+    transport = UdpDatagramTransport(*receiver.getsockname())
+    encoder = HueStreamEncoder(uuid4(), channel_ids=list(range(channels)))
+    frame_number = 0
+
+    def encode() -> None:
+        nonlocal frame_number
+        level = (frame_number % 256) / 255
+        for index in range(channels):
+            encoder.set_channel(index, level, 1.0 - level, 0.5)
+        encoder.frame()
+        frame_number += 1
+
+    def encode_and_send() -> None:
+        encode()
+        transport.send(encoder.frame())
+
+    try:
+        encode_samples = measure(encode, repeat=5, number=frames // 5)
+        send_samples = measure(encode_and_send, repeat=5, number=frames // 5)
+    finally:
+        transport.close()
+        receiver.close()
+
+    params = {"channels": channels, "frame_bytes": encoder.frame_size}
+    return [
+        BenchmarkResult("entertainment.encode_frame", "s", encode_samples, params),
+        BenchmarkResult(
+            "entertainment.encode_and_send_frame",
+            "s",
+            send_samples,
+            params,
+            extra={"frames_per_second": round(1 / min(send_samples), 1)},
+        ),
+    ]
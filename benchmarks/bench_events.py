@@ -0,0 +1,93 @@
+import json
+import time
+from uuid import uuid4
+
+from httpx_sse import ServerSentEvent
+
+from benchmarks._harness import BenchmarkResult, measure
+from hueify.credentials import HueBridgeCredentials
+from hueify.light import LightCache
+from hueify.light.views import LightInfo
+from hueify.sse import EventBus, ServerSentEventStream
+from hueify.testing import generate_home
+
+
+def _light_event_payload(light: dict, brightness: float) -> dict:
+    return {
+        "id": light["id"],
+        "type": "light",
+        "owner": light["owner"],
+        "dimming": {"brightness": brightness},
+    }
+
+
+async def run(quick: bool) -> list[BenchmarkResult]:
+    """SSE parsing and dispatch into the caches, plus raw cache update cost."""
+    lights = [
+        resource
+        for resource in generate_home(lights=50, rooms=5)
+        if resource["type"] == "light"
+    ]
+    event_count = 2_000 if quick else 20_000
+    events_per_message = 5
+
+    bus = EventBus()
+    cache = LightCache(bus)
+    cache.store_all([LightInfo.model_validate(light) for light in lights])
+    stream = ServerSentEventStream(
+        credentials=HueBridgeCredentials(
+            hue_bridge_ip="127.0.0.1", hue_app_key="benchmark-application-key"
+        ),
+        event_bus=bus,
+    )
+
+    messages = [
+        ServerSentEvent(
+            event="message",
+            id=str(index),
+            data=json.dumps(
+                [
+                    {
+                        "creationtime": "2024-01-01T00:00:00Z",
+                        "id": str(uuid4()),
+                        "type": "update",
+                        "data": [
+                            _light_event_payload(
+                                lights[(index + offset) % len(lights)],
+                                float((index + offset) % 100),
+                            )
+                            for offset in range(events_per_message)
+                        ],
+                    }
+                ]
+            ),
+        )
+        for index in range(event_count // events_per_message)
+    ]
+
+    samples = []
+    for _ in range(3):
+        started_at = time.perf_counter()
+        for message in messages:
+            await stream._handle_sse(message)
+        samples.append(time.perf_counter() - started_at)
+
+    first = lights[0]
+    first_id = LightInfo.model_validate(first).id
+    update = {"dimming": {"brightness": 12.0}, "owner": first["owner"]}
+    update_samples = measure(
+        lambda: cache.update_from_event(first_id, update),
+        repeat=5,
+        number=event_count // 10,
+    )
+
+    return [
+        BenchmarkResult(
+            "events.sse_to_cache",
+            "s",
+            samples,
+            params={"events": event_count, "events_per_message": events_per_message},
+            extra={"events_per_second": round(event_count / min(samples))},
+        ),
+        BenchmarkResult("events.update_from_event", "s", update_samples),
+    ]
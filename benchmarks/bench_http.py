@@ -0,0 +1,49 @@
+import httpx
+
+from benchmarks._harness import BenchmarkResult, measure_async
+from hueify.credentials import HueBridgeCredentials
+from hueify.http import HttpClient
+from hueify.shared.resource.views import ControllableLightUpdate, LightOnState
+from hueify.testing import FakeHueBridge
+
+
+async def run(quick: bool) -> list[BenchmarkResult]:
+    """PUT round trip through ``HttpClient`` versus a bare ``httpx`` client.
+
+    The difference between both medians is the overhead added by
+    ``HttpClient`` (serialisation, URL building, response handling).
+    """
+    number = 50 if quick else 500
+
+    async with FakeHueBridge.with_synthetic_home(lights=10) as bridge:
+        light_id = bridge.resources("light")[0]["id"]
+        update = ControllableLightUpdate(on=LightOnState(on=True))
+        credentials = HueBridgeCredentials(
+            hue_bridge_ip=bridge.host, hue_app_key=bridge.app_key
+        )
+
+        async with (
+            HttpClient(credentials, bridge_url=bridge.url) as client,
+            httpx.AsyncClient(http2=True) as raw_client,
+        ):
+            url = f"{bridge.url}/clip/v2/resource/light/{light_id}"
+            headers = {"hue-application-key": bridge.app_key}
+
+            async def hueify_put() -> None:
+                await client.put(f"light/{light_id}", data=update)
+
+            async def raw_put() -> None:
+                response = await raw_client.put(
+                    url, headers=headers, json={"on": {"on": True}}
+                )
+                response.raise_for_status()
+
+            await hueify_put()
+            await raw_put()
+            client_samples = await measure_async(hueify_put, repeat=5, number=number)
+            raw_samples = await measure_async(raw_put, repeat=5, number=number)
+
+    client_result = BenchmarkResult("http.put_round_trip", "s", client_samples)
+    raw_result = BenchmarkResult("http.put_round_trip_raw_httpx", "s", raw_samples)
+    client_result.extra["overhead_seconds"] = client_result.median - raw_result.median
+    return [client_result, raw_result]
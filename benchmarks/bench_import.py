@@ -0,0 +1,62 @@
+import re
+import subprocess
+import sys
+
+from benchmarks._harness import BenchmarkResult
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)")
+
+
+def _cumulative_import_seconds(module: str) -> float:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match and match.group(3) == module:
+            return int(match.group(2)) / 1e6
+    raise RuntimeError(f"No importtime entry for {module}")
+
+
+def _statement_seconds(statement: str) -> float:
+    # Lazily loaded modules are imported through importlib, which
+    # ``-X importtime`` does not report, so time the statement itself.
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import time\n"
+            "started_at = time.perf_counter()\n"
+            f"{statement}\n"
+            "print(time.perf_counter() - started_at)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(completed.stdout)
+
+
+async def run(quick: bool) -> list[BenchmarkResult]:
+    """Import cost in a fresh interpreter.
+
+    ``import.hueify`` is the cumulative ``-X importtime`` of the package
+    itself, which only sets up lazy attributes. ``import.hueify_client``
+    covers ``from hueify import Hueify``, which loads the client.
+    """
+    repeat = 3 if quick else 10
+    return [
+        BenchmarkResult(
+            "import.hueify",
+            "s",
+            [_cumulative_import_seconds("hueify") for _ in range(repeat)],
+        ),
+        BenchmarkResult(
+            "import.hueify_client",
+            "s",
+            [_statement_seconds("from hueify import Hueify") for _ in range(repeat)],
+        ),
+    ]
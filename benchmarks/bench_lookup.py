@@ -0,0 +1,47 @@
+import contextlib
+
+from benchmarks._harness import BenchmarkResult, measure
+from hueify import Hueify
+from hueify.exceptions import ResourceNotFoundException
+from hueify.testing import FakeHueBridge
+
+
+async def run(quick: bool) -> list[BenchmarkResult]:
+    """Cost of resolving names to resource handles on a populated client."""
+    lights = 100 if quick else 500
+    number = 200 if quick else 2_000
+    results = []
+
+    async with (
+        FakeHueBridge.with_synthetic_home(lights=lights, rooms=lights // 10) as bridge,
+        Hueify(
+            bridge_ip=bridge.host, app_key=bridge.app_key, bridge_url=bridge.url
+        ) as hue,
+    ):
+        room_name = hue.rooms.names[-1]
+
+        def miss() -> None:
+            with contextlib.suppress(ResourceNotFoundException):
+                hue.lights.from_name("Lihgt 9999")
+
+        cases = {
+            "lookup.light_from_name": lambda: hue.lights.from_name(f"Light {lights}"),
+            "lookup.light_from_name_case_insensitive": lambda: hue.lights.from_name(
+                f"LIGHT {lights}"
+            ),
+            "lookup.light_from_name_miss": miss,
+            "lookup.room_from_name": lambda: hue.rooms.from_name(room_name),
+        }
+        for name, fn in cases.items():
+            results.append(
+                BenchmarkResult(
+                    name,
+                    "s",
+                    measure(
+                        fn, repeat=5, number=number // 10 if "miss" in name else number
+                    ),
+                    params={"lights": lights},
+                )
+            )
+
+    return results
@@ -1,15 +1,43 @@
-from .exceptions import ResourceNotFoundException
-from .grouped_lights import GroupedLights
-from .hueify import Hueify
-from .light import Light
-from .shared.resource import ActionResult
-from .shared.resource.colors import Color
+from typing import TYPE_CHECKING
+
+from hueify._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .exceptions import (
+        BridgeNotFoundException,
+        BridgeUnavailableException,
+        ResourceNotFoundException,
+    )
+    from .grouped_lights import GroupedLights
+    from .hueify import Hueify
+    from .light import Light
+    from .multi import MultiHueify
+    from .shared.resource import ActionResult
+    from .shared.resource.colors import Color
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ActionResult": ".shared.resource",
+        "BridgeNotFoundException": ".exceptions",
+        "BridgeUnavailableException": ".exceptions",
+        "Color": ".shared.resource.colors",
+        "GroupedLights": ".grouped_lights",
+        "Hueify": ".hueify",
+        "Light": ".light",
+        "MultiHueify": ".multi",
+        "ResourceNotFoundException": ".exceptions",
+    },
+)
 
 __all__ = [
     "ActionResult",
+    "BridgeNotFoundException",
+    "BridgeUnavailableException",
     "Color",
     "GroupedLights",
     "Hueify",
     "Light",
+    "MultiHueify",
     "ResourceNotFoundException",
 ]
@@ -0,0 +1,30 @@
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build a package's ``__getattr__`` and ``__dir__`` that import on demand.
+
+    ``exports`` maps each public name to the submodule defining it, relative
+    to ``package``. The submodule is imported on first attribute access and
+    the value is cached on the package, so later lookups are plain attribute
+    reads. This keeps ``import hueify`` from pulling in httpx, pydantic models
+    and the rest of the client until something actually uses them.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *exports})
+
+    return __getattr__, __dir__
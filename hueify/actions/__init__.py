@@ -0,0 +1,29 @@
+from .executor import ActionExecutor
+from .views import (
+    Action,
+    ActionOutcome,
+    ActionTarget,
+    ActivateSceneAction,
+    DecreaseBrightnessAction,
+    IncreaseBrightnessAction,
+    SetBrightnessAction,
+    SetColorAction,
+    SetColorTemperatureAction,
+    TurnOffAction,
+    TurnOnAction,
+)
+
+__all__ = [
+    "Action",
+    "ActionExecutor",
+    "ActionOutcome",
+    "ActionTarget",
+    "ActivateSceneAction",
+    "DecreaseBrightnessAction",
+    "IncreaseBrightnessAction",
+    "SetBrightnessAction",
+    "SetColorAction",
+    "SetColorTemperatureAction",
+    "TurnOffAction",
+    "TurnOnAction",
+]
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Sequence
+from uuid import UUID
+
+import httpx
+
+from hueify.actions.views import Action, ActionOutcome, ActionTarget
+from hueify.exceptions import HueifyException
+from hueify.hueify import Hueify
+from hueify.multi import MultiHueify
+from hueify.shared.resource import Resource
+
+logger = logging.getLogger(__name__)
+
+
+class ActionExecutor:
+    """Runs a list of actions over one connected session.
+
+    Names are resolved against the in-memory caches before anything is sent.
+    Actions on different lights run concurrently, at most ``max_concurrency``
+    at a time, while actions that could interfere keep their list order:
+
+    - Actions on the same light run one after another.
+    - A room or zone action may touch any light, so it waits for all actions
+      listed before it, and all actions listed after it wait for it.
+
+    Pacing below the bridge limits is left to the session's
+    :class:`~hueify.http.RateLimiter`. A failing action is reported in its
+    :class:`ActionOutcome` and does not stop the others.
+    """
+
+    def __init__(self, hue: Hueify | MultiHueify, max_concurrency: int = 5) -> None:
+        """
+        Args:
+            hue: Connected session whose namespaces resolve the names.
+            max_concurrency: Upper bound on requests in flight at once.
+
+        Raises:
+            ValueError: When ``max_concurrency`` is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._hue = hue
+        self._max_concurrency = max_concurrency
+
+    async def run(self, actions: Sequence[Action]) -> list[ActionOutcome]:
+        """Execute all actions and return their outcomes in list order."""
+        outcomes = [outcome async for outcome in self.stream(actions)]
+        return sorted(outcomes, key=lambda outcome: outcome.index)
+
+    async def stream(self, actions: Sequence[Action]) -> AsyncIterator[ActionOutcome]:
+        """Execute all actions, yielding each outcome as soon as it is known."""
+        resolved: list[tuple[int, Action, Resource]] = []
+        for index, action in enumerate(actions):
+            try:
+                resolved.append((index, action, self._resolve(action)))
+            except HueifyException as e:
+                yield ActionOutcome(index=index, action=action, error=str(e))
+
+        if not resolved:
+            return
+
+        outcomes: asyncio.Queue[ActionOutcome] = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        finished = {index: asyncio.Event() for index, _, _ in resolved}
+
+        async def run_after(
+            dependencies: list[int], index: int, action: Action, resource: Resource
+        ) -> None:
+            try:
+                for dependency in dependencies:
+                    await finished[dependency].wait()
+                async with semaphore:
+                    outcome = await self._apply(index, action, resource)
+                outcomes.put_nowait(outcome)
+            finally:
+                finished[index].set()
+
+        tasks = [
+            asyncio.create_task(run_after(dependencies, index, action, resource))
+            for (index, action, resource), dependencies in zip(
+                resolved, _dependencies(resolved), strict=True
+            )
+        ]
+        try:
+            for _ in tasks:
+                yield await outcomes.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _resolve(self, action: Action) -> Resource:
+        match action.target:
+            case ActionTarget.LIGHT:
+                return self._hue.lights.from_name(action.name)
+            case ActionTarget.ROOM:
+                return self._hue.rooms.from_name(action.name)
+            case ActionTarget.ZONE:
+                return self._hue.zones.from_name(action.name)
+
+    async def _apply(
+        self, index: int, action: Action, resource: Resource
+    ) -> ActionOutcome:
+        try:
+            result = await action.apply(resource)
+        except (HueifyException, httpx.HTTPError) as e:
+            logger.warning(f"Action {index} ({action.action}) failed: {e}")
+            return ActionOutcome(index=index, action=action, error=str(e) or repr(e))
+        except Exception as e:
+            logger.error(f"Action {index} ({action.action}) failed: {e}", exc_info=True)
+            return ActionOutcome(index=index, action=action, error=str(e) or repr(e))
+        return ActionOutcome(index=index, action=action, result=result)
+
+
+def _dependencies(resolved: list[tuple[int, Action, Resource]]) -> list[list[int]]:
+    """For each action, the earlier actions it has to wait for."""
+    dependencies = []
+    last_for_resource: dict[UUID, int] = {}
+    last_group: int | None = None
+    lights_since_group: list[int] = []
+
+    for index, action, resource in resolved:
+        if action.target is ActionTarget.LIGHT:
+            waits_for = {last_for_resource.get(resource.id), last_group}
+            lights_since_group.append(index)
+        else:
+            waits_for = {*lights_since_group, last_group}
+            last_group = index
+            lights_since_group = []
+        last_for_resource[resource.id] = index
+        dependencies.append(sorted(i for i in waits_for if i is not None))
+    return dependencies
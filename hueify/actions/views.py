@@ -0,0 +1,134 @@
+from abc import ABC, abstractmethod
+from enum import StrEnum
+from typing import Annotated, Literal, cast
+
+from pydantic import BaseModel, Field
+
+from hueify.grouped_lights import GroupedLights
+from hueify.shared.resource import ActionResult, Color, Resource
+
+
+class ActionTarget(StrEnum):
+    LIGHT = "light"
+    ROOM = "room"
+    ZONE = "zone"
+
+
+class _TargetedAction(BaseModel, ABC):
+    target: ActionTarget
+    name: str = Field(description="Name of the light, room or zone")
+    transition_ms: int | None = Field(
+        default=None, ge=0, description="Bridge-side fade duration"
+    )
+
+    @abstractmethod
+    async def apply(self, resource: Resource) -> ActionResult: ...
+
+
+class TurnOnAction(_TargetedAction):
+    action: Literal["turn_on"] = "turn_on"
+
+    async def apply(self, resource: Resource) -> ActionResult:
+        return await resource.turn_on(transition_ms=self.transition_ms)
+
+
+class TurnOffAction(_TargetedAction):
+    action: Literal["turn_off"] = "turn_off"
+
+    async def apply(self, resource: Resource) -> ActionResult:
+        return await resource.turn_off(transition_ms=self.transition_ms)
+
+
+class SetBrightnessAction(_TargetedAction):
+    action: Literal["set_brightness"] = "set_brightness"
+    percentage: float
+
+    async def apply(self, resource: Resource) -> ActionResult:
+        return await resource.set_brightness(
+            self.percentage, transition_ms=self.transition_ms
+        )
+
+
+class IncreaseBrightnessAction(_TargetedAction):
+    action: Literal["increase_brightness"] = "increase_brightness"
+    percentage: float
+
+    async def apply(self, resource: Resource) -> ActionResult:
+        return await resource.increase_brightness(
+            self.percentage, transition_ms=self.transition_ms
+        )
+
+
+class DecreaseBrightnessAction(_TargetedAction):
+    action: Literal["decrease_brightness"] = "decrease_brightness"
+    percentage: float
+
+    async def apply(self, resource: Resource) -> ActionResult:
+        return await resource.decrease_brightness(
+            self.percentage, transition_ms=self.transition_ms
+        )
+
+
+class SetColorTemperatureAction(_TargetedAction):
+    action: Literal["set_color_temperature"] = "set_color_temperature"
+    percentage: float = Field(description="0 = warmest white, 100 = coolest")
+
+    async def apply(self, resource: Resource) -> ActionResult:
+        return await resource.set_color_temperature(
+            self.percentage, transition_ms=self.transition_ms
+        )
+
+
+class SetColorAction(_TargetedAction):
+    action: Literal["set_color"] = "set_color"
+    color: Color
+
+    async def apply(self, resource: Resource) -> ActionResult:
+        return await resource.set_named_color(
+            self.color, transition_ms=self.transition_ms
+        )
+
+
+class ActivateSceneAction(_TargetedAction):
+    action: Literal["activate_scene"] = "activate_scene"
+    target: Literal[ActionTarget.ROOM, ActionTarget.ZONE]
+    scene: str
+
+    async def apply(self, resource: Resource) -> ActionResult:
+        return await cast(GroupedLights, resource).activate_scene(
+            self.scene, transition_ms=self.transition_ms
+        )
+
+
+type Action = Annotated[
+    TurnOnAction
+    | TurnOffAction
+    | SetBrightnessAction
+    | IncreaseBrightnessAction
+    | DecreaseBrightnessAction
+    | SetColorTemperatureAction
+    | SetColorAction
+    | ActivateSceneAction,
+    Field(discriminator="action"),
+]
+
+
+class ActionOutcome(BaseModel):
+    """Result of one action in a batch.
+
+    Attributes:
+        index: Position of the action in the submitted list.
+        action: The action as submitted.
+        result: What the resource reported, absent when the action failed.
+        error: Why the action failed, e.g. an unknown light or scene name
+            or an error status from the bridge.
+    """
+
+    index: int
+    action: Action
+    result: ActionResult | None = None
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None and self.result is not None and self.result.success
@@ -0,0 +1,17 @@
+from .easing import Easing, ease
+from .namespace import AnimationNamespace
+from .scheduler import AnimationScheduler
+from .track import Frame, Track
+from .views import AnimationStats, Keyframe, TrackStats
+
+__all__ = [
+    "AnimationNamespace",
+    "AnimationScheduler",
+    "AnimationStats",
+    "Easing",
+    "Frame",
+    "Keyframe",
+    "Track",
+    "TrackStats",
+    "ease",
+]
@@ -0,0 +1,28 @@
+import math
+from enum import StrEnum
+
+
+class Easing(StrEnum):
+    LINEAR = "linear"
+    EASE_IN = "ease_in"
+    EASE_OUT = "ease_out"
+    EASE_IN_OUT = "ease_in_out"
+    SINE = "sine"
+    STEP = "step"
+
+
+def ease(easing: Easing, progress: float) -> float:
+    t = max(0.0, min(1.0, progress))
+    match easing:
+        case Easing.LINEAR:
+            return t
+        case Easing.EASE_IN:
+            return t * t
+        case Easing.EASE_OUT:
+            return 1 - (1 - t) * (1 - t)
+        case Easing.EASE_IN_OUT:
+            return 2 * t * t if t < 0.5 else 1 - ((-2 * t + 2) ** 2) / 2
+        case Easing.SINE:
+            return (1 - math.cos(math.pi * t)) / 2
+        case Easing.STEP:
+            return 1.0 if t >= 1.0 else 0.0
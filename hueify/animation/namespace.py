@@ -0,0 +1,124 @@
+import logging
+from collections.abc import Sequence
+from uuid import UUID
+
+from hueify.animation.easing import Easing
+from hueify.animation.scheduler import AnimationScheduler
+from hueify.animation.track import Track
+from hueify.animation.views import Keyframe
+from hueify.grouped_lights import RoomNamespace, ZoneNamespace
+from hueify.grouped_lights.service import GroupedLights
+from hueify.grouped_lights.views import GroupInfo
+from hueify.light import LightCache, LightNamespace
+
+logger = logging.getLogger(__name__)
+
+
+class AnimationNamespace:
+    """Entry point for building keyframe animations.
+
+    Accessible as :attr:`Hueify.animations <hueify.Hueify.animations>`.
+    Tracks built here collapse onto the room's or zone's grouped light when
+    the requested lights are exactly the members of that group, so a room
+    moving in unison costs one write per frame instead of one per bulb.
+
+    ```python
+    async with Hueify() as hue:
+        track = hue.animations.track(
+            ["Desk", "Floor Lamp"],
+            [Keyframe(at=0, color=(255, 0, 0)), Keyframe(at=5, color=(0, 0, 255))],
+            loop=True,
+        )
+        scheduler = hue.animations.scheduler()
+        scheduler.add(track)
+        await scheduler.run(duration=60)
+    ```
+    """
+
+    def __init__(
+        self,
+        light_cache: LightCache,
+        lights: LightNamespace,
+        rooms: RoomNamespace,
+        zones: ZoneNamespace,
+    ) -> None:
+        self._light_cache = light_cache
+        self._lights = lights
+        self._rooms = rooms
+        self._zones = zones
+
+    def track(
+        self,
+        light_names: Sequence[str],
+        keyframes: Sequence[Keyframe],
+        *,
+        easing: Easing = Easing.LINEAR,
+        loop: bool = False,
+        fps: float = 10.0,
+        name: str | None = None,
+    ) -> Track:
+        """Build a :class:`~hueify.animation.Track` for the named lights.
+
+        Args:
+            light_names: Lights that should follow the keyframes in unison.
+            keyframes: Keyframes of the track.
+            easing: Curve applied between keyframes.
+            loop: Restart after the last keyframe.
+            fps: Upper bound for the frame rate of this track.
+            name: Optional label for statistics.
+
+        Raises:
+            :class:`~hueify.exceptions.ResourceNotFoundException`: When a
+                light name is unknown.
+        """
+        lights = [self._lights.from_name(light_name) for light_name in light_names]
+        group = self._find_unison_group({light.id for light in lights})
+
+        if group is not None:
+            logger.debug(f"Animating '{group.name}' via its grouped light")
+            targets = [group]
+        else:
+            targets = lights
+
+        return Track(
+            targets=targets,
+            keyframes=keyframes,
+            easing=easing,
+            loop=loop,
+            fps=fps,
+            name=name,
+        )
+
+    def scheduler(
+        self,
+        light_commands_per_second: float = 10.0,
+        group_commands_per_second: float = 1.0,
+    ) -> AnimationScheduler:
+        """Create an :class:`~hueify.animation.AnimationScheduler` with the given bridge budget."""
+        return AnimationScheduler(
+            light_commands_per_second=light_commands_per_second,
+            group_commands_per_second=group_commands_per_second,
+        )
+
+    def _find_unison_group(self, light_ids: set[UUID]) -> GroupedLights | None:
+        if len(light_ids) < 2:
+            return None
+
+        for group_info in self._rooms.groups:
+            if self._member_light_ids(group_info) == light_ids:
+                return self._rooms.from_id(group_info.id)
+
+        for group_info in self._zones.groups:
+            if self._member_light_ids(group_info) == light_ids:
+                return self._zones.from_id(group_info.id)
+
+        return None
+
+    def _member_light_ids(self, group_info: GroupInfo) -> set[UUID]:
+        # Rooms list devices as children, zones list the light services directly.
+        child_ids = {child.rid for child in group_info.children}
+        return {
+            light.id
+            for light in self._light_cache.get_all()
+            if light.id in child_ids or light.owner.rid in child_ids
+        }
@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from hueify.animation.track import Frame, Track
+from hueify.animation.views import AnimationStats, TrackStats
+from hueify.http.ratelimit import TokenBucket
+from hueify.shared.resource import Resource
+
+logger = logging.getLogger(__name__)
+
+# Signify recommends at most ~10 light commands and ~1 grouped_light command
+# per second; anything above that is queued or dropped by the bridge.
+_DEFAULT_LIGHT_COMMANDS_PER_SECOND = 10.0
+_DEFAULT_GROUP_COMMANDS_PER_SECOND = 1.0
+_DEFAULT_TICK_SECONDS = 0.01
+
+
+@dataclass
+class _TrackState:
+    track: Track
+    stats: TrackStats
+    interval: float
+    next_due: float = 0.0
+    finished: bool = False
+
+
+class AnimationScheduler:
+    """Plays :class:`~hueify.animation.Track` objects within the bridge's command budget.
+
+    Each track is granted a frame rate from a fair share of the per-second
+    budget (light and grouped-light writes are budgeted separately). Every
+    frame is sent as one ``set_state`` call whose ``transition_ms`` equals the
+    frame interval, so the bridge interpolates smoothly between keyframes
+    even at low frame rates. Frames that cannot be sent in their slot are
+    dropped rather than queued, keeping the animation in sync with the clock.
+
+    ```python
+    scheduler = hue.animations.scheduler()
+    scheduler.add(hue.animations.track(["Desk", "Floor"], keyframes, loop=True))
+    stats = await scheduler.run(duration=30)
+    print(stats.achieved_fps, stats.frames_dropped)
+    ```
+    """
+
+    def __init__(
+        self,
+        light_commands_per_second: float = _DEFAULT_LIGHT_COMMANDS_PER_SECOND,
+        group_commands_per_second: float = _DEFAULT_GROUP_COMMANDS_PER_SECOND,
+        tick_seconds: float = _DEFAULT_TICK_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if light_commands_per_second <= 0 or group_commands_per_second <= 0:
+            raise ValueError("Command budgets must be positive")
+
+        self._light_budget = light_commands_per_second
+        self._group_budget = group_commands_per_second
+        self._tick_seconds = tick_seconds
+        self._clock = clock
+        self._tracks: list[Track] = []
+        self._stats = AnimationStats()
+        self._is_running = False
+
+    @property
+    def stats(self) -> AnimationStats:
+        """Frame statistics of the current or most recent run."""
+        return self._stats
+
+    def add(self, track: Track) -> None:
+        self._tracks.append(track)
+
+    def remove(self, track: Track) -> None:
+        if track in self._tracks:
+            self._tracks.remove(track)
+
+    def stop(self) -> None:
+        """Stop a running :meth:`run` after the current tick."""
+        self._is_running = False
+
+    def allocate_fps(self) -> dict[Track, float]:
+        """Return the frame rate each track is granted under the current budget."""
+        light_tracks = [t for t in self._tracks if not t.targets_groups]
+        group_tracks = [t for t in self._tracks if t.targets_groups]
+        return {
+            **_fair_share(light_tracks, self._light_budget),
+            **_fair_share(group_tracks, self._group_budget),
+        }
+
+    async def run(self, duration: float | None = None) -> AnimationStats:
+        """Play all added tracks.
+
+        Args:
+            duration: Stop after this many seconds. ``None`` runs until every
+                non-looping track has finished or :meth:`stop` is called.
+
+        Returns:
+            The final :class:`~hueify.animation.AnimationStats`.
+        """
+        if not self._tracks:
+            return self._stats
+
+        allocation = self.allocate_fps()
+        states = [
+            _TrackState(
+                track=track,
+                stats=TrackStats(
+                    name=track.name,
+                    target_fps=track.fps,
+                    allocated_fps=allocation[track],
+                ),
+                interval=1.0 / allocation[track],
+            )
+            for track in self._tracks
+        ]
+        self._stats = AnimationStats(tracks=[s.stats for s in states])
+
+        light_bucket = _budget_bucket(self._light_budget, self._clock)
+        group_bucket = _budget_bucket(self._group_budget, self._clock)
+
+        self._is_running = True
+        started_at = self._clock()
+        logger.info(f"Starting animation with {len(states)} track(s)")
+
+        try:
+            while self._is_running:
+                elapsed = self._clock() - started_at
+                if duration is not None and elapsed >= duration:
+                    break
+                if all(s.finished for s in states):
+                    break
+
+                writes = [
+                    self._render(state, elapsed, light_bucket, group_bucket)
+                    for state in states
+                    if not state.finished and elapsed >= state.next_due
+                ]
+                if writes:
+                    await asyncio.gather(*writes)
+
+                self._update_totals(self._clock() - started_at)
+                await asyncio.sleep(self._tick_seconds)
+        finally:
+            self._is_running = False
+            self._update_totals(self._clock() - started_at)
+            logger.info(
+                f"Animation finished: {self._stats.frames_sent} frame(s) sent, "
+                f"{self._stats.frames_dropped} dropped, "
+                f"{self._stats.achieved_fps:.1f} fps"
+            )
+
+        return self._stats
+
+    async def _render(
+        self,
+        state: _TrackState,
+        elapsed: float,
+        light_bucket: TokenBucket,
+        group_bucket: TokenBucket,
+    ) -> None:
+        track = state.track
+        missed_slots = int((elapsed - state.next_due) // state.interval)
+        state.stats.frames_dropped += missed_slots
+        state.next_due += (missed_slots + 1) * state.interval
+
+        if track.is_finished(elapsed):
+            state.finished = True
+
+        bucket = group_bucket if track.targets_groups else light_bucket
+        if not bucket.try_acquire(track.commands_per_frame):
+            state.stats.frames_dropped += 1
+            return
+
+        frame = track.frame_at(elapsed)
+        transition_ms = round(state.interval * 1000)
+        results = await asyncio.gather(
+            *[_send_frame(target, frame, transition_ms) for target in track.targets],
+            return_exceptions=True,
+        )
+
+        errors = [r for r in results if isinstance(r, Exception)]
+        for error in errors:
+            logger.error(f"Frame write failed for track '{track.name}': {error}")
+
+        if errors:
+            state.stats.frames_dropped += 1
+        else:
+            state.stats.frames_sent += 1
+
+    def _update_totals(self, elapsed: float) -> None:
+        stats = self._stats
+        stats.elapsed_seconds = elapsed
+        stats.frames_sent = sum(t.frames_sent for t in stats.tracks)
+        stats.frames_dropped = sum(t.frames_dropped for t in stats.tracks)
+        if elapsed > 0:
+            stats.achieved_fps = stats.frames_sent / elapsed
+            for track_stats in stats.tracks:
+                track_stats.achieved_fps = track_stats.frames_sent / elapsed
+
+
+async def _send_frame(target: Resource, frame: Frame, transition_ms: int) -> None:
+    # set_state reads floats in [0, 1] as fractions; frames are percentages.
+    brightness = round(frame.brightness) if frame.brightness is not None else None
+    await target.set_state(
+        brightness=brightness,
+        color=frame.color,
+        mirek=frame.mirek,
+        transition_ms=transition_ms,
+    )
+
+
+def _budget_bucket(rate: float, clock: Callable[[], float]) -> TokenBucket:
+    # One second of budget, so a frame costing several commands can be sent.
+    return TokenBucket(rate, burst=max(rate, 1.0), clock=clock)
+
+
+def _fair_share(tracks: list[Track], budget: float) -> dict[Track, float]:
+    # Water-filling: tracks that need less than an even share per command
+    # leave their surplus to the remaining, hungrier tracks.
+    allocation: dict[Track, float] = {}
+    remaining_budget = budget
+    remaining = sorted(tracks, key=lambda t: t.fps)
+
+    while remaining:
+        remaining_cost = sum(t.commands_per_frame for t in remaining)
+        fps_per_command = remaining_budget / remaining_cost
+        track = remaining.pop(0)
+        fps = min(track.fps, fps_per_command)
+        allocation[track] = fps
+        remaining_budget -= fps * track.commands_per_frame
+
+    return allocation
@@ -0,0 +1,165 @@
+import bisect
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from hueify.animation.easing import Easing, ease
+from hueify.animation.views import RGB, Keyframe
+from hueify.grouped_lights.service import GroupedLights
+from hueify.shared.resource import Resource
+
+
+@dataclass(frozen=True)
+class Frame:
+    brightness: float | None = None
+    color: RGB | None = None
+    mirek: int | None = None
+
+
+class Track:
+    """A keyframed animation applied to one or more lights or groups.
+
+    Every keyframe of a track must animate the same fields, so each frame can
+    be sent as a single :meth:`~hueify.shared.resource.Resource.set_state`
+    call. Targets are either all individual lights or all grouped lights,
+    because the bridge budgets the two kinds of writes separately.
+
+    ```python
+    breathe = Track(
+        targets=[hue.lights.from_name("Desk")],
+        keyframes=[
+            Keyframe(at=0, brightness=20),
+            Keyframe(at=2, brightness=80),
+            Keyframe(at=4, brightness=20),
+        ],
+        easing=Easing.SINE,
+        loop=True,
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        targets: Sequence[Resource],
+        keyframes: Sequence[Keyframe],
+        *,
+        easing: Easing = Easing.LINEAR,
+        loop: bool = False,
+        fps: float = 10.0,
+        name: str | None = None,
+    ) -> None:
+        """
+        Args:
+            targets: Lights or grouped lights that follow this track.
+            keyframes: At least one keyframe; they are sorted by ``at``.
+            easing: Curve applied between consecutive keyframes.
+            loop: Restart from the first keyframe after the last one.
+            fps: Upper bound for frames per second. The scheduler may grant
+                less when the bridge budget is shared with other tracks.
+            name: Label used in :class:`~hueify.animation.TrackStats`.
+                Defaults to the comma-joined target names.
+
+        Raises:
+            ValueError: When targets or keyframes are empty, keyframes animate
+                different fields, or lights and groups are mixed.
+        """
+        if not targets:
+            raise ValueError("A track needs at least one target")
+        if not keyframes:
+            raise ValueError("A track needs at least one keyframe")
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+
+        field_sets = {k.animated_fields for k in keyframes}
+        if len(field_sets) > 1:
+            raise ValueError("All keyframes of a track must animate the same fields")
+
+        group_targets = [t for t in targets if isinstance(t, GroupedLights)]
+        if group_targets and len(group_targets) != len(targets):
+            raise ValueError("A track cannot mix individual lights and groups")
+
+        self._targets = list(targets)
+        self._keyframes = sorted(keyframes, key=lambda k: k.at)
+        self._offsets = [k.at for k in self._keyframes]
+        self._easing = easing
+        self._loop = loop
+        self._fps = fps
+        self._name = name or ", ".join(str(t.name) for t in targets)
+        self._targets_groups = bool(group_targets)
+
+    @property
+    def targets(self) -> list[Resource]:
+        return list(self._targets)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def fps(self) -> float:
+        return self._fps
+
+    @property
+    def loop(self) -> bool:
+        return self._loop
+
+    @property
+    def duration(self) -> float:
+        return self._keyframes[-1].at
+
+    @property
+    def targets_groups(self) -> bool:
+        return self._targets_groups
+
+    @property
+    def commands_per_frame(self) -> int:
+        return len(self._targets)
+
+    def is_finished(self, elapsed: float) -> bool:
+        return not self._loop and elapsed > self.duration
+
+    def frame_at(self, elapsed: float) -> Frame:
+        t = self._local_time(elapsed)
+        index = bisect.bisect_right(self._offsets, t)
+
+        if index == 0:
+            return self._frame_from(self._keyframes[0])
+        if index == len(self._keyframes):
+            return self._frame_from(self._keyframes[-1])
+
+        start, end = self._keyframes[index - 1], self._keyframes[index]
+        progress = ease(self._easing, (t - start.at) / (end.at - start.at))
+        return Frame(
+            brightness=_lerp_optional(start.brightness, end.brightness, progress),
+            color=_lerp_rgb(start.color, end.color, progress),
+            mirek=_round_optional(_lerp_optional(start.mirek, end.mirek, progress)),
+        )
+
+    def _local_time(self, elapsed: float) -> float:
+        if self._loop and self.duration > 0:
+            return elapsed % self.duration
+        return min(elapsed, self.duration)
+
+    @staticmethod
+    def _frame_from(keyframe: Keyframe) -> Frame:
+        return Frame(
+            brightness=keyframe.brightness, color=keyframe.color, mirek=keyframe.mirek
+        )
+
+
+def _lerp_optional(
+    start: float | None, end: float | None, progress: float
+) -> float | None:
+    if start is None or end is None:
+        return None
+    return start + (end - start) * progress
+
+
+def _round_optional(value: float | None) -> int | None:
+    return None if value is None else round(value)
+
+
+def _lerp_rgb(start: RGB | None, end: RGB | None, progress: float) -> RGB | None:
+    if start is None or end is None:
+        return None
+    r, g, b = (round(s + (e - s) * progress) for s, e in zip(start, end, strict=True))
+    return r, g, b
@@ -0,0 +1,65 @@
+from typing import Self
+
+from pydantic import BaseModel, Field, model_validator
+
+type RGB = tuple[int, int, int]
+
+
+class Keyframe(BaseModel):
+    """Target state of a track at a point in time.
+
+    Attributes:
+        at: Offset from the start of the track in seconds.
+        brightness: Brightness in ``[0, 100]``.
+        color: sRGB ``(r, g, b)`` triplet. Mutually exclusive with ``mirek``.
+        mirek: Colour temperature in mirek.
+    """
+
+    at: float = Field(ge=0)
+    brightness: float | None = Field(default=None, ge=0, le=100)
+    color: RGB | None = None
+    mirek: int | None = None
+
+    @model_validator(mode="after")
+    def _validate_fields(self) -> Self:
+        if self.color is not None and self.mirek is not None:
+            raise ValueError("A keyframe cannot set both 'color' and 'mirek'")
+        if not self.animated_fields:
+            raise ValueError("A keyframe must set brightness, color or mirek")
+        return self
+
+    @property
+    def animated_fields(self) -> frozenset[str]:
+        return frozenset(
+            name
+            for name in ("brightness", "color", "mirek")
+            if getattr(self, name) is not None
+        )
+
+
+class TrackStats(BaseModel):
+    name: str
+    target_fps: float
+    allocated_fps: float
+    frames_sent: int = 0
+    frames_dropped: int = 0
+    achieved_fps: float = 0.0
+
+
+class AnimationStats(BaseModel):
+    """Frame accounting for one :meth:`AnimationScheduler.run` call.
+
+    Attributes:
+        elapsed_seconds: Wall-clock time the scheduler ran for.
+        frames_sent: Frames written to the bridge across all tracks.
+        frames_dropped: Frames skipped because the command budget was
+            exhausted or a write overran its slot.
+        achieved_fps: ``frames_sent / elapsed_seconds`` across all tracks.
+        tracks: Per-track breakdown.
+    """
+
+    elapsed_seconds: float = 0.0
+    frames_sent: int = 0
+    frames_dropped: int = 0
+    achieved_fps: float = 0.0
+    tracks: list[TrackStats] = Field(default_factory=list)
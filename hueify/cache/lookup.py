@@ -1,9 +1,12 @@
 import logging
+import time
 from typing import Generic, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel
 
+from hueify.profiling.profiler import active_profiler, current_event_type
+
 T = TypeVar("T", bound=BaseModel)
 
 logger = logging.getLogger(__name__)
@@ -32,6 +35,8 @@ class EntityLookupCache(Generic[T]):
         if cached_resource is None:
             return
 
+        profiler = active_profiler()
+        started_at = time.perf_counter()
         try:
             merged = {**cached_resource.model_dump(), **event_data}
             updated_resource = cached_resource.model_validate(merged)
@@ -42,6 +47,13 @@ class EntityLookupCache(Generic[T]):
                 f"Failed to update cached resource {resource_id}: {e}",
                 exc_info=True,
             )
+        finally:
+            if profiler is not None:
+                profiler.record_stage(
+                    "cache_update",
+                    current_event_type(),
+                    time.perf_counter() - started_at,
+                )
 
     def clear(self) -> None:
         self._id_to_model.clear()
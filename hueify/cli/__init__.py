@@ -1,3 +1,3 @@
-from .server import main
+from .client import main
 
 __all__ = ["main"]
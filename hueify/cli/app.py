@@ -1,4 +1,6 @@
+from collections.abc import Awaitable
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 try:
     import typer
@@ -11,7 +13,9 @@ except ImportError as e:
         "CLI support requires 'typer[all]'. Install with: pip install hueify[cli]"
     ) from e
 
-from hueify import ActionResult
+if TYPE_CHECKING:
+    from hueify import ActionResult, Hueify
+    from hueify.profiling import ProfileReport
 
 console = Console()
 err_console = Console(stderr=True)
@@ -21,6 +25,11 @@ err_console = Console(stderr=True)
 class CLIState:
     bridge_ip: str | None = None
     app_key: str | None = None
+    # Set by `hueify daemon`: commands reuse this connected session, and their
+    # coroutines are collected instead of run so the daemon can await them on
+    # its own event loop.
+    session: "Hueify | None" = None
+    deferred: list[Awaitable] | None = None
 
 
 state = CLIState()
@@ -75,7 +84,7 @@ def configure(
     state.app_key = app_key
 
 
-def print_result(result: ActionResult) -> None:
+def print_result(result: "ActionResult") -> None:
     if result.success:
         text = Text()
         text.append("✓ ", style="bold green")
@@ -191,3 +200,51 @@ def print_scenes(
             table.add_row(name, "[dim]–[/dim]")
 
     console.print(table)
+
+
+def print_profile_report(report: "ProfileReport") -> None:
+    lag = report.loop_lag
+    console.print(
+        f"Profiled [bold]{report.events}[/bold] event(s) over "
+        f"{report.duration_seconds:.1f}s - loop lag mean {lag.mean_ms:.2f} ms, "
+        f"p95 {lag.p95_ms:.2f} ms, max {lag.max_ms:.2f} ms"
+    )
+
+    if not report.stages:
+        console.print("[dim]No events received.[/dim]")
+        return
+
+    stages = Table(title="Pipeline stages", title_style="bold cyan")
+    stages.add_column("Stage", style="cyan")
+    stages.add_column("Event type")
+    for column in ("Count", "Total ms", "Mean ms", "Max ms"):
+        stages.add_column(column, justify="right")
+    for stage in report.stages:
+        stages.add_row(
+            stage.stage,
+            stage.event_type,
+            str(stage.count),
+            f"{stage.total_ms:.2f}",
+            f"{stage.mean_ms:.3f}",
+            f"{stage.max_ms:.3f}",
+        )
+    console.print(stages)
+
+    if not report.slowest_handlers:
+        return
+
+    handlers = Table(title="Slowest handlers", title_style="bold cyan")
+    handlers.add_column("Handler", style="cyan")
+    handlers.add_column("Event type")
+    for column in ("Count", "Total ms", "Mean ms", "Max ms"):
+        handlers.add_column(column, justify="right")
+    for handler in report.slowest_handlers:
+        handlers.add_row(
+            handler.handler,
+            handler.event_type,
+            str(handler.count),
+            f"{handler.total_ms:.2f}",
+            f"{handler.mean_ms:.3f}",
+            f"{handler.max_ms:.3f}",
+        )
+    console.print(handlers)
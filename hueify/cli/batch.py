@@ -0,0 +1,146 @@
+import json
+import shlex
+from dataclasses import dataclass
+
+from pydantic import TypeAdapter, ValidationError
+
+from hueify.actions import (
+    Action,
+    ActionOutcome,
+    ActionTarget,
+    ActivateSceneAction,
+    DecreaseBrightnessAction,
+    IncreaseBrightnessAction,
+    SetBrightnessAction,
+    SetColorTemperatureAction,
+    TurnOffAction,
+    TurnOnAction,
+)
+
+_action_adapter: TypeAdapter[Action] = TypeAdapter(Action)
+
+_TARGETS = {
+    "lights": ActionTarget.LIGHT,
+    "rooms": ActionTarget.ROOM,
+    "zones": ActionTarget.ZONE,
+}
+
+# CLI command name -> action model and the names of its arguments after the
+# resource name, mirroring `hueify <group> <command> <name> [args]`.
+_COMMANDS: dict[str, tuple[type[Action], tuple[str, ...]]] = {
+    "on": (TurnOnAction, ()),
+    "off": (TurnOffAction, ()),
+    "brightness": (SetBrightnessAction, ("percentage",)),
+    "brightness-up": (IncreaseBrightnessAction, ("percentage",)),
+    "brightness-down": (DecreaseBrightnessAction, ("percentage",)),
+    "temperature": (SetColorTemperatureAction, ("percentage",)),
+    "activate-scene": (ActivateSceneAction, ("scene",)),
+}
+
+
+@dataclass(frozen=True)
+class BatchEntry:
+    """One command of a batch: its source line and the parsed action or error."""
+
+    line: int
+    source: str
+    action: Action | None = None
+    error: str | None = None
+
+
+def parse_batch(text: str) -> list[BatchEntry]:
+    """Parse ``hueify batch`` input.
+
+    The input is either a JSON array of actions, or one command per line.
+    A line holds either a JSON action object or CLI arguments such as
+    ``rooms activate-scene "Living Room" Relax``. Blank lines and lines
+    starting with ``#`` are skipped. Lines that cannot be parsed become
+    entries with an ``error`` instead of failing the whole batch.
+    """
+    if text.lstrip().startswith("["):
+        return _parse_json_array(text)
+
+    entries = []
+    for number, raw in enumerate(text.splitlines(), start=1):
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            action = (
+                _action_adapter.validate_json(line)
+                if line.startswith("{")
+                else _parse_command(line)
+            )
+        except ValueError as e:
+            entries.append(BatchEntry(number, line, error=_describe(e)))
+        else:
+            entries.append(BatchEntry(number, line, action=action))
+    return entries
+
+
+def format_outcome(entry: BatchEntry, outcome: ActionOutcome | None = None) -> str:
+    """Render the result of one batch entry as a JSON line."""
+    result = outcome.result if outcome else None
+    error = outcome.error if outcome else entry.error
+    return json.dumps(
+        {
+            "line": entry.line,
+            "input": entry.source,
+            "success": outcome.success if outcome else False,
+            "message": result.message if result else None,
+            "error": error,
+            "result": result.model_dump(mode="json") if result else None,
+        }
+    )
+
+
+def _parse_json_array(text: str) -> list[BatchEntry]:
+    try:
+        items = json.loads(text)
+    except json.JSONDecodeError as e:
+        return [BatchEntry(e.lineno, text.strip(), error=f"Invalid JSON: {e.msg}")]
+
+    entries = []
+    for number, item in enumerate(items, start=1):
+        source = json.dumps(item)
+        try:
+            action = _action_adapter.validate_python(item)
+        except ValidationError as e:
+            entries.append(BatchEntry(number, source, error=_describe(e)))
+        else:
+            entries.append(BatchEntry(number, source, action=action))
+    return entries
+
+
+def _parse_command(line: str) -> Action:
+    words = shlex.split(line)
+    if words and words[0] == "hueify":
+        words = words[1:]
+    if len(words) < 3:
+        raise ValueError("Expected '<lights|rooms|zones> <command> <name> [value]'")
+
+    group, command, name, *args = words
+    if group not in _TARGETS:
+        raise ValueError(f"Unknown group '{group}', expected lights, rooms or zones")
+    if command not in _COMMANDS:
+        raise ValueError(
+            f"'{command}' cannot be batched, use one of: {', '.join(_COMMANDS)}"
+        )
+
+    model, fields = _COMMANDS[command]
+    if len(args) != len(fields):
+        raise ValueError(
+            f"'{group} {command}' expects {len(fields)} argument(s) after the name"
+        )
+    return model(
+        target=_TARGETS[group], name=name, **dict(zip(fields, args, strict=True))
+    )
+
+
+def _describe(error: ValueError) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(map(str, e['loc']))}: {e['msg']}" if e["loc"] else e["msg"]
+            for e in error.errors()
+        )
+    return str(error)
@@ -0,0 +1,127 @@
+"""Entry point of the ``hueify`` command.
+
+Forwards the command line to a running ``hueify daemon`` when one is
+listening, and otherwise runs the command directly. This module only uses the
+standard library so that the daemon path does not pay for importing typer,
+rich or the Hue client.
+"""
+
+import json
+import os
+import socket
+import stat
+import sys
+from pathlib import Path
+
+SOCKET_ENV_VAR = "HUEIFY_DAEMON_SOCKET"
+DISABLE_ENV_VAR = "HUEIFY_NO_DAEMON"
+
+# Commands that must run in this process: they are interactive, stream output
+# until interrupted, or start the daemon itself.
+DIRECT_COMMANDS = frozenset({"daemon", "setup", "watch"})
+_DIRECT_OPTIONS = frozenset(
+    {
+        "--help",
+        "--bridge-ip",
+        "--app-key",
+        "--install-completion",
+        "--show-completion",
+    }
+)
+_CONNECT_TIMEOUT = 0.2
+
+
+def default_socket_path() -> Path:
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return Path(override)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "hueify.sock"
+
+    import tempfile
+
+    fallback_dir = Path(tempfile.gettempdir()) / f"hueify-{os.getuid()}"
+    return _private_directory(fallback_dir) / "hueify.sock"
+
+
+def _private_directory(path: Path) -> Path:
+    # The shared temp dir is writable by everyone: another user could
+    # pre-create the directory to plant or snoop on the socket.
+    path.mkdir(mode=0o700, exist_ok=True)
+    info = path.lstat()
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise RuntimeError(f"{path} must be a directory only you can access")
+    return path
+
+
+def run_via_daemon(argv: list[str], socket_path: Path | None = None) -> int | None:
+    """Run ``argv`` on the daemon and print its output.
+
+    Returns the command's exit code, or ``None`` when no daemon is listening
+    and the command should run directly instead.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        path = socket_path or default_socket_path()
+    except RuntimeError:
+        return None
+    if not path.exists():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(_CONNECT_TIMEOUT)
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+
+    with sock:
+        sock.settimeout(None)
+        request = {
+            "argv": argv,
+            "cwd": os.getcwd(),
+            # `-` stands for stdin (e.g. `hueify batch -`), which only this
+            # process can read.
+            "stdin": sys.stdin.read() if "-" in argv else None,
+        }
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as stream:
+            line = stream.readline()
+
+    if not line:
+        # The command may or may not have run; retrying it directly could
+        # apply it twice.
+        print("hueify daemon closed the connection unexpectedly", file=sys.stderr)
+        return 1
+
+    response = json.loads(line)
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return response["exit_code"]
+
+
+def _can_use_daemon(argv: list[str]) -> bool:
+    if not argv or os.environ.get(DISABLE_ENV_VAR):
+        return False
+    if argv[0] in DIRECT_COMMANDS:
+        return False
+    return not any(arg.split("=", 1)[0] in _DIRECT_OPTIONS for arg in argv)
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    if _can_use_daemon(argv):
+        exit_code = run_via_daemon(argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from hueify.cli.server import main as run_directly
+
+    run_directly()
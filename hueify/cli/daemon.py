@@ -0,0 +1,155 @@
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import sys
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+type CommandExecutor = Callable[[list[str]], Awaitable[int]]
+
+
+class CommandDaemon:
+    """Serves CLI invocations over a Unix domain socket.
+
+    Each connection carries one JSON line ``{"argv": [...], "cwd": str,
+    "stdin": str | None}`` and receives one JSON line ``{"exit_code": int,
+    "stdout": str, "stderr": str}``. Commands run one at a time because they
+    borrow the daemon process's working directory and standard streams.
+    """
+
+    def __init__(self, execute: CommandExecutor, socket_path: Path) -> None:
+        self._execute = execute
+        self._socket_path = socket_path
+        self._lock = asyncio.Lock()
+
+    @property
+    def socket_path(self) -> Path:
+        return self._socket_path
+
+    async def serve_forever(self, ready: asyncio.Event | None = None) -> None:
+        """Listen until cancelled, then remove the socket file.
+
+        Raises:
+            RuntimeError: When another daemon is already listening on the socket.
+        """
+        await self._remove_stale_socket()
+        # Bind under a private umask so the socket is never reachable by
+        # other users, not even between creation and a later chmod.
+        with _umask(0o077):
+            server = await asyncio.start_unix_server(
+                self._handle_connection, path=str(self._socket_path)
+            )
+        logger.info(f"CLI daemon listening on {self._socket_path}")
+        if ready is not None:
+            ready.set()
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self._socket_path.unlink(missing_ok=True)
+            logger.info("CLI daemon stopped")
+
+    async def _remove_stale_socket(self) -> None:
+        if not self._socket_path.exists():
+            return
+        try:
+            _, writer = await asyncio.open_unix_connection(str(self._socket_path))
+        except OSError:
+            self._socket_path.unlink()
+            return
+        writer.close()
+        await writer.wait_closed()
+        raise RuntimeError(
+            f"A hueify daemon is already listening on {self._socket_path}"
+        )
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            response = await self._respond(await reader.readline())
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+        except ConnectionError as e:
+            logger.debug(f"CLI client went away: {e}")
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _respond(self, line: bytes) -> dict:
+        try:
+            request = json.loads(line)
+            argv = request["argv"]
+            if not isinstance(argv, list) or not all(isinstance(a, str) for a in argv):
+                raise TypeError("argv must be a list of strings")
+            cwd = request.get("cwd")
+            if cwd is not None and not os.path.isdir(cwd):
+                raise ValueError(f"working directory {cwd!r} does not exist")
+            stdin = io.StringIO(request.get("stdin") or "")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            return {"exit_code": 2, "stdout": "", "stderr": f"Invalid request: {e}\n"}
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        started_at = time.perf_counter()
+        async with self._lock:
+            with (
+                _working_directory(cwd),
+                _redirect_stdin(stdin),
+                contextlib.redirect_stdout(stdout),
+                contextlib.redirect_stderr(stderr),
+            ):
+                try:
+                    exit_code = await self._execute(argv)
+                except Exception as e:
+                    logger.error(f"CLI command {argv} failed: {e}", exc_info=True)
+                    print(f"Error: {e}", file=stderr)
+                    exit_code = 1
+
+        logger.debug(
+            f"Ran {argv} in {(time.perf_counter() - started_at) * 1000:.1f}ms "
+            f"(exit code {exit_code})"
+        )
+        return {
+            "exit_code": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+
+@contextlib.contextmanager
+def _umask(mask: int) -> Iterator[None]:
+    previous = os.umask(mask)
+    try:
+        yield
+    finally:
+        os.umask(previous)
+
+
+@contextlib.contextmanager
+def _working_directory(path: str | None) -> Iterator[None]:
+    if path is None:
+        yield
+        return
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+@contextlib.contextmanager
+def _redirect_stdin(stream: io.StringIO) -> Iterator[None]:
+    previous, sys.stdin = sys.stdin, stream
+    try:
+        yield
+    finally:
+        sys.stdin = previous
@@ -1,5 +1,8 @@
 import asyncio
+import sys
 from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 try:
     import typer
@@ -8,7 +11,6 @@ except ImportError as e:
         "CLI support requires 'typer[all]'. Install with: pip install hueify[cli]"
     ) from e
 
-from hueify import Hueify
 from hueify.cli.app import (
     app,
     console,
@@ -16,6 +18,7 @@ from hueify.cli.app import (
     lights_app,
     print_group_info,
     print_list,
+    print_profile_report,
     print_resource_info,
     print_result,
     print_scenes,
@@ -23,26 +26,50 @@ from hueify.cli.app import (
     state,
     zones_app,
 )
-from hueify.cli.setup import setup_command
+from hueify.cli.client import DIRECT_COMMANDS, default_socket_path
+from hueify.cli.daemon import CommandDaemon
 from hueify.exceptions import HueifyException, ResourceNotFoundException
 
+# The client, and the modules behind individual commands, are imported where
+# they are used so that `--help` and usage errors don't pay for them.
+if TYPE_CHECKING:
+    from hueify import Hueify
+    from hueify.cli.watch import WatchedChange
+
 
 def _run(coro: Awaitable) -> None:
+    if state.deferred is not None:
+        state.deferred.append(coro)
+        return
     try:
-        asyncio.run(coro)
+        asyncio.run(_guarded(coro))
+    except KeyboardInterrupt:
+        err_console.print("\n[dim]Interrupted.[/dim]")
+        raise typer.Exit(130) from None
+
+
+async def _guarded(coro: Awaitable) -> None:
+    try:
+        await coro
     except ResourceNotFoundException as exc:
         err_console.print(f"[red]Not found:[/red] {exc}")
         raise typer.Exit(1) from exc
     except HueifyException as exc:
         err_console.print(f"[red]Error:[/red] {exc}")
         raise typer.Exit(1) from exc
-    except KeyboardInterrupt:
-        err_console.print("\n[dim]Interrupted.[/dim]")
-        raise typer.Exit(130) from None
 
 
-async def _with_hueify(fn: Callable[[Hueify], Awaitable[None]]) -> None:
-    async with Hueify(state.bridge_ip, state.app_key) as hueify:
+async def _with_hueify(fn: Callable[["Hueify"], Awaitable[None]]) -> None:
+    if state.session is not None:
+        await fn(state.session)
+        return
+
+    from hueify import Hueify
+    from hueify.http import RateLimiter
+
+    async with Hueify(
+        state.bridge_ip, state.app_key, rate_limiter=RateLimiter()
+    ) as hueify:
         await fn(hueify)
 
 
@@ -50,7 +77,7 @@ async def _with_hueify(fn: Callable[[Hueify], Awaitable[None]]) -> None:
 def lights_list() -> None:
     """List all available lights."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         print_list("Lights", hueify.lights.names)
 
     _run(_with_hueify(_cmd))
@@ -60,7 +87,7 @@ def lights_list() -> None:
 def lights_info(name: str = typer.Argument(..., help="Light name")) -> None:
     """Show the current state of a light."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         light = hueify.lights.from_name(name)
         print_resource_info(
             name=name,
@@ -76,7 +103,7 @@ def lights_info(name: str = typer.Argument(..., help="Light name")) -> None:
 def lights_on(name: str = typer.Argument(..., help="Light name")) -> None:
     """Turn on a light."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.lights.turn_on(name)
         print_result(result)
 
@@ -87,7 +114,7 @@ def lights_on(name: str = typer.Argument(..., help="Light name")) -> None:
 def lights_off(name: str = typer.Argument(..., help="Light name")) -> None:
     """Turn off a light."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.lights.turn_off(name)
         print_result(result)
 
@@ -101,7 +128,7 @@ def lights_brightness(
 ) -> None:
     """Set a light's brightness to an absolute value."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.lights.set_brightness(name, value)
         print_result(result)
 
@@ -115,7 +142,7 @@ def lights_brightness_up(
 ) -> None:
     """Increase a light's brightness by a relative amount."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.lights.increase_brightness(name, value)
         print_result(result)
 
@@ -129,7 +156,7 @@ def lights_brightness_down(
 ) -> None:
     """Decrease a light's brightness by a relative amount."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.lights.decrease_brightness(name, value)
         print_result(result)
 
@@ -142,7 +169,7 @@ def lights_brightness_get(
 ) -> None:
     """Get the current brightness of a light."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         brightness = hueify.lights.get_brightness(name)
         console.print(f"[cyan]{name}[/cyan] brightness: [bold]{brightness:.1f}%[/bold]")
 
@@ -158,7 +185,7 @@ def lights_temperature(
 ) -> None:
     """Set a light's color temperature (0 = warmest, 100 = coolest)."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.lights.set_color_temperature(name, value)
         print_result(result)
 
@@ -169,7 +196,7 @@ def lights_temperature(
 def rooms_list() -> None:
     """List all available rooms."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         print_list("Rooms", hueify.rooms.names)
 
     _run(_with_hueify(_cmd))
@@ -179,7 +206,7 @@ def rooms_list() -> None:
 def rooms_info(name: str = typer.Argument(..., help="Room name")) -> None:
     """Show the current state of a room."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         room = hueify.rooms.from_name(name)
         active = room.get_active_scene()
         print_group_info(
@@ -198,7 +225,7 @@ def rooms_info(name: str = typer.Argument(..., help="Room name")) -> None:
 def rooms_on(name: str = typer.Argument(..., help="Room name")) -> None:
     """Turn on all lights in a room."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.rooms.turn_on(name)
         print_result(result)
 
@@ -209,7 +236,7 @@ def rooms_on(name: str = typer.Argument(..., help="Room name")) -> None:
 def rooms_off(name: str = typer.Argument(..., help="Room name")) -> None:
     """Turn off all lights in a room."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.rooms.turn_off(name)
         print_result(result)
 
@@ -223,7 +250,7 @@ def rooms_brightness(
 ) -> None:
     """Set a room's brightness to an absolute value."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.rooms.set_brightness(name, value)
         print_result(result)
 
@@ -237,7 +264,7 @@ def rooms_brightness_up(
 ) -> None:
     """Increase a room's brightness by a relative amount."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.rooms.increase_brightness(name, value)
         print_result(result)
 
@@ -251,7 +278,7 @@ def rooms_brightness_down(
 ) -> None:
     """Decrease a room's brightness by a relative amount."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.rooms.decrease_brightness(name, value)
         print_result(result)
 
@@ -264,7 +291,7 @@ def rooms_brightness_get(
 ) -> None:
     """Get the current brightness of a room."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         brightness = hueify.rooms.get_brightness(name)
         console.print(f"[cyan]{name}[/cyan] brightness: [bold]{brightness:.1f}%[/bold]")
 
@@ -280,7 +307,7 @@ def rooms_temperature(
 ) -> None:
     """Set a room's color temperature (0 = warmest, 100 = coolest)."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.rooms.set_color_temperature(name, value)
         print_result(result)
 
@@ -291,7 +318,7 @@ def rooms_temperature(
 def rooms_scenes(name: str = typer.Argument(..., help="Room name")) -> None:
     """List all scenes available in a room."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         room = hueify.rooms.from_name(name)
         active = room.get_active_scene()
         print_scenes(name, room.scene_names, active.name if active else None)
@@ -303,7 +330,7 @@ def rooms_scenes(name: str = typer.Argument(..., help="Room name")) -> None:
 def rooms_active_scene(name: str = typer.Argument(..., help="Room name")) -> None:
     """Show the currently active scene in a room."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         room = hueify.rooms.from_name(name)
         active = room.get_active_scene()
         if active:
@@ -323,7 +350,7 @@ def rooms_activate_scene(
 ) -> None:
     """Activate a scene in a room."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.rooms.activate_scene(name, scene)
         print_result(result)
 
@@ -334,7 +361,7 @@ def rooms_activate_scene(
 def zones_list() -> None:
     """List all available zones."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         print_list("Zones", hueify.zones.names)
 
     _run(_with_hueify(_cmd))
@@ -344,7 +371,7 @@ def zones_list() -> None:
 def zones_info(name: str = typer.Argument(..., help="Zone name")) -> None:
     """Show the current state of a zone."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         zone = hueify.zones.from_name(name)
         active = zone.get_active_scene()
         print_group_info(
@@ -363,7 +390,7 @@ def zones_info(name: str = typer.Argument(..., help="Zone name")) -> None:
 def zones_on(name: str = typer.Argument(..., help="Zone name")) -> None:
     """Turn on all lights in a zone."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.zones.turn_on(name)
         print_result(result)
 
@@ -374,7 +401,7 @@ def zones_on(name: str = typer.Argument(..., help="Zone name")) -> None:
 def zones_off(name: str = typer.Argument(..., help="Zone name")) -> None:
     """Turn off all lights in a zone."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.zones.turn_off(name)
         print_result(result)
 
@@ -388,7 +415,7 @@ def zones_brightness(
 ) -> None:
     """Set a zone's brightness to an absolute value."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.zones.set_brightness(name, value)
         print_result(result)
 
@@ -402,7 +429,7 @@ def zones_brightness_up(
 ) -> None:
     """Increase a zone's brightness by a relative amount."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.zones.increase_brightness(name, value)
         print_result(result)
 
@@ -416,7 +443,7 @@ def zones_brightness_down(
 ) -> None:
     """Decrease a zone's brightness by a relative amount."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.zones.decrease_brightness(name, value)
         print_result(result)
 
@@ -429,7 +456,7 @@ def zones_brightness_get(
 ) -> None:
     """Get the current brightness of a zone."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         brightness = hueify.zones.get_brightness(name)
         console.print(f"[cyan]{name}[/cyan] brightness: [bold]{brightness:.1f}%[/bold]")
 
@@ -445,7 +472,7 @@ def zones_temperature(
 ) -> None:
     """Set a zone's color temperature (0 = warmest, 100 = coolest)."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.zones.set_color_temperature(name, value)
         print_result(result)
 
@@ -456,7 +483,7 @@ def zones_temperature(
 def zones_scenes(name: str = typer.Argument(..., help="Zone name")) -> None:
     """List all scenes available in a zone."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         zone = hueify.zones.from_name(name)
         active = zone.get_active_scene()
         print_scenes(name, zone.scene_names, active.name if active else None)
@@ -468,7 +495,7 @@ def zones_scenes(name: str = typer.Argument(..., help="Zone name")) -> None:
 def zones_active_scene(name: str = typer.Argument(..., help="Zone name")) -> None:
     """Show the currently active scene in a zone."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         zone = hueify.zones.from_name(name)
         active = zone.get_active_scene()
         if active:
@@ -488,16 +515,196 @@ def zones_activate_scene(
 ) -> None:
     """Activate a scene in a zone."""
 
-    async def _cmd(hueify: Hueify) -> None:
+    async def _cmd(hueify: "Hueify") -> None:
         result = await hueify.zones.activate_scene(name, scene)
         print_result(result)
 
     _run(_with_hueify(_cmd))
 
 
+@app.command("profile")
+def profile(
+    duration: float = typer.Option(
+        10.0, "--duration", "-d", help="Seconds to profile for"
+    ),
+    top: int = typer.Option(10, "--top", "-n", help="Number of handlers to show"),
+    as_json: bool = typer.Option(False, "--json", help="Print the report as JSON"),
+) -> None:
+    """Measure event-loop lag and event-handler cost while listening to events."""
+
+    async def _cmd(hueify: "Hueify") -> None:
+        with hueify.profiler:
+            if not as_json:
+                console.print(f"[dim]Profiling for {duration:g}s...[/dim]")
+            await asyncio.sleep(duration)
+        report = hueify.profiler.report(top=top)
+        if as_json:
+            console.print_json(report.model_dump_json())
+        else:
+            print_profile_report(report)
+
+    _run(_with_hueify(_cmd))
+
+
+@app.command("watch")
+def watch(
+    resource_type: str | None = typer.Option(
+        None, "--type", "-t", help="Comma-separated resource types, e.g. light,motion"
+    ),
+    name: str | None = typer.Option(
+        None, "--name", help="Comma-separated light, room or zone names"
+    ),
+    fields: str | None = typer.Option(
+        None, "--fields", help="Comma-separated event fields, e.g. dimming,on"
+    ),
+    as_json: bool = typer.Option(
+        False, "--json", help="Print one JSON object per event (NDJSON)"
+    ),
+    refresh_rate: float = typer.Option(
+        4.0, "--refresh-rate", min=0.1, help="Maximum table redraws per second"
+    ),
+) -> None:
+    """Stream live state changes from the bridge until interrupted."""
+
+    def _split(value: str | None) -> list[str] | None:
+        return [part.strip() for part in value.split(",")] if value else None
+
+    from hueify.cli.watch import EventWatcher, LiveTable
+
+    async def _cmd(hueify: "Hueify") -> None:
+        table = LiveTable(console, refresh_rate)
+
+        def _print(change: "WatchedChange") -> None:
+            typer.echo(change.to_json())
+
+        try:
+            watcher = EventWatcher(
+                hueify,
+                _print if as_json else table.add,
+                resource_types=_split(resource_type),
+                names=_split(name),
+                fields=_split(fields),
+            )
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--type") from exc
+
+        watcher.start()
+        try:
+            if as_json:
+                await asyncio.Event().wait()
+            else:
+                await table.run()
+        finally:
+            watcher.stop()
+
+    _run(_with_hueify(_cmd))
+
+
+@app.command("batch")
+def batch(
+    source: str = typer.Argument(
+        ..., help="File with one command per line or a JSON array, - for stdin"
+    ),
+    concurrency: int = typer.Option(
+        5, "--concurrency", "-j", min=1, help="Commands in flight at once"
+    ),
+) -> None:
+    """Run many commands over one connection and print JSON-lines results.
+
+    Each line is either CLI arguments (`rooms activate-scene Office Focus`) or
+    a JSON action (`{"action": "turn_on", "target": "light", "name": "Desk"}`).
+    Commands on different lights run concurrently; room and zone commands keep
+    their place in the order.
+    """
+    try:
+        text = sys.stdin.read() if source == "-" else Path(source).read_text()
+    except OSError as exc:
+        err_console.print(f"[red]Error:[/red] {exc}")
+        raise typer.Exit(1) from exc
+    from hueify.actions import ActionExecutor
+    from hueify.cli.batch import format_outcome, parse_batch
+
+    entries = parse_batch(text)
+
+    async def _cmd(hueify: "Hueify") -> None:
+        failed = 0
+        for entry in entries:
+            if entry.error is not None:
+                failed += 1
+                typer.echo(format_outcome(entry))
+
+        runnable = [entry for entry in entries if entry.action is not None]
+        executor = ActionExecutor(hueify, max_concurrency=concurrency)
+        async for outcome in executor.stream([entry.action for entry in runnable]):
+            failed += not outcome.success
+            typer.echo(format_outcome(runnable[outcome.index], outcome))
+
+        if failed:
+            raise typer.Exit(1)
+
+    _run(_with_hueify(_cmd))
+
+
+@app.command("daemon")
+def daemon(
+    socket_path: str | None = typer.Option(
+        None, "--socket", help="Socket to listen on (default: per-user runtime dir)"
+    ),
+) -> None:
+    """Stay connected and serve CLI commands over a local socket."""
+
+    async def _cmd(hueify: "Hueify") -> None:
+        try:
+            path = Path(socket_path) if socket_path else default_socket_path()
+            console.print(f"[green]✓[/green] Daemon listening on {path}")
+            await _serve_daemon(hueify, path)
+        except RuntimeError as exc:
+            err_console.print(f"[red]Error:[/red] {exc}")
+            raise typer.Exit(1) from exc
+
+    _run(_with_hueify(_cmd))
+
+
+async def _serve_daemon(
+    hueify: "Hueify", socket_path: Path, ready: asyncio.Event | None = None
+) -> None:
+    state.session = hueify
+    try:
+        await CommandDaemon(_execute_argv, socket_path).serve_forever(ready)
+    finally:
+        state.session = None
+
+
+async def _execute_argv(argv: list[str]) -> int:
+    if argv and argv[0] in DIRECT_COMMANDS:
+        err_console.print(
+            f"[red]Error:[/red] '{argv[0]}' cannot run through the daemon"
+        )
+        return 2
+
+    deferred: list[Awaitable] = []
+    state.deferred = deferred
+    try:
+        app(args=argv, prog_name="hueify")
+    except SystemExit as exc:
+        if exc.code:
+            return exc.code if isinstance(exc.code, int) else 1
+    finally:
+        state.deferred = None
+
+    for coro in deferred:
+        try:
+            await _guarded(coro)
+        except typer.Exit as exc:
+            return exc.exit_code
+    return 0
+
+
 @app.command("setup")
 def setup() -> None:
     """Interactive onboarding: discover bridge and register an app key."""
+    from hueify.cli.setup import setup_command
+
     setup_command()
 
 
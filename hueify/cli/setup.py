@@ -8,7 +8,12 @@ except ImportError as e:
     ) from e
 
 from hueify.credentials import save_credentials_config
-from hueify.onboarding.discovery import DiscoveredBridge, discover_bridges
+from hueify.onboarding import (
+    BridgeCache,
+    DiscoveredBridge,
+    discover_bridges,
+    discover_bridges_locally,
+)
 from hueify.onboarding.registration import register_app_key
 
 console = Console()
@@ -34,7 +39,11 @@ async def _run_setup() -> None:
     console.print("[bold]Hue Bridge Setup[/bold]\n")
 
     with console.status("Searching for bridges on your network..."):
-        bridges = await discover_bridges()
+        cache = BridgeCache()
+        bridges = await discover_bridges_locally(cache=cache)
+        if not bridges:
+            bridges = await discover_bridges()
+            cache.remember(bridges)
 
     bridge = _select_bridge(bridges)
     console.print(f"\nUsing bridge at [green]{bridge.internalipaddress}[/green]\n")
@@ -46,7 +55,7 @@ async def _run_setup() -> None:
     with console.status("Registering app key..."):
         app_key = await register_app_key(bridge.internalipaddress)
 
-    config_path = save_credentials_config(bridge.internalipaddress, app_key)
+    config_path = save_credentials_config(bridge.internalipaddress, app_key, bridge.id)
 
     console.print("\n[bold green]Setup complete![/bold green]")
     console.print(f"\nCredentials saved to [cyan]{config_path}[/cyan]")
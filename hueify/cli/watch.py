@@ -0,0 +1,202 @@
+import asyncio
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, get_args
+from uuid import UUID
+
+try:
+    from rich.console import Console
+    from rich.live import Live
+    from rich.table import Table
+except ImportError as e:
+    raise ImportError(
+        "CLI support requires 'typer[all]'. Install with: pip install hueify[cli]"
+    ) from e
+
+from pydantic import BaseModel
+
+from hueify import Hueify
+from hueify.exceptions import ResourceNotFoundException
+from hueify.sse.views import HueEvent
+
+# Resource type -> event model, e.g. "light" -> LightEvent.
+EVENT_MODELS: dict[str, type[BaseModel]] = {
+    model.model_fields["type"].default.value: model
+    for model in get_args(get_args(HueEvent)[0])
+}
+
+_IDENTITY_FIELDS = {"type", "id", "id_v1", "owner", "service_id"}
+
+
+@dataclass(frozen=True)
+class WatchedChange:
+    timestamp: datetime
+    resource_type: str
+    resource_id: UUID
+    name: str | None
+    changes: dict[str, Any]
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "timestamp": self.timestamp.isoformat(),
+                "type": self.resource_type,
+                "id": str(self.resource_id),
+                "name": self.name,
+                "changes": self.changes,
+            }
+        )
+
+
+class EventWatcher:
+    """Turns bridge events into :class:`WatchedChange` records.
+
+    Only the fields an event actually carries are reported, so an update that
+    merely dims a light shows up as ``{"dimming": {"brightness": 40.0}}``.
+    """
+
+    def __init__(
+        self,
+        hue: Hueify,
+        on_change: Callable[[WatchedChange], None],
+        resource_types: Iterable[str] | None = None,
+        names: Iterable[str] | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> None:
+        """
+        Args:
+            hue: Connected session whose event stream is watched.
+            on_change: Called for every matching event.
+            resource_types: Keys of :data:`EVENT_MODELS` to watch; all when
+                omitted.
+            names: Light, room or zone names to watch (case-insensitive);
+                resources without a name never match.
+            fields: Top-level event fields to report, e.g. ``dimming``.
+
+        Raises:
+            ValueError: When a resource type is unknown.
+            :class:`~hueify.exceptions.ResourceNotFoundException`: When a
+                name matches no light, room or zone.
+        """
+        types = set(resource_types or EVENT_MODELS)
+        unknown = types - EVENT_MODELS.keys()
+        if unknown:
+            raise ValueError(
+                f"Unknown resource type(s): {', '.join(sorted(unknown))}. "
+                f"Choose from: {', '.join(sorted(EVENT_MODELS))}"
+            )
+
+        self._hue = hue
+        self._on_change = on_change
+        self._models = [EVENT_MODELS[t] for t in sorted(types)]
+        self._names_by_id = _names_by_id(hue)
+        self._names = {name.casefold() for name in names} if names else None
+        self._fields = list(fields) if fields else None
+
+        known = {name.casefold() for name in self._names_by_id.values()}
+        for name in names or ():
+            if name.casefold() not in known:
+                raise ResourceNotFoundException(
+                    resource_type="light, room or zone",
+                    lookup_name=name,
+                    suggested_names=list(self._names_by_id.values()),
+                )
+
+    def start(self) -> None:
+        for model in self._models:
+            self._hue.on(model, self._handle)
+
+    def stop(self) -> None:
+        for model in self._models:
+            self._hue.off(model, self._handle)
+
+    async def _handle(self, event: HueEvent) -> None:
+        name = self._names_by_id.get(event.id)
+        if self._names is not None and (
+            name is None or name.casefold() not in self._names
+        ):
+            return
+
+        changes = event.model_dump(
+            mode="json", exclude_none=True, exclude=_IDENTITY_FIELDS
+        )
+        if self._fields is not None:
+            changes = {f: changes[f] for f in self._fields if f in changes}
+        if not changes:
+            return
+
+        self._on_change(
+            WatchedChange(
+                timestamp=datetime.now(),
+                resource_type=event.type,
+                resource_id=event.id,
+                name=name,
+                changes=changes,
+            )
+        )
+
+
+class LiveTable:
+    """Live table with the latest change per resource.
+
+    Changes are only recorded when they arrive; the table is redrawn at most
+    ``refresh_rate`` times per second, so bursts of events cost one redraw.
+    """
+
+    def __init__(self, console: Console, refresh_rate: float = 4.0) -> None:
+        if refresh_rate <= 0:
+            raise ValueError("refresh_rate must be positive")
+        self._console = console
+        self._interval = 1 / refresh_rate
+        self._latest: dict[UUID, WatchedChange] = {}
+        self._events = 0
+        self._dirty = False
+
+    def add(self, change: WatchedChange) -> None:
+        self._latest[change.resource_id] = change
+        self._events += 1
+        self._dirty = True
+
+    def render(self) -> Table:
+        table = Table(title=f"Live events ({self._events} received)")
+        table.add_column("Time", style="dim")
+        table.add_column("Type")
+        table.add_column("Name", style="bold")
+        table.add_column("Changes")
+        for change in sorted(
+            self._latest.values(), key=lambda c: c.timestamp, reverse=True
+        ):
+            table.add_row(
+                change.timestamp.strftime("%H:%M:%S"),
+                change.resource_type,
+                change.name or str(change.resource_id)[:8],
+                " ".join(f"{k}={v}" for k, v in _flatten(change.changes)),
+            )
+        return table
+
+    async def run(self) -> None:
+        """Redraw until cancelled."""
+        with Live(self.render(), console=self._console, auto_refresh=False) as live:
+            while True:
+                await asyncio.sleep(self._interval)
+                if self._dirty:
+                    self._dirty = False
+                    live.update(self.render(), refresh=True)
+
+
+def _names_by_id(hue: Hueify) -> dict[UUID, str]:
+    names = {}
+    for namespace in (hue.lights, hue.rooms, hue.zones):
+        for name in namespace.names:
+            names[namespace.from_name(name).id] = name
+    return names
+
+
+def _flatten(values: dict[str, Any], prefix: str = "") -> Iterable[tuple[str, Any]]:
+    for key, value in values.items():
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", value
@@ -34,21 +34,22 @@ def get_credentials_config_path() -> Path:
     return config_root / "hueify" / "config.toml"
 
 
-def save_credentials_config(bridge_ip: str, app_key: str) -> Path:
+def save_credentials_config(
+    bridge_ip: str, app_key: str, bridge_id: str | None = None
+) -> Path:
     """Persist credentials in the same format HueBridgeCredentials reads."""
-    credentials = HueBridgeCredentials(hue_bridge_ip=bridge_ip, hue_app_key=app_key)
+    credentials = HueBridgeCredentials(
+        hue_bridge_ip=bridge_ip, hue_app_key=app_key, hue_bridge_id=bridge_id
+    )
+    lines = [
+        f'hue_bridge_ip = "{credentials.hue_bridge_ip}"',
+        f'hue_app_key = "{credentials.hue_app_key}"',
+    ]
+    if credentials.hue_bridge_id is not None:
+        lines.append(f'hue_bridge_id = "{credentials.hue_bridge_id}"')
     config_path = get_credentials_config_path()
     config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(
-        "\n".join(
-            (
-                f'hue_bridge_ip = "{credentials.hue_bridge_ip}"',
-                f'hue_app_key = "{credentials.hue_app_key}"',
-                "",
-            )
-        ),
-        encoding="utf-8",
-    )
+    config_path.write_text("\n".join([*lines, ""]), encoding="utf-8")
     return config_path
 
 
@@ -63,6 +64,7 @@ class HueBridgeCredentials(BaseSettings):
 
     hue_bridge_ip: str = Field(alias="HUE_BRIDGE_IP")
     hue_app_key: str = Field(alias="HUE_APP_KEY")
+    hue_bridge_id: str | None = Field(default=None, alias="HUE_BRIDGE_ID")
 
     @classmethod
     def settings_customise_sources(
@@ -109,6 +111,15 @@ class HueBridgeCredentials(BaseSettings):
 
         return value
 
+    @field_validator("hue_bridge_id")
+    @classmethod
+    def validate_bridge_id(cls, value: str | None) -> str | None:
+        if value is None:
+            return None
+        if not re.fullmatch(r"[0-9a-fA-F]{16}", value):
+            raise ValueError("Hue Bridge id must be 16 hexadecimal characters")
+        return value.lower()
+
     @field_validator("hue_app_key")
     @classmethod
     def validate_app_key(cls, value: str) -> str:
@@ -0,0 +1,23 @@
+from .encoder import ColorSpace, HueStreamEncoder
+from .namespace import EntertainmentNamespace
+from .session import EntertainmentSession
+from .transport import DatagramTransport, UdpDatagramTransport
+from .views import (
+    EntertainmentChannel,
+    EntertainmentConfigurationInfo,
+    EntertainmentStatus,
+    StreamStats,
+)
+
+__all__ = [
+    "ColorSpace",
+    "DatagramTransport",
+    "EntertainmentChannel",
+    "EntertainmentConfigurationInfo",
+    "EntertainmentNamespace",
+    "EntertainmentSession",
+    "EntertainmentStatus",
+    "HueStreamEncoder",
+    "StreamStats",
+    "UdpDatagramTransport",
+]
@@ -0,0 +1,102 @@
+import struct
+from collections.abc import Sequence
+from enum import IntEnum
+from uuid import UUID
+
+_PROTOCOL_NAME = b"HueStream"
+_VERSION_MAJOR = 2
+_VERSION_MINOR = 0
+_MAX_CHANNELS = 20
+_MAX_CHANNEL_VALUE = 0xFFFF
+
+# name | version major/minor | sequence | 2 reserved | colour space | 1 reserved | config id
+_HEADER = struct.Struct(">9sBBB2xBx36s")
+_SEQUENCE_OFFSET = 11
+# channel id | three 16-bit colour components
+_CHANNEL = struct.Struct(">BHHH")
+_CHANNEL_VALUES = struct.Struct(">HHH")
+
+
+class ColorSpace(IntEnum):
+    RGB = 0x00
+    XY = 0x01
+
+
+class HueStreamEncoder:
+    """Encodes HueStream v2 frames into a single preallocated buffer.
+
+    The header and channel ids are written once on construction; per frame
+    only the colour values and the sequence byte are patched in place, so
+    streaming does not allocate a new buffer per frame. :meth:`frame`
+    returns a ``memoryview`` onto that buffer which stays valid until the
+    next frame is encoded.
+    """
+
+    def __init__(
+        self,
+        configuration_id: UUID,
+        channel_ids: Sequence[int],
+        color_space: ColorSpace = ColorSpace.RGB,
+    ) -> None:
+        if not 0 < len(channel_ids) <= _MAX_CHANNELS:
+            raise ValueError(f"HueStream supports 1 to {_MAX_CHANNELS} channels")
+
+        self._channel_count = len(channel_ids)
+        self._buffer = bytearray(_HEADER.size + _CHANNEL.size * self._channel_count)
+        self._view = memoryview(self._buffer)
+        self._sequence = 0
+
+        _HEADER.pack_into(
+            self._buffer,
+            0,
+            _PROTOCOL_NAME,
+            _VERSION_MAJOR,
+            _VERSION_MINOR,
+            0,
+            color_space,
+            str(configuration_id).encode("ascii"),
+        )
+        for index, channel_id in enumerate(channel_ids):
+            _CHANNEL.pack_into(
+                self._buffer, self._channel_offset(index), channel_id, 0, 0, 0
+            )
+
+    @property
+    def channel_count(self) -> int:
+        return self._channel_count
+
+    @property
+    def frame_size(self) -> int:
+        return len(self._buffer)
+
+    def set_channel(self, index: int, a: float, b: float, c: float) -> None:
+        """Set the colour of the channel at ``index`` from components in ``[0, 1]``.
+
+        For :attr:`ColorSpace.RGB` the components are red, green and blue;
+        for :attr:`ColorSpace.XY` they are x, y and brightness.
+        """
+        self.set_channel_raw(
+            index,
+            _to_channel_value(a),
+            _to_channel_value(b),
+            _to_channel_value(c),
+        )
+
+    def set_channel_raw(self, index: int, a: int, b: int, c: int) -> None:
+        _CHANNEL_VALUES.pack_into(
+            self._buffer, self._channel_offset(index) + 1, a, b, c
+        )
+
+    def frame(self) -> memoryview:
+        self._buffer[_SEQUENCE_OFFSET] = self._sequence
+        self._sequence = (self._sequence + 1) & 0xFF
+        return self._view
+
+    def _channel_offset(self, index: int) -> int:
+        if not 0 <= index < self._channel_count:
+            raise IndexError(f"Channel index {index} out of range")
+        return _HEADER.size + index * _CHANNEL.size
+
+
+def _to_channel_value(component: float) -> int:
+    return round(max(0.0, min(1.0, component)) * _MAX_CHANNEL_VALUE)
@@ -0,0 +1,105 @@
+from hueify.entertainment.encoder import ColorSpace
+from hueify.entertainment.session import EntertainmentSession
+from hueify.entertainment.transport import DatagramTransport
+from hueify.entertainment.views import (
+    ChannelLightMapping,
+    EntertainmentConfigurationInfo,
+    EntertainmentServiceInfo,
+)
+from hueify.exceptions import ResourceNotFoundException
+from hueify.http import HttpClient
+
+
+class EntertainmentNamespace:
+    """Entry point for entertainment (streaming) configurations.
+
+    Accessible as :attr:`Hueify.entertainment <hueify.Hueify.entertainment>`.
+    Configurations are fetched on demand rather than cached at connect,
+    since most sessions never stream.
+
+    ```python
+    async with Hueify() as hue:
+        transport = MyDtlsTransport(bridge_ip, app_key, client_key)
+        session = await hue.entertainment.session("TV area", transport)
+        async with session:
+            await session.stream(render, fps=50, duration=30)
+    ```
+    """
+
+    def __init__(self, http_client: HttpClient) -> None:
+        self._http_client = http_client
+
+    async def list_configurations(self) -> list[EntertainmentConfigurationInfo]:
+        """Return all entertainment configurations known to the bridge."""
+        return await self._http_client.get_resources(
+            endpoint="/entertainment_configuration",
+            resource_type=EntertainmentConfigurationInfo,
+        )
+
+    async def get_configuration(self, name: str) -> EntertainmentConfigurationInfo:
+        """Look up an entertainment configuration by name (case-insensitive).
+
+        Raises:
+            :class:`~hueify.exceptions.ResourceNotFoundException`: When no
+                configuration with that name exists.
+        """
+        configurations = await self.list_configurations()
+        for configuration in configurations:
+            if configuration.name.lower() == name.lower():
+                return configuration
+
+        raise ResourceNotFoundException(
+            resource_type="entertainment configuration",
+            lookup_name=name,
+            suggested_names=[c.name for c in configurations],
+        )
+
+    async def channel_lights(
+        self, configuration: EntertainmentConfigurationInfo
+    ) -> ChannelLightMapping:
+        """Map every channel id of ``configuration`` to the lights it renders on.
+
+        Channel members reference ``entertainment`` services; each of those
+        points at its light through ``renderer_reference``.
+        """
+        services = await self._http_client.get_resources(
+            endpoint="/entertainment", resource_type=EntertainmentServiceInfo
+        )
+        light_by_service = {
+            service.id: service.renderer_reference.rid
+            for service in services
+            if service.renderer_reference is not None
+        }
+        return {
+            channel.channel_id: [
+                light_by_service[member.service.rid]
+                for member in channel.members
+                if member.service.rid in light_by_service
+            ]
+            for channel in configuration.channels
+        }
+
+    async def session(
+        self,
+        name: str,
+        transport: DatagramTransport,
+        color_space: ColorSpace = ColorSpace.RGB,
+    ) -> EntertainmentSession:
+        """Prepare a streaming session for the named configuration.
+
+        The session is not started yet; use it as an async context manager
+        or call :meth:`~hueify.entertainment.EntertainmentSession.start`.
+
+        Args:
+            name: Entertainment configuration name as shown in the Hue app.
+            transport: Datagram transport that delivers frames to the bridge.
+            color_space: Colour space used in every frame.
+        """
+        configuration = await self.get_configuration(name)
+        return EntertainmentSession(
+            configuration=configuration,
+            client=self._http_client,
+            transport=transport,
+            channel_lights=await self.channel_lights(configuration),
+            color_space=color_space,
+        )
@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from types import TracebackType
+from typing import Self
+from uuid import UUID
+
+from hueify.entertainment.encoder import ColorSpace, HueStreamEncoder
+from hueify.entertainment.transport import DatagramTransport
+from hueify.entertainment.views import (
+    ChannelLightMapping,
+    EntertainmentAction,
+    EntertainmentConfigurationInfo,
+    EntertainmentConfigurationUpdate,
+    StreamStats,
+)
+from hueify.http import HttpClient
+
+logger = logging.getLogger(__name__)
+
+type FrameRenderer = Callable[[HueStreamEncoder, int], None]
+
+
+class EntertainmentSession:
+    """A running entertainment stream for one entertainment configuration.
+
+    Obtain an instance via :meth:`EntertainmentNamespace.session
+    <hueify.entertainment.EntertainmentNamespace.session>`. Using it as an
+    async context manager starts the configuration on the bridge and stops
+    it (and closes the transport) on exit:
+
+    ```python
+    async with await hue.entertainment.session("TV area", transport) as session:
+        await session.stream(render, fps=50, duration=10)
+    ```
+    """
+
+    def __init__(
+        self,
+        configuration: EntertainmentConfigurationInfo,
+        client: HttpClient,
+        transport: DatagramTransport,
+        channel_lights: ChannelLightMapping,
+        color_space: ColorSpace = ColorSpace.RGB,
+    ) -> None:
+        self._configuration = configuration
+        self._client = client
+        self._transport = transport
+        self._channel_lights = channel_lights
+        self._channel_index = {
+            channel_id: index
+            for index, channel_id in enumerate(configuration.channel_ids)
+        }
+        self._encoder = HueStreamEncoder(
+            configuration_id=configuration.id,
+            channel_ids=configuration.channel_ids,
+            color_space=color_space,
+        )
+        self._is_streaming = False
+
+    @property
+    def configuration_id(self) -> UUID:
+        return self._configuration.id
+
+    @property
+    def channel_ids(self) -> list[int]:
+        """Channel ids in the order they appear in every frame."""
+        return self._configuration.channel_ids
+
+    @property
+    def channel_lights(self) -> ChannelLightMapping:
+        """Light ids rendered by each channel, keyed by channel id."""
+        return self._channel_lights
+
+    @property
+    def encoder(self) -> HueStreamEncoder:
+        return self._encoder
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """Ask the bridge to start streaming mode for this configuration."""
+        await self._update_action(EntertainmentAction.START)
+        logger.info(f"Entertainment configuration '{self._configuration.name}' started")
+
+    async def stop(self) -> None:
+        """Stop streaming, release the configuration and close the transport."""
+        self._is_streaming = False
+        try:
+            await self._update_action(EntertainmentAction.STOP)
+            logger.info(
+                f"Entertainment configuration '{self._configuration.name}' stopped"
+            )
+        finally:
+            self._transport.close()
+
+    def set_channel(self, channel_id: int, a: float, b: float, c: float) -> None:
+        """Set the colour of a channel by its bridge channel id (components in ``[0, 1]``)."""
+        self._encoder.set_channel(self._channel_index[channel_id], a, b, c)
+
+    def send(self) -> None:
+        """Send the current channel values as one frame."""
+        self._transport.send(self._encoder.frame())
+
+    async def stream(
+        self,
+        render: FrameRenderer,
+        fps: float = 50.0,
+        duration: float | None = None,
+    ) -> StreamStats:
+        """Render and send frames at a fixed rate.
+
+        A frame the transport cannot take right now, e.g. because the socket
+        send buffer is full, is counted in ``frames_dropped`` instead of
+        ending the stream; the next frame supersedes it anyway.
+
+        Args:
+            render: Called as ``render(encoder, frame_number)`` before each
+                frame to update the channel values in place.
+            fps: Target frame rate. The bridge accepts 25-50 Hz.
+            duration: Stop after this many seconds, or run until
+                :meth:`stop` is called when ``None``.
+        """
+        interval = 1.0 / fps
+        stats = StreamStats()
+        started_at = time.perf_counter()
+        next_frame_at = started_at
+        self._is_streaming = True
+
+        frame_number = 0
+
+        while self._is_streaming:
+            now = time.perf_counter()
+            if duration is not None and now - started_at >= duration:
+                break
+
+            render(self._encoder, frame_number)
+            frame_number += 1
+            try:
+                self.send()
+            except BlockingIOError:
+                stats.frames_dropped += 1
+                logger.debug("Transport busy, dropped an entertainment frame")
+            else:
+                stats.frames_sent += 1
+
+            next_frame_at += interval
+            await asyncio.sleep(max(0.0, next_frame_at - time.perf_counter()))
+
+        stats.elapsed_seconds = time.perf_counter() - started_at
+        if stats.elapsed_seconds > 0:
+            stats.achieved_fps = stats.frames_sent / stats.elapsed_seconds
+        return stats
+
+    async def _update_action(self, action: EntertainmentAction) -> None:
+        await self._client.put(
+            f"entertainment_configuration/{self._configuration.id}",
+            data=EntertainmentConfigurationUpdate(action=action),
+        )
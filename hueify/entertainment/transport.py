@@ -0,0 +1,32 @@
+import socket
+from typing import Protocol
+
+HUE_ENTERTAINMENT_PORT = 2100
+
+
+class DatagramTransport(Protocol):
+    """Anything that can deliver HueStream frames to the bridge.
+
+    A real bridge only accepts frames over DTLS 1.2 (PSK, using the
+    application key as identity and the client key as secret). The standard
+    library has no DTLS support, so plug in a DTLS-capable implementation of
+    this protocol for production use; :class:`UdpDatagramTransport` sends
+    plain UDP and is meant for local stand-ins and benchmarks.
+    """
+
+    def send(self, data: bytes | memoryview) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class UdpDatagramTransport:
+    def __init__(self, host: str, port: int = HUE_ENTERTAINMENT_PORT) -> None:
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+        self._socket.connect((host, port))
+
+    def send(self, data: bytes | memoryview) -> None:
+        self._socket.send(data)
+
+    def close(self) -> None:
+        self._socket.close()
@@ -0,0 +1,80 @@
+from enum import StrEnum
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from hueify.shared.resource.views import ResourceReference, ResourceType
+
+
+class EntertainmentStatus(StrEnum):
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+
+
+class EntertainmentAction(StrEnum):
+    START = "start"
+    STOP = "stop"
+
+
+class EntertainmentPosition(BaseModel):
+    x: float
+    y: float
+    z: float
+
+
+class EntertainmentChannelMember(BaseModel):
+    service: ResourceReference
+    index: int = 0
+
+
+class EntertainmentChannel(BaseModel):
+    channel_id: int = Field(ge=0, le=255)
+    position: EntertainmentPosition | None = None
+    members: list[EntertainmentChannelMember] = Field(default_factory=list)
+
+
+class EntertainmentConfigurationMetadata(BaseModel):
+    name: str
+
+
+class EntertainmentConfigurationInfo(BaseModel):
+    id: UUID
+    type: Literal[ResourceType.ENTERTAINMENT_CONFIGURATION] = (
+        ResourceType.ENTERTAINMENT_CONFIGURATION
+    )
+    metadata: EntertainmentConfigurationMetadata
+    configuration_type: str | None = None
+    status: EntertainmentStatus = EntertainmentStatus.INACTIVE
+    channels: list[EntertainmentChannel] = Field(default_factory=list)
+    light_services: list[ResourceReference] = Field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return self.metadata.name
+
+    @property
+    def channel_ids(self) -> list[int]:
+        return [channel.channel_id for channel in self.channels]
+
+
+class EntertainmentServiceInfo(BaseModel):
+    id: UUID
+    type: Literal[ResourceType.ENTERTAINMENT] = ResourceType.ENTERTAINMENT
+    owner: ResourceReference | None = None
+    renderer: bool = False
+    renderer_reference: ResourceReference | None = None
+
+
+class EntertainmentConfigurationUpdate(BaseModel):
+    action: EntertainmentAction
+
+
+class StreamStats(BaseModel):
+    frames_sent: int = 0
+    frames_dropped: int = 0
+    elapsed_seconds: float = 0.0
+    achieved_fps: float = 0.0
+
+
+type ChannelLightMapping = dict[int, list[UUID]]
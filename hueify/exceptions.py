@@ -38,3 +38,37 @@ class ResourceNotFoundException(HueifyException):
             error_msg += f". Did you mean: {suggestions}?"
 
         super().__init__(error_msg)
+
+
+class BridgeUnavailableException(HueifyException):
+    """Raised without contacting the bridge while the circuit breaker is open.
+
+    The breaker opens after repeated connection failures and lets a single
+    probe request through once ``retry_in`` seconds have passed.
+    """
+
+    def __init__(self, retry_in: float) -> None:
+        """
+        Args:
+            retry_in: Seconds until the breaker lets the next probe through.
+        """
+        self.retry_in = retry_in
+        super().__init__(
+            f"Hue Bridge is unreachable. Failing fast, next attempt in {retry_in:.1f}s."
+        )
+
+
+class BridgeNotFoundException(HueifyException):
+    """Raised when discovery cannot find the bridge the credentials are pinned to.
+
+    Hueify never switches to a different bridge on its own: the app key is
+    only valid for the bridge it was registered with.
+    """
+
+    def __init__(self, bridge_id: str) -> None:
+        """
+        Args:
+            bridge_id: Id of the bridge that was searched for.
+        """
+        self.bridge_id = bridge_id
+        super().__init__(f"Hue Bridge {bridge_id} was not found on the network.")
@@ -1,10 +1,12 @@
 from .cache import GroupedLightCache
+from .namespace import BaseGroupNamespace
 from .rooms import RoomCache, RoomNamespace
 from .service import GroupedLights
 from .views import GroupedLightInfo
 from .zones import ZoneCache, ZoneNamespace
 
 __all__ = [
+    "BaseGroupNamespace",
     "GroupedLightCache",
     "GroupedLightInfo",
     "GroupedLights",
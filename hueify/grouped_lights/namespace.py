@@ -1,4 +1,5 @@
 import logging
+from abc import ABC, abstractmethod
 from uuid import UUID
 
 from hueify.cache.lookup import NamedEntityLookupCache
@@ -14,7 +15,181 @@ from hueify.shared.resource.colors import Color
 logger = logging.getLogger(__name__)
 
 
-class GroupNamespace:
+class BaseGroupNamespace(ABC):
+    """Room or zone control by name, wherever the groups are looked up.
+
+    Implemented by :class:`GroupNamespace` for one bridge and by
+    :class:`~hueify.multi.MultiGroupNamespace` for several. Every command
+    resolves its target through :meth:`from_name`.
+    """
+
+    @property
+    @abstractmethod
+    def names(self) -> list[str]:
+        """Names of all known groups."""
+
+    @property
+    @abstractmethod
+    def groups(self) -> list[GroupInfo]:
+        """Metadata (including children) of all known groups."""
+
+    @abstractmethod
+    def from_name(self, name: str) -> GroupedLights:
+        """Look up a group by name and return a :class:`~hueify.grouped_lights.GroupedLights` handle."""
+
+    @abstractmethod
+    def from_id(self, group_id: UUID) -> GroupedLights:
+        """Look up a group by Hue resource ID and return a :class:`~hueify.grouped_lights.GroupedLights` handle."""
+
+    async def turn_on(
+        self, name: str, transition_ms: int | None = None
+    ) -> ActionResult:
+        """Turn all lights in the named group on with an optional bridge-side fade."""
+        group = self.from_name(name)
+        return await group.turn_on(transition_ms=transition_ms)
+
+    async def turn_off(
+        self, name: str, transition_ms: int | None = None
+    ) -> ActionResult:
+        """Turn all lights in the named group off with an optional bridge-side fade."""
+        group = self.from_name(name)
+        return await group.turn_off(transition_ms=transition_ms)
+
+    async def set_brightness(
+        self, name: str, percentage: float | int, transition_ms: int | None = None
+    ) -> ActionResult:
+        """Set the absolute brightness for all lights in the named group.
+
+        Args:
+            name: Group name.
+            percentage: Target brightness in ``[0, 100]``.
+            transition_ms: Optional bridge-side fade duration in milliseconds.
+        """
+        group = self.from_name(name)
+        return await group.set_brightness(percentage, transition_ms=transition_ms)
+
+    async def increase_brightness(
+        self, name: str, percentage: float | int, transition_ms: int | None = None
+    ) -> ActionResult:
+        """Increase brightness of the named group by a relative amount.
+
+        Args:
+            name: Group name.
+            percentage: Percentage points to add.
+            transition_ms: Optional bridge-side fade duration in milliseconds.
+        """
+        group = self.from_name(name)
+        return await group.increase_brightness(percentage, transition_ms=transition_ms)
+
+    async def decrease_brightness(
+        self, name: str, percentage: float | int, transition_ms: int | None = None
+    ) -> ActionResult:
+        """Decrease brightness of the named group by a relative amount.
+
+        Args:
+            name: Group name.
+            percentage: Percentage points to subtract.
+            transition_ms: Optional bridge-side fade duration in milliseconds.
+        """
+        group = self.from_name(name)
+        return await group.decrease_brightness(percentage, transition_ms=transition_ms)
+
+    async def set_color_temperature(
+        self, name: str, percentage: float | int, transition_ms: int | None = None
+    ) -> ActionResult:
+        """Set the colour temperature for all lights in the named group.
+
+        Args:
+            name: Group name.
+            percentage: ``0`` = warmest white, ``100`` = coolest.
+            transition_ms: Optional bridge-side fade duration in milliseconds.
+        """
+        group = self.from_name(name)
+        return await group.set_color_temperature(
+            percentage, transition_ms=transition_ms
+        )
+
+    async def set_color(
+        self, name: str, r: int, g: int, b: int, transition_ms: int | None = None
+    ) -> ActionResult:
+        """Set the colour of all lights in the named group using sRGB values.
+
+        Args:
+            name: Group name.
+            r: Red channel in ``[0, 255]``.
+            g: Green channel in ``[0, 255]``.
+            b: Blue channel in ``[0, 255]``.
+            transition_ms: Optional bridge-side fade duration in milliseconds.
+        """
+        group = self.from_name(name)
+        return await group.set_color(r, g, b, transition_ms=transition_ms)
+
+    async def set_named_color(
+        self, name: str, color: Color, transition_ms: int | None = None
+    ) -> ActionResult:
+        """Set the colour of all lights in the named group to a predefined :class:`~hueify.shared.resource.Color`.
+
+        Args:
+            name: Group name.
+            color: Named colour constant, e.g. ``Color.WARM_WHITE``.
+            transition_ms: Optional bridge-side fade duration in milliseconds.
+        """
+        group = self.from_name(name)
+        return await group.set_named_color(color, transition_ms=transition_ms)
+
+    async def set_state(
+        self,
+        name: str,
+        *,
+        on: bool | None = None,
+        brightness: float | int | None = None,
+        color: Color | tuple[int, int, int] | None = None,
+        mirek: int | None = None,
+        transition_ms: int | None = None,
+    ) -> ActionResult:
+        """Apply several state changes to the named group in one request.
+
+        See :meth:`~hueify.shared.resource.Resource.set_state` for the
+        meaning of each field.
+        """
+        group = self.from_name(name)
+        return await group.set_state(
+            on=on,
+            brightness=brightness,
+            color=color,
+            mirek=mirek,
+            transition_ms=transition_ms,
+        )
+
+    def get_brightness(self, name: str) -> float:
+        """Return the current brightness of the named group as a percentage."""
+        group = self.from_name(name)
+        return group.brightness_percentage
+
+    def scene_names(self, name: str) -> list[str]:
+        """Return the names of all scenes available for the named group."""
+        group = self.from_name(name)
+        return group.scene_names
+
+    async def activate_scene(
+        self, name: str, scene_name: str, transition_ms: int | None = None
+    ) -> ActionResult:
+        """Activate a scene for the named group.
+
+        Args:
+            name: Group name.
+            scene_name: Scene name (case-insensitive).
+            transition_ms: Optional bridge-side fade duration in milliseconds.
+
+        Raises:
+            :class:`~hueify.exceptions.ResourceNotFoundException`: When the
+                scene is not found for this group.
+        """
+        group = self.from_name(name)
+        return await group.activate_scene(scene_name, transition_ms=transition_ms)
+
+
+class GroupNamespace(BaseGroupNamespace):
     """Base namespace for room- and zone-level grouped-light control.
 
     Subclassed by :class:`~hueify.grouped_lights.RoomNamespace` and
@@ -42,6 +217,11 @@ class GroupNamespace:
         """Names of all groups currently known to the bridge."""
         return [g.metadata.name for g in self._group_cache.get_all()]
 
+    @property
+    def groups(self) -> list[GroupInfo]:
+        """Metadata (including children) of all groups currently known to the bridge."""
+        return self._group_cache.get_all()
+
     def from_name(self, name: str) -> GroupedLights:
         """Look up a group by name and return a :class:`~hueify.grouped_lights.GroupedLights` handle.
 
@@ -117,105 +297,3 @@ class GroupNamespace:
             scene_cache=self._scene_cache,
             cache=self._grouped_light_cache,
         )
-
-    async def turn_on(self, name: str) -> ActionResult:
-        """Turn all lights in the named group on."""
-        group = self.from_name(name)
-        return await group.turn_on()
-
-    async def turn_off(self, name: str) -> ActionResult:
-        """Turn all lights in the named group off."""
-        group = self.from_name(name)
-        return await group.turn_off()
-
-    async def set_brightness(self, name: str, percentage: float | int) -> ActionResult:
-        """Set the absolute brightness for all lights in the named group.
-
-        Args:
-            name: Group name.
-            percentage: Target brightness in ``[0, 100]``.
-        """
-        group = self.from_name(name)
-        return await group.set_brightness(percentage)
-
-    async def increase_brightness(
-        self, name: str, percentage: float | int
-    ) -> ActionResult:
-        """Increase brightness of the named group by a relative amount.
-
-        Args:
-            name: Group name.
-            percentage: Percentage points to add.
-        """
-        group = self.from_name(name)
-        return await group.increase_brightness(percentage)
-
-    async def decrease_brightness(
-        self, name: str, percentage: float | int
-    ) -> ActionResult:
-        """Decrease brightness of the named group by a relative amount.
-
-        Args:
-            name: Group name.
-            percentage: Percentage points to subtract.
-        """
-        group = self.from_name(name)
-        return await group.decrease_brightness(percentage)
-
-    async def set_color_temperature(
-        self, name: str, percentage: float | int
-    ) -> ActionResult:
-        """Set the colour temperature for all lights in the named group.
-
-        Args:
-            name: Group name.
-            percentage: ``0`` = warmest white, ``100`` = coolest.
-        """
-        group = self.from_name(name)
-        return await group.set_color_temperature(percentage)
-
-    async def set_color(self, name: str, r: int, g: int, b: int) -> ActionResult:
-        """Set the colour of all lights in the named group using sRGB values.
-
-        Args:
-            name: Group name.
-            r: Red channel in ``[0, 255]``.
-            g: Green channel in ``[0, 255]``.
-            b: Blue channel in ``[0, 255]``.
-        """
-        group = self.from_name(name)
-        return await group.set_color(r, g, b)
-
-    async def set_named_color(self, name: str, color: Color) -> ActionResult:
-        """Set the colour of all lights in the named group to a predefined :class:`~hueify.shared.resource.Color`.
-
-        Args:
-            name: Group name.
-            color: Named colour constant, e.g. ``Color.WARM_WHITE``.
-        """
-        group = self.from_name(name)
-        return await group.set_named_color(color)
-
-    def get_brightness(self, name: str) -> float:
-        """Return the current brightness of the named group as a percentage."""
-        group = self.from_name(name)
-        return group.brightness_percentage
-
-    def scene_names(self, name: str) -> list[str]:
-        """Return the names of all scenes available for the named group."""
-        group = self.from_name(name)
-        return group.scene_names
-
-    async def activate_scene(self, name: str, scene_name: str) -> ActionResult:
-        """Activate a scene for the named group.
-
-        Args:
-            name: Group name.
-            scene_name: Scene name (case-insensitive).
-
-        Raises:
-            :class:`~hueify.exceptions.ResourceNotFoundException`: When the
-                scene is not found for this group.
-        """
-        group = self.from_name(name)
-        return await group.activate_scene(scene_name)
@@ -61,7 +61,9 @@ class GroupedLights(Resource[GroupedLightInfo]):
         return next((s for s in self._list_scenes() if s.is_active), None)
 
     @timed()
-    async def activate_scene(self, scene_name: str) -> ActionResult:
+    async def activate_scene(
+        self, scene_name: str, transition_ms: int | None = None
+    ) -> ActionResult:
         """Activate a scene by name.
 
         Matching is case-insensitive. If the exact name is not found,
@@ -69,6 +71,7 @@ class GroupedLights(Resource[GroupedLightInfo]):
 
         Args:
             scene_name: Name of the scene to activate.
+            transition_ms: Optional bridge-side fade duration in milliseconds.
 
         Raises:
             :class:`~hueify.exceptions.ResourceNotFoundException`: When the
@@ -77,7 +80,7 @@ class GroupedLights(Resource[GroupedLightInfo]):
         scenes = self._list_scenes()
         scene_info = self._resolve_scene(scene_name, scenes)
         scene = Scene(scene_info=scene_info, client=self._client)
-        return await scene.activate()
+        return await scene.activate(transition_ms=transition_ms)
 
     def _list_scenes(self) -> list[SceneInfo]:
         if self._scene_cache is None or self._group_info is None:
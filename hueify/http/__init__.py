@@ -1,5 +1,46 @@
-from .client import HttpClient
+from typing import TYPE_CHECKING
+
+from hueify._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import HttpClient
+    from .ratelimit import RateLimiter
+    from .retry import CircuitBreaker, CircuitState, RetryBudget, RetryPolicy
+    from .tracing import (
+        RequestHook,
+        RequestTrace,
+        SlowRequestLogger,
+        correlation_scope,
+        current_correlation_id,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CircuitBreaker": ".retry",
+        "CircuitState": ".retry",
+        "HttpClient": ".client",
+        "RateLimiter": ".ratelimit",
+        "RequestHook": ".tracing",
+        "RequestTrace": ".tracing",
+        "RetryBudget": ".retry",
+        "RetryPolicy": ".retry",
+        "SlowRequestLogger": ".tracing",
+        "correlation_scope": ".tracing",
+        "current_correlation_id": ".tracing",
+    },
+)
 
 __all__ = [
+    "CircuitBreaker",
+    "CircuitState",
     "HttpClient",
+    "RateLimiter",
+    "RequestHook",
+    "RequestTrace",
+    "RetryBudget",
+    "RetryPolicy",
+    "SlowRequestLogger",
+    "correlation_scope",
+    "current_correlation_id",
 ]
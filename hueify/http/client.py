@@ -1,29 +1,87 @@
-from typing import TypeVar
+import asyncio
+import logging
+import re
+import time
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import httpx
 from pydantic import BaseModel, TypeAdapter
 
-from hueify.credentials import HueBridgeCredentials
+from hueify.exceptions import BridgeUnavailableException
+from hueify.http.ratelimit import RateLimiter
+from hueify.http.retry import (
+    CircuitBreaker,
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_after,
+)
 from hueify.http.schemas import ApiResponse, HueApiResponse
+from hueify.http.tracing import (
+    RequestHook,
+    RequestTrace,
+    current_correlation_id,
+    new_correlation_id,
+)
+from hueify.metrics.instruments import (
+    HTTP_CIRCUIT_REJECTED,
+    HTTP_COALESCED,
+    HTTP_ERRORS,
+    HTTP_IN_FLIGHT,
+    HTTP_REQUEST_DURATION,
+    HTTP_RETRIES,
+    HTTP_RETRIES_SUPPRESSED,
+    HTTP_THROTTLED,
+)
+
+if TYPE_CHECKING:
+    from hueify.credentials import HueBridgeCredentials
 
 T = TypeVar("T", bound=BaseModel)
 
+logger = logging.getLogger(__name__)
+
+_RESOURCE_ID = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+_TOO_MANY_REQUESTS = 429
+_SERVICE_UNAVAILABLE = 503
+
 
 class HttpClient:
     _HUE_API_BASE_PATH = "/clip/v2/resource"
 
     def __init__(
         self,
-        credentials: HueBridgeCredentials,
+        credentials: "HueBridgeCredentials",
         timeout: float = 10.0,
         verify_ssl: bool = False,
+        bridge_url: str | None = None,
+        hooks: Sequence[RequestHook] = (),
+        *,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        single_flight: bool = True,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
-        self._base_url = f"https://{credentials.hue_bridge_ip}{self._HUE_API_BASE_PATH}"
+        bridge_url = bridge_url or f"https://{credentials.hue_bridge_ip}"
+        self._base_url = f"{bridge_url.rstrip('/')}{self._HUE_API_BASE_PATH}"
         self._headers = {
             "hue-application-key": credentials.hue_app_key,
             "Content-Type": "application/json",
         }
         self._client = httpx.AsyncClient(timeout=timeout, verify=verify_ssl, http2=True)
+        self._hooks = list(hooks)
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._retry_budget = RetryBudget(
+            ratio=self._retry_policy.budget_ratio,
+            min_per_second=self._retry_policy.budget_min_per_second,
+        )
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._single_flight = single_flight
+        self._in_flight: dict[tuple[str, str], asyncio.Future[httpx.Response]] = {}
+        self._coalesced_requests = 0
+        self._rate_limiter = rate_limiter
 
     async def __aenter__(self):
         return self
@@ -32,30 +90,18 @@ class HttpClient:
         await self.close()
 
     async def get(self, endpoint: str) -> ApiResponse:
-        response = await self._client.get(
-            f"{self._base_url}/{self._normalize_endpoint(endpoint)}",
-            headers=self._headers,
-        )
-        response.raise_for_status()
+        response = await self._request("GET", endpoint)
         return response.json()
 
     async def get_resources(self, endpoint: str, resource_type: type[T]) -> list[T]:
-        response = await self._client.get(
-            f"{self._base_url}/{self._normalize_endpoint(endpoint)}",
-            headers=self._headers,
-        )
-        response.raise_for_status()
+        response = await self._request("GET", endpoint)
 
         adapter = TypeAdapter(HueApiResponse[resource_type])
         api_response = adapter.validate_python(response.json())
         return api_response.data
 
     async def get_resource(self, endpoint: str, resource_type: type[T]) -> T:
-        response = await self._client.get(
-            f"{self._base_url}/{self._normalize_endpoint(endpoint)}",
-            headers=self._headers,
-        )
-        response.raise_for_status()
+        response = await self._request("GET", endpoint)
 
         adapter = TypeAdapter(HueApiResponse[resource_type])
         api_response = adapter.validate_python(response.json())
@@ -64,12 +110,9 @@ class HttpClient:
     async def put(
         self, endpoint: str, data: BaseModel, resource_type: type[T] | None = None
     ) -> ApiResponse | T:
-        response = await self._client.put(
-            f"{self._base_url}/{self._normalize_endpoint(endpoint)}",
-            headers=self._headers,
-            json=data.model_dump(mode="json", exclude_none=True),
+        response = await self._request(
+            "PUT", endpoint, json=data.model_dump(mode="json", exclude_none=True)
         )
-        response.raise_for_status()
 
         if resource_type is not None:
             adapter = TypeAdapter(HueApiResponse[resource_type])
@@ -81,5 +124,193 @@ class HttpClient:
     async def close(self) -> None:
         await self._client.aclose()
 
+    def rebase(self, bridge_url: str) -> None:
+        """Send all further requests to ``bridge_url``, e.g. after the bridge moved.
+
+        Hooks, retry state and rate limits are kept. The circuit breaker is
+        closed, since its failures were counted against the old address.
+        """
+        self._base_url = f"{bridge_url.rstrip('/')}{self._HUE_API_BASE_PATH}"
+        self._circuit_breaker.record_success()
+        logger.info(f"Sending bridge requests to {bridge_url}")
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        return self._circuit_breaker
+
+    @property
+    def coalesced_requests(self) -> int:
+        """GETs that shared the response of an identical request in flight."""
+        return self._coalesced_requests
+
+    def add_hook(self, hook: RequestHook) -> None:
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        self._hooks.remove(hook)
+
+    async def _request(
+        self, method: str, endpoint: str, json: ApiResponse | None = None
+    ) -> httpx.Response:
+        endpoint = self._normalize_endpoint(endpoint)
+        if method != "GET" or not self._single_flight:
+            return await self._request_with_retries(method, endpoint, json)
+
+        # Concurrent identical GETs share one request. The shared task is
+        # shielded so that a cancelled caller does not cancel it for the others.
+        key = (method, endpoint)
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self._coalesced_requests += 1
+            HTTP_COALESCED.inc(endpoint=_RESOURCE_ID.sub("{id}", endpoint))
+            return await asyncio.shield(in_flight)
+
+        task = asyncio.ensure_future(self._request_with_retries(method, endpoint))
+        self._in_flight[key] = task
+        task.add_done_callback(lambda t: self._forget_in_flight(key, t))
+        return await asyncio.shield(task)
+
+    def _forget_in_flight(
+        self, key: tuple[str, str], task: asyncio.Future[httpx.Response]
+    ) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller went away.
+            task.exception()
+
+    async def _request_with_retries(
+        self, method: str, endpoint: str, json: ApiResponse | None = None
+    ) -> httpx.Response:
+        metric_endpoint = _RESOURCE_ID.sub("{id}", endpoint)
+        correlation_id = current_correlation_id() or new_correlation_id()
+        idempotent = self._retry_policy.is_idempotent(method, json)
+        self._retry_budget.deposit()
+
+        attempt = 1
+        while True:
+            if method == "PUT" and self._rate_limiter is not None:
+                await self._rate_limiter.acquire(endpoint)
+            if not self._circuit_breaker.allow_request():
+                HTTP_CIRCUIT_REJECTED.inc()
+                raise BridgeUnavailableException(self._circuit_breaker.retry_in)
+
+            trace = RequestTrace(
+                correlation_id=correlation_id,
+                method=method,
+                endpoint=metric_endpoint,
+                attempt=attempt,
+            )
+            try:
+                return await self._send(trace, endpoint, json)
+            except httpx.TransportError:
+                retryable = idempotent and self._retry_policy.retry_on_transport_errors
+                delay = self._retry_delay(trace, retryable, retry_after=None)
+                reason = "transport"
+                if delay is None:
+                    raise
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                retryable = (
+                    idempotent and status_code in self._retry_policy.retry_statuses
+                )
+                delay = self._retry_delay(
+                    trace, retryable, retry_after=parse_retry_after(e.response.headers)
+                )
+                reason = str(status_code)
+                if delay is None:
+                    raise
+
+            HTTP_RETRIES.inc(method=method, endpoint=metric_endpoint, reason=reason)
+            logger.info(
+                f"Retrying {method} {metric_endpoint} in {delay:.2f}s "
+                f"(attempt {attempt + 1}/{self._retry_policy.max_attempts}, {reason})"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(
+        self, trace: RequestTrace, retryable: bool, retry_after: float | None
+    ) -> float | None:
+        policy = self._retry_policy
+        if not retryable or trace.attempt >= policy.max_attempts:
+            return None
+        if retry_after is not None and retry_after > policy.max_retry_after:
+            logger.warning(
+                f"Bridge asked to retry {trace.method} {trace.endpoint} after "
+                f"{retry_after:.1f}s, more than the {policy.max_retry_after:.1f}s allowed"
+            )
+            return None
+        if not self._retry_budget.try_withdraw():
+            HTTP_RETRIES_SUPPRESSED.inc(method=trace.method, endpoint=trace.endpoint)
+            logger.warning(
+                f"Retry budget exhausted, not retrying {trace.method} {trace.endpoint}"
+            )
+            return None
+        return retry_after if retry_after is not None else policy.backoff(trace.attempt)
+
+    async def _send(
+        self, trace: RequestTrace, endpoint: str, json: ApiResponse | None
+    ) -> httpx.Response:
+        method = trace.method
+        metric_endpoint = trace.endpoint
+        kwargs: dict[str, Any] = {"headers": self._headers}
+        if method == "PUT":
+            kwargs["json"] = json
+        if self._hooks:
+            kwargs["extensions"] = {"trace": self._trace_callback(trace)}
+            for hook in self._hooks:
+                hook.before_send(trace)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            send = self._client.put if method == "PUT" else self._client.get
+            response = await send(f"{self._base_url}/{endpoint}", **kwargs)
+        except httpx.HTTPError as e:
+            if isinstance(e, httpx.TransportError):
+                self._circuit_breaker.record_failure()
+            HTTP_ERRORS.inc(method=method, endpoint=metric_endpoint, status="0")
+            for hook in self._hooks:
+                hook.on_error(trace, e)
+            raise
+        finally:
+            trace.finished_at = time.perf_counter()
+            HTTP_IN_FLIGHT.dec()
+            HTTP_REQUEST_DURATION.observe(
+                trace.elapsed, method=method, endpoint=metric_endpoint
+            )
+
+        trace.status_code = response.status_code
+        if response.status_code == _SERVICE_UNAVAILABLE:
+            self._circuit_breaker.record_failure()
+        else:
+            self._circuit_breaker.record_success()
+        for hook in self._hooks:
+            hook.after_body(trace)
+
+        if response.status_code == _TOO_MANY_REQUESTS:
+            HTTP_THROTTLED.inc(method=method, endpoint=metric_endpoint)
+        if response.is_error:
+            HTTP_ERRORS.inc(
+                method=method,
+                endpoint=metric_endpoint,
+                status=str(response.status_code),
+            )
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            for hook in self._hooks:
+                hook.on_error(trace, e)
+            raise
+        return response
+
+    def _trace_callback(self, trace: RequestTrace):
+        async def on_trace_event(event_name: str, info: dict[str, Any]) -> None:
+            if trace.record(event_name) == "headers_received":
+                for hook in self._hooks:
+                    hook.after_headers(trace)
+
+        return on_trace_event
+
     def _normalize_endpoint(self, endpoint: str) -> str:
         return endpoint.lstrip("/")
@@ -0,0 +1,93 @@
+import asyncio
+import time
+from collections.abc import Callable
+
+from hueify.metrics.instruments import HTTP_RATE_LIMIT_WAIT
+
+_GROUP_RESOURCES = ("grouped_light", "scene")
+_LIGHT_RESOURCES = ("light",)
+
+
+class TokenBucket:
+    """Tokens refilled at ``rate`` per second, holding at most ``burst``."""
+
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float]) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._tokens = burst
+        self._updated_at = clock()
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """Take ``tokens`` if they are available now, without waiting."""
+        self._refill()
+        if self._tokens < tokens:
+            return False
+        self._tokens -= tokens
+        return True
+
+    def reserve(self) -> float:
+        """Take a token, returning how long the caller must wait for it.
+
+        Tokens may go negative: each waiting caller reserves its own slot, so
+        concurrent callers are spaced out in arrival order without a lock.
+        """
+        self._refill()
+        self._tokens -= 1
+        return max(0.0, -self._tokens / self._rate)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
+
+
+class RateLimiter:
+    """Paces writes to one bridge below the rates it can process.
+
+    Signify recommends at most about ten light commands and one grouped-light
+    command per second per bridge; beyond that the bridge queues, drops or
+    answers ``429``. Light and group writes (scene recalls count as group
+    writes) draw from separate token buckets. Reads are never delayed.
+
+    Each :class:`~hueify.Hueify` owns its own limiter, so with several
+    bridges the total throughput grows with the number of bridges.
+    """
+
+    def __init__(
+        self,
+        light_commands_per_second: float = 10.0,
+        group_commands_per_second: float = 1.0,
+        burst: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            light_commands_per_second: Sustained rate for ``light`` writes.
+            group_commands_per_second: Sustained rate for ``grouped_light``
+                writes and scene recalls.
+            burst: Writes of each kind that may go out back to back after an
+                idle period.
+            clock: Monotonic time source, replaceable in tests.
+        """
+        if light_commands_per_second <= 0 or group_commands_per_second <= 0:
+            raise ValueError("Command rates must be positive")
+        self._light_bucket = TokenBucket(light_commands_per_second, burst, clock)
+        self._group_bucket = TokenBucket(group_commands_per_second, burst, clock)
+
+    async def acquire(self, endpoint: str) -> None:
+        """Wait until a write to ``endpoint`` may be sent."""
+        resource_type = endpoint.lstrip("/").split("/", 1)[0]
+        if resource_type in _LIGHT_RESOURCES:
+            bucket = self._light_bucket
+        elif resource_type in _GROUP_RESOURCES:
+            bucket = self._group_bucket
+        else:
+            return
+
+        delay = bucket.reserve()
+        if delay > 0:
+            HTTP_RATE_LIMIT_WAIT.observe(delay, resource_type=resource_type)
+            await asyncio.sleep(delay)
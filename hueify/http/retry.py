@@ -0,0 +1,224 @@
+import logging
+import random
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_RELATIVE_SUFFIX = "_delta"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how often to retry a failed bridge request.
+
+    Only idempotent requests are retried: every ``GET``, and ``PUT`` bodies
+    that set absolute state. A ``PUT`` carrying a relative change (any
+    ``*_delta`` field such as ``dimming_delta``) would be applied twice if
+    the first attempt reached the bridge, so it is never retried.
+
+    Delays grow exponentially from ``base_delay`` up to ``max_delay`` with
+    full jitter. A ``Retry-After`` header from the bridge takes precedence;
+    if it asks for more than ``max_retry_after`` seconds the request fails
+    instead of waiting.
+
+    Attributes:
+        max_attempts: Total attempts including the first. ``1`` disables retries.
+        base_delay: Backoff before the first retry, in seconds.
+        max_delay: Upper bound for the exponential backoff, in seconds.
+        max_retry_after: Longest ``Retry-After`` the client is willing to honour.
+        jitter: Randomise each delay in ``[0, backoff]`` to spread out retries.
+        retry_statuses: Response status codes that are worth retrying.
+        retry_on_transport_errors: Retry connection failures and timeouts.
+        budget_ratio: Retries allowed per request on average, see
+            :class:`RetryBudget`.
+        budget_min_per_second: Retries always allowed per second, regardless
+            of traffic.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 2.0
+    max_retry_after: float = 10.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset({429, 503})
+    )
+    retry_on_transport_errors: bool = True
+    budget_ratio: float = 0.2
+    budget_min_per_second: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("Retry delays must not be negative")
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        return cls(max_attempts=1)
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retrying after ``attempt`` failed attempts."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def is_idempotent(self, method: str, json: Any = None) -> bool:
+        if method == "GET":
+            return True
+        return method == "PUT" and not _contains_relative_change(json)
+
+
+class RetryBudget:
+    """Token bucket that caps retries to a fraction of the request rate.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so
+    at most ``ratio`` retries per request happen on average. On top of that
+    ``min_per_second`` tokens trickle in, so a quiet client can still retry.
+    When the bridge is overloaded every request fails, the budget runs dry and
+    retries stop instead of multiplying the load.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        capacity: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ratio = ratio
+        self._min_per_second = min_per_second
+        self._capacity = capacity
+        self._clock = clock
+        self._balance = capacity
+        self._refilled_at = clock()
+
+    @property
+    def balance(self) -> float:
+        self._refill()
+        return self._balance
+
+    def deposit(self) -> None:
+        self._balance = min(self._capacity, self._balance + self._ratio)
+
+    def try_withdraw(self) -> bool:
+        self._refill()
+        if self._balance < 1:
+            return False
+        self._balance -= 1
+        return True
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._balance = min(
+            self._capacity, self._balance + elapsed * self._min_per_second
+        )
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fails requests fast while the bridge is unreachable.
+
+    After ``failure_threshold`` consecutive failures (connection errors,
+    timeouts, ``503``) the breaker opens and requests are rejected without
+    touching the network. Once ``reset_timeout`` seconds have passed a single
+    probe request is let through: success closes the breaker, failure opens
+    it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self.retry_in > 0:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed, ``0`` when not open."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._reset_timeout - self._clock())
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info("Hue Bridge reachable again, closing circuit breaker")
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._probe_in_flight or (
+            self._opened_at is None and self._failures >= self._failure_threshold
+        ):
+            logger.warning(
+                f"Opening circuit breaker after {self._failures} failure(s), "
+                f"retrying in {self._reset_timeout:.1f}s"
+            )
+            self._opened_at = self._clock()
+        self._probe_in_flight = False
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """Seconds to wait according to a ``Retry-After`` header, if present."""
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def _contains_relative_change(payload: Any) -> bool:
+    if isinstance(payload, dict):
+        return any(
+            key.endswith(_RELATIVE_SUFFIX) or _contains_relative_change(value)
+            for key, value in payload.items()
+        )
+    if isinstance(payload, list):
+        return any(_contains_relative_change(item) for item in payload)
+    return False
@@ -0,0 +1,161 @@
+import logging
+import random
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+_correlation_id: ContextVar[str | None] = ContextVar(
+    "hueify_correlation_id", default=None
+)
+
+# httpcore trace event (without its "http11." / "http2." prefix) -> phase mark
+_TRACE_MARKS = {
+    "connection.connect_tcp.started": "connect_started",
+    "connection.connect_tcp.complete": "connect_complete",
+    "connection.start_tls.started": "tls_started",
+    "connection.start_tls.complete": "tls_complete",
+    "send_request_headers.started": "request_started",
+    "send_request_body.complete": "request_sent",
+    "receive_response_headers.complete": "headers_received",
+    "receive_response_body.complete": "body_received",
+}
+
+
+def new_correlation_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+def current_correlation_id() -> str | None:
+    """Correlation id of the command currently running in this task, if any."""
+    return _correlation_id.get()
+
+
+@contextmanager
+def correlation_scope(correlation_id: str | None = None) -> Iterator[str]:
+    """Tag every bridge request made inside the block with one correlation id.
+
+    Nested scopes reuse the outer id unless an explicit one is given. Every
+    :class:`~hueify.ActionResult` created inside the scope carries the id.
+    """
+    outer = _correlation_id.get()
+    scoped_id = correlation_id or outer or new_correlation_id()
+    token = _correlation_id.set(scoped_id)
+    try:
+        yield scoped_id
+    finally:
+        _correlation_id.reset(token)
+
+
+@dataclass
+class RequestTrace:
+    """Timeline of one request to the bridge, in ``time.perf_counter()`` seconds.
+
+    ``marks`` holds the moments reported by the HTTP stack (connect, TLS,
+    request sent, headers and body received); phases that did not happen,
+    e.g. connecting on a reused connection, are absent.
+    """
+
+    correlation_id: str
+    method: str
+    endpoint: str
+    attempt: int = 1
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: float | None = None
+    status_code: int | None = None
+    marks: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def phases(self) -> dict[str, float]:
+        """Split the elapsed time into network, bridge and event-loop phases.
+
+        ``connect`` and ``tls`` are the network setup, ``server`` is the time
+        from the request being sent until the response headers arrived (the
+        bridge's own processing plus one round trip), ``body`` is reading the
+        response, and ``event_loop`` is the delay between the body arriving
+        and this coroutine actually resuming.
+        """
+        marks = self.marks
+        phases: dict[str, float] = {}
+        for name, start, end in (
+            ("connect", "connect_started", "connect_complete"),
+            ("tls", "tls_started", "tls_complete"),
+            ("server", "request_sent", "headers_received"),
+            ("body", "headers_received", "body_received"),
+        ):
+            if start in marks and end in marks:
+                phases[name] = marks[end] - marks[start]
+        if self.finished_at is not None and "body_received" in marks:
+            phases["event_loop"] = self.finished_at - marks["body_received"]
+        return phases
+
+    def record(self, event_name: str) -> str | None:
+        """Store the time of an httpcore trace event; returns the mark it set."""
+        name = (
+            event_name.split(".", 1)[1] if event_name.startswith("http") else event_name
+        )
+        mark = _TRACE_MARKS.get(name)
+        if mark is not None:
+            self.marks[mark] = time.perf_counter()
+        return mark
+
+
+class RequestHook:
+    """Lifecycle callbacks for requests made by :class:`~hueify.http.HttpClient`.
+
+    Subclass and override any of the methods; all are no-ops by default.
+    Hooks run inline on the request path, so keep them cheap.
+    """
+
+    def before_send(self, trace: RequestTrace) -> None:
+        pass
+
+    def after_headers(self, trace: RequestTrace) -> None:
+        pass
+
+    def after_body(self, trace: RequestTrace) -> None:
+        pass
+
+    def on_error(self, trace: RequestTrace, error: BaseException) -> None:
+        pass
+
+
+class SlowRequestLogger(RequestHook):
+    """Logs requests slower than ``threshold`` with their phase breakdown.
+
+    ``sample_rate`` (0-1) limits how many of the slow requests are logged,
+    which keeps the log readable during an outage.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        sample_rate: float = 1.0,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self._logger = logger or logging.getLogger("hueify.http.slow")
+
+    def after_body(self, trace: RequestTrace) -> None:
+        if trace.elapsed < self.threshold:
+            return
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+
+        breakdown = ", ".join(
+            f"{phase}={seconds * 1000:.1f}ms"
+            for phase, seconds in trace.phases().items()
+        )
+        self._logger.warning(
+            f"Slow request [{trace.correlation_id}] {trace.method} {trace.endpoint} "
+            f"-> {trace.status_code} took {trace.elapsed * 1000:.1f}ms"
+            f" (attempt {trace.attempt}; {breakdown or 'no phase data'})"
+        )
@@ -1,14 +1,14 @@
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from pathlib import Path
 from types import TracebackType
-from typing import Self, overload
+from typing import TYPE_CHECKING, Self, overload
 
 import httpx
 from pydantic import BaseModel
 
 from hueify.cache import ManagedCache
-from hueify.credentials import HueBridgeCredentials
 from hueify.grouped_lights import (
     GroupedLightCache,
     RoomCache,
@@ -16,23 +16,34 @@ from hueify.grouped_lights import (
     ZoneCache,
     ZoneNamespace,
 )
-from hueify.http import HttpClient
+from hueify.http import HttpClient, RateLimiter, RequestHook, RetryPolicy
 from hueify.light import LightCache, LightNamespace
-from hueify.onboarding.discovery import discover_bridges
+from hueify.metrics import MetricsRegistry, default_registry
+from hueify.metrics.instruments import BRIDGE_RECONNECTS, CACHE_POPULATE_DURATION
+from hueify.profiling import EventProfiler
 from hueify.scenes import SceneCache
 from hueify.scenes.namespace import SceneNamespace
+from hueify.sensors import SensorCache, SensorNamespace
 from hueify.shared.decorators import timed
-from hueify.sse import EventBus, ServerSentEventStream
+from hueify.shared.resource import WriteSuppression
+from hueify.sse import EventBus, ServerSentEventStream, SseRecorder
 from hueify.sse.bus import EventHandler
 
+if TYPE_CHECKING:
+    from hueify.animation import AnimationNamespace
+    from hueify.credentials import HueBridgeCredentials
+    from hueify.entertainment import EntertainmentNamespace
+    from hueify.onboarding import BridgeCache, DiscoveredBridge
+
 logger = logging.getLogger(__name__)
 
 
 class Hueify:
     """Async client for the Philips Hue local API.
 
-    Wraps the Hue Bridge REST API and SSE event stream behind three
-    high-level namespaces: :attr:`lights`, :attr:`rooms`, and :attr:`zones`.
+    Wraps the Hue Bridge REST API and SSE event stream behind high-level
+    namespaces such as :attr:`lights`, :attr:`rooms`, :attr:`zones` and
+    :attr:`sensors`.
     All resource state is kept in in-memory caches that are populated on
     :meth:`connect` and kept live via server-sent events.
 
@@ -46,12 +57,22 @@ class Hueify:
 
     Credentials are read from the ``HUE_BRIDGE_IP`` and ``HUE_APP_KEY``
     environment variables when ``bridge_ip`` / ``app_key`` are omitted.
+    ``HUE_BRIDGE_ID`` pins the client to one bridge across address changes,
+    see :meth:`reconnect`.
     """
 
     def __init__(
         self,
         bridge_ip: str | None = None,
         app_key: str | None = None,
+        *,
+        bridge_id: str | None = None,
+        bridge_url: str | None = None,
+        record_events_to: str | Path | None = None,
+        request_hooks: Sequence[RequestHook] = (),
+        retry_policy: RetryPolicy | None = None,
+        write_suppression: WriteSuppression | None = None,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
         """
         Args:
@@ -59,14 +80,52 @@ class Hueify:
                 ``HUE_BRIDGE_IP`` environment variable when ``None``.
             app_key: Hue application key. Falls back to the ``HUE_APP_KEY``
                 environment variable when ``None``.
+            bridge_id: Id of the bridge the app key belongs to. Falls back to
+                the ``HUE_BRIDGE_ID`` environment variable. :meth:`reconnect`
+                only ever switches to this bridge.
+            bridge_url: Base URL (scheme, host and port) to reach the bridge
+                at instead of ``https://<bridge_ip>``, e.g. a
+                :class:`~hueify.testing.FakeHueBridge`.
+            record_events_to: Append every raw event-stream payload to this
+                file for later :func:`~hueify.sse.replay_recording`.
+            request_hooks: Lifecycle hooks for every bridge request, e.g.
+                :class:`~hueify.http.SlowRequestLogger`.
+            retry_policy: How to retry throttled or failed idempotent requests.
+                Defaults to :class:`~hueify.http.RetryPolicy` with three
+                attempts; pass :meth:`~hueify.http.RetryPolicy.disabled` to
+                surface every failure immediately.
+            write_suppression: Tolerances for skipping light updates that the
+                cache says are already in effect. Defaults to
+                :class:`~hueify.shared.resource.WriteSuppression`; pass
+                :meth:`~hueify.shared.resource.WriteSuppression.disabled` to
+                send every update.
+            rate_limiter: Client-side pacing of writes to this bridge, see
+                :class:`~hueify.http.RateLimiter`. ``None`` sends writes as
+                fast as they are issued.
         """
         logger.debug(f"Initializing Hueify with bridge_ip={bridge_ip}")
-        self._credentials = self._resolve_credentials(bridge_ip, app_key)
-
-        self._http_client = HttpClient(self._credentials)
+        self._credentials = self._resolve_credentials(bridge_ip, app_key, bridge_id)
+        self._bridge_url = bridge_url or f"https://{self._credentials.hue_bridge_ip}"
+
+        self._request_hooks = list(request_hooks)
+        self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._http_client = HttpClient(
+            self._credentials,
+            bridge_url=bridge_url,
+            hooks=self._request_hooks,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+        )
         self._event_bus = EventBus()
+        self._recorder = (
+            SseRecorder(record_events_to) if record_events_to is not None else None
+        )
         self._event_stream = ServerSentEventStream(
-            credentials=self._credentials, event_bus=self._event_bus
+            credentials=self._credentials,
+            event_bus=self._event_bus,
+            bridge_url=bridge_url,
+            recorder=self._recorder,
         )
         self._stream_task: asyncio.Task | None = None
 
@@ -75,6 +134,7 @@ class Hueify:
         self._room_cache = RoomCache()
         self._zone_cache = ZoneCache()
         self._scene_cache = SceneCache(self._event_bus)
+        self._sensor_cache = SensorCache(self._event_bus)
 
         self._caches: list[ManagedCache] = [
             self._light_cache,
@@ -82,10 +142,13 @@ class Hueify:
             self._room_cache,
             self._zone_cache,
             self._scene_cache,
+            self._sensor_cache,
         ]
 
         self._lights = LightNamespace(
-            light_cache=self._light_cache, http_client=self._http_client
+            light_cache=self._light_cache,
+            http_client=self._http_client,
+            write_suppression=write_suppression or WriteSuppression(),
         )
         self._scenes = SceneNamespace(
             scene_cache=self._scene_cache, http_client=self._http_client
@@ -102,8 +165,56 @@ class Hueify:
             http_client=self._http_client,
             scene_cache=self._scene_cache,
         )
+        self._sensors = SensorNamespace(
+            sensor_cache=self._sensor_cache, room_cache=self._room_cache
+        )
+        # Built on first access: most sessions never animate or stream.
+        self._animations: AnimationNamespace | None = None
+        self._entertainment: EntertainmentNamespace | None = None
+        self._profiler = EventProfiler()
         logger.info("Hueify initialized successfully")
 
+    @property
+    def animations(self) -> "AnimationNamespace":
+        """Namespace for keyframe animations. See :class:`~hueify.animation.AnimationNamespace`."""
+        if self._animations is None:
+            from hueify.animation import AnimationNamespace
+
+            self._animations = AnimationNamespace(
+                light_cache=self._light_cache,
+                lights=self._lights,
+                rooms=self._rooms,
+                zones=self._zones,
+            )
+        return self._animations
+
+    @property
+    def entertainment(self) -> "EntertainmentNamespace":
+        """Namespace for entertainment streaming. See :class:`~hueify.entertainment.EntertainmentNamespace`."""
+        if self._entertainment is None:
+            from hueify.entertainment import EntertainmentNamespace
+
+            self._entertainment = EntertainmentNamespace(http_client=self._http_client)
+        return self._entertainment
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Latency histograms, counters and gauges recorded by this process.
+
+        See :mod:`hueify.metrics` for exporters (Prometheus text format,
+        OpenTelemetry).
+        """
+        return default_registry
+
+    @property
+    def profiler(self) -> EventProfiler:
+        """Opt-in event-loop lag and event-handler profiler.
+
+        Nothing is recorded until :meth:`~hueify.profiling.EventProfiler.start`
+        is called. See :class:`~hueify.profiling.EventProfiler`.
+        """
+        return self._profiler
+
     @property
     def scenes(self) -> SceneNamespace:
         """Namespace for bridge-wide scene lookup and activation. See :class:`~hueify.scenes.SceneNamespace`."""
@@ -119,6 +230,11 @@ class Hueify:
         """Namespace for room-level grouped-light and scene control. See :class:`~hueify.grouped_lights.RoomNamespace`."""
         return self._rooms
 
+    @property
+    def sensors(self) -> SensorNamespace:
+        """Namespace for live sensor readings. See :class:`~hueify.sensors.SensorNamespace`."""
+        return self._sensors
+
     @property
     def lights(self) -> LightNamespace:
         """Namespace for individual light control. See :class:`~hueify.light.LightNamespace`."""
@@ -128,12 +244,18 @@ class Hueify:
         self,
         bridge_ip: str | None,
         app_key: str | None,
-    ) -> HueBridgeCredentials:
+        bridge_id: str | None,
+    ) -> "HueBridgeCredentials":
+        # pydantic-settings is only needed once credentials are resolved.
+        from hueify.credentials import HueBridgeCredentials
+
         credential_overrides = {}
         if bridge_ip is not None:
             credential_overrides["hue_bridge_ip"] = bridge_ip
         if app_key is not None:
             credential_overrides["hue_app_key"] = app_key
+        if bridge_id is not None:
+            credential_overrides["hue_bridge_id"] = bridge_id
         if credential_overrides:
             return HueBridgeCredentials(**credential_overrides)
         return HueBridgeCredentials()
@@ -170,37 +292,104 @@ class Hueify:
         logger.info("Caches populated successfully")
 
     async def _populate_caches(self) -> None:
-        await asyncio.gather(*[c.populate(self._http_client) for c in self._caches])
+        await asyncio.gather(*[self._populate_cache(c) for c in self._caches])
         logger.info("Caches populated successfully")
 
+    async def _populate_cache(self, cache: ManagedCache) -> None:
+        with CACHE_POPULATE_DURATION.time(cache=type(cache).__name__):
+            await cache.populate(self._http_client)
+
     async def _reconnect_after_discovery(self) -> None:
         logger.warning(
             "Connection to Hue Bridge at %s timed out — starting automatic bridge discovery.",
             self._credentials.hue_bridge_ip,
         )
+        await self.reconnect()
 
-        if self._stream_task and not self._stream_task.done():
-            self._stream_task.cancel()
+    async def reconnect(self) -> None:
+        """Find the bridge again after its address changed and switch to it.
 
-        bridges = await discover_bridges()
-        discovered_ip = bridges[0].internalipaddress
-        logger.warning(
-            "Discovered Hue Bridge at %s — reconnecting.",
-            discovered_ip,
-        )
+        The bridge is identified by ``HUE_BRIDGE_ID`` or, failing that, by the
+        id :class:`~hueify.onboarding.BridgeCache` recorded for the current
+        address. Its last-known address is tried first, then local discovery,
+        then the cloud endpoint. Without any id the first bridge found is used.
 
-        await self._http_client.close()
-        self._credentials = HueBridgeCredentials(
-            hue_bridge_ip=discovered_ip,
-            hue_app_key=self._credentials.hue_app_key,
-        )
-        self._http_client = HttpClient(self._credentials)
-        self._event_stream = ServerSentEventStream(
-            credentials=self._credentials, event_bus=self._event_bus
+        The HTTP client and event stream are pointed at the new address in
+        place, so namespaces, caches, event handlers and light handles stay
+        valid. Caches are refreshed to pick up changes missed while the
+        bridge was unreachable.
+
+        Raises:
+            BridgeNotFoundException: When the pinned bridge cannot be found.
+        """
+        from hueify.onboarding import BridgeCache
+
+        cache = BridgeCache()
+        bridge = await self._locate_bridge(cache)
+        authority = bridge.internalipaddress
+        if bridge.port is not None:
+            authority = f"{authority}:{bridge.port}"
+        bridge_url = f"{httpx.URL(self._bridge_url).scheme}://{authority}"
+        logger.warning(f"Found Hue Bridge {bridge.id} at {authority} — reconnecting.")
+
+        BRIDGE_RECONNECTS.inc()
+        self._event_stream.disconnect()
+        if self._stream_task and not self._stream_task.done():
+            self._stream_task.cancel()
+        self._credentials = self._credentials.model_copy(
+            update={
+                "hue_bridge_ip": bridge.internalipaddress,
+                "hue_bridge_id": bridge.id,
+            }
         )
+        self._bridge_url = bridge_url
+        self._http_client.rebase(bridge_url)
+        self._event_stream.rebase(bridge_url)
         self._stream_task = asyncio.create_task(self._event_stream.connect())
         await self._populate_caches()
 
+    async def _locate_bridge(self, cache: "BridgeCache") -> "DiscoveredBridge":
+        from hueify.exceptions import BridgeNotFoundException
+        from hueify.onboarding import (
+            discover_bridges,
+            discover_bridges_locally,
+            probe_bridges,
+        )
+
+        bridge_id = self._credentials.hue_bridge_id
+        if bridge_id is None:
+            known = cache.find_by_ip(self._credentials.hue_bridge_ip)
+            bridge_id = known.id if known is not None else None
+
+        if bridge_id is not None:
+            last = cache.get(bridge_id)
+            current = httpx.URL(self._bridge_url)
+            if last is not None and (last.internalipaddress, last.port) != (
+                current.host,
+                current.port,
+            ):
+                # Usually the bridge is still where discovery last saw it.
+                found = await probe_bridges(
+                    [last.internalipaddress], bridge_id=bridge_id, port=last.port
+                )
+                cache.remember(found)
+                bridge = next((b for b in found if b.id == bridge_id), None)
+                if bridge is not None:
+                    return bridge
+
+        bridges = await discover_bridges_locally(bridge_id=bridge_id, cache=cache)
+        if bridge_id is not None:
+            bridges = [b for b in bridges if b.id == bridge_id]
+        if not bridges:
+            logger.warning("No bridge answered locally — asking the cloud endpoint.")
+            bridges = await discover_bridges()
+            cache.remember(bridges)
+            if bridge_id is not None:
+                bridges = [b for b in bridges if b.id == bridge_id]
+        if not bridges and bridge_id is not None:
+            raise BridgeNotFoundException(bridge_id)
+        return bridges[0]
+
     async def close(self) -> None:
         """Disconnect from the Hue Bridge and release all resources.
 
@@ -216,6 +405,9 @@ class Hueify:
             logger.debug("Event stream task cancelled")
 
         await self._http_client.close()
+        if self._recorder is not None:
+            self._recorder.close()
+        self._profiler.stop()
         self._clear_caches()
 
     def _clear_caches(self) -> None:
@@ -1,9 +1,10 @@
 from .cache import LightCache
-from .namespace import LightNamespace
+from .namespace import BaseLightNamespace, LightNamespace
 from .service import Light
 from .views import LightInfo
 
 __all__ = [
+    "BaseLightNamespace",
     "Light",
     "LightCache",
     "LightInfo",
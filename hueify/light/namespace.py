@@ -1,142 +1,133 @@
 import logging
+from abc import ABC, abstractmethod
 from uuid import UUID
 
 from hueify.exceptions import ResourceNotFoundException
 from hueify.http import HttpClient
 from hueify.light.cache import LightCache
 from hueify.light.service import Light
-from hueify.shared.resource import ActionResult
+from hueify.light.views import LightInfo
+from hueify.shared.resource import ActionResult, WriteSuppression
 from hueify.shared.resource.colors import Color
 
 logger = logging.getLogger(__name__)
 
 
-class LightNamespace:
-    """Entry point for controlling individual lights.
-
-    Accessible as :attr:`Hueify.lights <hueify.service.Hueify.lights>`.
-    All name lookups accept the exact configured light name (case-insensitive
-    matching is handled by the cache layer).
+class BaseLightNamespace(ABC):
+    """Light control by name, wherever the lights are looked up.
 
-    ```python
-    async with Hueify() as hue:
-        await hue.lights.turn_on("Desk")
-        await hue.lights.set_brightness("Desk", 60)
-    ```
+    Implemented by :class:`~hueify.light.LightNamespace` for one bridge and
+    by :class:`~hueify.multi.MultiLightNamespace` for several. Every command
+    resolves its target through :meth:`from_name`.
     """
 
-    def __init__(self, light_cache: LightCache, http_client: HttpClient) -> None:
-        self._light_cache = light_cache
-        self._http_client = http_client
-
     @property
+    @abstractmethod
     def names(self) -> list[str]:
-        """Names of all lights currently known to the bridge."""
-        return [light.metadata.name for light in self._light_cache.get_all()]
-
-    def from_name(self, name: str) -> Light:
-        """Look up a light by name and return a :class:`~hueify.light.Light` handle.
+        """Names of all known lights."""
 
-        Args:
-            name: Exact light name as configured in the Hue app.
+    @property
+    @abstractmethod
+    def infos(self) -> list[LightInfo]:
+        """Cached state of all known lights."""
 
-        Raises:
-            :class:`~hueify.exceptions.ResourceNotFoundException`: When no
-                light with that name exists in the cache.
-        """
-        cached_info = self._light_cache.get_by_name(name)
-        if cached_info is None:
-            available = [light.metadata.name for light in self._light_cache.get_all()]
-            raise ResourceNotFoundException(
-                resource_type="light",
-                lookup_name=name,
-                suggested_names=available,
-            )
-        return Light(
-            light_info=cached_info, client=self._http_client, cache=self._light_cache
-        )
+    @abstractmethod
+    def from_name(self, name: str) -> Light:
+        """Look up a light by name and return a :class:`~hueify.light.Light` handle."""
 
+    @abstractmethod
     def from_id(self, light_id: UUID) -> Light:
-        """Look up a light by Hue resource ID and return a :class:`~hueify.light.Light` handle.
-
-        Args:
-            light_id: Hue light resource ID.
-
-        Raises:
-            :class:`~hueify.exceptions.ResourceNotFoundException`: When no
-                light with that ID exists in the cache.
-        """
-        cached_info = self._light_cache.get_by_id(light_id)
-        if cached_info is None:
-            available = [light.metadata.name for light in self._light_cache.get_all()]
-            raise ResourceNotFoundException(
-                resource_type="light",
-                lookup_name=str(light_id),
-                suggested_names=available,
-            )
-        return Light(
-            light_info=cached_info, client=self._http_client, cache=self._light_cache
-        )
+        """Look up a light by Hue resource ID and return a :class:`~hueify.light.Light` handle."""
 
-    async def turn_on(self, name: str) -> ActionResult:
-        """Turn the named light on."""
+    async def turn_on(
+        self, name: str, transition_ms: int | None = None
+    ) -> ActionResult:
+        """Turn the named light on with an optional bridge-side fade."""
         light = self.from_name(name)
-        return await light.turn_on()
+        return await light.turn_on(transition_ms=transition_ms)
 
-    async def turn_off(self, name: str) -> ActionResult:
-        """Turn the named light off."""
+    async def turn_off(
+        self, name: str, transition_ms: int | None = None
+    ) -> ActionResult:
+        """Turn the named light off with an optional bridge-side fade."""
         light = self.from_name(name)
-        return await light.turn_off()
+        return await light.turn_off(transition_ms=transition_ms)
 
     async def set_brightness(
-        self, name: str, brightness_percentage: float | int
+        self,
+        name: str,
+        brightness_percentage: float | int,
+        transition_ms: int | None = None,
     ) -> ActionResult:
         """Set the absolute brightness of the named light.
 
         Args:
             name: Light name.
             brightness_percentage: Target brightness in ``[0, 100]``.
+            transition_ms: Optional bridge-side fade duration in milliseconds.
         """
         light = self.from_name(name)
-        return await light.set_brightness(brightness_percentage)
+        return await light.set_brightness(
+            brightness_percentage, transition_ms=transition_ms
+        )
 
     async def increase_brightness(
-        self, name: str, brightness_percentage: float | int
+        self,
+        name: str,
+        brightness_percentage: float | int,
+        transition_ms: int | None = None,
     ) -> ActionResult:
         """Increase the brightness of the named light by a relative amount.
 
         Args:
             name: Light name.
             brightness_percentage: Percentage points to add.
+            transition_ms: Optional bridge-side fade duration in milliseconds.
         """
         light = self.from_name(name)
-        return await light.increase_brightness(brightness_percentage)
+        return await light.increase_brightness(
+            brightness_percentage, transition_ms=transition_ms
+        )
 
     async def decrease_brightness(
-        self, name: str, brightness_percentage: float | int
+        self,
+        name: str,
+        brightness_percentage: float | int,
+        transition_ms: int | None = None,
     ) -> ActionResult:
         """Decrease the brightness of the named light by a relative amount.
 
         Args:
             name: Light name.
             brightness_percentage: Percentage points to subtract.
+            transition_ms: Optional bridge-side fade duration in milliseconds.
         """
         light = self.from_name(name)
-        return await light.decrease_brightness(brightness_percentage)
+        return await light.decrease_brightness(
+            brightness_percentage, transition_ms=transition_ms
+        )
 
     async def set_color_temperature(
-        self, name: str, color_temperature_percentage: float | int
+        self,
+        name: str,
+        color_temperature_percentage: float | int,
+        transition_ms: int | None = None,
     ) -> ActionResult:
         """Set the colour temperature of the named light.
 
         Args:
             name: Light name.
             color_temperature_percentage: ``0`` = warmest white, ``100`` = coolest.
+            transition_ms: Optional bridge-side fade duration in milliseconds.
         """
         light = self.from_name(name)
-        return await light.set_color_temperature(color_temperature_percentage)
+        return await light.set_color_temperature(
+            color_temperature_percentage, transition_ms=transition_ms
+        )
 
-    async def set_color(self, name: str, r: int, g: int, b: int) -> ActionResult:
+    async def set_color(
+        self, name: str, r: int, g: int, b: int, transition_ms: int | None = None
+    ) -> ActionResult:
         """Set the colour of the named light using sRGB values.
 
         Args:
@@ -144,21 +135,134 @@ class LightNamespace:
             r: Red channel in ``[0, 255]``.
             g: Green channel in ``[0, 255]``.
             b: Blue channel in ``[0, 255]``.
+            transition_ms: Optional bridge-side fade duration in milliseconds.
         """
         light = self.from_name(name)
-        return await light.set_color(r, g, b)
+        return await light.set_color(r, g, b, transition_ms=transition_ms)
 
-    async def set_named_color(self, name: str, color: Color) -> ActionResult:
+    async def set_named_color(
+        self, name: str, color: Color, transition_ms: int | None = None
+    ) -> ActionResult:
         """Set the colour of the named light to a predefined :class:`~hueify.shared.resource.Color`.
 
         Args:
             name: Light name.
             color: Named colour constant, e.g. ``Color.WARM_WHITE``.
+            transition_ms: Optional bridge-side fade duration in milliseconds.
         """
         light = self.from_name(name)
-        return await light.set_named_color(color)
+        return await light.set_named_color(color, transition_ms=transition_ms)
+
+    async def set_state(
+        self,
+        name: str,
+        *,
+        on: bool | None = None,
+        brightness: float | int | None = None,
+        color: Color | tuple[int, int, int] | None = None,
+        mirek: int | None = None,
+        transition_ms: int | None = None,
+    ) -> ActionResult:
+        """Apply several state changes to the named light in one request.
+
+        See :meth:`~hueify.shared.resource.Resource.set_state` for the
+        meaning of each field.
+        """
+        light = self.from_name(name)
+        return await light.set_state(
+            on=on,
+            brightness=brightness,
+            color=color,
+            mirek=mirek,
+            transition_ms=transition_ms,
+        )
 
     def get_brightness(self, name: str) -> float:
         """Return the current brightness of the named light as a percentage."""
         light = self.from_name(name)
         return light.brightness_percentage
+
+
+class LightNamespace(BaseLightNamespace):
+    """Entry point for controlling individual lights.
+
+    Accessible as :attr:`Hueify.lights <hueify.service.Hueify.lights>`.
+    All name lookups accept the exact configured light name (case-insensitive
+    matching is handled by the cache layer).
+
+    ```python
+    async with Hueify() as hue:
+        await hue.lights.turn_on("Desk")
+        await hue.lights.set_brightness("Desk", 60)
+    ```
+    """
+
+    def __init__(
+        self,
+        light_cache: LightCache,
+        http_client: HttpClient,
+        write_suppression: WriteSuppression | None = None,
+    ) -> None:
+        self._light_cache = light_cache
+        self._http_client = http_client
+        self._write_suppression = write_suppression
+
+    @property
+    def names(self) -> list[str]:
+        """Names of all lights currently known to the bridge."""
+        return [light.metadata.name for light in self._light_cache.get_all()]
+
+    @property
+    def infos(self) -> list[LightInfo]:
+        """Cached state of all lights currently known to the bridge."""
+        return self._light_cache.get_all()
+
+    def from_name(self, name: str) -> Light:
+        """Look up a light by name and return a :class:`~hueify.light.Light` handle.
+
+        Args:
+            name: Exact light name as configured in the Hue app.
+
+        Raises:
+            :class:`~hueify.exceptions.ResourceNotFoundException`: When no
+                light with that name exists in the cache.
+        """
+        cached_info = self._light_cache.get_by_name(name)
+        if cached_info is None:
+            available = [light.metadata.name for light in self._light_cache.get_all()]
+            raise ResourceNotFoundException(
+                resource_type="light",
+                lookup_name=name,
+                suggested_names=available,
+            )
+        return Light(
+            light_info=cached_info,
+            client=self._http_client,
+            cache=self._light_cache,
+            write_suppression=self._write_suppression,
+        )
+
+    def from_id(self, light_id: UUID) -> Light:
+        """Look up a light by Hue resource ID and return a :class:`~hueify.light.Light` handle.
+
+        Args:
+            light_id: Hue light resource ID.
+
+        Raises:
+            :class:`~hueify.exceptions.ResourceNotFoundException`: When no
+                light with that ID exists in the cache.
+        """
+        cached_info = self._light_cache.get_by_id(light_id)
+        if cached_info is None:
+            available = [light.metadata.name for light in self._light_cache.get_all()]
+            raise ResourceNotFoundException(
+                resource_type="light",
+                lookup_name=str(light_id),
+                suggested_names=available,
+            )
+        return Light(
+            light_info=cached_info,
+            client=self._http_client,
+            cache=self._light_cache,
+            write_suppression=self._write_suppression,
+        )
@@ -2,6 +2,7 @@ from hueify.light.views import (
     LightInfo,
 )
 from hueify.shared.resource import Resource
+from hueify.shared.resource.views import GamutType
 
 
 class Light(Resource[LightInfo]):
@@ -29,5 +30,10 @@ class Light(Resource[LightInfo]):
         """Display name of the light as configured in the Hue app."""
         return self._light_info.metadata.name
 
+    @property
+    def _gamut_type(self) -> GamutType | None:
+        color = self._light_info.color
+        return color.gamut_type if color else None
+
     def _get_resource_endpoint(self) -> str:
         return "/light"
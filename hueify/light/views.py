@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field, TypeAdapter
 
 from hueify.shared.resource.views import (
     ControllableLight,
+    GamutType,
     ResourceReference,
     ResourceType,
 )
@@ -90,13 +91,6 @@ class ColorGamut(BaseModel):
     blue: ColorXY | None = None
 
 
-class GamutType(StrEnum):
-    A = "A"
-    B = "B"
-    C = "C"
-    OTHER = "other"
-
-
 class ColorState(BaseModel):
     xy: ColorXY | None = None
     gamut: ColorGamut | None = None
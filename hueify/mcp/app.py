@@ -1,7 +1,8 @@
 import functools
 import inspect
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
+from typing import Any
 
 try:
     from fastmcp import Context, FastMCP
@@ -10,27 +11,84 @@ except ImportError as e:
         "MCP support requires 'fastmcp'. Install with: pip install hueify[mcp]"
     ) from e
 
+from mcp import types
+from mcp.server.subscriptions import (
+    InMemorySubscriptionBus,
+    ListenHandler,
+    ResourceUpdated,
+)
+
 from hueify import Hueify
+from hueify.http import RateLimiter
+from hueify.mcp.snapshot import HomeStateSnapshot
+from hueify.mcp.subscriptions import ResourceUpdateNotifier, SessionSubscriptions
 
 
 @asynccontextmanager
-async def lifespan(_: FastMCP) -> AsyncIterator[dict]:
-    async with Hueify() as hueify:
-        yield {"hueify": hueify}
+async def lifespan(server: FastMCP) -> AsyncIterator[dict]:
+    # Batched tools issue many writes at once; pace them below the bridge limits.
+    async with Hueify(rate_limiter=RateLimiter()) as hueify:
+        home_state = HomeStateSnapshot(hueify)
+        home_state.start()
+        notifier = (
+            ResourceUpdateNotifier(hueify, server.publish_resource_updated)
+            if isinstance(server, HueifyMCP)
+            else None
+        )
+        if notifier is not None:
+            notifier.start()
+        try:
+            yield {"hueify": hueify, "home_state": home_state}
+        finally:
+            if notifier is not None:
+                notifier.stop()
+            home_state.stop()
 
 
 class HueifyMCP(FastMCP):
-    def _namespace_tool(self, namespace: str, **tool_kwargs):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._subscription_bus = InMemorySubscriptionBus()
+        self._session_subscriptions = SessionSubscriptions()
+        self._subscription_bus.subscribe(self._session_subscriptions.deliver)
+
+        server = self._mcp_server
+        server.add_request_handler(
+            "subscriptions/listen",
+            types.SubscriptionsListenRequestParams,
+            ListenHandler(self._subscription_bus),
+        )
+        server.add_request_handler(
+            "resources/subscribe",
+            types.SubscribeRequestParams,
+            self._session_subscriptions.subscribe,
+        )
+        server.add_request_handler(
+            "resources/unsubscribe",
+            types.UnsubscribeRequestParams,
+            self._session_subscriptions.unsubscribe,
+        )
+
+    async def publish_resource_updated(self, uri: str) -> None:
+        """Notify every client subscribed to ``uri`` that it should be re-read."""
+        await self._subscription_bus.publish(ResourceUpdated(uri))
+
+    def _injected(
+        self,
+        parameter: str,
+        resolve: Callable[[dict[str, Any]], Any],
+        register: Callable[[Callable], Any],
+    ):
         def decorator(func):
             @functools.wraps(func)
             async def wrapper(*args, ctx: Context, **kwargs):
-                hueify: Hueify = ctx.request_context.lifespan_context["hueify"]
+                lifespan_context = ctx.request_context.lifespan_context
                 return await func(
-                    *args, **{namespace: getattr(hueify, namespace)}, **kwargs
+                    *args, **{parameter: resolve(lifespan_context)}, **kwargs
                 )
 
             sig = inspect.signature(func)
-            params = [p for p in sig.parameters.values() if p.name != namespace]
+            params = [p for p in sig.parameters.values() if p.name != parameter]
             ctx_param = inspect.Parameter(
                 "ctx", inspect.Parameter.KEYWORD_ONLY, annotation=Context
             )
@@ -45,10 +103,43 @@ class HueifyMCP(FastMCP):
             if sig.return_annotation is not inspect.Parameter.empty:
                 wrapper.__annotations__["return"] = sig.return_annotation
 
-            return self.tool(**tool_kwargs)(wrapper)
+            return register(wrapper)
 
         return decorator
 
+    def _namespace_tool(self, namespace: str, **tool_kwargs):
+        return self._injected(
+            namespace,
+            lambda context: getattr(context["hueify"], namespace),
+            self.tool(**tool_kwargs),
+        )
+
+    def session_tool(self, **tool_kwargs):
+        return self._injected(
+            "hueify", lambda context: context["hueify"], self.tool(**tool_kwargs)
+        )
+
+    def home_state_tool(self, **tool_kwargs):
+        return self._injected(
+            "home_state",
+            lambda context: context["home_state"],
+            self.tool(**tool_kwargs),
+        )
+
+    def home_state_resource(self, uri: str, **resource_kwargs):
+        return self._injected(
+            "home_state",
+            lambda context: context["home_state"],
+            self.resource(uri, **resource_kwargs),
+        )
+
+    def session_resource(self, uri: str, **resource_kwargs):
+        return self._injected(
+            "hueify",
+            lambda context: context["hueify"],
+            self.resource(uri, **resource_kwargs),
+        )
+
     def light_tool(self, **tool_kwargs):
         return self._namespace_tool("lights", **tool_kwargs)
 
@@ -1,10 +1,76 @@
-from hueify import ActionResult
+from pydantic import TypeAdapter
+
+from hueify import ActionResult, Hueify
+from hueify.actions import Action, ActionExecutor, ActionOutcome
 from hueify.grouped_lights import RoomNamespace, ZoneNamespace
 from hueify.light import LightNamespace
 from hueify.mcp.app import HueifyMCP, lifespan
+from hueify.mcp.snapshot import HomeState, HomeStateSnapshot, SceneState
 
 mcp_server = HueifyMCP("Hueify MCP Server", lifespan=lifespan)
 
+_SCENE_LIST = TypeAdapter(list[SceneState])
+
+
+# ===== Home =====
+
+
+@mcp_server.home_state_tool()
+async def get_home_state(home_state: HomeStateSnapshot) -> HomeState:
+    """Return on/off, brightness and active scene of every room, zone and light.
+
+    Use this first to answer questions like "what's on?" instead of listing
+    lights and reading them one by one. Lights appear under their room;
+    zones name their lights; lights outside any room are under ``lights``.
+    """
+    return home_state.get()
+
+
+@mcp_server.home_state_resource("hue://home", mime_type="application/json")
+async def home_state_resource(home_state: HomeStateSnapshot) -> str:
+    """Snapshot of every room, zone and light, as returned by ``get_home_state``."""
+    return home_state.get().model_dump_json()
+
+
+@mcp_server.home_state_resource(
+    "hue://lights/{light_name}", mime_type="application/json"
+)
+async def light_resource(light_name: str, home_state: HomeStateSnapshot) -> str:
+    """On state and brightness of one light. Subscribe to be notified of changes."""
+    return home_state.light(light_name).model_dump_json()
+
+
+@mcp_server.home_state_resource("hue://rooms/{room_name}", mime_type="application/json")
+async def room_resource(room_name: str, home_state: HomeStateSnapshot) -> str:
+    """State, active scene and lights of one room. Subscribe to be notified of changes."""
+    return home_state.room(room_name).model_dump_json()
+
+
+@mcp_server.home_state_resource(
+    "hue://rooms/{room_name}/scenes", mime_type="application/json"
+)
+async def room_scenes_resource(room_name: str, home_state: HomeStateSnapshot) -> str:
+    """Scenes of one room and which one is active. Subscribe to be notified of changes."""
+    return _SCENE_LIST.dump_json(home_state.room_scenes(room_name)).decode()
+
+
+# ===== Batches =====
+
+
+@mcp_server.session_tool()
+async def execute_actions(actions: list[Action], hueify: Hueify) -> list[ActionOutcome]:
+    """Run several light, room and zone actions in a single call.
+
+    Prefer this over calling one tool per change, e.g. to set up a mood:
+    activate a scene in a room, then adjust individual lights. Actions on
+    different lights run concurrently. Actions on the same light run in list
+    order. A room or zone action runs after everything listed before it.
+    Returns one outcome per action, in list order, with an ``error`` for
+    actions that failed (for example unknown names or a bridge error); the
+    rest still run.
+    """
+    return await ActionExecutor(hueify).run(actions)
+
 
 # ===== Lights =====
 
@@ -0,0 +1,180 @@
+import logging
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from hueify import Hueify
+from hueify.grouped_lights import GroupedLights
+from hueify.grouped_lights.views import GroupInfo
+from hueify.light.views import LightInfo
+from hueify.sse.views import GroupedLightEvent, LightEvent, SceneEvent
+
+logger = logging.getLogger(__name__)
+
+
+class LightState(BaseModel):
+    on: bool
+    brightness: int
+
+
+class GroupState(LightState):
+    scene: str | None = None
+
+
+class RoomState(GroupState):
+    lights: dict[str, LightState] = Field(default_factory=dict)
+
+
+class ZoneState(GroupState):
+    lights: list[str] = Field(default_factory=list)
+
+
+class SceneState(BaseModel):
+    name: str
+    active: bool
+
+
+class HomeState(BaseModel):
+    """Compact snapshot of every room, zone and light.
+
+    Lights are listed once, under the room that contains them; zones only
+    name their lights. Lights outside every room are listed in ``lights``.
+    Brightness is a whole percentage.
+    """
+
+    rooms: dict[str, RoomState] = Field(default_factory=dict)
+    zones: dict[str, ZoneState] = Field(default_factory=dict)
+    lights: dict[str, LightState] = Field(default_factory=dict)
+
+
+class HomeStateSnapshot:
+    """Serve :class:`HomeState` from the live caches of a :class:`~hueify.Hueify` session.
+
+    The snapshot is built on first access and reused until an event changes
+    the on state, brightness or active scene of a light, room or zone.
+    """
+
+    def __init__(self, hueify: Hueify) -> None:
+        self._hueify = hueify
+        self._state: HomeState | None = None
+
+    def start(self) -> None:
+        self._hueify.on(LightEvent, self._on_light_event)
+        self._hueify.on(GroupedLightEvent, self._on_grouped_light_event)
+        self._hueify.on(SceneEvent, self._on_scene_event)
+
+    def stop(self) -> None:
+        self._hueify.off(LightEvent, self._on_light_event)
+        self._hueify.off(GroupedLightEvent, self._on_grouped_light_event)
+        self._hueify.off(SceneEvent, self._on_scene_event)
+
+    def get(self) -> HomeState:
+        if self._state is None:
+            self._state = self._build()
+        return self._state
+
+    def light(self, name: str) -> LightState:
+        """State of one light, taken from the memoized snapshot.
+
+        Raises:
+            :class:`~hueify.exceptions.ResourceNotFoundException`: When no
+                light with this name exists.
+        """
+        light_name = self._hueify.lights.from_name(name).name
+        state = self.get()
+        for room in state.rooms.values():
+            if light_name in room.lights:
+                return room.lights[light_name]
+        return state.lights[light_name]
+
+    def room(self, name: str) -> RoomState:
+        """State of one room, taken from the memoized snapshot.
+
+        Raises:
+            :class:`~hueify.exceptions.ResourceNotFoundException`: When no
+                room with this name exists.
+        """
+        return self.get().rooms[self._hueify.rooms.from_name(name).name]
+
+    def room_scenes(self, name: str) -> list[SceneState]:
+        """Scenes of one room and whether each is active.
+
+        Raises:
+            :class:`~hueify.exceptions.ResourceNotFoundException`: When no
+                room with this name exists.
+        """
+        room = self._hueify.rooms.from_name(name)
+        return [
+            SceneState(name=scene.name, active=scene.is_active)
+            for scene in room.list_scenes()
+        ]
+
+    def invalidate(self) -> None:
+        self._state = None
+
+    async def _on_light_event(self, event: LightEvent) -> None:
+        if event.on is not None or event.dimming is not None:
+            self.invalidate()
+
+    async def _on_grouped_light_event(self, event: GroupedLightEvent) -> None:
+        if event.on is not None or event.dimming is not None:
+            self.invalidate()
+
+    async def _on_scene_event(self, _: SceneEvent) -> None:
+        self.invalidate()
+
+    def _build(self) -> HomeState:
+        lights = self._hueify.lights.infos
+        state = HomeState()
+        placed: set[UUID] = set()
+
+        for group_info in self._hueify.rooms.groups:
+            members = _members(group_info, lights)
+            placed.update(light.id for light in members)
+            group = self._hueify.rooms.from_id(group_info.id)
+            state.rooms[group.name] = RoomState(
+                **_group_fields(group),
+                lights={light.metadata.name: _light_state(light) for light in members},
+            )
+
+        for group_info in self._hueify.zones.groups:
+            group = self._hueify.zones.from_id(group_info.id)
+            state.zones[group.name] = ZoneState(
+                **_group_fields(group),
+                lights=[light.metadata.name for light in _members(group_info, lights)],
+            )
+
+        state.lights = {
+            light.metadata.name: _light_state(light)
+            for light in lights
+            if light.id not in placed
+        }
+        logger.debug(
+            f"Built home state with {len(state.rooms)} room(s), "
+            f"{len(state.zones)} zone(s) and {len(lights)} light(s)"
+        )
+        return state
+
+
+def _members(group_info: GroupInfo, lights: list[LightInfo]) -> list[LightInfo]:
+    # Rooms list devices as children, zones list the light services directly.
+    child_ids = {child.rid for child in group_info.children}
+    return [
+        light
+        for light in lights
+        if light.id in child_ids or light.owner.rid in child_ids
+    ]
+
+
+def _light_state(light: LightInfo) -> LightState:
+    brightness = light.dimming.brightness if light.dimming else 0.0
+    return LightState(on=light.on.on, brightness=round(brightness))
+
+
+def _group_fields(group: GroupedLights) -> dict:
+    active_scene = group.get_active_scene()
+    return {
+        "on": group.is_on,
+        "brightness": round(group.brightness_percentage),
+        "scene": active_scene.name if active_scene else None,
+    }
@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import weakref
+from collections.abc import Awaitable, Callable
+from urllib.parse import quote
+from uuid import UUID
+
+from mcp import types
+from mcp.server.context import ServerRequestContext
+from mcp.server.session import ServerSession
+from mcp.server.subscriptions import ResourceUpdated, ServerEvent
+
+from hueify import Hueify
+from hueify.sse.views import GroupedLightEvent, LightEvent, SceneEvent
+
+logger = logging.getLogger(__name__)
+
+HOME_URI = "hue://home"
+
+
+def light_uri(name: str) -> str:
+    return f"hue://lights/{quote(name)}"
+
+
+def room_uri(name: str) -> str:
+    return f"hue://rooms/{quote(name)}"
+
+
+def room_scenes_uri(name: str) -> str:
+    return f"hue://rooms/{quote(name)}/scenes"
+
+
+class ResourceUpdateNotifier:
+    """Turn bridge events into debounced ``resources/updated`` notifications.
+
+    Each event is mapped to the URIs of the resources whose content it
+    changes. The first change to a URI starts a window of ``debounce_seconds``;
+    further changes inside that window are folded into a single notification
+    sent when it closes, so a scene recall touching ten lights notifies each
+    resource once.
+    """
+
+    def __init__(
+        self,
+        hueify: Hueify,
+        publish: Callable[[str], Awaitable[None]],
+        debounce_seconds: float = 0.2,
+    ) -> None:
+        if debounce_seconds < 0:
+            raise ValueError("debounce_seconds must not be negative")
+        self._hueify = hueify
+        self._publish = publish
+        self._debounce_seconds = debounce_seconds
+        self._pending: dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        self._hueify.on(LightEvent, self._on_light_event)
+        self._hueify.on(GroupedLightEvent, self._on_grouped_light_event)
+        self._hueify.on(SceneEvent, self._on_scene_event)
+
+    def stop(self) -> None:
+        self._hueify.off(LightEvent, self._on_light_event)
+        self._hueify.off(GroupedLightEvent, self._on_grouped_light_event)
+        self._hueify.off(SceneEvent, self._on_scene_event)
+        for handle in self._pending.values():
+            handle.cancel()
+        self._pending.clear()
+
+    async def _on_light_event(self, event: LightEvent) -> None:
+        if event.on is None and event.dimming is None:
+            return
+        light = self._hueify.lights.from_id(event.id)
+        uris = [HOME_URI, light_uri(light.name)]
+        uris += [
+            room_uri(group.name)
+            for group in self._hueify.rooms.groups
+            if any(child.rid in (event.id, event.owner.rid) for child in group.children)
+        ]
+        self._schedule(uris)
+
+    async def _on_grouped_light_event(self, event: GroupedLightEvent) -> None:
+        if event.on is None and event.dimming is None:
+            return
+        uris = [HOME_URI]
+        if event.owner is not None:
+            room = self._room_name(event.owner.rid)
+            if room is not None:
+                uris.append(room_uri(room))
+        self._schedule(uris)
+
+    async def _on_scene_event(self, event: SceneEvent) -> None:
+        uris = [HOME_URI]
+        for group in self._hueify.rooms.groups:
+            room = self._hueify.rooms.from_id(group.id)
+            if any(scene.id == event.id for scene in room.list_scenes()):
+                uris += [room_uri(room.name), room_scenes_uri(room.name)]
+        self._schedule(uris)
+
+    def _room_name(self, room_id: UUID) -> str | None:
+        return next(
+            (g.name for g in self._hueify.rooms.groups if g.id == room_id), None
+        )
+
+    def _schedule(self, uris: list[str]) -> None:
+        loop = asyncio.get_running_loop()
+        for uri in uris:
+            if uri not in self._pending:
+                self._pending[uri] = loop.call_later(
+                    self._debounce_seconds, self._flush, uri
+                )
+
+    def _flush(self, uri: str) -> None:
+        del self._pending[uri]
+        task = asyncio.create_task(self._publish(uri))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+class SessionSubscriptions:
+    """Serve ``resources/subscribe`` for clients on pre-2026 protocol versions.
+
+    Newer clients open a ``subscriptions/listen`` stream instead, which the
+    SDK serves straight from the subscription bus. Sessions are held weakly
+    and forgotten once their connection is gone.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: dict[str, weakref.WeakSet[ServerSession]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def subscribe(
+        self, ctx: ServerRequestContext, params: types.SubscribeRequestParams
+    ) -> types.EmptyResult:
+        self._sessions.setdefault(str(params.uri), weakref.WeakSet()).add(ctx.session)
+        logger.debug(f"Session subscribed to {params.uri}")
+        return types.EmptyResult()
+
+    async def unsubscribe(
+        self, ctx: ServerRequestContext, params: types.UnsubscribeRequestParams
+    ) -> types.EmptyResult:
+        sessions = self._sessions.get(str(params.uri))
+        if sessions is not None:
+            sessions.discard(ctx.session)
+        return types.EmptyResult()
+
+    def deliver(self, event: ServerEvent) -> None:
+        if not isinstance(event, ResourceUpdated):
+            return
+        for session in list(self._sessions.get(event.uri, ())):
+            task = asyncio.create_task(self._send(session, event.uri))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, session: ServerSession, uri: str) -> None:
+        try:
+            await session.send_resource_updated(uri)
+        except Exception as e:
+            logger.debug(f"Dropping subscriber of {uri}: {e}")
+            self._sessions[uri].discard(session)
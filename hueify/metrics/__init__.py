@@ -0,0 +1,26 @@
+from .exporters import OpenTelemetryExporter, render_prometheus
+from .registry import (
+    DEFAULT_LATENCY_BUCKETS,
+    Counter,
+    Gauge,
+    Histogram,
+    Metric,
+    MetricsExporter,
+    MetricsRegistry,
+    MetricType,
+    default_registry,
+)
+
+__all__ = [
+    "DEFAULT_LATENCY_BUCKETS",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Metric",
+    "MetricType",
+    "MetricsExporter",
+    "MetricsRegistry",
+    "OpenTelemetryExporter",
+    "default_registry",
+    "render_prometheus",
+]
@@ -0,0 +1,119 @@
+from typing import Any
+
+from hueify.metrics.registry import (
+    Counter,
+    Gauge,
+    Histogram,
+    Metric,
+    MetricsRegistry,
+    MetricType,
+    default_registry,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return f"{{{pairs}}}"
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def render_prometheus(registry: MetricsRegistry = default_registry) -> str:
+    """Render every metric in the Prometheus text exposition format (v0.0.4)."""
+    lines: list[str] = []
+    for metric in registry.metrics():
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.type}")
+
+        if isinstance(metric, Counter | Gauge):
+            for values, value in metric.samples().items():
+                labels = _format_labels(metric.labelnames, values)
+                lines.append(f"{metric.name}{labels} {_format_number(value)}")
+            continue
+
+        assert isinstance(metric, Histogram)
+        for values, sample in metric.samples().items():
+            cumulative = 0
+            for bound, bucket_count in zip(
+                metric.buckets, sample.bucket_counts, strict=True
+            ):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    (*metric.labelnames, "le"), (*values, _format_number(bound))
+                )
+                lines.append(f"{metric.name}_bucket{labels} {cumulative}")
+            labels = _format_labels((*metric.labelnames, "le"), (*values, "+Inf"))
+            lines.append(f"{metric.name}_bucket{labels} {sample.count}")
+            labels = _format_labels(metric.labelnames, values)
+            lines.append(f"{metric.name}_sum{labels} {_format_number(sample.sum)}")
+            lines.append(f"{metric.name}_count{labels} {sample.count}")
+
+    return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryExporter:
+    """Forwards hueify observations to an OpenTelemetry ``Meter``.
+
+    Instruments are created lazily on the given meter, so hueify itself does
+    not depend on ``opentelemetry``:
+
+    ```python
+    from opentelemetry import metrics
+
+    default_registry.add_exporter(
+        OpenTelemetryExporter(metrics.get_meter("hueify"))
+    )
+    ```
+
+    Counters map to ``Counter``, histograms to ``Histogram`` and gauges to
+    ``UpDownCounter`` (fed with the delta to the previous value).
+    """
+
+    def __init__(self, meter: Any) -> None:
+        self._meter = meter
+        self._instruments: dict[str, Any] = {}
+        self._gauge_values: dict[tuple[str, tuple], float] = {}
+
+    def observe(self, metric: Metric, labels: dict[str, str], value: float) -> None:
+        instrument = self._instruments.get(metric.name)
+        if instrument is None:
+            instrument = self._instruments[metric.name] = self._create(metric)
+
+        match metric.type:
+            case MetricType.COUNTER:
+                instrument.add(value, attributes=labels)
+            case MetricType.HISTOGRAM:
+                instrument.record(value, attributes=labels)
+            case MetricType.GAUGE:
+                key = (metric.name, tuple(sorted(labels.items())))
+                delta = value - self._gauge_values.get(key, 0.0)
+                self._gauge_values[key] = value
+                instrument.add(delta, attributes=labels)
+
+    def _create(self, metric: Metric) -> Any:
+        unit = "s" if metric.name.endswith("_seconds") else "1"
+        match metric.type:
+            case MetricType.COUNTER:
+                return self._meter.create_counter(
+                    metric.name, unit=unit, description=metric.documentation
+                )
+            case MetricType.HISTOGRAM:
+                return self._meter.create_histogram(
+                    metric.name, unit=unit, description=metric.documentation
+                )
+            case MetricType.GAUGE:
+                return self._meter.create_up_down_counter(
+                    metric.name, unit=unit, description=metric.documentation
+                )
@@ -0,0 +1,95 @@
+from hueify.metrics.registry import default_registry
+
+OPERATION_DURATION = default_registry.histogram(
+    "hueify_operation_duration_seconds",
+    "Duration of high-level hueify operations.",
+    ("operation",),
+)
+OPERATION_ERRORS = default_registry.counter(
+    "hueify_operation_errors_total",
+    "High-level hueify operations that raised.",
+    ("operation",),
+)
+
+HTTP_REQUEST_DURATION = default_registry.histogram(
+    "hueify_http_request_duration_seconds",
+    "Round-trip time of requests to the bridge REST API.",
+    ("method", "endpoint"),
+)
+HTTP_ERRORS = default_registry.counter(
+    "hueify_http_errors_total",
+    "Bridge REST requests that failed, by status code (0 for transport errors).",
+    ("method", "endpoint", "status"),
+)
+HTTP_THROTTLED = default_registry.counter(
+    "hueify_http_throttled_total",
+    "Bridge REST requests answered with 429 Too Many Requests.",
+    ("method", "endpoint"),
+)
+HTTP_RETRIES = default_registry.counter(
+    "hueify_http_retries_total",
+    "Bridge REST requests that were retried, by reason (status code or transport).",
+    ("method", "endpoint", "reason"),
+)
+HTTP_RETRIES_SUPPRESSED = default_registry.counter(
+    "hueify_http_retries_suppressed_total",
+    "Retryable failures that were not retried because the retry budget was empty.",
+    ("method", "endpoint"),
+)
+HTTP_CIRCUIT_REJECTED = default_registry.counter(
+    "hueify_http_circuit_rejected_total",
+    "Bridge REST requests failed fast because the circuit breaker was open.",
+)
+HTTP_COALESCED = default_registry.counter(
+    "hueify_http_coalesced_total",
+    "GET requests answered by an identical request that was already in flight.",
+    ("endpoint",),
+)
+HTTP_RATE_LIMIT_WAIT = default_registry.histogram(
+    "hueify_http_rate_limit_wait_seconds",
+    "Time bridge writes were held back by the client-side rate limiter.",
+    ("resource_type",),
+)
+HTTP_IN_FLIGHT = default_registry.gauge(
+    "hueify_http_requests_in_flight",
+    "Bridge REST requests currently awaiting a response.",
+)
+
+CACHE_POPULATE_DURATION = default_registry.histogram(
+    "hueify_cache_populate_duration_seconds",
+    "Time to fetch and store the initial snapshot of a cache.",
+    ("cache",),
+)
+
+EVENT_DISPATCH_DURATION = default_registry.histogram(
+    "hueify_event_dispatch_duration_seconds",
+    "Time to run all handlers of one event.",
+    ("event_type",),
+)
+EVENT_HANDLER_DURATION = default_registry.histogram(
+    "hueify_event_handler_duration_seconds",
+    "Time spent in a single event handler.",
+    ("event_type", "handler"),
+)
+EVENT_HANDLER_ERRORS = default_registry.counter(
+    "hueify_event_handler_errors_total",
+    "Event handlers that raised.",
+    ("event_type", "handler"),
+)
+EVENT_HANDLERS_IN_FLIGHT = default_registry.gauge(
+    "hueify_event_handlers_in_flight",
+    "Event handlers currently running.",
+)
+
+EVENT_STREAM_CONNECTS = default_registry.counter(
+    "hueify_event_stream_connects_total",
+    "Connections opened to the bridge event stream.",
+)
+EVENT_STREAM_ERRORS = default_registry.counter(
+    "hueify_event_stream_errors_total",
+    "Event stream connections that ended with an error.",
+)
+BRIDGE_RECONNECTS = default_registry.counter(
+    "hueify_bridge_reconnects_total",
+    "Reconnects to a rediscovered bridge after a connect timeout.",
+)
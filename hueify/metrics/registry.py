@@ -0,0 +1,266 @@
+import bisect
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from enum import StrEnum
+from typing import Protocol
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+type LabelValues = tuple[str, ...]
+
+
+class MetricType(StrEnum):
+    COUNTER = "counter"
+    GAUGE = "gauge"
+    HISTOGRAM = "histogram"
+
+
+class MetricsExporter(Protocol):
+    """Receives every observation as it is recorded.
+
+    Push-style backends (e.g. OpenTelemetry) implement this and register via
+    :meth:`MetricsRegistry.add_exporter`. Pull-style backends read
+    :meth:`MetricsRegistry.metrics` instead, see
+    :func:`~hueify.metrics.render_prometheus`.
+    """
+
+    def observe(
+        self, metric: "Metric", labels: dict[str, str], value: float
+    ) -> None: ...
+
+
+class Metric:
+    type: MetricType
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._registry = registry
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: dict[str, str]) -> LabelValues:
+        if not labels and not self.labelnames:
+            return ()
+        try:
+            if len(labels) == len(self.labelnames):
+                return tuple([labels[name] for name in self.labelnames])
+        except KeyError:
+            pass
+        raise ValueError(
+            f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+        )
+
+    def _notify(self, label_values: LabelValues, value: float) -> None:
+        exporters = self._registry.exporters
+        if exporters:
+            labels = dict(zip(self.labelnames, label_values, strict=True))
+            for exporter in exporters:
+                exporter.observe(self, labels, value)
+
+
+class Counter(Metric):
+    type = MetricType.COUNTER
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+        self._notify(key, amount)
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def samples(self) -> dict[LabelValues, float]:
+        with self._lock:
+            return dict(self._values)
+
+
+class Gauge(Metric):
+    type = MetricType.GAUGE
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+        self._notify(key, value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            value = self._values[key] = self._values.get(key, 0.0) + amount
+        self._notify(key, value)
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def samples(self) -> dict[LabelValues, float]:
+        with self._lock:
+            return dict(self._values)
+
+
+class HistogramSample:
+    __slots__ = ("bucket_counts", "count", "sum")
+
+    def __init__(self, bucket_count: int) -> None:
+        self.bucket_counts = [0] * bucket_count
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram(Metric):
+    type = MetricType.HISTOGRAM
+
+    def __init__(
+        self,
+        *args,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        self._samples: dict[LabelValues, HistogramSample] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            sample = self._samples.get(key)
+            if sample is None:
+                sample = self._samples[key] = HistogramSample(len(self.buckets))
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                sample.bucket_counts[index] += 1
+            sample.count += 1
+            sample.sum += value
+        self._notify(key, value)
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started_at, **labels)
+
+    def count(self, **labels: str) -> int:
+        sample = self._samples.get(self._label_values(labels))
+        return sample.count if sample else 0
+
+    def samples(self) -> dict[LabelValues, HistogramSample]:
+        with self._lock:
+            return dict(self._samples)
+
+
+class MetricsRegistry:
+    """Holds the metrics recorded by hueify.
+
+    Metrics are created once by name; asking again for the same name returns
+    the existing instance, so instrumented modules can declare their metrics
+    at import time. All hueify components record into
+    :data:`~hueify.metrics.default_registry`, also reachable as
+    :attr:`Hueify.metrics <hueify.Hueify.metrics>`.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self.exporters: list[MetricsExporter] = []
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def get(self, name: str) -> Metric | None:
+        return self._metrics.get(name)
+
+    def metrics(self) -> list[Metric]:
+        return list(self._metrics.values())
+
+    def add_exporter(self, exporter: MetricsExporter) -> None:
+        self.exporters.append(exporter)
+
+    def remove_exporter(self, exporter: MetricsExporter) -> None:
+        self.exporters.remove(exporter)
+
+    def clear(self) -> None:
+        """Drop all recorded values while keeping the metric definitions."""
+        for metric in self._metrics.values():
+            with metric._lock:
+                if isinstance(metric, Histogram):
+                    metric._samples.clear()
+                else:
+                    metric._values.clear()
+
+    def _get_or_create[M: Metric](
+        self,
+        metric_class: type[M],
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        **kwargs,
+    ) -> M:
+        existing = self._metrics.get(name)
+        if existing is not None:
+            if not isinstance(existing, metric_class) or existing.labelnames != tuple(
+                labelnames
+            ):
+                raise ValueError(f"Metric {name} already registered differently")
+            return existing
+
+        metric = metric_class(self, name, documentation, labelnames, **kwargs)
+        self._metrics[name] = metric
+        return metric
+
+
+default_registry = MetricsRegistry()
@@ -0,0 +1,11 @@
+from .namespaces import MultiGroupNamespace, MultiLightNamespace, MultiSceneNamespace
+from .routing import BridgeRouter
+from .service import MultiHueify
+
+__all__ = [
+    "BridgeRouter",
+    "MultiGroupNamespace",
+    "MultiHueify",
+    "MultiLightNamespace",
+    "MultiSceneNamespace",
+]
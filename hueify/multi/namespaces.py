@@ -0,0 +1,123 @@
+from collections.abc import Callable, Mapping
+from uuid import UUID
+
+from hueify.exceptions import ResourceNotFoundException
+from hueify.grouped_lights.namespace import BaseGroupNamespace
+from hueify.grouped_lights.service import GroupedLights
+from hueify.grouped_lights.views import GroupInfo
+from hueify.light.namespace import BaseLightNamespace
+from hueify.light.service import Light
+from hueify.light.views import LightInfo
+from hueify.multi.routing import BridgeRouter
+from hueify.scenes.namespace import BaseSceneNamespace
+from hueify.scenes.service import Scene
+
+# The merged namespaces share the command methods of the single-bridge ones
+# through their abstract bases and implement only the lookups. Every command
+# resolves its target through from_name, so it runs against the handle of the
+# owning bridge, with that bridge's HTTP client, cache and rate limiter.
+
+
+def _from_id[N, R](
+    namespaces: Mapping[str, N],
+    lookup: Callable[[N], R],
+    resource_type: str,
+    resource_id: UUID,
+    suggested_names: list[str],
+) -> R:
+    for namespace in namespaces.values():
+        try:
+            return lookup(namespace)
+        except ResourceNotFoundException:
+            continue
+    raise ResourceNotFoundException(
+        resource_type=resource_type,
+        lookup_name=str(resource_id),
+        suggested_names=suggested_names,
+    )
+
+
+class MultiLightNamespace(BaseLightNamespace):
+    """The lights of several bridges behind the :class:`~hueify.light.BaseLightNamespace` API.
+
+    Names that exist on more than one bridge are qualified as
+    ``"<bridge>/<name>"``, see :class:`~hueify.multi.BridgeRouter`.
+    """
+
+    def __init__(self, namespaces: Mapping[str, BaseLightNamespace]) -> None:
+        self._router = BridgeRouter(namespaces, lambda ns: ns.names, "light")
+
+    @property
+    def names(self) -> list[str]:
+        return self._router.names()
+
+    @property
+    def infos(self) -> list[LightInfo]:
+        return [
+            info
+            for namespace in self._router.namespaces.values()
+            for info in namespace.infos
+        ]
+
+    def from_name(self, name: str) -> Light:
+        _, namespace, local_name = self._router.resolve(name)
+        return namespace.from_name(local_name)
+
+    def from_id(self, light_id: UUID) -> Light:
+        return _from_id(
+            self._router.namespaces,
+            lambda ns: ns.from_id(light_id),
+            "light",
+            light_id,
+            self.names,
+        )
+
+
+class MultiGroupNamespace(BaseGroupNamespace):
+    """The rooms or zones of several bridges behind the :class:`~hueify.grouped_lights.BaseGroupNamespace` API."""
+
+    def __init__(
+        self, namespaces: Mapping[str, BaseGroupNamespace], resource_type: str
+    ) -> None:
+        self._resource_type = resource_type
+        self._router = BridgeRouter(namespaces, lambda ns: ns.names, resource_type)
+
+    @property
+    def names(self) -> list[str]:
+        return self._router.names()
+
+    @property
+    def groups(self) -> list[GroupInfo]:
+        return [
+            group
+            for namespace in self._router.namespaces.values()
+            for group in namespace.groups
+        ]
+
+    def from_name(self, name: str) -> GroupedLights:
+        _, namespace, local_name = self._router.resolve(name)
+        return namespace.from_name(local_name)
+
+    def from_id(self, group_id: UUID) -> GroupedLights:
+        return _from_id(
+            self._router.namespaces,
+            lambda ns: ns.from_id(group_id),
+            self._resource_type,
+            group_id,
+            self.names,
+        )
+
+
+class MultiSceneNamespace(BaseSceneNamespace):
+    """The scenes of several bridges behind the :class:`~hueify.scenes.BaseSceneNamespace` API."""
+
+    def __init__(self, namespaces: Mapping[str, BaseSceneNamespace]) -> None:
+        self._router = BridgeRouter(namespaces, lambda ns: ns.names, "scene")
+
+    @property
+    def names(self) -> list[str]:
+        return sorted(self._router.names())
+
+    def from_name(self, name: str) -> Scene:
+        _, namespace, local_name = self._router.resolve(name)
+        return namespace.from_name(local_name)
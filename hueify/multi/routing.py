@@ -0,0 +1,78 @@
+from collections.abc import Callable, Mapping
+
+from hueify.exceptions import ResourceNotFoundException
+
+QUALIFIER_SEPARATOR = "/"
+
+
+class BridgeRouter[N]:
+    """Maps the names of a merged namespace to the bridge that owns them.
+
+    A name that exists on exactly one bridge is used as-is. A name that
+    exists on several bridges is listed once per bridge as
+    ``"<bridge>/<name>"`` and must be qualified that way to be resolved.
+    Qualified names are always accepted, even when they are unique.
+    """
+
+    def __init__(
+        self,
+        namespaces: Mapping[str, N],
+        names_of: Callable[[N], list[str]],
+        resource_type: str,
+    ) -> None:
+        self._namespaces = dict(namespaces)
+        self._names_of = names_of
+        self._resource_type = resource_type
+
+    @property
+    def namespaces(self) -> dict[str, N]:
+        return self._namespaces
+
+    def names(self) -> list[str]:
+        owners = self._owners()
+        return [
+            self._display_name(bridge, name, owners)
+            for bridge, namespace in self._namespaces.items()
+            for name in self._names_of(namespace)
+        ]
+
+    def resolve(self, name: str) -> tuple[str, N, str]:
+        """Return ``(bridge, namespace, local_name)`` for a merged name.
+
+        Raises:
+            :class:`~hueify.exceptions.ResourceNotFoundException`: When the
+                name is unknown, or exists on several bridges and is not
+                qualified; the suggestions then list the qualified names.
+        """
+        bridge, separator, local_name = name.partition(QUALIFIER_SEPARATOR)
+        if separator and bridge in self._namespaces:
+            return bridge, self._namespaces[bridge], local_name
+
+        bridges = self._owners().get(name.lower(), [])
+        if len(bridges) == 1:
+            return bridges[0], self._namespaces[bridges[0]], name
+
+        suggestions = (
+            [f"{bridge}{QUALIFIER_SEPARATOR}{name}" for bridge in bridges]
+            if bridges
+            else self.names()
+        )
+        raise ResourceNotFoundException(
+            resource_type=self._resource_type,
+            lookup_name=name,
+            suggested_names=suggestions,
+        )
+
+    def _owners(self) -> dict[str, list[str]]:
+        owners: dict[str, list[str]] = {}
+        for bridge, namespace in self._namespaces.items():
+            for name in {n.lower() for n in self._names_of(namespace)}:
+                owners.setdefault(name, []).append(bridge)
+        return owners
+
+    def _display_name(
+        self, bridge: str, name: str, owners: dict[str, list[str]]
+    ) -> str:
+        if len(owners[name.lower()]) > 1:
+            return f"{bridge}{QUALIFIER_SEPARATOR}{name}"
+        return name
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+from collections.abc import Mapping
+from types import TracebackType
+from typing import Self
+
+from pydantic import BaseModel
+
+from hueify.grouped_lights.namespace import BaseGroupNamespace
+from hueify.hueify import Hueify
+from hueify.light.namespace import BaseLightNamespace
+from hueify.multi.namespaces import (
+    MultiGroupNamespace,
+    MultiLightNamespace,
+    MultiSceneNamespace,
+)
+from hueify.multi.routing import QUALIFIER_SEPARATOR
+from hueify.scenes.namespace import BaseSceneNamespace
+from hueify.sse.bus import EventHandler
+
+logger = logging.getLogger(__name__)
+
+
+class MultiHueify:
+    """Several Hue Bridges behind one set of namespaces.
+
+    A bridge's Zigbee network tops out at about 50-60 lights, so larger
+    installations use several bridges. ``MultiHueify`` connects to all of
+    them concurrently and merges their caches into unified :attr:`lights`,
+    :attr:`rooms`, :attr:`zones` and :attr:`scenes`. Names that exist on
+    more than one bridge are listed and addressed as ``"<bridge>/<name>"``.
+
+    Every command runs on the owning bridge's :class:`~hueify.Hueify`, with
+    that bridge's HTTP connection, event stream and
+    :class:`~hueify.http.RateLimiter`. Concurrent commands therefore scale
+    with the number of bridges:
+
+    ```python
+    async with MultiHueify(
+        {
+            "upstairs": Hueify("192.168.1.10", key_1, rate_limiter=RateLimiter()),
+            "downstairs": Hueify("192.168.1.11", key_2, rate_limiter=RateLimiter()),
+        }
+    ) as hue:
+        await asyncio.gather(
+            *(hue.lights.turn_on(name) for name in hue.lights.names)
+        )
+        await hue.rooms.turn_off("upstairs/Office")
+    ```
+    """
+
+    def __init__(self, bridges: Mapping[str, Hueify]) -> None:
+        """
+        Args:
+            bridges: One connected-or-not :class:`~hueify.Hueify` per bridge,
+                keyed by the label used to qualify colliding names.
+
+        Raises:
+            ValueError: When no bridge is given or a label contains ``"/"``.
+        """
+        if not bridges:
+            raise ValueError("MultiHueify needs at least one bridge")
+        for label in bridges:
+            if not label or QUALIFIER_SEPARATOR in label:
+                raise ValueError(
+                    f"Invalid bridge label {label!r}: must be non-empty "
+                    f"and must not contain {QUALIFIER_SEPARATOR!r}"
+                )
+
+        self._bridges = dict(bridges)
+        self._lights = MultiLightNamespace(
+            {label: hue.lights for label, hue in self._bridges.items()}
+        )
+        self._rooms = MultiGroupNamespace(
+            {label: hue.rooms for label, hue in self._bridges.items()}, "room"
+        )
+        self._zones = MultiGroupNamespace(
+            {label: hue.zones for label, hue in self._bridges.items()}, "zone"
+        )
+        self._scenes = MultiSceneNamespace(
+            {label: hue.scenes for label, hue in self._bridges.items()}
+        )
+
+    @property
+    def bridges(self) -> dict[str, Hueify]:
+        """The per-bridge clients, keyed by label."""
+        return dict(self._bridges)
+
+    @property
+    def lights(self) -> BaseLightNamespace:
+        """Lights of all bridges. See :class:`~hueify.multi.MultiLightNamespace`."""
+        return self._lights
+
+    @property
+    def rooms(self) -> BaseGroupNamespace:
+        """Rooms of all bridges. See :class:`~hueify.multi.MultiGroupNamespace`."""
+        return self._rooms
+
+    @property
+    def zones(self) -> BaseGroupNamespace:
+        """Zones of all bridges. See :class:`~hueify.multi.MultiGroupNamespace`."""
+        return self._zones
+
+    @property
+    def scenes(self) -> BaseSceneNamespace:
+        """Scenes of all bridges. See :class:`~hueify.multi.MultiSceneNamespace`."""
+        return self._scenes
+
+    def bridge(self, label: str) -> Hueify:
+        """Return the client of one bridge.
+
+        Raises:
+            KeyError: When no bridge has that label.
+        """
+        return self._bridges[label]
+
+    async def __aenter__(self) -> Self:
+        await self.connect()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        """Connect to all bridges concurrently.
+
+        If any bridge fails to connect, the others are closed again and the
+        first error is raised.
+        """
+        logger.info(f"Connecting to {len(self._bridges)} Hue Bridges")
+        results = await asyncio.gather(
+            *(hue.connect() for hue in self._bridges.values()),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            await self.close()
+            raise errors[0]
+
+    async def close(self) -> None:
+        """Disconnect from all bridges."""
+        results = await asyncio.gather(
+            *(hue.close() for hue in self._bridges.values()),
+            return_exceptions=True,
+        )
+        for label, result in zip(self._bridges, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to close bridge '{label}': {result}")
+
+    def on[T: BaseModel](self, event_type: type[T], handler: EventHandler[T]) -> None:
+        """Subscribe ``handler`` to ``event_type`` on every bridge."""
+        for hue in self._bridges.values():
+            hue.on(event_type, handler)
+
+    def off[T: BaseModel](self, event_type: type[T], handler: EventHandler[T]) -> None:
+        """Unsubscribe ``handler`` from ``event_type`` on every bridge."""
+        for hue in self._bridges.values():
+            hue.off(event_type, handler)
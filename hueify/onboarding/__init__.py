@@ -1,8 +1,20 @@
-from .discovery import DiscoveredBridge, discover_bridges
+from .cache import BridgeCache, KnownBridge
+from .discovery import (
+    DiscoveredBridge,
+    discover_bridges,
+    discover_bridges_locally,
+    discover_bridges_mdns,
+    probe_bridges,
+)
 from .registration import register_app_key
 
 __all__ = [
+    "BridgeCache",
     "DiscoveredBridge",
+    "KnownBridge",
     "discover_bridges",
+    "discover_bridges_locally",
+    "discover_bridges_mdns",
+    "probe_bridges",
     "register_app_key",
 ]
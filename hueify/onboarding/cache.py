@@ -0,0 +1,89 @@
+import logging
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from hueify.onboarding.discovery import DiscoveredBridge
+
+logger = logging.getLogger(__name__)
+
+_CACHE_FILE_NAME = "bridges.json"
+
+
+class KnownBridge(DiscoveredBridge):
+    last_seen: datetime
+
+
+class _CacheFile(BaseModel):
+    bridges: dict[str, KnownBridge] = {}
+
+
+class BridgeCache:
+    """Last-known address of every bridge seen by discovery, keyed by bridge id.
+
+    Stored as JSON next to the CLI config file, so it survives restarts and
+    a reconnect can look up a bridge without any network traffic. A missing
+    or corrupt file reads as empty.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """
+        Args:
+            path: JSON file to use. Defaults to ``bridges.json`` in the
+                directory of :func:`~hueify.credentials.get_credentials_config_path`.
+        """
+        if path is None:
+            from hueify.credentials import get_credentials_config_path
+
+            path = get_credentials_config_path().parent / _CACHE_FILE_NAME
+        self._path = Path(path)
+        self._bridges: dict[str, KnownBridge] | None = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def bridges(self) -> list[KnownBridge]:
+        return list(self._load().values())
+
+    def get(self, bridge_id: str) -> KnownBridge | None:
+        return self._load().get(bridge_id.lower())
+
+    def find_by_ip(self, ip: str) -> KnownBridge | None:
+        return next(
+            (b for b in self._load().values() if b.internalipaddress == ip), None
+        )
+
+    def remember(self, bridges: list[DiscoveredBridge]) -> None:
+        """Record ``bridges`` as seen now and write the file."""
+        if not bridges:
+            return
+        known = self._load()
+        now = datetime.now(UTC)
+        for bridge in bridges:
+            known[bridge.id] = KnownBridge(**bridge.model_dump(), last_seen=now)
+        self._save(known)
+
+    def _load(self) -> dict[str, KnownBridge]:
+        if self._bridges is None:
+            try:
+                content = self._path.read_text(encoding="utf-8")
+                self._bridges = _CacheFile.model_validate_json(content).bridges
+            except FileNotFoundError:
+                self._bridges = {}
+            except (OSError, ValidationError) as e:
+                logger.warning(f"Ignoring unreadable bridge cache {self._path}: {e}")
+                self._bridges = {}
+        return self._bridges
+
+    def _save(self, known: dict[str, KnownBridge]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._path.with_suffix(".tmp")
+        temporary.write_text(
+            _CacheFile(bridges=known).model_dump_json(indent=2), encoding="utf-8"
+        )
+        os.replace(temporary, self._path)
+        logger.debug(f"Saved {len(known)} bridge(s) to {self._path}")
@@ -1,10 +1,33 @@
+import asyncio
+import ipaddress
+import logging
+import socket
+from collections.abc import AsyncIterator, Iterable
+from typing import TYPE_CHECKING
+
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
+
+from hueify.onboarding import mdns
+
+if TYPE_CHECKING:
+    from hueify.onboarding.cache import BridgeCache
+
+logger = logging.getLogger(__name__)
+
+_CONFIG_PATH = "/api/config"
 
 
 class DiscoveredBridge(BaseModel):
     id: str
     internalipaddress: str
+    port: int | None = None
+
+    @field_validator("id")
+    @classmethod
+    def normalize_id(cls, value: str) -> str:
+        # The cloud endpoint and mDNS use lower case, /api/config upper case.
+        return value.lower()
 
 
 async def discover_bridges() -> list[DiscoveredBridge]:
@@ -15,3 +38,176 @@ async def discover_bridges() -> list[DiscoveredBridge]:
         if not bridges:
             raise RuntimeError("No Hue Bridge found on the network.")
         return [DiscoveredBridge(**b) for b in bridges]
+
+
+async def discover_bridges_mdns(
+    timeout: float = 1.0,
+    *,
+    bridge_id: str | None = None,
+    address: tuple[str, int] = mdns.MDNS_ADDRESS,
+) -> list[DiscoveredBridge]:
+    """Find bridges announcing ``_hue._tcp`` on the local network.
+
+    Args:
+        timeout: Seconds to collect answers for.
+        bridge_id: Return as soon as this bridge has answered.
+        address: Where to send the query; a local responder in tests.
+    """
+    found = [b async for b in _iter_mdns(timeout, bridge_id, address)]
+    logger.debug(f"mDNS discovery found {len(found)} bridge(s)")
+    return found
+
+
+async def _iter_mdns(
+    timeout: float, bridge_id: str | None, address: tuple[str, int]
+) -> AsyncIterator[DiscoveredBridge]:
+    seen: set[str] = set()
+    async for records, sender in mdns.query(timeout, address=address):
+        for instance in records.pointers:
+            text = records.texts.get(instance, {})
+            if "bridgeid" not in text:
+                continue
+            target, port = records.services.get(instance, ("", None))
+            bridge = DiscoveredBridge(
+                id=text["bridgeid"],
+                internalipaddress=records.addresses.get(target, sender),
+                port=port,
+            )
+            if bridge.id in seen:
+                continue
+            seen.add(bridge.id)
+            yield bridge
+            if bridge_id is not None and bridge.id == bridge_id.lower():
+                return
+
+
+def local_subnet_hosts() -> list[str]:
+    """Every other address in the /24 of this machine's primary IPv4 address.
+
+    Returns an empty list when the machine has no routable IPv4 address.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+        try:
+            # Connecting a UDP socket picks a route without sending anything.
+            probe.connect(("192.0.2.1", 80))
+        except OSError:
+            return []
+        own_ip = probe.getsockname()[0]
+    network = ipaddress.ip_network(f"{own_ip}/24", strict=False)
+    return [str(host) for host in network.hosts() if str(host) != own_ip]
+
+
+async def probe_bridges(
+    hosts: Iterable[str] | None = None,
+    *,
+    bridge_id: str | None = None,
+    port: int | None = None,
+    concurrency: int = 64,
+    timeout: float = 0.5,
+) -> list[DiscoveredBridge]:
+    """Ask every host for the unauthenticated ``/api/config`` and keep the bridges.
+
+    Args:
+        hosts: Addresses to probe. Defaults to :func:`local_subnet_hosts`.
+        bridge_id: Stop probing as soon as this bridge has answered.
+        port: Port to probe instead of 80, e.g. for a
+            :class:`~hueify.testing.FakeHueBridge`.
+        concurrency: Maximum number of hosts probed at once.
+        timeout: Seconds to wait for each host.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    hosts = local_subnet_hosts() if hosts is None else list(hosts)
+    semaphore = asyncio.Semaphore(concurrency)
+    found: list[DiscoveredBridge] = []
+
+    async with httpx.AsyncClient(timeout=timeout) as client:
+
+        async def probe(host: str) -> DiscoveredBridge | None:
+            async with semaphore:
+                return await _probe(client, host, port)
+
+        tasks = [asyncio.create_task(probe(host)) for host in hosts]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                bridge = await next_done
+                if bridge is None:
+                    continue
+                found.append(bridge)
+                if bridge_id is not None and bridge.id == bridge_id.lower():
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    logger.debug(f"Probed {len(hosts)} host(s), found {len(found)} bridge(s)")
+    return found
+
+
+async def _probe(
+    client: httpx.AsyncClient, host: str, port: int | None
+) -> DiscoveredBridge | None:
+    authority = host if port is None else f"{host}:{port}"
+    try:
+        response = await client.get(f"http://{authority}{_CONFIG_PATH}")
+        config = response.json()
+    except (httpx.HTTPError, ValueError):
+        return None
+    if not isinstance(config, dict) or "bridgeid" not in config:
+        return None
+    return DiscoveredBridge(id=config["bridgeid"], internalipaddress=host, port=port)
+
+
+async def discover_bridges_locally(
+    timeout: float = 1.0,
+    *,
+    bridge_id: str | None = None,
+    cache: "BridgeCache | None" = None,
+    mdns_address: tuple[str, int] = mdns.MDNS_ADDRESS,
+    hosts: Iterable[str] | None = None,
+    port: int | None = None,
+) -> list[DiscoveredBridge]:
+    """Find bridges without the cloud endpoint, via mDNS and a subnet probe.
+
+    Both run concurrently. With ``bridge_id`` the search ends as soon as
+    either finds that bridge, which on a healthy network takes milliseconds.
+    Results are merged by bridge id.
+
+    Args:
+        timeout: Seconds to wait for mDNS answers; the probe uses short
+            per-host timeouts and usually finishes well within this.
+        bridge_id: Return as soon as this bridge is found.
+        cache: Record every bridge found here, see
+            :class:`~hueify.onboarding.BridgeCache`.
+        mdns_address: Where to send the mDNS query.
+        hosts: Addresses to probe. Defaults to the local /24.
+        port: Port to probe instead of 80.
+    """
+    searches = [
+        asyncio.create_task(
+            discover_bridges_mdns(timeout, bridge_id=bridge_id, address=mdns_address)
+        ),
+        asyncio.create_task(probe_bridges(hosts, bridge_id=bridge_id, port=port)),
+    ]
+    found: dict[str, DiscoveredBridge] = {}
+    try:
+        for next_done in asyncio.as_completed(searches):
+            try:
+                bridges = await next_done
+            except OSError as e:
+                logger.debug(f"Local discovery method failed: {e}")
+                continue
+            for bridge in bridges:
+                found.setdefault(bridge.id, bridge)
+            if bridge_id is not None and bridge_id.lower() in found:
+                break
+    finally:
+        for search in searches:
+            search.cancel()
+        await asyncio.gather(*searches, return_exceptions=True)
+
+    bridges = list(found.values())
+    if cache is not None:
+        cache.remember(bridges)
+    return bridges
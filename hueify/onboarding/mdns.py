@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import socket
+import struct
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+MDNS_ADDRESS = ("224.0.0.251", 5353)
+HUE_SERVICE = "_hue._tcp.local"
+
+TYPE_A = 1
+TYPE_PTR = 12
+TYPE_TXT = 16
+TYPE_SRV = 33
+
+_CLASS_IN = 1
+_UNICAST_RESPONSE = 0x8000
+_CACHE_FLUSH = 0x8000
+_RESPONSE_FLAGS = 0x8400
+_HEADER = struct.Struct("!HHHHHH")
+_RECORD = struct.Struct("!HHIH")
+_POINTER = 0xC0
+
+
+@dataclass
+class ServiceRecords:
+    """Records of one mDNS response, grouped for service resolution."""
+
+    pointers: list[str] = field(default_factory=list)
+    texts: dict[str, dict[str, str]] = field(default_factory=dict)
+    services: dict[str, tuple[str, int]] = field(default_factory=dict)
+    addresses: dict[str, str] = field(default_factory=dict)
+
+
+def encode_name(name: str) -> bytes:
+    encoded = b"".join(
+        bytes([len(label)]) + label for label in (p.encode() for p in name.split("."))
+    )
+    return encoded + b"\x00"
+
+
+def encode_record(name: str, record_type: int, data: bytes, ttl: int = 120) -> bytes:
+    return (
+        encode_name(name)
+        + _RECORD.pack(record_type, _CLASS_IN | _CACHE_FLUSH, ttl, len(data))
+        + data
+    )
+
+
+def build_query(service: str = HUE_SERVICE) -> bytes:
+    """Build a PTR question asking responders to answer by unicast."""
+    return (
+        _HEADER.pack(0, 0, 1, 0, 0, 0)
+        + encode_name(service)
+        + struct.pack("!HH", TYPE_PTR, _CLASS_IN | _UNICAST_RESPONSE)
+    )
+
+
+def build_response(records: list[bytes]) -> bytes:
+    return _HEADER.pack(0, _RESPONSE_FLAGS, 0, len(records), 0, 0) + b"".join(records)
+
+
+def parse_response(packet: bytes) -> ServiceRecords:
+    """Parse the answer, authority and additional sections of an mDNS packet.
+
+    Raises:
+        ValueError: When the packet is truncated or malformed.
+    """
+    try:
+        return _parse_response(packet)
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise ValueError(f"Malformed mDNS packet: {e}") from e
+
+
+def _parse_response(packet: bytes) -> ServiceRecords:
+    _, flags, questions, *counts = _HEADER.unpack_from(packet)
+    if not flags & 0x8000:
+        raise ValueError("Not an mDNS response")
+
+    offset = _HEADER.size
+    for _ in range(questions):
+        _, offset = _read_name(packet, offset)
+        offset += 4
+
+    records = ServiceRecords()
+    for _ in range(sum(counts)):
+        name, offset = _read_name(packet, offset)
+        record_type, _, _, length = _RECORD.unpack_from(packet, offset)
+        offset += _RECORD.size
+        data_offset, offset = offset, offset + length
+        if offset > len(packet):
+            raise ValueError("Record runs past the end of the packet")
+
+        if record_type == TYPE_A and length == 4:
+            records.addresses[name] = socket.inet_ntoa(packet[data_offset:offset])
+        elif record_type == TYPE_PTR:
+            records.pointers.append(_read_name(packet, data_offset)[0])
+        elif record_type == TYPE_TXT:
+            records.texts[name] = _read_text(packet[data_offset:offset])
+        elif record_type == TYPE_SRV:
+            (port,) = struct.unpack_from("!H", packet, data_offset + 4)
+            target, _ = _read_name(packet, data_offset + 6)
+            records.services[name] = (target, port)
+    return records
+
+
+def _read_name(packet: bytes, offset: int) -> tuple[str, int]:
+    labels: list[str] = []
+    end: int | None = None
+    for _ in range(len(packet)):
+        length = packet[offset]
+        if length & _POINTER == _POINTER:
+            if end is None:
+                end = offset + 2
+            offset = ((length & ~_POINTER & 0xFF) << 8) | packet[offset + 1]
+            continue
+        if length == 0:
+            return ".".join(labels), end if end is not None else offset + 1
+        labels.append(packet[offset + 1 : offset + 1 + length].decode())
+        offset += 1 + length
+    raise ValueError("Name compression loop")
+
+
+def _read_text(data: bytes) -> dict[str, str]:
+    entries: dict[str, str] = {}
+    offset = 0
+    while offset < len(data):
+        length = data[offset]
+        key, _, value = data[offset + 1 : offset + 1 + length].decode().partition("=")
+        entries[key.lower()] = value
+        offset += 1 + length
+    return entries
+
+
+class _QueryProtocol(asyncio.DatagramProtocol):
+    def __init__(self, responses: asyncio.Queue[tuple[bytes, str]]) -> None:
+        self._responses = responses
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        self._responses.put_nowait((data, addr[0]))
+
+    def error_received(self, exc: Exception) -> None:
+        logger.debug(f"mDNS socket error: {exc}")
+
+
+async def query(
+    timeout: float,
+    *,
+    service: str = HUE_SERVICE,
+    address: tuple[str, int] = MDNS_ADDRESS,
+) -> AsyncIterator[tuple[ServiceRecords, str]]:
+    """Send one service query and yield ``(records, sender_ip)`` until ``timeout``.
+
+    The query is sent from an ephemeral port, which makes responders answer
+    by unicast (RFC 6762 section 6.7), so no multicast membership is needed.
+    Malformed packets are skipped.
+    """
+    loop = asyncio.get_running_loop()
+    responses: asyncio.Queue[tuple[bytes, str]] = asyncio.Queue()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: _QueryProtocol(responses), local_addr=("0.0.0.0", 0)
+    )
+    try:
+        transport.sendto(build_query(service), address)
+        deadline = loop.time() + timeout
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                packet, sender = await asyncio.wait_for(responses.get(), remaining)
+            except TimeoutError:
+                return
+            try:
+                records = parse_response(packet)
+            except ValueError as e:
+                logger.debug(f"Ignoring mDNS packet from {sender}: {e}")
+                continue
+            yield records, sender
+    finally:
+        transport.close()
@@ -0,0 +1,37 @@
+from typing import TYPE_CHECKING
+
+from hueify._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .profiler import (
+        EventProfiler,
+        active_profiler,
+        current_event_type,
+        event_scope,
+    )
+    from .views import HandlerStats, LoopLagStats, ProfileReport, StageStats
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EventProfiler": ".profiler",
+        "HandlerStats": ".views",
+        "LoopLagStats": ".views",
+        "ProfileReport": ".views",
+        "StageStats": ".views",
+        "active_profiler": ".profiler",
+        "current_event_type": ".profiler",
+        "event_scope": ".profiler",
+    },
+)
+
+__all__ = [
+    "EventProfiler",
+    "HandlerStats",
+    "LoopLagStats",
+    "ProfileReport",
+    "StageStats",
+    "active_profiler",
+    "current_event_type",
+    "event_scope",
+]
@@ -0,0 +1,217 @@
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextvars import ContextVar
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from hueify.profiling.views import LoopLagStats, ProfileReport
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_LAG_INTERVAL = 0.05
+_MAX_LAG_SAMPLES = 10_000
+
+_active_profiler: "EventProfiler | None" = None
+_current_event_type: ContextVar[str] = ContextVar(
+    "hueify_profiled_event_type", default="*"
+)
+
+
+def active_profiler() -> "EventProfiler | None":
+    """The running profiler, or ``None``. Instrumented code checks this first."""
+    return _active_profiler
+
+
+def current_event_type() -> str:
+    """The event type being dispatched in this context, ``"*"`` outside one."""
+    return _current_event_type.get()
+
+
+@contextlib.contextmanager
+def event_scope(event_type: str) -> Iterator[None]:
+    """Attribute profiled work inside the block to ``event_type``."""
+    token = _current_event_type.set(event_type)
+    try:
+        yield
+    finally:
+        _current_event_type.reset(token)
+
+
+class _Accumulator:
+    __slots__ = ("count", "max", "total")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+class EventProfiler:
+    """Opt-in profiler for the event pipeline and event-loop responsiveness.
+
+    While running it records how late the event loop wakes up a periodic
+    probe (loop lag) and how long each pipeline stage and each event handler
+    takes per event type. Only one profiler can run at a time; when none is
+    running the instrumentation costs a single global lookup per stage.
+
+    ```python
+    with hue.profiler:
+        await asyncio.sleep(30)
+    print(hue.profiler.report(top=5))
+    ```
+    """
+
+    def __init__(self, lag_interval: float = _DEFAULT_LAG_INTERVAL) -> None:
+        self._lag_interval = lag_interval
+        self._lag_task: asyncio.Task | None = None
+        self._lag_samples: deque[float] = deque(maxlen=_MAX_LAG_SAMPLES)
+        self._stages: dict[tuple[str, str], _Accumulator] = {}
+        self._handlers: dict[tuple[str, str], _Accumulator] = {}
+        self._events = 0
+        self._started_at: float | None = None
+        self._elapsed = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return _active_profiler is self
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start profiling. Must be called from within a running event loop."""
+        global _active_profiler
+        if _active_profiler is not None and _active_profiler is not self:
+            raise RuntimeError("Another EventProfiler is already running")
+        if self.is_running:
+            return
+
+        _active_profiler = self
+        self._started_at = time.perf_counter()
+        self._lag_task = asyncio.get_running_loop().create_task(self._probe_loop_lag())
+        logger.info("Event profiler started")
+
+    def stop(self) -> None:
+        global _active_profiler
+        if not self.is_running:
+            return
+
+        _active_profiler = None
+        if self._started_at is not None:
+            self._elapsed += time.perf_counter() - self._started_at
+            self._started_at = None
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            self._lag_task = None
+        logger.info("Event profiler stopped")
+
+    def reset(self) -> None:
+        self._lag_samples.clear()
+        self._stages.clear()
+        self._handlers.clear()
+        self._events = 0
+        self._elapsed = 0.0
+        if self._started_at is not None:
+            self._started_at = time.perf_counter()
+
+    def record_stage(self, stage: str, event_type: str, seconds: float) -> None:
+        key = (stage, event_type)
+        accumulator = self._stages.get(key)
+        if accumulator is None:
+            accumulator = self._stages[key] = _Accumulator()
+        accumulator.add(seconds)
+        if stage == "dispatch":
+            self._events += 1
+
+    def record_handler(self, handler: str, event_type: str, seconds: float) -> None:
+        key = (handler, event_type)
+        accumulator = self._handlers.get(key)
+        if accumulator is None:
+            accumulator = self._handlers[key] = _Accumulator()
+        accumulator.add(seconds)
+
+    def report(self, top: int = 10) -> "ProfileReport":
+        """Summarise what was recorded so far.
+
+        Args:
+            top: Number of handlers to include, slowest (by total time) first.
+        """
+        from hueify.profiling.views import HandlerStats, ProfileReport, StageStats
+
+        elapsed = self._elapsed
+        if self._started_at is not None:
+            elapsed += time.perf_counter() - self._started_at
+
+        stages = [
+            StageStats(
+                stage=stage,
+                event_type=event_type,
+                count=acc.count,
+                total_ms=acc.total * 1000,
+                mean_ms=acc.total / acc.count * 1000,
+                max_ms=acc.max * 1000,
+            )
+            for (stage, event_type), acc in self._stages.items()
+        ]
+        handlers = [
+            HandlerStats(
+                handler=handler,
+                event_type=event_type,
+                count=acc.count,
+                total_ms=acc.total * 1000,
+                mean_ms=acc.total / acc.count * 1000,
+                max_ms=acc.max * 1000,
+            )
+            for (handler, event_type), acc in self._handlers.items()
+        ]
+
+        return ProfileReport(
+            duration_seconds=elapsed,
+            events=self._events,
+            loop_lag=self._loop_lag_stats(),
+            stages=sorted(stages, key=lambda s: s.total_ms, reverse=True),
+            slowest_handlers=sorted(handlers, key=lambda h: h.total_ms, reverse=True)[
+                :top
+            ],
+        )
+
+    def _loop_lag_stats(self) -> "LoopLagStats":
+        from hueify.profiling.views import LoopLagStats
+
+        samples = sorted(self._lag_samples)
+        if not samples:
+            return LoopLagStats()
+        p95_index = min(len(samples) - 1, math.ceil(0.95 * len(samples)) - 1)
+        return LoopLagStats(
+            samples=len(samples),
+            mean_ms=sum(samples) / len(samples) * 1000,
+            p95_ms=samples[p95_index] * 1000,
+            max_ms=samples[-1] * 1000,
+        )
+
+    async def _probe_loop_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._lag_interval
+            await asyncio.sleep(self._lag_interval)
+            self._lag_samples.append(max(0.0, loop.time() - expected))
@@ -0,0 +1,43 @@
+from pydantic import BaseModel, Field
+
+
+class LoopLagStats(BaseModel):
+    """How late the event loop woke up a periodic probe, in milliseconds."""
+
+    samples: int = 0
+    mean_ms: float = 0.0
+    p95_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+class StageStats(BaseModel):
+    """Time spent in one stage of the event pipeline for one event type.
+
+    Stages are ``parse`` (decoding the SSE payload), ``validate`` (pydantic
+    validation of each event), ``dispatch`` (running all handlers) and
+    ``cache_update`` (merging the event into the in-memory caches).
+    """
+
+    stage: str
+    event_type: str
+    count: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+
+
+class HandlerStats(BaseModel):
+    handler: str
+    event_type: str
+    count: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+
+
+class ProfileReport(BaseModel):
+    duration_seconds: float
+    events: int
+    loop_lag: LoopLagStats
+    stages: list[StageStats] = Field(default_factory=list)
+    slowest_handlers: list[HandlerStats] = Field(default_factory=list)
@@ -1,9 +1,10 @@
 from .cache import SceneCache
-from .namespace import SceneNamespace
+from .namespace import BaseSceneNamespace, SceneNamespace
 from .schemas import SceneInfo, SceneStatusValue
 from .service import Scene
 
 __all__ = [
+    "BaseSceneNamespace",
     "Scene",
     "SceneCache",
     "SceneInfo",
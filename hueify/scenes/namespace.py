@@ -1,10 +1,43 @@
+from abc import ABC, abstractmethod
+
 from hueify.exceptions import ResourceNotFoundException
 from hueify.http import HttpClient
 from hueify.scenes.cache import SceneCache
 from hueify.scenes.service import Scene
 
 
-class SceneNamespace:
+class BaseSceneNamespace(ABC):
+    """Scene activation by name, wherever the scenes are looked up.
+
+    Implemented by :class:`~hueify.scenes.SceneNamespace` for one bridge and
+    by :class:`~hueify.multi.MultiSceneNamespace` for several.
+    """
+
+    @property
+    @abstractmethod
+    def names(self) -> list[str]:
+        """Names of all known scenes, sorted."""
+
+    @abstractmethod
+    def from_name(self, name: str) -> Scene:
+        """Look up a scene by name and return a :class:`~hueify.scenes.Scene` handle."""
+
+    async def activate(self, name: str, transition_ms: int | None = None) -> None:
+        """Activate a scene by name.
+
+        Args:
+            name: Exact scene name as configured in the Hue app.
+            transition_ms: Optional bridge-side fade duration in milliseconds.
+
+        Raises:
+            :class:`~hueify.exceptions.ResourceNotFoundException`: When no
+                matching scene is found.
+        """
+        scene = self.from_name(name)
+        await scene.activate(transition_ms=transition_ms)
+
+
+class SceneNamespace(BaseSceneNamespace):
     """Namespace for bridge-wide scene lookup and activation.
 
     Accessible as :attr:`Hueify.scenes <hueify.service.Hueify.scenes>`.
@@ -45,16 +78,3 @@ class SceneNamespace:
                 suggested_names=self.names,
             )
         return Scene(scene_info=scene_info, client=self._http_client)
-
-    async def activate(self, name: str) -> None:
-        """Activate a scene by name.
-
-        Args:
-            name: Exact scene name as configured in the Hue app.
-
-        Raises:
-            :class:`~hueify.exceptions.ResourceNotFoundException`: When no
-                matching scene is found.
-        """
-        scene = self.from_name(name)
-        await scene.activate()
@@ -35,18 +35,24 @@ class Scene:
         """Display name of the scene."""
         return self._scene_info.name
 
-    async def activate(self) -> ActionResult:
+    async def activate(self, transition_ms: int | None = None) -> ActionResult:
         """Activate this scene.
 
         Returns an :class:`~hueify.shared.resource.ActionResult` noting
         whether the scene was already active before the call.
+
+        Args:
+            transition_ms: Duration of the bridge-side fade into the scene in
+                milliseconds. ``None`` keeps the bridge default.
         """
         was_already_active = (
             self._scene_info.status
             and self._scene_info.status.active != SceneStatusValue.INACTIVE
         )
 
-        request = SceneActivationRequest(recall=SceneRecall(action=SceneAction.ACTIVE))
+        request = SceneActivationRequest(
+            recall=SceneRecall(action=SceneAction.ACTIVE, duration=transition_ms)
+        )
         await self._client.put(f"scene/{self.id}", data=request)
 
         if was_already_active:
@@ -0,0 +1,23 @@
+from .cache import SensorCache
+from .namespace import SensorNamespace
+from .service import Sensor
+from .views import (
+    ContactInfo,
+    DeviceInfo,
+    DevicePowerInfo,
+    LightLevelInfo,
+    MotionInfo,
+    TemperatureInfo,
+)
+
+__all__ = [
+    "ContactInfo",
+    "DeviceInfo",
+    "DevicePowerInfo",
+    "LightLevelInfo",
+    "MotionInfo",
+    "Sensor",
+    "SensorCache",
+    "SensorNamespace",
+    "TemperatureInfo",
+]
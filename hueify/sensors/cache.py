@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from hueify.cache import ManagedCache
+from hueify.cache.lookup import EntityLookupCache, NamedEntityLookupCache
+from hueify.http import HttpClient
+from hueify.sensors.views import (
+    ContactInfo,
+    DeviceInfo,
+    DevicePowerInfo,
+    LightLevelInfo,
+    MotionInfo,
+    SensorServiceInfo,
+    TemperatureInfo,
+)
+from hueify.sse.bus import EventBus
+from hueify.sse.views import (
+    ContactEvent,
+    DeviceEvent,
+    DevicePowerEvent,
+    LightLevelEvent,
+    MotionEvent,
+    TemperatureEvent,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SensorServiceCache[T: SensorServiceInfo](EntityLookupCache[T]):
+    """One kind of sensor service, additionally indexed by owning device."""
+
+    def __init__(self, endpoint: str, resource_type: type[T]) -> None:
+        super().__init__()
+        self._endpoint = endpoint
+        self._resource_type = resource_type
+        self._owner_to_id: dict[UUID, UUID] = {}
+
+    def get_by_owner(self, device_id: UUID) -> T | None:
+        service_id = self._owner_to_id.get(device_id)
+        return self.get_by_id(service_id) if service_id is not None else None
+
+    @property
+    def owner_ids(self) -> set[UUID]:
+        return set(self._owner_to_id)
+
+    async def populate(self, http_client: HttpClient) -> None:
+        services = await http_client.get_resources(
+            endpoint=self._endpoint, resource_type=self._resource_type
+        )
+        self._owner_to_id.clear()
+        self.store_all(services)
+
+    def _store_single(self, entity: T) -> None:
+        super()._store_single(entity)
+        self._owner_to_id[entity.owner.rid] = entity.id
+
+    async def on_event(self, event: BaseModel) -> None:
+        self.update_from_event(
+            event.id,
+            event.model_dump(exclude_none=True, exclude={"id", "type", "owner"}),
+        )
+        logger.debug(f"Updated {self._endpoint} {event.id} from SSE event")
+
+    def clear(self) -> None:
+        super().clear()
+        self._owner_to_id.clear()
+
+
+class DeviceCache(NamedEntityLookupCache[DeviceInfo]):
+    """Device names, which sensor services do not carry themselves."""
+
+    async def populate(self, http_client: HttpClient) -> None:
+        devices = await http_client.get_resources(
+            endpoint="/device", resource_type=DeviceInfo
+        )
+        self.store_all(devices)
+
+    async def on_event(self, event: DeviceEvent) -> None:
+        if event.metadata is None or event.metadata.name is None:
+            return
+        self.update_from_event(event.id, {"metadata": {"name": event.metadata.name}})
+        logger.debug(f"Updated device {event.id} from SSE event")
+
+
+class SensorCache(ManagedCache):
+    """Motion, temperature, light level, contact and battery readings.
+
+    Every kind of sensor service is a separate resource on the bridge, owned
+    by a device that carries the name. All of them are fetched concurrently
+    on :meth:`populate` and kept live by their SSE events.
+    """
+
+    def __init__(self, event_bus: EventBus) -> None:
+        self.devices = DeviceCache()
+        self.motion = SensorServiceCache("/motion", MotionInfo)
+        self.temperature = SensorServiceCache("/temperature", TemperatureInfo)
+        self.light_level = SensorServiceCache("/light_level", LightLevelInfo)
+        self.contact = SensorServiceCache("/contact", ContactInfo)
+        self.power = SensorServiceCache("/device_power", DevicePowerInfo)
+
+        event_bus.subscribe(DeviceEvent, self.devices.on_event)
+        event_bus.subscribe(MotionEvent, self.motion.on_event)
+        event_bus.subscribe(TemperatureEvent, self.temperature.on_event)
+        event_bus.subscribe(LightLevelEvent, self.light_level.on_event)
+        event_bus.subscribe(ContactEvent, self.contact.on_event)
+        event_bus.subscribe(DevicePowerEvent, self.power.on_event)
+        logger.debug("SensorCache subscribed to sensor events")
+
+    @property
+    def _services(self) -> list[SensorServiceCache]:
+        return [
+            self.motion,
+            self.temperature,
+            self.light_level,
+            self.contact,
+            self.power,
+        ]
+
+    @property
+    def device_ids(self) -> set[UUID]:
+        """Devices that own at least one sensor service."""
+        return set().union(*(cache.owner_ids for cache in self._services))
+
+    async def populate(self, http_client: HttpClient) -> None:
+        await asyncio.gather(
+            self.devices.populate(http_client),
+            *(cache.populate(http_client) for cache in self._services),
+        )
+
+    def clear(self) -> None:
+        self.devices.clear()
+        for cache in self._services:
+            cache.clear()
@@ -0,0 +1,82 @@
+from uuid import UUID
+
+from hueify.exceptions import ResourceNotFoundException
+from hueify.grouped_lights import RoomCache
+from hueify.sensors.cache import SensorCache
+from hueify.sensors.service import Sensor
+
+
+class SensorNamespace:
+    """Read-only access to motion, temperature, light level, contact and battery sensors.
+
+    Accessible as :attr:`Hueify.sensors <hueify.service.Hueify.sensors>`.
+    Sensors are addressed by the name of their device. Every reading comes
+    from caches populated on connect and kept live by the event stream, so
+    no read sends a request to the bridge.
+
+    ```python
+    async with Hueify() as hue:
+        hallway = hue.sensors.from_name("Hallway sensor")
+        print(hallway.motion, hallway.temperature, hallway.battery_level)
+
+        for sensor in hue.sensors.in_room("Kitchen"):
+            print(sensor.name, sensor.motion)
+    ```
+    """
+
+    def __init__(self, sensor_cache: SensorCache, room_cache: RoomCache) -> None:
+        self._sensor_cache = sensor_cache
+        self._room_cache = room_cache
+
+    @property
+    def names(self) -> list[str]:
+        """Names of all devices that report at least one sensor reading."""
+        return sorted(
+            self._sensor(device_id).name for device_id in self._sensor_cache.device_ids
+        )
+
+    def from_name(self, name: str) -> Sensor:
+        """Look up a sensor by device name and return a :class:`~hueify.sensors.Sensor` handle.
+
+        Args:
+            name: Exact device name as configured in the Hue app.
+
+        Raises:
+            :class:`~hueify.exceptions.ResourceNotFoundException`: When no
+                device with that name has sensor services.
+        """
+        device = self._sensor_cache.devices.get_by_name(name)
+        if device is None or device.id not in self._sensor_cache.device_ids:
+            raise ResourceNotFoundException(
+                resource_type="sensor",
+                lookup_name=name,
+                suggested_names=self.names,
+            )
+        return self._sensor(device.id)
+
+    def in_room(self, room_name: str) -> list[Sensor]:
+        """Sensors whose device is assigned to a room.
+
+        Args:
+            room_name: Exact room name as configured in the Hue app.
+
+        Raises:
+            :class:`~hueify.exceptions.ResourceNotFoundException`: When no
+                room with that name exists.
+        """
+        room = self._room_cache.get_by_name(room_name)
+        if room is None:
+            raise ResourceNotFoundException(
+                resource_type="room",
+                lookup_name=room_name,
+                suggested_names=[r.name for r in self._room_cache.get_all()],
+            )
+        device_ids = self._sensor_cache.device_ids
+        return [
+            self._sensor(child.rid)
+            for child in room.children
+            if child.rid in device_ids
+        ]
+
+    def _sensor(self, device_id: UUID) -> Sensor:
+        return Sensor(device_id, self._sensor_cache, self._room_cache)
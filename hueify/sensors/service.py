@@ -0,0 +1,95 @@
+from uuid import UUID
+
+from hueify.grouped_lights import RoomCache
+from hueify.sensors.cache import SensorCache
+from hueify.sse.views import BatteryState, ContactState
+
+
+class Sensor:
+    """A device with sensor services, e.g. a Hue motion sensor or contact sensor.
+
+    Every property reads the live cache, so a handle kept around always shows
+    the latest reading without a request to the bridge. Readings the device
+    does not provide, or currently reports as invalid, are ``None``.
+
+    Obtain instances via :meth:`SensorNamespace.from_name
+    <hueify.sensors.SensorNamespace.from_name>` rather than constructing
+    directly.
+    """
+
+    def __init__(
+        self, device_id: UUID, sensor_cache: SensorCache, room_cache: RoomCache
+    ) -> None:
+        self._device_id = device_id
+        self._sensor_cache = sensor_cache
+        self._room_cache = room_cache
+
+    @property
+    def id(self) -> UUID:
+        """ID of the device that owns the sensor services."""
+        return self._device_id
+
+    @property
+    def name(self) -> str:
+        """Device name as configured in the Hue app."""
+        device = self._sensor_cache.devices.get_by_id(self._device_id)
+        return device.name if device is not None else str(self._device_id)
+
+    @property
+    def room(self) -> str | None:
+        """Name of the room the device is assigned to, if any."""
+        for room in self._room_cache.get_all():
+            if any(child.rid == self._device_id for child in room.children):
+                return room.name
+        return None
+
+    @property
+    def motion(self) -> bool | None:
+        """Whether motion is currently detected."""
+        info = self._sensor_cache.motion.get_by_owner(self._device_id)
+        if info is None or info.motion.motion_valid is False:
+            return None
+        return info.motion.motion
+
+    @property
+    def temperature(self) -> float | None:
+        """Temperature in degrees Celsius."""
+        info = self._sensor_cache.temperature.get_by_owner(self._device_id)
+        if info is None or info.temperature.temperature_valid is False:
+            return None
+        return info.temperature.temperature
+
+    @property
+    def light_level(self) -> int | None:
+        """Raw light level as reported by the bridge, ``10000 * log10(lux) + 1``."""
+        info = self._sensor_cache.light_level.get_by_owner(self._device_id)
+        if info is None or info.light.light_level_valid is False:
+            return None
+        return info.light.light_level
+
+    @property
+    def lux(self) -> float | None:
+        """Illuminance in lux, converted from :attr:`light_level`."""
+        light_level = self.light_level
+        if light_level is None:
+            return None
+        return 10 ** ((light_level - 1) / 10000)
+
+    @property
+    def contact(self) -> bool | None:
+        """``True`` while the contact is closed, ``False`` while it is open."""
+        info = self._sensor_cache.contact.get_by_owner(self._device_id)
+        if info is None or info.contact_report is None:
+            return None
+        return info.contact_report.state == ContactState.CONTACT
+
+    @property
+    def battery_level(self) -> int | None:
+        """Remaining battery in percent."""
+        info = self._sensor_cache.power.get_by_owner(self._device_id)
+        return info.power_state.battery_level if info is not None else None
+
+    @property
+    def battery_state(self) -> BatteryState | None:
+        info = self._sensor_cache.power.get_by_owner(self._device_id)
+        return info.power_state.battery_state if info is not None else None
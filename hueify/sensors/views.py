@@ -0,0 +1,61 @@
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from hueify.shared.resource.views import ResourceMetadata, ResourceType
+from hueify.sse.views import (
+    ContactReport,
+    LightLevelData,
+    MotionData,
+    OwnerReference,
+    PowerStateData,
+    TemperatureData,
+)
+
+
+class SensorServiceInfo(BaseModel):
+    """Fields shared by every sensor service; ``owner`` is the physical device."""
+
+    id: UUID
+    id_v1: str | None = None
+    owner: OwnerReference
+
+
+class MotionInfo(SensorServiceInfo):
+    type: Literal[ResourceType.MOTION] = ResourceType.MOTION
+    enabled: bool = True
+    motion: MotionData
+
+
+class TemperatureInfo(SensorServiceInfo):
+    type: Literal[ResourceType.TEMPERATURE] = ResourceType.TEMPERATURE
+    enabled: bool = True
+    temperature: TemperatureData
+
+
+class LightLevelInfo(SensorServiceInfo):
+    type: Literal[ResourceType.LIGHT_LEVEL] = ResourceType.LIGHT_LEVEL
+    enabled: bool = True
+    light: LightLevelData
+
+
+class ContactInfo(SensorServiceInfo):
+    type: Literal[ResourceType.CONTACT] = ResourceType.CONTACT
+    enabled: bool = True
+    contact_report: ContactReport | None = None
+
+
+class DevicePowerInfo(SensorServiceInfo):
+    type: Literal[ResourceType.DEVICE_POWER] = ResourceType.DEVICE_POWER
+    power_state: PowerStateData
+
+
+class DeviceInfo(BaseModel):
+    id: UUID
+    type: Literal[ResourceType.DEVICE] = ResourceType.DEVICE
+    metadata: ResourceMetadata
+
+    @property
+    def name(self) -> str:
+        return self.metadata.name
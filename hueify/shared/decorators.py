@@ -4,6 +4,9 @@ import time
 from collections.abc import Callable, Coroutine
 from typing import Any, ParamSpec, TypeVar
 
+from hueify.http.tracing import correlation_scope
+from hueify.metrics.instruments import OPERATION_DURATION, OPERATION_ERRORS
+
 P = ParamSpec("P")
 R = TypeVar("R")
 
@@ -17,12 +20,20 @@ def timed(
 ) -> _AsyncDecorator:
     def decorator(func: _AsyncFunc) -> _AsyncFunc:
         logger = logging.getLogger(func.__module__)
+        operation = additional_text.strip("-") or func.__qualname__
 
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             start_time = time.perf_counter()
-            result = await func(*args, **kwargs)
-            execution_time = time.perf_counter() - start_time
+            try:
+                with correlation_scope():
+                    result = await func(*args, **kwargs)
+            except Exception:
+                OPERATION_ERRORS.inc(operation=operation)
+                raise
+            finally:
+                execution_time = time.perf_counter() - start_time
+                OPERATION_DURATION.observe(execution_time, operation=operation)
 
             if execution_time > min_duration_to_log:
                 function_name = additional_text.strip("-") or func.__name__
@@ -1,11 +1,13 @@
 from .base import Resource
-from .colors import Color, resolve_color
+from .colors import Color, resolve_color, resolve_color_xy, rgb_to_xy
 from .lookup import NamedResourceLookup, ResourceLookup
+from .suppression import WriteSuppression
 from .views import (
     ActionResult,
     ColorTemperatureState,
     ColorXY,
     ColorXYState,
+    GamutType,
     LightOnState,
     ResourceInfo,
     ResourceMetadata,
@@ -19,6 +21,7 @@ __all__ = [
     "ColorTemperatureState",
     "ColorXY",
     "ColorXYState",
+    "GamutType",
     "LightOnState",
     "NamedResourceLookup",
     "Resource",
@@ -27,5 +30,8 @@ __all__ = [
     "ResourceMetadata",
     "ResourceReference",
     "ResourceType",
+    "WriteSuppression",
     "resolve_color",
+    "resolve_color_xy",
+    "rgb_to_xy",
 ]
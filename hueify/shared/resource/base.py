@@ -6,7 +6,13 @@ from uuid import UUID
 from hueify.cache.lookup import EntityLookupCache
 from hueify.http import HttpClient
 from hueify.shared.decorators import timed
-from hueify.shared.resource.colors import Color, resolve_color
+from hueify.shared.resource.colors import (
+    Color,
+    resolve_color,
+    resolve_color_xy,
+    rgb_to_xy,
+)
+from hueify.shared.resource.suppression import WriteSuppression
 from hueify.shared.resource.views import (
     ActionResult,
     ColorTemperatureState,
@@ -14,6 +20,8 @@ from hueify.shared.resource.views import (
     ColorXYState,
     ControllableLightUpdate,
     DimmingState,
+    DynamicsUpdate,
+    GamutType,
     LightOnState,
     TLightInfo,
 )
@@ -41,11 +49,13 @@ class Resource(ABC, Generic[TLightInfo]):
         light_info: TLightInfo,
         client: HttpClient,
         cache: EntityLookupCache[TLightInfo] | None = None,
+        write_suppression: WriteSuppression | None = None,
     ) -> None:
         self._id = light_info.id
         self._fallback_info = light_info
         self._cache = cache
         self._client = client
+        self._write_suppression = write_suppression
 
     @property
     def _light_info(self) -> TLightInfo:
@@ -84,6 +94,10 @@ class Resource(ABC, Generic[TLightInfo]):
             ((mirek - self._MIREK_MIN) / (self._MIREK_MAX - self._MIREK_MIN)) * 100
         )
 
+    @property
+    def _gamut_type(self) -> GamutType | None:
+        return None
+
     @property
     def id(self) -> UUID:
         """Unique resource ID assigned by the Hue Bridge."""
@@ -106,49 +120,87 @@ class Resource(ABC, Generic[TLightInfo]):
         pass
 
     @timed()
-    async def turn_on(self) -> ActionResult:
+    async def turn_on(self, transition_ms: int | None = None) -> ActionResult:
         """Turn the resource on.
 
         Returns an :class:`~hueify.shared.resource.ActionResult` describing
         the outcome. No-ops (and still succeeds) when already on.
+
+        Args:
+            transition_ms: Duration of the bridge-side fade in milliseconds.
+                ``None`` keeps the bridge default.
         """
         if self.is_on:
-            return ActionResult(message="Already on")
+            return ActionResult(message="Already on", unchanged=True)
 
-        await self._update_remote_state(self._create_on_state())
+        await self._update_remote_state(self._create_on_state(), transition_ms)
         return ActionResult(message="Turned on successfully")
 
-    async def _update_remote_state(self, state: ControllableLightUpdate) -> None:
+    async def _update_remote_state(
+        self, state: ControllableLightUpdate, transition_ms: int | None = None
+    ) -> bool:
+        """Send ``state`` to the bridge, minus the fields already in effect.
+
+        Returns ``False`` when write suppression skipped the request entirely.
+        """
+        changed = self._drop_unchanged_fields(state)
+        if changed is None:
+            logger.debug(f"Skipping no-op update for {self.id}")
+            return False
+
+        if transition_ms is not None:
+            changed.dynamics = DynamicsUpdate(duration=transition_ms)
         endpoint = self._get_resource_endpoint()
-        await self._client.put(f"{endpoint}/{self.id}", data=state)
+        await self._client.put(f"{endpoint}/{self.id}", data=changed)
+        return True
+
+    def _drop_unchanged_fields(
+        self, state: ControllableLightUpdate
+    ) -> ControllableLightUpdate | None:
+        # Only trust state the event stream keeps fresh, never the snapshot
+        # this handle was created from.
+        if self._write_suppression is None or self._cache is None:
+            return state
+        current = self._cache.get_by_id(self._id)
+        if current is None:
+            return state
+        return self._write_suppression.changed_fields(state, current)
 
     def _create_on_state(self) -> ControllableLightUpdate:
         return ControllableLightUpdate(on=LightOnState(on=True))
 
     @timed()
-    async def turn_off(self) -> ActionResult:
+    async def turn_off(self, transition_ms: int | None = None) -> ActionResult:
         """Turn the resource off.
 
         Returns an :class:`~hueify.shared.resource.ActionResult` describing
         the outcome. No-ops (and still succeeds) when already off.
+
+        Args:
+            transition_ms: Duration of the bridge-side fade in milliseconds.
+                ``None`` keeps the bridge default.
         """
         if not self.is_on:
-            return ActionResult(message="Already off")
+            return ActionResult(message="Already off", unchanged=True)
 
-        await self._update_remote_state(self._create_off_state())
+        await self._update_remote_state(self._create_off_state(), transition_ms)
         return ActionResult(message="Turned off successfully")
 
     def _create_off_state(self) -> ControllableLightUpdate:
         return ControllableLightUpdate(on=LightOnState(on=False))
 
     @timed()
-    async def set_brightness(self, percentage: float | int) -> ActionResult:
+    async def set_brightness(
+        self, percentage: float | int, transition_ms: int | None = None
+    ) -> ActionResult:
         """Set brightness to an absolute level.
 
         Args:
             percentage: Target brightness in ``[0, 100]``. A float in
                 ``(0, 1]`` is treated as a fraction and multiplied by 100.
                 Values outside the valid range are clamped.
+            transition_ms: Duration of the bridge-side fade in milliseconds.
+                ``None`` keeps the bridge default.
 
         Returns:
             :class:`~hueify.shared.resource.ActionResult` with
@@ -166,16 +218,29 @@ class Resource(ABC, Generic[TLightInfo]):
         else:
             message = f"Brightness set to {clamped}%"
 
-        await self._update_remote_state(self._create_brightness_state(clamped))
-        return ActionResult(message=message, clamped=was_clamped, final_value=clamped)
+        sent = await self._update_remote_state(
+            self._create_brightness_state(clamped), transition_ms
+        )
+        if not sent:
+            message = f"Brightness already at {clamped}%"
+        return ActionResult(
+            message=message,
+            clamped=was_clamped,
+            final_value=clamped,
+            unchanged=not sent,
+        )
 
     @timed()
-    async def increase_brightness(self, percentage: float | int) -> ActionResult:
+    async def increase_brightness(
+        self, percentage: float | int, transition_ms: int | None = None
+    ) -> ActionResult:
         """Increase brightness relative to the current level.
 
         Args:
             percentage: Amount to add in percentage points. The result is
                 clamped to ``[0, 100]``.
+            transition_ms: Duration of the bridge-side fade in milliseconds.
+                ``None`` keeps the bridge default.
 
         Returns:
             :class:`~hueify.shared.resource.ActionResult` with
@@ -192,16 +257,29 @@ class Resource(ABC, Generic[TLightInfo]):
             else f"Brightness increased to {clamped}%"
         )
 
-        await self._update_remote_state(self._create_brightness_state(clamped))
-        return ActionResult(message=message, clamped=was_clamped, final_value=clamped)
+        sent = await self._update_remote_state(
+            self._create_brightness_state(clamped), transition_ms
+        )
+        if not sent:
+            message = f"Brightness already at {clamped}%"
+        return ActionResult(
+            message=message,
+            clamped=was_clamped,
+            final_value=clamped,
+            unchanged=not sent,
+        )
 
     @timed()
-    async def decrease_brightness(self, percentage: float | int) -> ActionResult:
+    async def decrease_brightness(
+        self, percentage: float | int, transition_ms: int | None = None
+    ) -> ActionResult:
         """Decrease brightness relative to the current level.
 
         Args:
             percentage: Amount to subtract in percentage points. The result
                 is clamped to ``[0, 100]``.
+            transition_ms: Duration of the bridge-side fade in milliseconds.
+                ``None`` keeps the bridge default.
 
         Returns:
             :class:`~hueify.shared.resource.ActionResult` with
@@ -218,8 +296,17 @@ class Resource(ABC, Generic[TLightInfo]):
             else f"Brightness decreased to {clamped}%"
         )
 
-        await self._update_remote_state(self._create_brightness_state(clamped))
-        return ActionResult(message=message, clamped=was_clamped, final_value=clamped)
+        sent = await self._update_remote_state(
+            self._create_brightness_state(clamped), transition_ms
+        )
+        if not sent:
+            message = f"Brightness already at {clamped}%"
+        return ActionResult(
+            message=message,
+            clamped=was_clamped,
+            final_value=clamped,
+            unchanged=not sent,
+        )
 
     def _create_brightness_state(self, brightness: int) -> ControllableLightUpdate:
         return ControllableLightUpdate(
@@ -232,12 +319,16 @@ class Resource(ABC, Generic[TLightInfo]):
         return int(percentage)
 
     @timed()
-    async def set_color_temperature(self, percentage: float | int) -> ActionResult:
+    async def set_color_temperature(
+        self, percentage: float | int, transition_ms: int | None = None
+    ) -> ActionResult:
         """Set the colour temperature as a percentage of the bulb's supported range.
 
         Args:
             percentage: ``0`` = warmest white, ``100`` = coolest white.
                 Clamped to ``[0, 100]`` before conversion.
+            transition_ms: Duration of the bridge-side fade in milliseconds.
+                ``None`` keeps the bridge default.
 
         Returns:
             :class:`~hueify.shared.resource.ActionResult` with
@@ -258,8 +349,17 @@ class Resource(ABC, Generic[TLightInfo]):
         mirek = int(
             self._MIREK_MIN + (clamped / 100) * (self._MIREK_MAX - self._MIREK_MIN)
         )
-        await self._update_remote_state(self._create_color_temperature_state(mirek))
-        return ActionResult(message=message, clamped=was_clamped, final_value=clamped)
+        sent = await self._update_remote_state(
+            self._create_color_temperature_state(mirek), transition_ms
+        )
+        if not sent:
+            message = f"Temperature already at {clamped}%"
+        return ActionResult(
+            message=message,
+            clamped=was_clamped,
+            final_value=clamped,
+            unchanged=not sent,
+        )
 
     def _create_color_temperature_state(self, mirek: int) -> ControllableLightUpdate:
         return ControllableLightUpdate(
@@ -268,40 +368,37 @@ class Resource(ABC, Generic[TLightInfo]):
         )
 
     @timed()
-    async def set_color(self, r: int, g: int, b: int) -> ActionResult:
+    async def set_color(
+        self, r: int, g: int, b: int, transition_ms: int | None = None
+    ) -> ActionResult:
         """Set the colour using sRGB values.
 
         The RGB triplet is converted to CIE xy chromaticity coordinates using
-        the Hue wide-gamut D65 colour matrix with proper sRGB gamma correction.
+        the Hue wide-gamut D65 colour matrix with proper sRGB gamma correction
+        and clamped into the light's colour gamut when the bridge reports one.
 
         Args:
             r: Red channel in ``[0, 255]``.
             g: Green channel in ``[0, 255]``.
             b: Blue channel in ``[0, 255]``.
+            transition_ms: Duration of the bridge-side fade in milliseconds.
+                ``None`` keeps the bridge default.
 
         Returns:
             :class:`~hueify.shared.resource.ActionResult` confirming the applied colour.
         """
-        x, y = self._rgb_to_xy(r, g, b)
-        await self._update_remote_state(self._create_color_state(x, y))
-        return ActionResult(message=f"Color set to rgb({r}, {g}, {b})")
-
-    @staticmethod
-    def _rgb_to_xy(r: int, g: int, b: int) -> tuple[float, float]:
-        def gamma(v: float) -> float:
-            v /= 255
-            return ((v + 0.055) / 1.055) ** 2.4 if v > 0.04045 else v / 12.92
-
-        r_, g_, b_ = gamma(r), gamma(g), gamma(b)
-
-        X = r_ * 0.664511 + g_ * 0.154324 + b_ * 0.162028
-        Y = r_ * 0.283881 + g_ * 0.668433 + b_ * 0.047685
-        Z = r_ * 0.000088 + g_ * 0.072310 + b_ * 0.986039
+        x, y = rgb_to_xy(r, g, b, self._gamut_type)
+        sent = await self._update_remote_state(
+            self._create_color_state(x, y), transition_ms
+        )
+        return self._color_result(r, g, b, sent)
 
-        total = X + Y + Z
-        if total == 0:
-            return 0.0, 0.0
-        return round(X / total, 4), round(Y / total, 4)
+    def _color_result(self, r: int, g: int, b: int, sent: bool) -> ActionResult:
+        if not sent:
+            return ActionResult(
+                message=f"Color already rgb({r}, {g}, {b})", unchanged=True
+            )
+        return ActionResult(message=f"Color set to rgb({r}, {g}, {b})")
 
     def _create_color_state(self, x: float, y: float) -> ControllableLightUpdate:
         return ControllableLightUpdate(
@@ -310,18 +407,124 @@ class Resource(ABC, Generic[TLightInfo]):
         )
 
     @timed()
-    async def set_named_color(self, color: Color) -> ActionResult:
+    async def set_named_color(
+        self, color: Color, transition_ms: int | None = None
+    ) -> ActionResult:
         """Set the colour using a predefined :class:`~hueify.shared.resource.Color` constant.
 
-        Resolves the named colour to an RGB triplet and delegates to
-        :meth:`set_color`.
+        The xy coordinates for every named colour and gamut are precomputed,
+        so no colour conversion happens per call.
 
         Args:
             color: One of the named colours from :class:`~hueify.shared.resource.Color`,
                 e.g. ``Color.WARM_WHITE`` or ``Color.OCEAN``.
+            transition_ms: Duration of the bridge-side fade in milliseconds.
+                ``None`` keeps the bridge default.
 
         Returns:
             :class:`~hueify.shared.resource.ActionResult` confirming the applied colour.
         """
-        r, g, b = resolve_color(color)
-        return await self.set_color(r, g, b)
+        x, y = resolve_color_xy(color, self._gamut_type)
+        sent = await self._update_remote_state(
+            self._create_color_state(x, y), transition_ms
+        )
+        return self._color_result(*resolve_color(color), sent)
+
+    @timed()
+    async def set_state(
+        self,
+        *,
+        on: bool | None = None,
+        brightness: float | int | None = None,
+        color: Color | tuple[int, int, int] | None = None,
+        mirek: int | None = None,
+        transition_ms: int | None = None,
+    ) -> ActionResult:
+        """Apply several state changes in a single bridge request.
+
+        Every given field is merged into one update, so switching a light on,
+        dimming it and changing its colour costs one round trip instead of
+        three. Setting brightness, colour or mirek implies ``on=True`` unless
+        ``on`` is passed explicitly.
+
+        Args:
+            on: Switch the resource on (``True``) or off (``False``).
+            brightness: Target brightness in ``[0, 100]``, clamped like
+                :meth:`set_brightness`.
+            color: A named :class:`~hueify.shared.resource.Color` or an sRGB
+                ``(r, g, b)`` triplet.
+            mirek: Colour temperature in mirek, clamped to ``[153, 500]``.
+                Mutually exclusive with ``color``.
+            transition_ms: Duration of the bridge-side fade in milliseconds.
+                ``None`` keeps the bridge default.
+
+        Returns:
+            :class:`~hueify.shared.resource.ActionResult` whose
+            ``clamped_fields`` lists every field that was adjusted and whose
+            ``final_value`` maps field names to the values actually sent.
+
+        Raises:
+            ValueError: When no field is given or both ``color`` and
+                ``mirek`` are set.
+        """
+        if color is not None and mirek is not None:
+            raise ValueError("'color' and 'mirek' cannot be set at the same time")
+        if on is None and brightness is None and color is None and mirek is None:
+            raise ValueError("set_state() requires at least one state field")
+
+        state = ControllableLightUpdate()
+        applied: dict[str, object] = {}
+        clamped_fields: list[str] = []
+
+        if brightness is not None:
+            percentage_int = self._normalize_percentage(brightness)
+            clamped = max(
+                self._MIN_BRIGHTNESS, min(self._MAX_BRIGHTNESS, percentage_int)
+            )
+            if clamped != percentage_int:
+                clamped_fields.append("brightness")
+            state.dimming = DimmingState(brightness=clamped)
+            applied["brightness"] = clamped
+
+        if color is not None:
+            x, y = (
+                resolve_color_xy(color, self._gamut_type)
+                if isinstance(color, Color)
+                else rgb_to_xy(*color, self._gamut_type)
+            )
+            state.color = ColorXYState(xy=ColorXY(x=x, y=y))
+            applied["color"] = {"x": x, "y": y}
+
+        if mirek is not None:
+            clamped_mirek = max(self._MIREK_MIN, min(self._MIREK_MAX, mirek))
+            if clamped_mirek != mirek:
+                clamped_fields.append("mirek")
+            state.color_temperature = ColorTemperatureState(mirek=clamped_mirek)
+            applied["mirek"] = clamped_mirek
+
+        on = True if on is None else on
+        state.on = LightOnState(on=on)
+        applied["on"] = on
+
+        if transition_ms is not None:
+            applied["transition_ms"] = transition_ms
+
+        if clamped_fields:
+            logger.warning(f"Clamped out-of-range fields: {', '.join(clamped_fields)}")
+
+        sent = await self._update_remote_state(state, transition_ms)
+
+        summary = ", ".join(f"{key}={value}" for key, value in applied.items())
+        message = (
+            f"State updated ({summary})" if sent else f"State unchanged ({summary})"
+        )
+        if clamped_fields:
+            message += f". Clamped: {', '.join(clamped_fields)}"
+
+        return ActionResult(
+            message=message,
+            clamped=bool(clamped_fields),
+            clamped_fields=clamped_fields,
+            final_value=applied,
+            unchanged=not sent,
+        )
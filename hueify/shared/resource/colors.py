@@ -1,5 +1,10 @@
+import functools
 from enum import StrEnum
 
+from hueify.shared.resource.views import GamutType
+
+type _XY = tuple[float, float]
+
 
 class Color(StrEnum):
     # Reds
@@ -107,5 +112,88 @@ _COLOR_MAP: dict[Color, tuple[int, int, int]] = {
 }
 
 
+# Corner points (red, green, blue) of the Hue colour gamuts as published by Signify.
+_GAMUT_TRIANGLES: dict[GamutType, tuple[_XY, _XY, _XY]] = {
+    GamutType.A: ((0.704, 0.296), (0.2151, 0.7106), (0.138, 0.08)),
+    GamutType.B: ((0.675, 0.322), (0.409, 0.518), (0.167, 0.04)),
+    GamutType.C: ((0.6915, 0.3083), (0.17, 0.7), (0.1532, 0.0475)),
+}
+
+_XY_PRECISION = 4
+
+
 def resolve_color(color: Color) -> tuple[int, int, int]:
     return _COLOR_MAP[color]
+
+
+def resolve_color_xy(color: Color, gamut_type: GamutType | None = None) -> _XY:
+    return _NAMED_COLOR_XY[(color, gamut_type)]
+
+
+# Lights without a known gamut (or GamutType.OTHER) get the unclamped
+# wide-gamut value and the bridge clips it.
+@functools.lru_cache(maxsize=1024)
+def rgb_to_xy(r: int, g: int, b: int, gamut_type: GamutType | None = None) -> _XY:
+    x, y = _rgb_to_wide_gamut_xy(r, g, b)
+    if gamut_type in _GAMUT_TRIANGLES:
+        x, y = clamp_xy_to_gamut(x, y, _GAMUT_TRIANGLES[gamut_type])
+    return round(x, _XY_PRECISION), round(y, _XY_PRECISION)
+
+
+def clamp_xy_to_gamut(x: float, y: float, triangle: tuple[_XY, _XY, _XY]) -> _XY:
+    red, green, blue = triangle
+    if _is_inside_triangle((x, y), red, green, blue):
+        return x, y
+
+    candidates = [
+        _closest_point_on_segment((x, y), red, green),
+        _closest_point_on_segment((x, y), green, blue),
+        _closest_point_on_segment((x, y), blue, red),
+    ]
+    return min(candidates, key=lambda p: (p[0] - x) ** 2 + (p[1] - y) ** 2)
+
+
+def _rgb_to_wide_gamut_xy(r: int, g: int, b: int) -> _XY:
+    def gamma(v: float) -> float:
+        v /= 255
+        return ((v + 0.055) / 1.055) ** 2.4 if v > 0.04045 else v / 12.92
+
+    r_, g_, b_ = gamma(r), gamma(g), gamma(b)
+
+    X = r_ * 0.664511 + g_ * 0.154324 + b_ * 0.162028
+    Y = r_ * 0.283881 + g_ * 0.668433 + b_ * 0.047685
+    Z = r_ * 0.000088 + g_ * 0.072310 + b_ * 0.986039
+
+    total = X + Y + Z
+    if total == 0:
+        return 0.0, 0.0
+    return X / total, Y / total
+
+
+def _is_inside_triangle(p: _XY, a: _XY, b: _XY, c: _XY) -> bool:
+    def cross(o: _XY, u: _XY, v: _XY) -> float:
+        return (u[0] - o[0]) * (v[1] - o[1]) - (u[1] - o[1]) * (v[0] - o[0])
+
+    d1, d2, d3 = cross(a, b, p), cross(b, c, p), cross(c, a, p)
+    has_negative = d1 < 0 or d2 < 0 or d3 < 0
+    has_positive = d1 > 0 or d2 > 0 or d3 > 0
+    return not (has_negative and has_positive)
+
+
+def _closest_point_on_segment(p: _XY, a: _XY, b: _XY) -> _XY:
+    abx, aby = b[0] - a[0], b[1] - a[1]
+    t = ((p[0] - a[0]) * abx + (p[1] - a[1]) * aby) / (abx * abx + aby * aby)
+    t = max(0.0, min(1.0, t))
+    return a[0] + t * abx, a[1] + t * aby
+
+
+def _build_named_color_table() -> dict[tuple[Color, GamutType | None], _XY]:
+    gamut_types: list[GamutType | None] = [*GamutType, None]
+    return {
+        (color, gamut_type): rgb_to_xy.__wrapped__(*rgb, gamut_type)
+        for color, rgb in _COLOR_MAP.items()
+        for gamut_type in gamut_types
+    }
+
+
+_NAMED_COLOR_XY = _build_named_color_table()
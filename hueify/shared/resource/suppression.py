@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+
+from hueify.shared.resource.views import ControllableLight, ControllableLightUpdate
+
+
+@dataclass(frozen=True)
+class WriteSuppression:
+    """Drops state changes that the cache says are already in effect.
+
+    Automations often re-assert the same state every few minutes. Comparing
+    each update against the cached state (kept fresh by the event stream)
+    avoids spending the bridge's limited request budget on writes that change
+    nothing. Only the fields that differ are sent; when none differ the
+    request is skipped and the command reports ``unchanged=True``.
+
+    The bridge rounds what it stores (brightness to 1/254 steps, xy to four
+    decimals), so values are compared with a tolerance.
+
+    Attributes:
+        enabled: ``False`` sends every update as-is.
+        brightness_tolerance: Largest brightness difference, in percentage
+            points, that counts as unchanged.
+        mirek_tolerance: Largest colour temperature difference, in mirek,
+            that counts as unchanged.
+        xy_tolerance: Largest difference per CIE xy coordinate that counts as
+            unchanged.
+    """
+
+    enabled: bool = True
+    brightness_tolerance: float = 0.5
+    mirek_tolerance: int = 1
+    xy_tolerance: float = 0.002
+
+    @classmethod
+    def disabled(cls) -> "WriteSuppression":
+        return cls(enabled=False)
+
+    def changed_fields(
+        self, update: ControllableLightUpdate, current: ControllableLight
+    ) -> ControllableLightUpdate | None:
+        """Reduce ``update`` to the fields that differ from ``current``.
+
+        Returns ``None`` when applying ``update`` would not change anything.
+        """
+        if not self.enabled:
+            return update
+
+        changed = update.model_copy()
+        if update.on is not None and update.on.on == current.on.on:
+            changed.on = None
+        if update.dimming is not None and self._same_brightness(update, current):
+            changed.dimming = None
+        if update.color_temperature is not None and self._same_mirek(update, current):
+            changed.color_temperature = None
+        if update.color is not None and self._same_xy(update, current):
+            changed.color = None
+
+        if (
+            changed.on is None
+            and changed.dimming is None
+            and changed.color_temperature is None
+            and changed.color is None
+        ):
+            return None
+        return changed
+
+    def _same_brightness(
+        self, update: ControllableLightUpdate, current: ControllableLight
+    ) -> bool:
+        if current.dimming is None:
+            return False
+        return (
+            abs(update.dimming.brightness - current.dimming.brightness)
+            <= self.brightness_tolerance
+        )
+
+    def _same_mirek(
+        self, update: ControllableLightUpdate, current: ControllableLight
+    ) -> bool:
+        target = update.color_temperature.mirek
+        state = current.color_temperature
+        # The bridge reports mirek_valid=False while the light shows an xy colour.
+        if target is None or state is None or state.mirek is None:
+            return False
+        if state.mirek_valid is False:
+            return False
+        return abs(target - state.mirek) <= self.mirek_tolerance
+
+    def _same_xy(
+        self, update: ControllableLightUpdate, current: ControllableLight
+    ) -> bool:
+        target = update.color.xy
+        state = current.color.xy if current.color is not None else None
+        if target is None or state is None:
+            return False
+        return (
+            abs(target.x - state.x) <= self.xy_tolerance
+            and abs(target.y - state.y) <= self.xy_tolerance
+        )
@@ -4,6 +4,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from hueify.http.tracing import current_correlation_id
+
 
 class ResourceType(StrEnum):
     # Lighting
@@ -84,10 +86,21 @@ class ColorXY(BaseModel):
     y: float = Field(ge=0.0, le=1.0)
 
 
+class GamutType(StrEnum):
+    A = "A"
+    B = "B"
+    C = "C"
+    OTHER = "other"
+
+
 class ColorXYState(BaseModel):
     xy: ColorXY | None = None
 
 
+class DynamicsUpdate(BaseModel):
+    duration: int | None = Field(default=None, ge=0)
+
+
 class ResourceMetadata(BaseModel):
     name: str
 
@@ -99,10 +112,30 @@ class ResourceInfo(BaseModel):
 
 
 class ActionResult(BaseModel):
+    """Outcome returned by every command method on lights, rooms, and zones.
+
+    Attributes:
+        message: Human-readable description of what happened.
+        success: ``True`` when the command completed without errors.
+        clamped: ``True`` when an input value was silently clamped to its
+            valid range (e.g. brightness > 100 → 100).
+        clamped_fields: Names of the fields that were clamped when a single
+            command set several values at once (see ``Resource.set_state``).
+        final_value: The effective value that was actually applied, present
+            only when the command accepted a numeric parameter.
+        unchanged: ``True`` when the resource was already in the requested
+            state and no request was sent to the bridge.
+        correlation_id: Id shared by every bridge request the command made;
+            it also appears in slow-request logs and request traces.
+    """
+
     message: str
     success: bool = True
     clamped: bool = False
+    clamped_fields: list[str] = Field(default_factory=list)
     final_value: Any | None = None
+    unchanged: bool = False
+    correlation_id: str | None = Field(default_factory=current_correlation_id)
 
 
 class ControllableLight(BaseModel):
@@ -118,6 +151,7 @@ class ControllableLightUpdate(BaseModel):
     dimming: DimmingState | None = None
     color_temperature: ColorTemperatureState | None = None
     color: ColorXYState | None = None
+    dynamics: DynamicsUpdate | None = None
 
 
 TLightInfo = TypeVar("TLightInfo", bound=ControllableLight)
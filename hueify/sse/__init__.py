@@ -1,8 +1,31 @@
-from .bus import EventBus, EventHandler
-from .stream import ServerSentEventStream
+from typing import TYPE_CHECKING
+
+from hueify._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .bus import EventBus, EventHandler
+    from .recording import ReplayStats, SseRecorder, read_recording, replay_recording
+    from .stream import ServerSentEventStream
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EventBus": ".bus",
+        "EventHandler": ".bus",
+        "ReplayStats": ".recording",
+        "ServerSentEventStream": ".stream",
+        "SseRecorder": ".recording",
+        "read_recording": ".recording",
+        "replay_recording": ".recording",
+    },
+)
 
 __all__ = [
     "EventBus",
     "EventHandler",
+    "ReplayStats",
     "ServerSentEventStream",
+    "SseRecorder",
+    "read_recording",
+    "replay_recording",
 ]
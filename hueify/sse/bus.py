@@ -1,9 +1,19 @@
 import asyncio
+import contextlib
 import logging
+import time
 from collections.abc import Awaitable, Callable
 
 from pydantic import BaseModel
 
+from hueify.metrics.instruments import (
+    EVENT_DISPATCH_DURATION,
+    EVENT_HANDLER_DURATION,
+    EVENT_HANDLER_ERRORS,
+    EVENT_HANDLERS_IN_FLIGHT,
+)
+from hueify.profiling.profiler import active_profiler, event_scope
+
 type EventHandler[T: BaseModel] = Callable[[T], Awaitable[None]]
 
 logger = logging.getLogger(__name__)
@@ -27,23 +37,63 @@ class EventBus:
 
     async def dispatch[T: BaseModel](self, event: T) -> T:
         event_type = type(event)
-        handlers = self._handlers.get(event_type, [])
+        handlers = tuple(self._handlers.get(event_type, ()))
         logger.debug(f"Dispatching {event_type.__name__} to {len(handlers)} handler(s)")
 
         if not handlers:
             logger.debug(f"No handlers registered for {event_type.__name__}")
             return event
 
-        results = await asyncio.gather(
-            *[handler(event) for handler in handlers],
-            return_exceptions=True,
+        profiler = active_profiler()
+        scope = (
+            event_scope(event_type.__name__)
+            if profiler is not None
+            else contextlib.nullcontext()
         )
+        started_at = time.perf_counter()
+        EVENT_HANDLERS_IN_FLIGHT.inc(len(handlers))
+        try:
+            with scope:
+                results = await asyncio.gather(
+                    *[self._run_handler(handler, event) for handler in handlers],
+                    return_exceptions=True,
+                )
+        finally:
+            EVENT_HANDLERS_IN_FLIGHT.dec(len(handlers))
+        duration = time.perf_counter() - started_at
+        EVENT_DISPATCH_DURATION.observe(duration, event_type=event_type.__name__)
+        if profiler is not None:
+            profiler.record_stage("dispatch", event_type.__name__, duration)
 
-        for result in results:
+        for handler, result in zip(handlers, results, strict=True):
             if isinstance(result, Exception):
+                EVENT_HANDLER_ERRORS.inc(
+                    event_type=event_type.__name__, handler=_handler_name(handler)
+                )
                 logger.error(
                     f"Handler failed for {event_type.__name__}: {result}",
                     exc_info=result,
                 )
 
         return event
+
+    async def _run_handler[T: BaseModel](
+        self, handler: EventHandler[T], event: T
+    ) -> None:
+        started_at = time.perf_counter()
+        try:
+            await handler(event)
+        finally:
+            duration = time.perf_counter() - started_at
+            event_type_name = type(event).__name__
+            handler_name = _handler_name(handler)
+            EVENT_HANDLER_DURATION.observe(
+                duration, event_type=event_type_name, handler=handler_name
+            )
+            profiler = active_profiler()
+            if profiler is not None:
+                profiler.record_handler(handler_name, event_type_name, duration)
+
+
+def _handler_name(handler: Callable) -> str:
+    return getattr(handler, "__qualname__", None) or repr(handler)
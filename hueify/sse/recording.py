@@ -0,0 +1,144 @@
+import asyncio
+import gzip
+import json
+import logging
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from types import TracebackType
+from typing import IO, NamedTuple, Self
+
+from httpx_sse import ServerSentEvent
+from pydantic import BaseModel
+
+from hueify.sse.stream import ServerSentEventStream
+
+logger = logging.getLogger(__name__)
+
+
+class RecordedPayload(NamedTuple):
+    offset: float
+    data: str
+
+
+class ReplayStats(BaseModel):
+    payloads: int = 0
+    elapsed_seconds: float = 0.0
+    payloads_per_second: float = 0.0
+
+
+def _open_text(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, f"{mode}t", encoding="utf-8")
+    return path.open(mode, encoding="utf-8", buffering=1 if mode == "a" else -1)
+
+
+class SseRecorder:
+    """Appends raw SSE payloads with monotonic timestamps to a JSON-lines file.
+
+    Each recording session starts with a ``{"started_at": ...}`` header line
+    followed by one ``[offset_seconds, raw_data]`` line per payload, where the
+    offset is measured from the start of the session. Files ending in ``.gz``
+    are gzip-compressed. Pass a recorder to
+    :class:`~hueify.sse.ServerSentEventStream` (or ``record_events_to`` to
+    :class:`~hueify.Hueify`) and feed the file to :func:`replay_recording`
+    later.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = _open_text(self._path, "a")
+        self._started_at = time.monotonic()
+        self._count = 0
+        self._file.write(
+            json.dumps({"started_at": datetime.now(UTC).isoformat()}) + "\n"
+        )
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def record(self, data: str) -> None:
+        offset = round(time.monotonic() - self._started_at, 6)
+        self._file.write(json.dumps([offset, data], separators=(",", ":")) + "\n")
+        self._count += 1
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+            logger.info(f"Recorded {self._count} SSE payloads to {self._path}")
+
+
+def read_recording(path: str | Path) -> Iterator[RecordedPayload]:
+    """Yield the payloads of a recording with offsets on one continuous timeline.
+
+    Sessions appended to the same file are concatenated back to back.
+    """
+    session_base = 0.0
+    last_offset = 0.0
+    with _open_text(Path(path), "r") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if isinstance(entry, dict):
+                session_base = last_offset
+                continue
+            offset, data = entry
+            last_offset = session_base + offset
+            yield RecordedPayload(last_offset, data)
+
+
+async def replay_recording(
+    path: str | Path,
+    stream: ServerSentEventStream,
+    speed: float | None = 1.0,
+) -> ReplayStats:
+    """Feed a recording back through ``stream`` as if it came from the bridge.
+
+    Payloads go through the same parsing and :class:`~hueify.sse.EventBus`
+    dispatch as live traffic, so caches and handlers see a realistic load.
+
+    Args:
+        path: File written by :class:`SseRecorder`.
+        stream: Stream whose event bus receives the replayed events.
+        speed: Playback speed relative to the original timing (``2.0`` plays
+            twice as fast). ``None`` replays as fast as possible.
+    """
+    if speed is not None and speed <= 0:
+        raise ValueError("speed must be positive or None")
+
+    stats = ReplayStats()
+    started_at = time.perf_counter()
+
+    for payload in read_recording(path):
+        if speed is not None:
+            due = started_at + payload.offset / speed
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        await stream._handle_sse(ServerSentEvent(data=payload.data))
+        stats.payloads += 1
+
+    stats.elapsed_seconds = time.perf_counter() - started_at
+    if stats.elapsed_seconds > 0:
+        stats.payloads_per_second = stats.payloads / stats.elapsed_seconds
+    return stats
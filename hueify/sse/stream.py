@@ -1,25 +1,49 @@
+import functools
 import json
 import logging
+import time
+from typing import TYPE_CHECKING
 
 import httpx
 from httpx_sse import ServerSentEvent, aconnect_sse
 from pydantic import TypeAdapter
 
-from hueify.credentials import HueBridgeCredentials
+from hueify.metrics.instruments import EVENT_STREAM_CONNECTS, EVENT_STREAM_ERRORS
+from hueify.profiling.profiler import active_profiler
 from hueify.sse.bus import EventBus
 from hueify.sse.views import HueEvent, UnknownEvent
 
+if TYPE_CHECKING:
+    from hueify.credentials import HueBridgeCredentials
+    from hueify.profiling import EventProfiler
+    from hueify.sse.recording import SseRecorder
+
 logger = logging.getLogger(__name__)
 
-_event_adapter = TypeAdapter(HueEvent | UnknownEvent)
+
+@functools.cache
+def _event_adapter() -> TypeAdapter[HueEvent | UnknownEvent]:
+    # Building the validator for the full event union is one of the slowest
+    # steps of importing hueify, so it waits for the first event.
+    return TypeAdapter(HueEvent | UnknownEvent)
 
 
 class ServerSentEventStream:
-    def __init__(self, credentials: HueBridgeCredentials, event_bus: EventBus) -> None:
+    _EVENT_STREAM_PATH = "/eventstream/clip/v2"
+
+    def __init__(
+        self,
+        credentials: "HueBridgeCredentials",
+        event_bus: EventBus,
+        bridge_url: str | None = None,
+        recorder: "SseRecorder | None" = None,
+    ) -> None:
         self._credentials = credentials
         self._event_bus = event_bus
+        self._recorder = recorder
         self._is_running = False
-        self._url = f"https://{self._credentials.hue_bridge_ip}/eventstream/clip/v2"
+        bridge_url = bridge_url or f"https://{self._credentials.hue_bridge_ip}"
+        self._url = f"{bridge_url.rstrip('/')}{self._EVENT_STREAM_PATH}"
         self._headers = {
             "hue-application-key": self._credentials.hue_app_key,
             "Accept": "text/event-stream",
@@ -40,24 +64,33 @@ class ServerSentEventStream:
                 ) as event_source,
             ):
                 logger.info("Connected to event stream")
+                EVENT_STREAM_CONNECTS.inc()
 
                 async for sse in event_source.aiter_sse():
                     if not self._is_running:
                         break
+                    if self._recorder is not None:
+                        self._recorder.record(sse.data)
                     await self._handle_sse(sse)
 
         except Exception as e:
+            EVENT_STREAM_ERRORS.inc()
             logger.error(f"Event stream error: {e}", exc_info=True)
         finally:
             logger.info("Disconnected from event stream")
 
     async def _handle_sse(self, sse: ServerSentEvent) -> None:
         try:
+            profiler = active_profiler()
+            if profiler is not None:
+                await self._handle_sse_profiled(sse, profiler)
+                return
+
             containers: list[dict] = json.loads(sse.data)
 
             for container in containers:
                 for raw_event in container.get("data", []):
-                    event = _event_adapter.validate_python(raw_event)
+                    event = _event_adapter().validate_python(raw_event)
                     await self._event_bus.dispatch(event)
 
         except json.JSONDecodeError as e:
@@ -65,6 +98,26 @@ class ServerSentEventStream:
         except Exception as e:
             logger.error(f"Error processing event: {e}", exc_info=True)
 
+    async def _handle_sse_profiled(
+        self, sse: ServerSentEvent, profiler: "EventProfiler"
+    ) -> None:
+        started_at = time.perf_counter()
+        containers: list[dict] = json.loads(sse.data)
+        profiler.record_stage("parse", "*", time.perf_counter() - started_at)
+
+        for container in containers:
+            for raw_event in container.get("data", []):
+                started_at = time.perf_counter()
+                event = _event_adapter().validate_python(raw_event)
+                profiler.record_stage(
+                    "validate", type(event).__name__, time.perf_counter() - started_at
+                )
+                await self._event_bus.dispatch(event)
+
+    def rebase(self, bridge_url: str) -> None:
+        """Connect to ``bridge_url`` from the next :meth:`connect` on."""
+        self._url = f"{bridge_url.rstrip('/')}{self._EVENT_STREAM_PATH}"
+
     def disconnect(self) -> None:
         self._is_running = False
         logger.info("Stopping event stream")
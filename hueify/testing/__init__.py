@@ -0,0 +1,10 @@
+from .home import generate_home
+from .mdns import FakeMdnsResponder
+from .server import DEFAULT_APP_KEY, FakeHueBridge
+
+__all__ = [
+    "DEFAULT_APP_KEY",
+    "FakeHueBridge",
+    "FakeMdnsResponder",
+    "generate_home",
+]
@@ -0,0 +1,200 @@
+import random
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+from hueify.shared.resource.views import ResourceType
+
+type RawResource = dict[str, Any]
+
+_ROOM_ARCHETYPES = ["living_room", "kitchen", "bedroom", "office", "bathroom"]
+_SCENE_NAMES = ["Relax", "Concentrate", "Energize", "Nightlight", "Read"]
+_LIGHT_ARCHETYPES = ["classic_bulb", "ceiling_round", "table_shade", "hue_lightstrip"]
+
+
+def generate_home(
+    lights: int = 10,
+    rooms: int = 2,
+    scenes_per_room: int = 2,
+    sensors: int = 0,
+    *,
+    seed: int = 0,
+) -> list[RawResource]:
+    """Build the raw CLIP v2 resources of a synthetic home.
+
+    Lights are spread round-robin over the rooms; every light is owned by its
+    own device, every room gets a grouped light and ``scenes_per_room``
+    scenes. ``sensors`` motion sensors, each with motion, temperature, light
+    level and battery services, are spread over the rooms the same way. The
+    same ``seed`` always yields the same ids.
+    """
+    if rooms < 1 or lights < rooms:
+        raise ValueError(
+            "A synthetic home needs at least one room and one light per room"
+        )
+
+    rng = random.Random(seed)
+
+    def new_id() -> str:
+        return str(UUID(int=rng.getrandbits(128), version=4))
+
+    resources: list[RawResource] = []
+    room_devices: list[list[RawResource]] = [[] for _ in range(rooms)]
+    room_lights: list[list[RawResource]] = [[] for _ in range(rooms)]
+
+    for index in range(lights):
+        device_id, light_id = new_id(), new_id()
+        light = _light(light_id, device_id, f"Light {index + 1}", rng)
+        device = {
+            "id": device_id,
+            "type": ResourceType.DEVICE,
+            "metadata": {"name": f"Light {index + 1}", "archetype": "classic_bulb"},
+            "services": [_reference(light_id, ResourceType.LIGHT)],
+        }
+        room_devices[index % rooms].append(device)
+        room_lights[index % rooms].append(light)
+        resources += [device, light]
+
+    for index in range(sensors):
+        device, services = _motion_sensor(new_id, f"Motion sensor {index + 1}", rng)
+        room_devices[index % rooms].append(device)
+        resources += [device, *services]
+
+    for index in range(rooms):
+        room_id, grouped_light_id = new_id(), new_id()
+        archetype = _ROOM_ARCHETYPES[index % len(_ROOM_ARCHETYPES)]
+        resources.append(
+            {
+                "id": room_id,
+                "type": ResourceType.ROOM,
+                "metadata": {
+                    "name": f"{archetype.replace('_', ' ').title()} {index + 1}",
+                    "archetype": archetype,
+                },
+                "children": [
+                    _reference(device["id"], ResourceType.DEVICE)
+                    for device in room_devices[index]
+                ],
+                "services": [_reference(grouped_light_id, ResourceType.GROUPED_LIGHT)],
+            }
+        )
+        resources.append(
+            {
+                "id": grouped_light_id,
+                "type": ResourceType.GROUPED_LIGHT,
+                "owner": _reference(room_id, ResourceType.ROOM),
+                "on": {"on": any(light["on"]["on"] for light in room_lights[index])},
+                "dimming": {"brightness": 100.0},
+                "color_temperature": None,
+            }
+        )
+        for scene_index in range(scenes_per_room):
+            resources.append(
+                _scene(
+                    new_id(),
+                    room_id,
+                    f"{_SCENE_NAMES[scene_index % len(_SCENE_NAMES)]} {index + 1}",
+                    room_lights[index],
+                    rng,
+                )
+            )
+
+    return resources
+
+
+def _reference(rid: str, rtype: ResourceType) -> RawResource:
+    return {"rid": rid, "rtype": rtype}
+
+
+def _light(light_id: str, device_id: str, name: str, rng: random.Random) -> RawResource:
+    return {
+        "id": light_id,
+        "type": ResourceType.LIGHT,
+        "owner": _reference(device_id, ResourceType.DEVICE),
+        "metadata": {"name": name, "archetype": rng.choice(_LIGHT_ARCHETYPES)},
+        "on": {"on": rng.random() < 0.5},
+        "dimming": {"brightness": float(rng.randint(1, 100))},
+        "color_temperature": {"mirek": rng.randint(153, 500), "mirek_valid": True},
+        "color": {
+            "xy": {"x": 0.3227, "y": 0.329},
+            "gamut_type": "C",
+        },
+    }
+
+
+def _motion_sensor(
+    new_id: Callable[[], str], name: str, rng: random.Random
+) -> tuple[RawResource, list[RawResource]]:
+    device_id = new_id()
+    owner = _reference(device_id, ResourceType.DEVICE)
+    services = [
+        {
+            "id": new_id(),
+            "type": ResourceType.MOTION,
+            "owner": owner,
+            "enabled": True,
+            "motion": {"motion": False, "motion_valid": True},
+        },
+        {
+            "id": new_id(),
+            "type": ResourceType.TEMPERATURE,
+            "owner": owner,
+            "enabled": True,
+            "temperature": {
+                "temperature": round(rng.uniform(17.0, 24.0), 2),
+                "temperature_valid": True,
+            },
+        },
+        {
+            "id": new_id(),
+            "type": ResourceType.LIGHT_LEVEL,
+            "owner": owner,
+            "enabled": True,
+            "light": {
+                "light_level": rng.randint(0, 30000),
+                "light_level_valid": True,
+            },
+        },
+        {
+            "id": new_id(),
+            "type": ResourceType.DEVICE_POWER,
+            "owner": owner,
+            "power_state": {
+                "battery_state": "normal",
+                "battery_level": rng.randint(20, 100),
+            },
+        },
+    ]
+    device = {
+        "id": device_id,
+        "type": ResourceType.DEVICE,
+        "metadata": {"name": name, "archetype": "unknown_archetype"},
+        "services": [_reference(s["id"], s["type"]) for s in services],
+    }
+    return device, services
+
+
+def _scene(
+    scene_id: str,
+    room_id: str,
+    name: str,
+    lights: list[RawResource],
+    rng: random.Random,
+) -> RawResource:
+    return {
+        "id": scene_id,
+        "type": ResourceType.SCENE,
+        "metadata": {"name": name},
+        "group": _reference(room_id, ResourceType.ROOM),
+        "actions": [
+            {
+                "target": _reference(light["id"], ResourceType.LIGHT),
+                "action": {
+                    "on": {"on": True},
+                    "dimming": {"brightness": float(rng.randint(10, 100))},
+                },
+            }
+            for light in lights
+        ],
+        "status": {"active": "inactive"},
+    }
@@ -0,0 +1,102 @@
+import asyncio
+import socket
+import struct
+from types import TracebackType
+from typing import Self
+
+from hueify.onboarding import mdns
+
+
+class _ResponderProtocol(asyncio.DatagramProtocol):
+    def __init__(self, responder: "FakeMdnsResponder") -> None:
+        self._responder = responder
+        self.transport: asyncio.DatagramTransport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        self._responder.queries += 1
+        if self.transport is not None:
+            for packet in self._responder.responses():
+                self.transport.sendto(packet, addr)
+
+
+class FakeMdnsResponder:
+    """A local stand-in for the mDNS responders of one or more Hue Bridges.
+
+    Answers every query on a local UDP port with one ``_hue._tcp`` response
+    per bridge, carrying the PTR, TXT, SRV and A records a real bridge
+    announces. Point discovery at :attr:`address`:
+
+    ```python
+    async with FakeMdnsResponder({"001788fffe000001": "192.168.1.20"}) as responder:
+        bridges = await discover_bridges_mdns(address=responder.address)
+    ```
+    """
+
+    def __init__(
+        self, bridges: dict[str, str], *, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        """
+        Args:
+            bridges: Bridge id to the IPv4 address it announces.
+            host: Interface to listen on.
+            port: Port to listen on; ``0`` picks a free one.
+        """
+        self.bridges = dict(bridges)
+        self.queries = 0
+        self._host = host
+        self._port = port
+        self._transport: asyncio.DatagramTransport | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._host, self._port
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _ResponderProtocol(self), local_addr=(self._host, self._port)
+        )
+        self._port = self._transport.get_extra_info("sockname")[1]
+
+    def stop(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def responses(self) -> list[bytes]:
+        return [_response(bridge_id, ip) for bridge_id, ip in self.bridges.items()]
+
+
+def _response(bridge_id: str, ip: str) -> bytes:
+    instance = f"Hue Bridge - {bridge_id[-6:].upper()}.{mdns.HUE_SERVICE}"
+    host = f"{bridge_id}.local"
+    text = b"".join(
+        bytes([len(entry)]) + entry
+        for entry in (f"bridgeid={bridge_id}".encode(), b"modelid=BSB002")
+    )
+    service = struct.pack("!HHH", 0, 0, 443) + mdns.encode_name(host)
+    return mdns.build_response(
+        [
+            mdns.encode_record(
+                mdns.HUE_SERVICE, mdns.TYPE_PTR, mdns.encode_name(instance)
+            ),
+            mdns.encode_record(instance, mdns.TYPE_TXT, text),
+            mdns.encode_record(instance, mdns.TYPE_SRV, service),
+            mdns.encode_record(host, mdns.TYPE_A, socket.inet_aton(ip)),
+        ]
+    )
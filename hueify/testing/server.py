@@ -0,0 +1,480 @@
+import asyncio
+import json
+import logging
+import ssl
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from types import TracebackType
+from typing import Any, Self
+from uuid import uuid4
+
+from hueify.http.ratelimit import TokenBucket
+from hueify.shared.resource.views import ResourceType
+from hueify.testing.home import RawResource, generate_home
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_APP_KEY = "fake-bridge-application-key"
+
+_RESOURCE_PATH = "/clip/v2/resource"
+_EVENT_STREAM_PATH = "/eventstream/clip/v2"
+_CONFIG_PATH = "/api/config"
+_LIGHT_STATE_KEYS = ("on", "dimming", "color_temperature", "color")
+_REASONS = {
+    200: "OK",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    400: "Bad Request",
+    429: "Too Many Requests",
+}
+
+
+class FakeHueBridge:
+    """An in-process stand-in for a Hue Bridge serving the CLIP v2 API.
+
+    Serves ``/clip/v2/resource/*`` and ``/eventstream/clip/v2`` on a local
+    port. ``PUT`` requests mutate the in-memory state and publish the
+    matching ``update`` events on every open event stream, so a real
+    :class:`~hueify.Hueify` client can be exercised end to end offline:
+
+    ```python
+    async with FakeHueBridge.with_synthetic_home(lights=50, rooms=5) as bridge:
+        async with Hueify(
+            bridge_ip=bridge.host, app_key=bridge.app_key, bridge_url=bridge.url
+        ) as hue:
+            await hue.lights.turn_on("Light 1")
+    ```
+
+    The server speaks HTTP/1.1 (over TLS when ``ssl_context`` is given);
+    httpx falls back to it transparently even when HTTP/2 is enabled.
+    """
+
+    def __init__(
+        self,
+        resources: Iterable[RawResource] = (),
+        *,
+        app_key: str = DEFAULT_APP_KEY,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        light_commands_per_second: float | None = None,
+        group_commands_per_second: float | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        bridge_id: str | None = None,
+    ) -> None:
+        """
+        Args:
+            resources: Raw CLIP v2 resources to serve, e.g. from
+                :func:`~hueify.testing.generate_home`.
+            app_key: Application key clients must send; others get ``403``.
+            host: Interface to listen on.
+            port: Port to listen on; ``0`` picks a free one.
+            latency: Seconds added before answering every REST request.
+            light_commands_per_second: Answer ``light`` writes above this
+                rate with ``429``. ``None`` disables throttling.
+            group_commands_per_second: Same for ``grouped_light`` writes.
+            ssl_context: Serve HTTPS with this server context instead of
+                plain HTTP.
+            clock: Monotonic clock used for throttling.
+            bridge_id: Id reported by the unauthenticated ``/api/config``
+                used for discovery. Random when ``None``.
+        """
+        self._resources: dict[str, RawResource] = {
+            resource["id"]: resource for resource in resources
+        }
+        self._app_key = app_key
+        self._bridge_id = bridge_id or f"001788fffe{uuid4().hex[:6]}"
+        self._host = host
+        self._port = port
+        self.latency = latency
+        self._ssl_context = ssl_context
+        self._buckets: dict[str, TokenBucket] = {}
+        if light_commands_per_second is not None:
+            self._buckets[ResourceType.LIGHT] = TokenBucket(
+                light_commands_per_second,
+                burst=max(light_commands_per_second, 1.0),
+                clock=clock,
+            )
+        if group_commands_per_second is not None:
+            self._buckets[ResourceType.GROUPED_LIGHT] = TokenBucket(
+                group_commands_per_second,
+                burst=max(group_commands_per_second, 1.0),
+                clock=clock,
+            )
+
+        self._server: asyncio.Server | None = None
+        self._connections: set[asyncio.StreamWriter] = set()
+        self._subscribers: set[asyncio.Queue[str | None]] = set()
+        self._subscribers_changed = asyncio.Condition()
+        self._event_counter = 0
+
+        self.request_counts: Counter[str] = Counter()
+        self.throttled_count = 0
+
+    @classmethod
+    def with_synthetic_home(
+        cls,
+        lights: int = 10,
+        rooms: int = 2,
+        scenes_per_room: int = 2,
+        sensors: int = 0,
+        **kwargs: Any,
+    ) -> Self:
+        """Create a bridge serving :func:`~hueify.testing.generate_home` output."""
+        return cls(
+            generate_home(
+                lights=lights,
+                rooms=rooms,
+                scenes_per_room=scenes_per_room,
+                sensors=sensors,
+            ),
+            **kwargs,
+        )
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    @property
+    def app_key(self) -> str:
+        return self._app_key
+
+    @property
+    def bridge_id(self) -> str:
+        return self._bridge_id
+
+    @property
+    def url(self) -> str:
+        scheme = "https" if self._ssl_context is not None else "http"
+        return f"{scheme}://{self._host}:{self._port}"
+
+    @property
+    def event_stream_count(self) -> int:
+        return len(self._subscribers)
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection, self._host, self._port, ssl=self._ssl_context
+        )
+        self._port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Fake Hue bridge listening on {self.url}")
+
+    async def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        self.drop_event_streams()
+        for writer in list(self._connections):
+            writer.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    def resources(self, resource_type: str | None = None) -> list[RawResource]:
+        return [
+            resource
+            for resource in self._resources.values()
+            if resource_type is None or resource["type"] == resource_type
+        ]
+
+    def get(self, resource_id: str) -> RawResource:
+        return self._resources[resource_id]
+
+    def find(self, resource_type: str, name: str) -> RawResource:
+        for resource in self.resources(resource_type):
+            if resource.get("metadata", {}).get("name") == name:
+                return resource
+        raise KeyError(f"No {resource_type} named '{name}'")
+
+    def publish(self, changes: list[RawResource]) -> None:
+        """Send ``changes`` as one ``update`` event to every open event stream."""
+        if not changes:
+            return
+
+        self._event_counter += 1
+        container = {
+            "creationtime": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "data": changes,
+            "id": str(uuid4()),
+            "type": "update",
+        }
+        message = (
+            f"id: {int(time.time())}:{self._event_counter}\n"
+            f"data: {json.dumps([container])}\n\n"
+        )
+        for queue in self._subscribers:
+            queue.put_nowait(message)
+
+    def drop_event_streams(self) -> None:
+        """Disconnect every open event stream, as a rebooting bridge would."""
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+
+    async def wait_for_event_streams(
+        self, count: int = 1, timeout: float = 5.0
+    ) -> None:
+        async with asyncio.timeout(timeout), self._subscribers_changed:
+            await self._subscribers_changed.wait_for(
+                lambda: len(self._subscribers) >= count
+            )
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._connections.add(writer)
+        try:
+            while request_line := await reader.readline():
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                path = target.split("?", 1)[0]
+
+                if path == _EVENT_STREAM_PATH and self._is_authorized(headers):
+                    await self._serve_event_stream(writer)
+                    break
+
+                status, payload, extra_headers = await self._handle_request(
+                    method, path, headers, body
+                )
+                self._write_response(writer, status, payload, extra_headers)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _handle_request(
+        self, method: str, path: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, Any, dict[str, str]]:
+        if method == "GET" and path == _CONFIG_PATH:
+            return 200, self._config(), {}
+
+        if not self._is_authorized(headers):
+            return 403, _error_body("unauthorized user"), {}
+
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+
+        if not path.startswith(_RESOURCE_PATH):
+            return 404, _error_body(f"Not Found: {path}"), {}
+
+        parts = [part for part in path[len(_RESOURCE_PATH) :].split("/") if part]
+        resource_type = parts[0] if parts else None
+        resource_id = parts[1] if len(parts) > 1 else None
+        self.request_counts[f"{method} {resource_type or 'resource'}"] += 1
+
+        if method == "GET":
+            return self._handle_get(resource_type, resource_id)
+        if method == "PUT" and resource_type and resource_id:
+            return self._handle_put(resource_type, resource_id, body)
+        return 405, _error_body(f"Method {method} not allowed"), {}
+
+    def _handle_get(
+        self, resource_type: str | None, resource_id: str | None
+    ) -> tuple[int, Any, dict[str, str]]:
+        if resource_id is None:
+            return 200, _data_body(self.resources(resource_type)), {}
+
+        resource = self._resources.get(resource_id)
+        if resource is None or resource["type"] != resource_type:
+            return 404, _error_body(f"Not Found: {resource_type}/{resource_id}"), {}
+        return 200, _data_body([resource]), {}
+
+    def _handle_put(
+        self, resource_type: str, resource_id: str, body: bytes
+    ) -> tuple[int, Any, dict[str, str]]:
+        resource = self._resources.get(resource_id)
+        if resource is None or resource["type"] != resource_type:
+            return 404, _error_body(f"Not Found: {resource_type}/{resource_id}"), {}
+
+        bucket = self._buckets.get(resource_type)
+        if bucket is not None and not bucket.try_acquire():
+            self.throttled_count += 1
+            return 429, _error_body("Too many requests"), {"Retry-After": "1"}
+
+        try:
+            patch = json.loads(body or b"{}")
+        except json.JSONDecodeError:
+            return 400, _error_body("Invalid JSON"), {}
+
+        self.publish(self._apply_update(resource, patch))
+        return 200, _data_body([{"rid": resource_id, "rtype": resource_type}]), {}
+
+    def _apply_update(
+        self, resource: RawResource, patch: RawResource
+    ) -> list[RawResource]:
+        patch = dict(patch)
+        patch.pop("dynamics", None)
+
+        match resource["type"]:
+            case ResourceType.LIGHT:
+                return [self._apply_light_state(resource, patch)]
+            case ResourceType.GROUPED_LIGHT:
+                changes = [self._apply_light_state(resource, patch)]
+                changes += [
+                    self._apply_light_state(light, patch)
+                    for light in self._lights_of_group(resource)
+                ]
+                return changes
+            case ResourceType.SCENE if "recall" in patch:
+                return self._recall_scene(resource)
+            case ResourceType.ENTERTAINMENT_CONFIGURATION if "action" in patch:
+                status = "active" if patch["action"] == "start" else "inactive"
+                resource["status"] = status
+                return [_change(resource, status=status)]
+            case _:
+                _merge(resource, patch)
+                return [_change(resource, **patch)]
+
+    def _apply_light_state(self, light: RawResource, patch: RawResource) -> RawResource:
+        state = {key: patch[key] for key in _LIGHT_STATE_KEYS if key in patch}
+        if "color" in state and light.get("color_temperature") is not None:
+            state["color_temperature"] = {"mirek": None, "mirek_valid": False}
+        elif "color_temperature" in state:
+            state["color_temperature"] = {
+                **state["color_temperature"],
+                "mirek_valid": True,
+            }
+
+        _merge(light, state)
+        return _change(light, **{key: light[key] for key in state})
+
+    def _recall_scene(self, scene: RawResource) -> list[RawResource]:
+        changes = []
+        for other in self.resources(ResourceType.SCENE):
+            if (
+                other is not scene
+                and other["group"] == scene["group"]
+                and other.get("status", {}).get("active") != "inactive"
+            ):
+                other["status"] = {"active": "inactive"}
+                changes.append(_change(other, status=other["status"]))
+
+        scene["status"] = {"active": "static"}
+        changes.append(_change(scene, status=scene["status"]))
+
+        for action in scene.get("actions", []):
+            light = self._resources.get(action["target"]["rid"])
+            if light is not None:
+                changes.append(self._apply_light_state(light, action["action"]))
+        return changes
+
+    def _lights_of_group(self, grouped_light: RawResource) -> list[RawResource]:
+        owner = grouped_light.get("owner")
+        group = self._resources.get(owner["rid"]) if owner else None
+        if group is None:
+            return self.resources(ResourceType.LIGHT)
+
+        lights = []
+        for child in group.get("children", []):
+            if child["rtype"] == ResourceType.LIGHT:
+                lights.append(self._resources[child["rid"]])
+            elif child["rtype"] == ResourceType.DEVICE:
+                device = self._resources.get(child["rid"], {})
+                lights += [
+                    self._resources[service["rid"]]
+                    for service in device.get("services", [])
+                    if service["rtype"] == ResourceType.LIGHT
+                ]
+        return lights
+
+    def _config(self) -> dict[str, Any]:
+        return {
+            "name": "Hue Bridge",
+            "datastoreversion": "172",
+            "swversion": "1967054020",
+            "apiversion": "1.67.0",
+            "mac": ":".join(self._bridge_id[i : i + 2] for i in (0, 2, 4, 10, 12, 14)),
+            "bridgeid": self._bridge_id.upper(),
+            "factorynew": False,
+            "replacesbridgeid": None,
+            "modelid": "BSB002",
+        }
+
+    def _is_authorized(self, headers: dict[str, str]) -> bool:
+        return headers.get("hue-application-key") == self._app_key
+
+    async def _serve_event_stream(self, writer: asyncio.StreamWriter) -> None:
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: close\r\n\r\n"
+            b": hi\n\n"
+        )
+        await writer.drain()
+
+        queue: asyncio.Queue[str | None] = asyncio.Queue()
+        async with self._subscribers_changed:
+            self._subscribers.add(queue)
+            self._subscribers_changed.notify_all()
+        try:
+            while (message := await queue.get()) is not None:
+                writer.write(message.encode())
+                await writer.drain()
+        finally:
+            self._subscribers.discard(queue)
+
+    def _write_response(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: Any,
+        extra_headers: dict[str, str],
+    ) -> None:
+        body = json.dumps(payload).encode()
+        headers = {
+            "Content-Type": "application/json",
+            "Content-Length": str(len(body)),
+            **extra_headers,
+        }
+        head = f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n" + "".join(
+            f"{name}: {value}\r\n" for name, value in headers.items()
+        )
+        writer.write(head.encode("latin-1") + b"\r\n" + body)
+
+
+def _merge(target: RawResource, patch: RawResource) -> None:
+    for key, value in patch.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+
+
+def _change(resource: RawResource, **fields: Any) -> RawResource:
+    change = {"id": resource["id"], "type": resource["type"], **fields}
+    if "owner" in resource:
+        change["owner"] = resource["owner"]
+    return change
+
+
+def _data_body(data: list[RawResource]) -> RawResource:
+    return {"errors": [], "data": data}
+
+
+def _error_body(description: str) -> RawResource:
+    return {"errors": [{"description": description}], "data": []}
@@ -0,0 +1,142 @@
+import time
+
+import pytest
+
+from hueify import Color, Hueify
+from hueify.actions import (
+    ActionExecutor,
+    ActionTarget,
+    ActivateSceneAction,
+    SetBrightnessAction,
+    SetColorAction,
+    TurnOffAction,
+    TurnOnAction,
+)
+from hueify.actions.views import _TargetedAction
+from hueify.http import RetryPolicy
+from hueify.testing import FakeHueBridge, generate_home
+
+
+@pytest.fixture
+def home_size() -> dict[str, int]:
+    return {"lights": 4, "rooms": 1}
+
+
+def light(name: str) -> dict:
+    return {"target": ActionTarget.LIGHT, "name": name}
+
+
+class TestActionExecutor:
+    @pytest.mark.asyncio
+    async def test_returns_outcomes_in_submission_order(
+        self, hue: Hueify, bridge: FakeHueBridge
+    ) -> None:
+        room = hue.rooms.names[0]
+        scene = hue.rooms.scene_names(room)[0]
+
+        outcomes = await ActionExecutor(hue).run(
+            [
+                ActivateSceneAction(target=ActionTarget.ROOM, name=room, scene=scene),
+                SetBrightnessAction(**light("Light 1"), percentage=30),
+                SetColorAction(**light("Light 2"), color=Color.RED),
+            ]
+        )
+
+        assert [outcome.index for outcome in outcomes] == [0, 1, 2]
+        assert all(outcome.success for outcome in outcomes)
+        assert bridge.find("light", "Light 1")["dimming"]["brightness"] == 30
+
+    @pytest.mark.asyncio
+    async def test_room_actions_wait_for_earlier_light_actions(
+        self, hue: Hueify, bridge: FakeHueBridge
+    ) -> None:
+        room = hue.rooms.names[0]
+
+        await ActionExecutor(hue).run(
+            [
+                TurnOnAction(**light("Light 1")),
+                TurnOffAction(target=ActionTarget.ROOM, name=room),
+            ]
+        )
+
+        assert bridge.find("light", "Light 1")["on"]["on"] is False
+
+    @pytest.mark.asyncio
+    async def test_runs_actions_on_the_same_resource_in_order(
+        self, hue: Hueify, bridge: FakeHueBridge
+    ) -> None:
+        await ActionExecutor(hue).run(
+            [
+                TurnOffAction(**light("Light 1")),
+                TurnOnAction(**light("Light 1")),
+                SetBrightnessAction(**light("Light 1"), percentage=20),
+                TurnOffAction(**light("Light 1")),
+            ]
+        )
+
+        state = bridge.find("light", "Light 1")
+        assert state["on"]["on"] is False
+        assert state["dimming"]["brightness"] == 20
+
+    @pytest.mark.asyncio
+    async def test_reports_unknown_names_without_stopping_the_batch(
+        self, hue: Hueify
+    ) -> None:
+        outcomes = await ActionExecutor(hue).run(
+            [TurnOnAction(**light("Nope")), TurnOnAction(**light("Light 1"))]
+        )
+
+        assert not outcomes[0].success
+        assert outcomes[0].error is not None
+        assert outcomes[1].success
+
+    @pytest.mark.asyncio
+    async def test_reports_bridge_errors_without_stopping_the_batch(self) -> None:
+        home = generate_home(lights=2, rooms=1, seed=3)
+        async with (
+            FakeHueBridge(home, light_commands_per_second=0.01) as bridge,
+            Hueify(
+                bridge.host,
+                bridge.app_key,
+                bridge_url=bridge.url,
+                retry_policy=RetryPolicy.disabled(),
+            ) as hue,
+        ):
+            outcomes = await ActionExecutor(hue).run(
+                [
+                    SetBrightnessAction(**light("Light 1"), percentage=20),
+                    SetBrightnessAction(**light("Light 1"), percentage=40),
+                    SetBrightnessAction(**light("Light 1"), percentage=60),
+                ]
+            )
+
+        assert outcomes[0].success
+        assert [outcome.error is not None for outcome in outcomes[1:]] == [True, True]
+        assert "429" in (outcomes[1].error or "")
+
+    @pytest.mark.asyncio
+    async def test_runs_independent_actions_concurrently(
+        self, hue: Hueify, bridge: FakeHueBridge
+    ) -> None:
+        bridge.latency = 0.1
+        actions = [
+            SetBrightnessAction(**light(f"Light {index}"), percentage=10)
+            for index in range(1, 5)
+        ]
+
+        started_at = time.perf_counter()
+        await ActionExecutor(hue, max_concurrency=4).run(actions)
+
+        assert time.perf_counter() - started_at < 0.3
+
+    def test_rejects_non_positive_concurrency(self, hue: Hueify) -> None:
+        with pytest.raises(ValueError):
+            ActionExecutor(hue, max_concurrency=0)
+
+
+def test_actions_must_implement_apply() -> None:
+    class IncompleteAction(_TargetedAction):
+        action: str = "incomplete"
+
+    with pytest.raises(TypeError):
+        IncompleteAction(**light("Light 1"))
@@ -0,0 +1,121 @@
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from hueify.animation import AnimationNamespace, Keyframe
+from hueify.grouped_lights import (
+    GroupedLightCache,
+    GroupedLightInfo,
+    GroupedLights,
+    RoomCache,
+    RoomNamespace,
+    ZoneCache,
+    ZoneNamespace,
+)
+from hueify.grouped_lights.views import GroupInfo
+from hueify.light import LightCache, LightInfo, LightNamespace
+from hueify.scenes import SceneCache
+from hueify.sse import EventBus
+
+KEYFRAMES = [Keyframe(at=0, brightness=0), Keyframe(at=1, brightness=100)]
+
+
+def make_light_info(name: str, device_id: UUID) -> LightInfo:
+    return LightInfo.model_validate(
+        {
+            "id": str(uuid4()),
+            "owner": {"rid": str(device_id), "rtype": "device"},
+            "metadata": {"name": name},
+            "on": {"on": True},
+            "dimming": {"brightness": 50},
+            "color_temperature": None,
+        }
+    )
+
+
+@pytest.fixture
+def namespace() -> AnimationNamespace:
+    bus = EventBus()
+    client = AsyncMock()
+    light_cache = LightCache(bus)
+    room_cache = RoomCache()
+    grouped_light_cache = GroupedLightCache(bus)
+    scene_cache = SceneCache(bus)
+
+    devices = [uuid4(), uuid4(), uuid4()]
+    light_cache.store_all(
+        [
+            make_light_info("Desk", devices[0]),
+            make_light_info("Floor", devices[1]),
+            make_light_info("Hall", devices[2]),
+        ]
+    )
+
+    grouped_light_id = uuid4()
+    grouped_light_cache.store_all(
+        [
+            GroupedLightInfo.model_validate(
+                {
+                    "id": str(grouped_light_id),
+                    "on": {"on": True},
+                    "dimming": None,
+                    "color_temperature": None,
+                }
+            )
+        ]
+    )
+    room_cache.store_all(
+        [
+            GroupInfo.model_validate(
+                {
+                    "id": str(uuid4()),
+                    "type": "room",
+                    "metadata": {"name": "Office", "archetype": "office"},
+                    "children": [
+                        {"rid": str(devices[0]), "rtype": "device"},
+                        {"rid": str(devices[1]), "rtype": "device"},
+                    ],
+                    "services": [
+                        {"rid": str(grouped_light_id), "rtype": "grouped_light"}
+                    ],
+                }
+            )
+        ]
+    )
+
+    return AnimationNamespace(
+        light_cache=light_cache,
+        lights=LightNamespace(light_cache=light_cache, http_client=client),
+        rooms=RoomNamespace(
+            room_cache=room_cache,
+            grouped_light_cache=grouped_light_cache,
+            http_client=client,
+            scene_cache=scene_cache,
+        ),
+        zones=ZoneNamespace(
+            zone_cache=ZoneCache(),
+            grouped_light_cache=grouped_light_cache,
+            http_client=client,
+            scene_cache=scene_cache,
+        ),
+    )
+
+
+class TestTrack:
+    def test_collapses_whole_room_onto_grouped_light(
+        self, namespace: AnimationNamespace
+    ) -> None:
+        track = namespace.track(["Desk", "Floor"], KEYFRAMES)
+
+        assert track.targets_groups
+        assert len(track.targets) == 1
+        assert isinstance(track.targets[0], GroupedLights)
+
+    def test_keeps_individual_lights_for_partial_room(
+        self, namespace: AnimationNamespace
+    ) -> None:
+        track = namespace.track(["Desk", "Hall"], KEYFRAMES)
+
+        assert not track.targets_groups
+        assert [t.name for t in track.targets] == ["Desk", "Hall"]
@@ -0,0 +1,166 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from hueify import Hueify
+from hueify.animation import AnimationScheduler, Keyframe, Track
+from hueify.grouped_lights import GroupedLights
+from hueify.light import Light
+from hueify.sse.views import LightEvent
+from hueify.testing import FakeHueBridge, generate_home
+
+KEYFRAMES = [Keyframe(at=0, brightness=0), Keyframe(at=1, brightness=100)]
+
+
+def make_light(name: str = "Desk") -> MagicMock:
+    light = MagicMock(spec=Light)
+    light.name = name
+    light.set_state = AsyncMock()
+    return light
+
+
+def make_group(name: str = "Living Room") -> MagicMock:
+    group = MagicMock(spec=GroupedLights)
+    group.name = name
+    group.set_state = AsyncMock()
+    return group
+
+
+class TestAllocateFps:
+    def test_grants_requested_fps_within_budget(self) -> None:
+        scheduler = AnimationScheduler(light_commands_per_second=10)
+        track = Track([make_light()], KEYFRAMES, fps=4)
+        scheduler.add(track)
+
+        assert scheduler.allocate_fps()[track] == 4
+
+    def test_splits_budget_by_command_cost(self) -> None:
+        scheduler = AnimationScheduler(light_commands_per_second=10)
+        single = Track([make_light("A")], KEYFRAMES, fps=10)
+        quad = Track([make_light(n) for n in "BCDE"], KEYFRAMES, fps=10)
+        scheduler.add(single)
+        scheduler.add(quad)
+
+        allocation = scheduler.allocate_fps()
+
+        assert allocation[single] == pytest.approx(2)
+        assert allocation[quad] == pytest.approx(2)
+
+    def test_redistributes_surplus_of_slow_tracks(self) -> None:
+        scheduler = AnimationScheduler(light_commands_per_second=10)
+        slow = Track([make_light("A")], KEYFRAMES, fps=1)
+        fast = Track([make_light("B")], KEYFRAMES, fps=20)
+        scheduler.add(slow)
+        scheduler.add(fast)
+
+        allocation = scheduler.allocate_fps()
+
+        assert allocation[slow] == 1
+        assert allocation[fast] == pytest.approx(9)
+
+    def test_budgets_group_tracks_separately(self) -> None:
+        scheduler = AnimationScheduler(
+            light_commands_per_second=10, group_commands_per_second=1
+        )
+        group_track = Track([make_group()], KEYFRAMES, fps=10)
+        light_track = Track([make_light()], KEYFRAMES, fps=10)
+        scheduler.add(group_track)
+        scheduler.add(light_track)
+
+        allocation = scheduler.allocate_fps()
+
+        assert allocation[group_track] == 1
+        assert allocation[light_track] == 10
+
+    def test_rejects_non_positive_budget(self) -> None:
+        with pytest.raises(ValueError, match="positive"):
+            AnimationScheduler(light_commands_per_second=0)
+
+
+class TestRun:
+    @pytest.mark.asyncio
+    async def test_returns_empty_stats_without_tracks(self) -> None:
+        stats = await AnimationScheduler().run(duration=0.1)
+        assert stats.frames_sent == 0
+
+    @pytest.mark.asyncio
+    async def test_sends_frames_with_bridge_side_transition(self) -> None:
+        light = make_light()
+        scheduler = AnimationScheduler(light_commands_per_second=20)
+        scheduler.add(Track([light], KEYFRAMES, fps=20))
+
+        stats = await scheduler.run(duration=0.3)
+
+        assert stats.frames_sent >= 2
+        assert light.set_state.await_args.kwargs["transition_ms"] == 50
+
+    @pytest.mark.asyncio
+    async def test_finishes_non_looping_track_on_last_keyframe(self) -> None:
+        light = make_light()
+        scheduler = AnimationScheduler(light_commands_per_second=50)
+        scheduler.add(
+            Track(
+                [light],
+                [Keyframe(at=0, brightness=0), Keyframe(at=0.1, brightness=80)],
+                fps=50,
+            )
+        )
+
+        await scheduler.run(duration=5)
+
+        assert light.set_state.await_args.kwargs["brightness"] == 80
+
+    @pytest.mark.asyncio
+    async def test_counts_failed_writes_as_dropped(self) -> None:
+        light = make_light()
+        light.set_state.side_effect = RuntimeError("bridge busy")
+        scheduler = AnimationScheduler(light_commands_per_second=20)
+        scheduler.add(Track([light], KEYFRAMES, fps=20, loop=True))
+
+        stats = await scheduler.run(duration=0.2)
+
+        assert stats.frames_sent == 0
+        assert stats.frames_dropped >= 1
+
+    @pytest.mark.asyncio
+    async def test_reports_achieved_fps(self) -> None:
+        scheduler = AnimationScheduler(light_commands_per_second=20)
+        scheduler.add(Track([make_light()], KEYFRAMES, fps=20, loop=True))
+
+        stats = await scheduler.run(duration=0.5)
+
+        assert 0 < stats.achieved_fps <= 25
+        assert stats.tracks[0].achieved_fps == pytest.approx(stats.achieved_fps)
+
+
+class TestRunAgainstBridge:
+    @pytest.mark.asyncio
+    async def test_sends_low_brightness_as_percentages(self) -> None:
+        home = generate_home(lights=1, rooms=1, seed=1)
+        async with (
+            FakeHueBridge(home) as bridge,
+            Hueify(bridge.host, bridge.app_key, bridge_url=bridge.url) as hue,
+        ):
+            await bridge.wait_for_event_streams()
+            sent: list[float] = []
+
+            @hue.on(LightEvent)
+            async def record(event: LightEvent) -> None:
+                if event.dimming is not None:
+                    sent.append(event.dimming.brightness)
+
+            scheduler = AnimationScheduler(light_commands_per_second=20)
+            scheduler.add(
+                Track(
+                    [hue.lights.from_name("Light 1")],
+                    # Early frames of a slow fade fall in (0, 1]: 0.5 %, 1 %, ...
+                    [Keyframe(at=0, brightness=0), Keyframe(at=2, brightness=20)],
+                    fps=20,
+                )
+            )
+            await scheduler.run(duration=0.3)
+            await asyncio.sleep(0.05)
+
+        assert sent
+        assert all(brightness <= 3 for brightness in sent)
@@ -0,0 +1,99 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from hueify.animation import Easing, Keyframe, Track, ease
+from hueify.grouped_lights import GroupedLights
+from hueify.light import Light
+
+
+def make_light(name: str = "Desk") -> MagicMock:
+    light = MagicMock(spec=Light)
+    light.name = name
+    return light
+
+
+class TestEase:
+    @pytest.mark.parametrize("easing", list(Easing))
+    def test_starts_at_zero(self, easing: Easing) -> None:
+        assert ease(easing, 0.0) == 0.0
+
+    @pytest.mark.parametrize("easing", list(Easing))
+    def test_ends_at_one(self, easing: Easing) -> None:
+        assert ease(easing, 1.0) == 1.0
+
+    def test_ease_in_is_slower_than_linear_at_start(self) -> None:
+        assert ease(Easing.EASE_IN, 0.25) < ease(Easing.LINEAR, 0.25)
+
+    def test_clamps_progress_outside_unit_interval(self) -> None:
+        assert ease(Easing.LINEAR, 1.5) == 1.0
+        assert ease(Easing.LINEAR, -0.5) == 0.0
+
+
+class TestKeyframe:
+    def test_rejects_empty_keyframe(self) -> None:
+        with pytest.raises(ValueError, match="must set"):
+            Keyframe(at=0)
+
+    def test_rejects_color_with_mirek(self) -> None:
+        with pytest.raises(ValueError, match="both"):
+            Keyframe(at=0, color=(255, 0, 0), mirek=300)
+
+
+class TestTrack:
+    def test_interpolates_brightness_linearly(self) -> None:
+        track = Track(
+            [make_light()],
+            [Keyframe(at=0, brightness=0), Keyframe(at=2, brightness=100)],
+        )
+        assert track.frame_at(1.0).brightness == 50
+
+    def test_interpolates_color_per_channel(self) -> None:
+        track = Track(
+            [make_light()],
+            [Keyframe(at=0, color=(0, 0, 0)), Keyframe(at=1, color=(255, 100, 50))],
+        )
+        assert track.frame_at(0.5).color == (128, 50, 25)
+
+    def test_holds_last_keyframe_after_end(self) -> None:
+        track = Track(
+            [make_light()],
+            [Keyframe(at=0, brightness=10), Keyframe(at=1, brightness=90)],
+        )
+        assert track.frame_at(5.0).brightness == 90
+        assert track.is_finished(5.0)
+
+    def test_wraps_when_looping(self) -> None:
+        track = Track(
+            [make_light()],
+            [Keyframe(at=0, brightness=0), Keyframe(at=2, brightness=100)],
+            loop=True,
+        )
+        assert track.frame_at(3.0).brightness == 50
+        assert not track.is_finished(100.0)
+
+    def test_sorts_keyframes_by_offset(self) -> None:
+        track = Track(
+            [make_light()],
+            [Keyframe(at=2, brightness=100), Keyframe(at=0, brightness=0)],
+        )
+        assert track.frame_at(0).brightness == 0
+
+    def test_rejects_keyframes_with_different_fields(self) -> None:
+        with pytest.raises(ValueError, match="same fields"):
+            Track(
+                [make_light()],
+                [Keyframe(at=0, brightness=0), Keyframe(at=1, mirek=300)],
+            )
+
+    def test_rejects_mixing_lights_and_groups(self) -> None:
+        group = MagicMock(spec=GroupedLights)
+        group.name = "Living Room"
+        with pytest.raises(ValueError, match="mix"):
+            Track([make_light(), group], [Keyframe(at=0, brightness=0)])
+
+    def test_defaults_name_to_target_names(self) -> None:
+        track = Track(
+            [make_light("Desk"), make_light("Floor")], [Keyframe(at=0, brightness=0)]
+        )
+        assert track.name == "Desk, Floor"
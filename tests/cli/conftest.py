@@ -0,0 +1,19 @@
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest_asyncio
+
+from hueify import Hueify
+from hueify.cli.server import _serve_daemon
+
+
+@pytest_asyncio.fixture
+async def socket_path(hue: Hueify, tmp_path: Path) -> AsyncIterator[Path]:
+    path = tmp_path / "hueify.sock"
+    ready = asyncio.Event()
+    server = asyncio.create_task(_serve_daemon(hue, path, ready))
+    await ready.wait()
+    yield path
+    server.cancel()
+    await asyncio.gather(server, return_exceptions=True)
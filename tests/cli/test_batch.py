@@ -0,0 +1,120 @@
+import asyncio
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from hueify.actions import (
+    ActionTarget,
+    ActivateSceneAction,
+    SetBrightnessAction,
+    TurnOnAction,
+)
+from hueify.cli.batch import parse_batch
+from hueify.cli.client import run_via_daemon
+from hueify.testing import FakeHueBridge
+
+
+@pytest.fixture
+def home_size() -> dict[str, int]:
+    return {"lights": 3, "rooms": 1}
+
+
+class TestParseBatch:
+    def test_parses_cli_arguments(self) -> None:
+        entries = parse_batch(
+            'lights on Desk\nhueify rooms activate-scene "Living Room" Relax\n'
+        )
+
+        assert [entry.action for entry in entries] == [
+            TurnOnAction(target=ActionTarget.LIGHT, name="Desk"),
+            ActivateSceneAction(
+                target=ActionTarget.ROOM, name="Living Room", scene="Relax"
+            ),
+        ]
+
+    def test_parses_json_lines_and_skips_comments(self) -> None:
+        entries = parse_batch(
+            "# evening\n\n"
+            '{"action": "set_brightness", "target": "zone", "name": "Up", '
+            '"percentage": 40}\n'
+        )
+
+        assert len(entries) == 1
+        assert entries[0].line == 3
+        assert entries[0].action == SetBrightnessAction(
+            target=ActionTarget.ZONE, name="Up", percentage=40
+        )
+
+    def test_parses_json_array(self) -> None:
+        entries = parse_batch(
+            '[{"action": "turn_on", "target": "light", "name": "A"},'
+            ' {"action": "turn_on", "target": "light", "name": "B"}]'
+        )
+
+        assert [entry.line for entry in entries] == [1, 2]
+        assert [entry.action.name for entry in entries if entry.action] == ["A", "B"]
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "lights list",
+            "lamps on Desk",
+            "lights info Desk",
+            "lights brightness Desk",
+            "lights brightness Desk bright",
+            '{"action": "activate_scene", "target": "light", "name": "A", "scene": "B"}',
+        ],
+    )
+    def test_reports_invalid_lines(self, line: str) -> None:
+        [entry] = parse_batch(line)
+
+        assert entry.action is None
+        assert entry.error
+
+
+class TestBatchCommand:
+    @pytest.mark.asyncio
+    async def test_streams_one_json_line_per_command(
+        self,
+        bridge: FakeHueBridge,
+        socket_path: Path,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        script = tmp_path / "evening.txt"
+        script.write_text(
+            "lights brightness 'Light 1' 25\nlights off 'Light 2'\nlights on Nope\n"
+        )
+
+        exit_code = await asyncio.to_thread(
+            run_via_daemon, ["batch", str(script)], socket_path
+        )
+
+        results = {
+            result["line"]: result
+            for result in map(json.loads, capsys.readouterr().out.splitlines())
+        }
+        assert exit_code == 1
+        assert results[1]["success"] and results[2]["success"]
+        assert not results[3]["success"]
+        assert "Nope" in results[3]["error"]
+        assert bridge.find("light", "Light 1")["dimming"]["brightness"] == 25
+        assert bridge.find("light", "Light 2")["on"]["on"] is False
+
+    @pytest.mark.asyncio
+    async def test_reads_commands_from_stdin(
+        self,
+        bridge: FakeHueBridge,
+        socket_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        monkeypatch.setattr("sys.stdin", io.StringIO("lights brightness 'Light 3' 5\n"))
+
+        exit_code = await asyncio.to_thread(run_via_daemon, ["batch", "-"], socket_path)
+
+        assert exit_code == 0
+        assert json.loads(capsys.readouterr().out)["success"]
+        assert bridge.find("light", "Light 3")["dimming"]["brightness"] == 5
@@ -0,0 +1,153 @@
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from hueify import Hueify
+from hueify.cli.client import _can_use_daemon, default_socket_path, run_via_daemon
+from hueify.cli.server import _serve_daemon
+from hueify.testing import FakeHueBridge
+
+
+async def _run(
+    socket_path: Path, *argv: str, capsys: pytest.CaptureFixture[str]
+) -> tuple[int | None, str, str]:
+    exit_code = await asyncio.to_thread(run_via_daemon, list(argv), socket_path)
+    captured = capsys.readouterr()
+    return exit_code, captured.out, captured.err
+
+
+class TestDaemon:
+    @pytest.mark.asyncio
+    async def test_runs_commands_on_the_connected_session(
+        self,
+        bridge: FakeHueBridge,
+        socket_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        exit_code, out, _ = await _run(
+            socket_path, "lights", "brightness", "Light 1", "40", capsys=capsys
+        )
+
+        assert exit_code == 0
+        assert "40%" in out
+        assert bridge.find("light", "Light 1")["dimming"]["brightness"] == 40
+
+    @pytest.mark.asyncio
+    async def test_reports_errors_with_exit_code(
+        self, socket_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        exit_code, _, err = await _run(
+            socket_path, "lights", "on", "Nope", capsys=capsys
+        )
+
+        assert exit_code == 1
+        assert "Not found" in err
+
+    @pytest.mark.asyncio
+    async def test_reports_usage_errors(
+        self, socket_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        exit_code, _, err = await _run(socket_path, "lights", "dance", capsys=capsys)
+
+        assert exit_code == 2
+        assert "dance" in err
+
+    @pytest.mark.asyncio
+    async def test_refuses_commands_that_must_run_directly(
+        self, socket_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        exit_code, _, err = await _run(socket_path, "setup", capsys=capsys)
+
+        assert exit_code == 2
+        assert "setup" in err
+
+    @pytest.mark.asyncio
+    async def test_answers_from_the_cache_quickly(
+        self, socket_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        await _run(socket_path, "lights", "list", capsys=capsys)
+
+        started_at = time.perf_counter()
+        exit_code, out, _ = await _run(socket_path, "lights", "list", capsys=capsys)
+
+        assert exit_code == 0
+        assert "Light 2" in out
+        assert time.perf_counter() - started_at < 0.5
+
+    @pytest.mark.asyncio
+    async def test_removes_the_socket_on_shutdown(
+        self, bridge: FakeHueBridge, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "hueify.sock"
+        ready = asyncio.Event()
+        async with Hueify(bridge.host, bridge.app_key, bridge_url=bridge.url) as hueify:
+            server = asyncio.create_task(_serve_daemon(hueify, path, ready))
+            await ready.wait()
+            assert path.exists()
+
+            server.cancel()
+            await asyncio.gather(server, return_exceptions=True)
+
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_creates_a_socket_only_the_owner_can_use(
+        self, socket_path: Path
+    ) -> None:
+        assert socket_path.stat().st_mode & 0o077 == 0
+
+
+class TestClient:
+    def test_falls_back_when_no_daemon_is_listening(self, tmp_path: Path) -> None:
+        assert run_via_daemon(["lights", "list"], tmp_path / "missing.sock") is None
+
+    def test_falls_back_on_a_stale_socket(self, tmp_path: Path) -> None:
+        stale = tmp_path / "stale.sock"
+        stale.touch()
+
+        assert run_via_daemon(["lights", "list"], stale) is None
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["daemon"],
+            ["setup"],
+            ["--help"],
+            ["--bridge-ip", "10.0.0.2", "lights", "list"],
+            ["--app-key=abc", "lights", "list"],
+        ],
+    )
+    def test_runs_some_invocations_directly(self, argv: list[str]) -> None:
+        assert not _can_use_daemon(argv)
+
+    def test_can_be_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("HUEIFY_NO_DAEMON", "1")
+
+        assert not _can_use_daemon(["lights", "list"])
+
+
+class TestDefaultSocketPath:
+    @pytest.fixture(autouse=True)
+    def temp_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        monkeypatch.delenv("HUEIFY_DAEMON_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        return tmp_path
+
+    def test_falls_back_to_a_private_directory(self) -> None:
+        path = default_socket_path()
+
+        assert path.parent.stat().st_mode & 0o777 == 0o700
+
+    def test_refuses_a_directory_others_can_access(self, temp_dir: Path) -> None:
+        shared = temp_dir / f"hueify-{os.getuid()}"
+        shared.mkdir()
+        shared.chmod(0o755)
+
+        with pytest.raises(RuntimeError):
+            default_socket_path()
@@ -0,0 +1,140 @@
+import asyncio
+import io
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from rich.console import Console
+from rich.table import Table
+
+from hueify import Hueify
+from hueify.cli.watch import EventWatcher, LiveTable, WatchedChange
+from hueify.exceptions import ResourceNotFoundException
+from hueify.testing import FakeHueBridge
+
+
+def publish_brightness(bridge: FakeHueBridge, name: str, brightness: float) -> None:
+    light = bridge.find("light", name)
+    bridge.publish(
+        [
+            {
+                "id": light["id"],
+                "type": "light",
+                "owner": light["owner"],
+                "on": {"on": True},
+                "dimming": {"brightness": brightness},
+            }
+        ]
+    )
+
+
+class TestEventWatcher:
+    @pytest.mark.asyncio
+    async def test_reports_only_the_fields_an_event_carries(
+        self, hue: Hueify, bridge: FakeHueBridge
+    ) -> None:
+        changes: list[WatchedChange] = []
+        watcher = EventWatcher(hue, changes.append, resource_types=["light"])
+        watcher.start()
+
+        publish_brightness(bridge, "Light 1", 40.0)
+        await asyncio.sleep(0.05)
+
+        [change] = changes
+        assert change.name == "Light 1"
+        assert change.changes == {"on": {"on": True}, "dimming": {"brightness": 40.0}}
+        assert json.loads(change.to_json())["type"] == "light"
+
+    @pytest.mark.asyncio
+    async def test_filters_by_name_and_fields(
+        self, hue: Hueify, bridge: FakeHueBridge
+    ) -> None:
+        changes: list[WatchedChange] = []
+        watcher = EventWatcher(
+            hue, changes.append, names=["light 2"], fields=["dimming"]
+        )
+        watcher.start()
+
+        publish_brightness(bridge, "Light 1", 10.0)
+        publish_brightness(bridge, "Light 2", 20.0)
+        await asyncio.sleep(0.05)
+
+        assert [(c.name, c.changes) for c in changes] == [
+            ("Light 2", {"dimming": {"brightness": 20.0}})
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stops_reporting_after_stop(
+        self, hue: Hueify, bridge: FakeHueBridge
+    ) -> None:
+        changes: list[WatchedChange] = []
+        watcher = EventWatcher(hue, changes.append)
+        watcher.start()
+        watcher.stop()
+
+        publish_brightness(bridge, "Light 1", 40.0)
+        await asyncio.sleep(0.05)
+
+        assert changes == []
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_types_and_names(self, hue: Hueify) -> None:
+        with pytest.raises(ValueError, match="lamp"):
+            EventWatcher(hue, print, resource_types=["lamp"])
+        with pytest.raises(ResourceNotFoundException):
+            EventWatcher(hue, print, names=["Nope"])
+
+
+class TestLiveTable:
+    light_id = uuid4()
+
+    def make_change(self, brightness: float) -> WatchedChange:
+        return WatchedChange(
+            timestamp=datetime.now(),
+            resource_type="light",
+            resource_id=self.light_id,
+            name="Desk",
+            changes={"dimming": {"brightness": brightness}},
+        )
+
+    def test_keeps_the_latest_change_per_resource(self) -> None:
+        table = LiveTable(Console(file=io.StringIO()))
+        table.add(self.make_change(10.0))
+        table.add(self.make_change(20.0))
+
+        output = io.StringIO()
+        Console(file=output, width=120).print(table.render())
+
+        assert "dimming.brightness=20.0" in output.getvalue()
+        assert "dimming.brightness=10.0" not in output.getvalue()
+        assert "2 received" in output.getvalue()
+
+    @pytest.mark.asyncio
+    async def test_coalesces_bursts_into_one_redraw(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        table = LiveTable(Console(file=io.StringIO()), refresh_rate=20)
+        renders = 0
+        render = table.render
+
+        def counting_render() -> Table:
+            nonlocal renders
+            renders += 1
+            return render()
+
+        monkeypatch.setattr(table, "render", counting_render)
+        task = asyncio.create_task(table.run())
+        await asyncio.sleep(0.01)
+        for brightness in range(100):
+            table.add(self.make_change(float(brightness)))
+        await asyncio.sleep(0.12)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        # The initial frame plus a single redraw for the whole burst.
+        assert renders == 2
+
+    def test_rejects_non_positive_refresh_rate(self) -> None:
+        with pytest.raises(ValueError):
+            LiveTable(Console(), refresh_rate=0)
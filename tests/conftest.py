@@ -0,0 +1,43 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+import pytest_asyncio
+
+from hueify import Hueify
+from hueify.testing import FakeHueBridge, generate_home
+from hueify.testing.home import RawResource
+
+DEFAULT_HOME_SIZE = {"lights": 2, "rooms": 1}
+
+
+@pytest.fixture
+def home_size(request: pytest.FixtureRequest) -> dict[str, int]:
+    """``generate_home`` counts; override it or parametrize it indirectly."""
+    return getattr(request, "param", DEFAULT_HOME_SIZE)
+
+
+@pytest.fixture
+def home(home_size: dict[str, int]) -> list[RawResource]:
+    return generate_home(**home_size, seed=1)
+
+
+@pytest.fixture
+def bridge_options() -> dict[str, Any]:
+    """Extra ``FakeHueBridge`` arguments, e.g. latency or throttling."""
+    return {}
+
+
+@pytest_asyncio.fixture
+async def bridge(
+    home: list[RawResource], bridge_options: dict[str, Any]
+) -> AsyncIterator[FakeHueBridge]:
+    async with FakeHueBridge(home, **bridge_options) as bridge:
+        yield bridge
+
+
+@pytest_asyncio.fixture
+async def hue(bridge: FakeHueBridge) -> AsyncIterator[Hueify]:
+    async with Hueify(bridge.host, bridge.app_key, bridge_url=bridge.url) as hue:
+        await bridge.wait_for_event_streams()
+        yield hue
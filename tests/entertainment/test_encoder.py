@@ -0,0 +1,69 @@
+import struct
+from uuid import UUID
+
+import pytest
+
+from hueify.entertainment import ColorSpace, HueStreamEncoder
+
+CONFIGURATION_ID = UUID("1a8d99cc-967b-44f2-9202-43f976c0fa6b")
+
+
+@pytest.fixture
+def encoder() -> HueStreamEncoder:
+    return HueStreamEncoder(CONFIGURATION_ID, channel_ids=[0, 1, 5])
+
+
+class TestHueStreamEncoder:
+    def test_writes_protocol_header(self, encoder: HueStreamEncoder) -> None:
+        frame = bytes(encoder.frame())
+
+        assert frame[:9] == b"HueStream"
+        assert frame[9:11] == b"\x02\x00"
+        assert frame[14] == ColorSpace.RGB
+        assert frame[16:52] == str(CONFIGURATION_ID).encode("ascii")
+
+    def test_frame_size_matches_channel_count(self, encoder: HueStreamEncoder) -> None:
+        assert encoder.frame_size == 52 + 3 * 7
+        assert len(encoder.frame()) == encoder.frame_size
+
+    def test_encodes_channel_values_big_endian(self, encoder: HueStreamEncoder) -> None:
+        encoder.set_channel(2, 1.0, 0.5, 0.0)
+
+        channel = struct.unpack_from(">BHHH", encoder.frame(), 52 + 2 * 7)
+
+        assert channel == (5, 0xFFFF, 0x8000, 0)
+
+    def test_clamps_out_of_range_components(self, encoder: HueStreamEncoder) -> None:
+        encoder.set_channel(0, 2.0, -1.0, 0.25)
+
+        channel = struct.unpack_from(">BHHH", encoder.frame(), 52)
+
+        assert channel == (0, 0xFFFF, 0, 0x4000)
+
+    def test_increments_and_wraps_sequence(self, encoder: HueStreamEncoder) -> None:
+        sequences = [encoder.frame()[11] for _ in range(258)]
+
+        assert sequences[:3] == [0, 1, 2]
+        assert sequences[255:] == [255, 0, 1]
+
+    def test_reuses_the_same_buffer(self, encoder: HueStreamEncoder) -> None:
+        first = encoder.frame()
+        encoder.set_channel(1, 1.0, 1.0, 1.0)
+        second = encoder.frame()
+
+        assert first.obj is second.obj
+        assert first[52 + 7 + 1] == 0xFF
+
+    def test_writes_xy_color_space(self) -> None:
+        encoder = HueStreamEncoder(CONFIGURATION_ID, [0], color_space=ColorSpace.XY)
+
+        assert encoder.frame()[14] == ColorSpace.XY
+
+    def test_rejects_invalid_channel_index(self, encoder: HueStreamEncoder) -> None:
+        with pytest.raises(IndexError):
+            encoder.set_channel(3, 0.0, 0.0, 0.0)
+
+    @pytest.mark.parametrize("channel_count", [0, 21])
+    def test_rejects_unsupported_channel_count(self, channel_count: int) -> None:
+        with pytest.raises(ValueError):
+            HueStreamEncoder(CONFIGURATION_ID, list(range(channel_count)))
@@ -0,0 +1,202 @@
+import socket
+from collections.abc import Iterator
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from hueify.entertainment import (
+    EntertainmentConfigurationInfo,
+    EntertainmentNamespace,
+    UdpDatagramTransport,
+)
+from hueify.entertainment.views import (
+    EntertainmentAction,
+    EntertainmentConfigurationUpdate,
+    EntertainmentServiceInfo,
+)
+from hueify.exceptions import ResourceNotFoundException
+
+LIGHT_A = uuid4()
+LIGHT_B = uuid4()
+SERVICE_A = uuid4()
+SERVICE_B = uuid4()
+
+
+def make_configuration(name: str = "TV area") -> EntertainmentConfigurationInfo:
+    return EntertainmentConfigurationInfo.model_validate(
+        {
+            "id": str(uuid4()),
+            "metadata": {"name": name},
+            "status": "inactive",
+            "channels": [
+                {
+                    "channel_id": 0,
+                    "members": [
+                        {"service": {"rid": str(SERVICE_A), "rtype": "entertainment"}}
+                    ],
+                },
+                {
+                    "channel_id": 1,
+                    "members": [
+                        {"service": {"rid": str(SERVICE_B), "rtype": "entertainment"}}
+                    ],
+                },
+            ],
+        }
+    )
+
+
+def make_service(service_id: UUID, light_id: UUID) -> EntertainmentServiceInfo:
+    return EntertainmentServiceInfo.model_validate(
+        {
+            "id": str(service_id),
+            "renderer": True,
+            "renderer_reference": {"rid": str(light_id), "rtype": "light"},
+        }
+    )
+
+
+@pytest.fixture
+def receiver() -> Iterator[socket.socket]:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(1.0)
+    yield sock
+    sock.close()
+
+
+@pytest.fixture
+def configuration() -> EntertainmentConfigurationInfo:
+    return make_configuration()
+
+
+@pytest.fixture
+def client(configuration: EntertainmentConfigurationInfo) -> AsyncMock:
+    client = AsyncMock()
+
+    async def get_resources(endpoint: str, resource_type: type) -> list:
+        if endpoint == "/entertainment_configuration":
+            return [configuration]
+        return [make_service(SERVICE_A, LIGHT_A), make_service(SERVICE_B, LIGHT_B)]
+
+    client.get_resources.side_effect = get_resources
+    return client
+
+
+@pytest.fixture
+def namespace(client: AsyncMock) -> EntertainmentNamespace:
+    return EntertainmentNamespace(http_client=client)
+
+
+class TestEntertainmentNamespace:
+    @pytest.mark.asyncio
+    async def test_finds_configuration_case_insensitively(
+        self, namespace: EntertainmentNamespace
+    ) -> None:
+        configuration = await namespace.get_configuration("tv AREA")
+
+        assert configuration.name == "TV area"
+
+    @pytest.mark.asyncio
+    async def test_raises_for_unknown_configuration(
+        self, namespace: EntertainmentNamespace
+    ) -> None:
+        with pytest.raises(ResourceNotFoundException):
+            await namespace.get_configuration("Gaming")
+
+    @pytest.mark.asyncio
+    async def test_maps_channels_to_lights(
+        self,
+        namespace: EntertainmentNamespace,
+        configuration: EntertainmentConfigurationInfo,
+    ) -> None:
+        mapping = await namespace.channel_lights(configuration)
+
+        assert mapping == {0: [LIGHT_A], 1: [LIGHT_B]}
+
+
+class TestEntertainmentSession:
+    @pytest.mark.asyncio
+    async def test_starts_and_stops_configuration(
+        self,
+        namespace: EntertainmentNamespace,
+        client: AsyncMock,
+        configuration: EntertainmentConfigurationInfo,
+        receiver: socket.socket,
+    ) -> None:
+        transport = UdpDatagramTransport(*receiver.getsockname())
+
+        async with await namespace.session("TV area", transport):
+            pass
+
+        endpoints = [call.args[0] for call in client.put.await_args_list]
+        bodies = [call.kwargs["data"] for call in client.put.await_args_list]
+        assert endpoints == [f"entertainment_configuration/{configuration.id}"] * 2
+        assert bodies == [
+            EntertainmentConfigurationUpdate(action=EntertainmentAction.START),
+            EntertainmentConfigurationUpdate(action=EntertainmentAction.STOP),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sends_frames_to_udp_stand_in(
+        self, namespace: EntertainmentNamespace, receiver: socket.socket
+    ) -> None:
+        transport = UdpDatagramTransport(*receiver.getsockname())
+        session = await namespace.session("TV area", transport)
+
+        session.set_channel(1, 1.0, 0.0, 0.0)
+        session.send()
+        frame = receiver.recv(1024)
+
+        assert frame[:9] == b"HueStream"
+        assert frame[52 + 7 : 52 + 7 + 3] == b"\x01\xff\xff"
+        transport.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_renders_and_sends_each_frame(
+        self, namespace: EntertainmentNamespace, receiver: socket.socket
+    ) -> None:
+        transport = UdpDatagramTransport(*receiver.getsockname())
+        session = await namespace.session("TV area", transport)
+        rendered: list[int] = []
+
+        def render(encoder, frame_number: int) -> None:
+            rendered.append(frame_number)
+            if frame_number == 4:
+                session._is_streaming = False
+
+        stats = await session.stream(render, fps=1000)
+
+        assert stats.frames_sent == 5
+        assert rendered == [0, 1, 2, 3, 4]
+        assert [receiver.recv(1024)[11] for _ in range(5)] == [0, 1, 2, 3, 4]
+        transport.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_drops_frames_the_transport_cannot_take(
+        self, namespace: EntertainmentNamespace, receiver: socket.socket
+    ) -> None:
+        class FullBufferTransport(UdpDatagramTransport):
+            """Reports a full send buffer for every other frame."""
+
+            attempts = 0
+
+            def send(self, data: bytes | memoryview) -> None:
+                self.attempts += 1
+                if self.attempts % 2 == 0:
+                    raise BlockingIOError
+                super().send(data)
+
+        transport = FullBufferTransport(*receiver.getsockname())
+        session = await namespace.session("TV area", transport)
+
+        def render(encoder, frame_number: int) -> None:
+            if frame_number == 5:
+                session._is_streaming = False
+
+        stats = await session.stream(render, fps=1000)
+
+        assert stats.frames_sent == 3
+        assert stats.frames_dropped == 3
+        transport.close()
@@ -0,0 +1,132 @@
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from hueify.credentials import HueBridgeCredentials
+from hueify.sse import SseRecorder, read_recording, replay_recording
+from hueify.sse.bus import EventBus
+from hueify.sse.stream import ServerSentEventStream
+from hueify.sse.views import LightEvent
+from hueify.testing import FakeHueBridge
+
+
+def make_stream() -> tuple[ServerSentEventStream, AsyncMock]:
+    credentials = HueBridgeCredentials(
+        hue_bridge_ip="192.168.1.1", hue_app_key="a" * 20
+    )
+    bus = AsyncMock(spec=EventBus)
+    return ServerSentEventStream(credentials=credentials, event_bus=bus), bus
+
+
+def make_payload() -> str:
+    event = {
+        "id": str(uuid4()),
+        "type": "light",
+        "owner": {"rid": str(uuid4()), "rtype": "device"},
+    }
+    return json.dumps([{"type": "update", "data": [event]}])
+
+
+@pytest.fixture(params=["events.jsonl", "events.jsonl.gz"])
+def recording_path(request: pytest.FixtureRequest, tmp_path: Path) -> Path:
+    return tmp_path / request.param
+
+
+class TestSseRecorder:
+    def test_round_trips_payloads_in_order(self, recording_path: Path) -> None:
+        payloads = [make_payload() for _ in range(3)]
+
+        with SseRecorder(recording_path) as recorder:
+            for payload in payloads:
+                recorder.record(payload)
+
+        recorded = list(read_recording(recording_path))
+        assert [entry.data for entry in recorded] == payloads
+        assert [entry.offset for entry in recorded] == sorted(
+            entry.offset for entry in recorded
+        )
+
+    def test_appends_sessions_on_one_timeline(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        for _ in range(2):
+            with SseRecorder(path) as recorder:
+                recorder.record(make_payload())
+
+        offsets = [entry.offset for entry in read_recording(path)]
+
+        assert len(offsets) == 2
+        assert offsets[1] >= offsets[0]
+
+
+class TestReplayRecording:
+    @pytest.mark.asyncio
+    async def test_dispatches_every_recorded_event(self, recording_path: Path) -> None:
+        with SseRecorder(recording_path) as recorder:
+            for _ in range(4):
+                recorder.record(make_payload())
+        stream, bus = make_stream()
+
+        stats = await replay_recording(recording_path, stream, speed=None)
+
+        assert stats.payloads == 4
+        assert bus.dispatch.await_count == 4
+        assert all(
+            isinstance(call.args[0], LightEvent)
+            for call in bus.dispatch.await_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_honours_original_timing_scaled_by_speed(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "events.jsonl"
+        path.write_text(
+            '{"started_at": "2024-01-01T00:00:00+00:00"}\n'
+            f"{json.dumps([0.0, make_payload()])}\n"
+            f"{json.dumps([0.2, make_payload()])}\n"
+        )
+        stream, _ = make_stream()
+
+        stats = await replay_recording(path, stream, speed=2.0)
+
+        assert stats.payloads == 2
+        assert 0.09 <= stats.elapsed_seconds < 0.2
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_speed(self, tmp_path: Path) -> None:
+        stream, _ = make_stream()
+
+        with pytest.raises(ValueError):
+            await replay_recording(tmp_path / "missing.jsonl", stream, speed=0)
+
+
+class TestStreamRecording:
+    @pytest.mark.asyncio
+    async def test_stream_tees_payloads_to_recorder(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        async with FakeHueBridge.with_synthetic_home() as bridge:
+            recorder = SseRecorder(path)
+            stream = ServerSentEventStream(
+                credentials=HueBridgeCredentials(
+                    hue_bridge_ip=bridge.host, hue_app_key=bridge.app_key
+                ),
+                event_bus=EventBus(),
+                bridge_url=bridge.url,
+                recorder=recorder,
+            )
+            task = asyncio.create_task(stream.connect())
+            await bridge.wait_for_event_streams()
+
+            bridge.publish(
+                [{"id": str(uuid4()), "type": "scene", "status": {"active": "static"}}]
+            )
+            await asyncio.sleep(0.05)
+            stream.disconnect()
+            task.cancel()
+            recorder.close()
+
+        assert recorder.count == 1
@@ -35,6 +35,14 @@ def test_base_url_construction(http_client: HttpClient) -> None:
     assert http_client._base_url == f"https://{VALID_IP}/clip/v2/resource"
 
 
+def test_base_url_uses_bridge_url_override(
+    credentials: HueBridgeCredentials,
+) -> None:
+    client = HttpClient(credentials=credentials, bridge_url="http://127.0.0.1:8080/")
+
+    assert client._base_url == "http://127.0.0.1:8080/clip/v2/resource"
+
+
 def test_headers_construction(http_client: HttpClient) -> None:
     assert http_client._headers["hue-application-key"] == VALID_APP_KEY
     assert http_client._headers["Content-Type"] == "application/json"
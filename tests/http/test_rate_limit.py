@@ -0,0 +1,67 @@
+import pytest
+
+from hueify.http import RateLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr("hueify.http.ratelimit.asyncio.sleep", fake_sleep)
+    return delays
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_allows_burst_then_spaces_out_writes(
+        self, sleeps: list[float]
+    ) -> None:
+        limiter = RateLimiter(light_commands_per_second=10, burst=2, clock=FakeClock())
+
+        for _ in range(4):
+            await limiter.acquire("light/1")
+
+        assert sleeps == pytest.approx([0.1, 0.2])
+
+    @pytest.mark.asyncio
+    async def test_budgets_lights_and_groups_separately(
+        self, sleeps: list[float]
+    ) -> None:
+        limiter = RateLimiter(burst=1, clock=FakeClock())
+
+        await limiter.acquire("/grouped_light/1")
+        await limiter.acquire("/light/1")
+        await limiter.acquire("scene/1")
+
+        assert sleeps == pytest.approx([1.0])
+
+    @pytest.mark.asyncio
+    async def test_refills_over_time(self, sleeps: list[float]) -> None:
+        clock = FakeClock()
+        limiter = RateLimiter(group_commands_per_second=1, burst=1, clock=clock)
+
+        await limiter.acquire("grouped_light/1")
+        clock.now = 1.0
+        await limiter.acquire("grouped_light/1")
+
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_ignores_other_resources(self, sleeps: list[float]) -> None:
+        limiter = RateLimiter(burst=1, clock=FakeClock())
+
+        for _ in range(3):
+            await limiter.acquire("entertainment_configuration/1")
+
+        assert sleeps == []
@@ -0,0 +1,267 @@
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from hueify.credentials import HueBridgeCredentials
+from hueify.exceptions import BridgeUnavailableException
+from hueify.http import (
+    CircuitBreaker,
+    CircuitState,
+    HttpClient,
+    RequestHook,
+    RequestTrace,
+    RetryBudget,
+    RetryPolicy,
+)
+from hueify.http.retry import parse_retry_after
+
+OK_BODY = {"errors": [], "data": []}
+
+
+class Dimming(BaseModel):
+    brightness: float
+
+
+class DimmingDelta(BaseModel):
+    action: str
+    brightness_delta: float
+
+
+class RelativeUpdate(BaseModel):
+    dimming_delta: DimmingDelta
+
+
+class AttemptHook(RequestHook):
+    def __init__(self) -> None:
+        self.attempts: list[int] = []
+
+    def before_send(self, trace: RequestTrace) -> None:
+        self.attempts.append(trace.attempt)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr("hueify.http.client.asyncio.sleep", fake_sleep)
+    return delays
+
+
+def make_client(
+    responses: list[httpx.Response | Exception],
+    **kwargs,
+) -> tuple[HttpClient, list[httpx.Request]]:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response = responses.pop(0) if len(responses) > 1 else responses[0]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    credentials = HueBridgeCredentials(
+        hue_bridge_ip="192.168.1.2", hue_app_key="a" * 40
+    )
+    client = HttpClient(credentials, **kwargs)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, requests
+
+
+def throttled(retry_after: str | None = "1") -> httpx.Response:
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return httpx.Response(429, headers=headers, json=OK_BODY)
+
+
+def ok() -> httpx.Response:
+    return httpx.Response(200, json=OK_BODY)
+
+
+class TestRetries:
+    @pytest.mark.asyncio
+    async def test_retries_throttled_request_after_retry_after(
+        self, sleeps: list[float]
+    ) -> None:
+        hook = AttemptHook()
+        client, requests = make_client([throttled("0.5"), ok()], hooks=[hook])
+
+        await client.put("light/1", Dimming(brightness=50))
+
+        assert len(requests) == 2
+        assert sleeps == [0.5]
+        assert hook.attempts == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_uses_exponential_backoff_without_retry_after(
+        self, sleeps: list[float]
+    ) -> None:
+        policy = RetryPolicy(max_attempts=4, base_delay=0.1, jitter=False)
+        client, _ = make_client(
+            [httpx.Response(503), httpx.Response(503), httpx.Response(503), ok()],
+            retry_policy=policy,
+        )
+
+        await client.get("light")
+
+        assert sleeps == pytest.approx([0.1, 0.2, 0.4])
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, sleeps: list[float]) -> None:
+        client, requests = make_client([throttled()])
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("light")
+
+        assert len(requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_never_retries_relative_changes(self, sleeps: list[float]) -> None:
+        client, requests = make_client([throttled(), ok()])
+        update = RelativeUpdate(
+            dimming_delta=DimmingDelta(action="up", brightness_delta=10)
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.put("light/1", update)
+
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self, sleeps: list[float]) -> None:
+        client, requests = make_client([httpx.Response(400), ok()])
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("light")
+
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_refuses_excessive_retry_after(self, sleeps: list[float]) -> None:
+        client, requests = make_client([throttled("120"), ok()])
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("light")
+
+        assert len(requests) == 1
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_retries_transport_errors(self, sleeps: list[float]) -> None:
+        client, requests = make_client([httpx.ConnectError("refused"), ok()])
+
+        await client.get("light")
+
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_stops_retrying_when_budget_is_empty(
+        self, sleeps: list[float]
+    ) -> None:
+        client, requests = make_client([throttled("0")])
+        client._retry_budget = RetryBudget(ratio=0.0, min_per_second=0.0, capacity=1)
+
+        for _ in range(3):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get("light")
+
+        assert len(requests) == 4
+
+
+class TestCircuitBreaker:
+    @pytest.mark.asyncio
+    async def test_fails_fast_while_bridge_is_unreachable(
+        self, sleeps: list[float]
+    ) -> None:
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=5.0)
+        client, requests = make_client(
+            [httpx.ConnectError("unreachable")],
+            retry_policy=RetryPolicy.disabled(),
+            circuit_breaker=breaker,
+        )
+
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                await client.get("light")
+        with pytest.raises(BridgeUnavailableException):
+            await client.get("light")
+
+        assert len(requests) == 2
+        assert breaker.state is CircuitState.OPEN
+
+    def test_closes_after_successful_probe(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, clock=clock)
+        breaker.record_failure()
+        assert not breaker.allow_request()
+
+        clock.now = 5.0
+
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_reopens_after_failed_probe(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, clock=clock)
+        breaker.record_failure()
+        clock.now = 5.0
+
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.retry_in == pytest.approx(5.0)
+
+
+class TestRetryBudget:
+    def test_refills_over_time(self) -> None:
+        clock = FakeClock()
+        budget = RetryBudget(ratio=0.0, min_per_second=1.0, capacity=1, clock=clock)
+
+        assert budget.try_withdraw()
+        assert not budget.try_withdraw()
+
+        clock.now = 1.0
+
+        assert budget.try_withdraw()
+
+    def test_requests_earn_retries(self) -> None:
+        budget = RetryBudget(
+            ratio=0.5, min_per_second=0.0, capacity=1, clock=FakeClock()
+        )
+        assert budget.try_withdraw()
+
+        budget.deposit()
+        assert not budget.try_withdraw()
+        budget.deposit()
+        assert budget.try_withdraw()
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({}, None),
+        ({"Retry-After": "2"}, 2.0),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+        ({"Retry-After": "soon"}, None),
+    ],
+)
+def test_parse_retry_after(headers: dict[str, str], expected: float | None) -> None:
+    assert parse_retry_after(headers) == expected
+
+
+def test_policy_rejects_invalid_attempts() -> None:
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
@@ -0,0 +1,85 @@
+import asyncio
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from hueify.credentials import HueBridgeCredentials
+from hueify.http import HttpClient
+from hueify.testing import FakeHueBridge
+
+
+@pytest.fixture
+def home_size() -> dict[str, int]:
+    return {"lights": 3, "rooms": 1}
+
+
+@pytest.fixture
+def bridge_options() -> dict[str, Any]:
+    return {"latency": 0.05}
+
+
+class LightId(BaseModel):
+    id: str
+
+
+def make_client(bridge: FakeHueBridge, **kwargs) -> HttpClient:
+    credentials = HueBridgeCredentials(
+        hue_bridge_ip=bridge.host, hue_app_key=bridge.app_key
+    )
+    return HttpClient(credentials, bridge_url=bridge.url, **kwargs)
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_share_one_request(
+        self, bridge: FakeHueBridge
+    ) -> None:
+        async with make_client(bridge) as client:
+            results = await asyncio.gather(
+                *[client.get_resources("light", LightId) for _ in range(5)]
+            )
+
+        assert bridge.request_counts["GET light"] == 1
+        assert client.coalesced_requests == 4
+        assert all(len(lights) == 3 for lights in results)
+        assert results[0][0] is not results[1][0]
+
+    @pytest.mark.asyncio
+    async def test_different_endpoints_are_not_coalesced(
+        self, bridge: FakeHueBridge
+    ) -> None:
+        async with make_client(bridge) as client:
+            await asyncio.gather(client.get("light"), client.get("room"))
+
+        assert client.coalesced_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_gets_are_sent_again(self, bridge: FakeHueBridge) -> None:
+        async with make_client(bridge) as client:
+            await client.get("light")
+            await client.get("light")
+
+        assert bridge.request_counts["GET light"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(
+        self, bridge: FakeHueBridge
+    ) -> None:
+        async with make_client(bridge) as client:
+            first = asyncio.create_task(client.get("light"))
+            second = asyncio.create_task(client.get("light"))
+            await asyncio.sleep(0.01)
+            first.cancel()
+
+            result = await second
+
+        assert result["data"]
+        assert bridge.request_counts["GET light"] == 1
+
+    @pytest.mark.asyncio
+    async def test_can_be_disabled(self, bridge: FakeHueBridge) -> None:
+        async with make_client(bridge, single_flight=False) as client:
+            await asyncio.gather(client.get("light"), client.get("light"))
+
+        assert bridge.request_counts["GET light"] == 2
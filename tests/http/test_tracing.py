@@ -0,0 +1,137 @@
+import logging
+
+import httpx
+import pytest
+
+from hueify import Hueify
+from hueify.credentials import HueBridgeCredentials
+from hueify.http import (
+    HttpClient,
+    RequestHook,
+    RequestTrace,
+    SlowRequestLogger,
+    correlation_scope,
+    current_correlation_id,
+)
+from hueify.testing import FakeHueBridge
+
+
+class RecordingHook(RequestHook):
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, RequestTrace]] = []
+
+    def before_send(self, trace: RequestTrace) -> None:
+        self.calls.append(("before_send", trace))
+
+    def after_headers(self, trace: RequestTrace) -> None:
+        self.calls.append(("after_headers", trace))
+
+    def after_body(self, trace: RequestTrace) -> None:
+        self.calls.append(("after_body", trace))
+
+    def on_error(self, trace: RequestTrace, error: BaseException) -> None:
+        self.calls.append(("on_error", trace))
+
+
+def make_client(bridge: FakeHueBridge, hook: RequestHook) -> HttpClient:
+    credentials = HueBridgeCredentials(
+        hue_bridge_ip=bridge.host, hue_app_key=bridge.app_key
+    )
+    return HttpClient(credentials, bridge_url=bridge.url, hooks=[hook])
+
+
+class TestCorrelationScope:
+    def test_generates_and_restores_id(self) -> None:
+        assert current_correlation_id() is None
+
+        with correlation_scope() as correlation_id:
+            assert current_correlation_id() == correlation_id
+
+        assert current_correlation_id() is None
+
+    def test_nested_scope_reuses_outer_id(self) -> None:
+        with correlation_scope("outer"), correlation_scope() as inner:
+            assert inner == "outer"
+
+
+class TestRequestHooks:
+    @pytest.mark.asyncio
+    async def test_calls_lifecycle_hooks_in_order(self, bridge: FakeHueBridge) -> None:
+        hook = RecordingHook()
+
+        async with make_client(bridge, hook) as client:
+            await client.get("light")
+
+        assert [name for name, _ in hook.calls] == [
+            "before_send",
+            "after_headers",
+            "after_body",
+        ]
+        trace = hook.calls[-1][1]
+        assert trace.status_code == 200
+        assert trace.endpoint == "light"
+        assert {"server", "body", "event_loop"} <= trace.phases().keys()
+
+    @pytest.mark.asyncio
+    async def test_reports_status_errors(self, bridge: FakeHueBridge) -> None:
+        hook = RecordingHook()
+
+        async with make_client(bridge, hook) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get("light/00000000-0000-4000-8000-000000000000")
+
+        assert hook.calls[-1][0] == "on_error"
+        assert hook.calls[-1][1].endpoint == "light/{id}"
+
+    @pytest.mark.asyncio
+    async def test_correlation_id_flows_into_action_result(
+        self, bridge: FakeHueBridge
+    ) -> None:
+        hook = RecordingHook()
+
+        async with Hueify(
+            bridge_ip=bridge.host,
+            app_key=bridge.app_key,
+            bridge_url=bridge.url,
+            request_hooks=[hook],
+        ) as hue:
+            hook.calls.clear()
+            result = await hue.lights.set_brightness("Light 1", 30)
+
+        put_ids = {
+            trace.correlation_id for _, trace in hook.calls if trace.method == "PUT"
+        }
+        assert result.correlation_id is not None
+        assert put_ids == {result.correlation_id}
+
+
+class TestSlowRequestLogger:
+    def make_trace(self, elapsed: float) -> RequestTrace:
+        trace = RequestTrace(correlation_id="abc", method="PUT", endpoint="light/{id}")
+        trace.finished_at = trace.started_at + elapsed
+        trace.status_code = 200
+        return trace
+
+    def test_logs_requests_over_threshold(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        with caplog.at_level(logging.WARNING, logger="hueify.http.slow"):
+            SlowRequestLogger(threshold=0.1).after_body(self.make_trace(0.2))
+            SlowRequestLogger(threshold=0.1).after_body(self.make_trace(0.05))
+
+        assert len(caplog.records) == 1
+        assert "[abc] PUT light/{id}" in caplog.records[0].getMessage()
+
+    def test_zero_sample_rate_suppresses_logging(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        with caplog.at_level(logging.WARNING, logger="hueify.http.slow"):
+            SlowRequestLogger(threshold=0, sample_rate=0).after_body(
+                self.make_trace(1.0)
+            )
+
+        assert caplog.records == []
+
+    def test_rejects_invalid_sample_rate(self) -> None:
+        with pytest.raises(ValueError):
+            SlowRequestLogger(sample_rate=2)
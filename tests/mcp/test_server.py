@@ -0,0 +1,61 @@
+import functools
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("fastmcp")
+
+from fastmcp import Client
+
+import hueify.mcp.app
+from hueify import Hueify
+from hueify.http import RetryPolicy
+from hueify.mcp.server import mcp_server
+from hueify.testing import FakeHueBridge
+
+
+@pytest.fixture
+def bridge_options() -> dict[str, Any]:
+    return {"light_commands_per_second": 0.01}
+
+
+@pytest_asyncio.fixture
+async def client(
+    bridge: FakeHueBridge, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[Client]:
+    monkeypatch.setenv("HUEIFY_CONFIG_FILE", str(tmp_path / "config.toml"))
+    monkeypatch.setenv("HUE_BRIDGE_IP", bridge.host)
+    monkeypatch.setenv("HUE_APP_KEY", bridge.app_key)
+    # The server builds its session from credentials; point it at the fake.
+    monkeypatch.setattr(
+        hueify.mcp.app,
+        "Hueify",
+        functools.partial(
+            Hueify, bridge_url=bridge.url, retry_policy=RetryPolicy.disabled()
+        ),
+    )
+    async with Client(mcp_server) as client:
+        yield client
+
+
+class TestExecuteActions:
+    @pytest.mark.asyncio
+    async def test_reports_failed_writes_per_action(self, client: Client) -> None:
+        light = {"target": "light", "name": "Light 1"}
+
+        result = await client.call_tool(
+            "execute_actions",
+            {
+                "actions": [
+                    {**light, "action": "set_brightness", "percentage": 20},
+                    {**light, "action": "set_brightness", "percentage": 40},
+                ]
+            },
+        )
+
+        first, second = result.structured_content["result"]
+        assert first["error"] is None
+        assert "429" in second["error"]
@@ -0,0 +1,77 @@
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+
+pytest.importorskip("fastmcp")
+
+from hueify import Hueify
+from hueify.mcp.snapshot import HomeStateSnapshot
+from hueify.testing import FakeHueBridge
+
+
+@pytest.fixture
+def home_size() -> dict[str, int]:
+    return {"lights": 3, "rooms": 1}
+
+
+@pytest.fixture
+def snapshot(hue: Hueify) -> Iterator[HomeStateSnapshot]:
+    snapshot = HomeStateSnapshot(hue)
+    snapshot.start()
+    yield snapshot
+    snapshot.stop()
+
+
+def publish_light(bridge: FakeHueBridge, name: str, **fields: object) -> None:
+    light = bridge.find("light", name)
+    bridge.publish(
+        [{"id": light["id"], "type": "light", "owner": light["owner"], **fields}]
+    )
+
+
+class TestHomeStateSnapshot:
+    def test_lists_lights_under_their_room(
+        self, hue: Hueify, snapshot: HomeStateSnapshot
+    ) -> None:
+        state = snapshot.get()
+
+        [room] = hue.rooms.names
+        assert sorted(state.rooms[room].lights) == ["Light 1", "Light 2", "Light 3"]
+        assert state.lights == {}
+        light = hue.lights.from_name("Light 1")
+        assert state.rooms[room].lights["Light 1"].on == light.is_on
+        assert state.rooms[room].lights["Light 1"].brightness == round(
+            light.brightness_percentage
+        )
+
+    @pytest.mark.asyncio
+    async def test_reuses_snapshot_until_a_relevant_event(
+        self, bridge: FakeHueBridge, snapshot: HomeStateSnapshot
+    ) -> None:
+        first = snapshot.get()
+        assert snapshot.get() is first
+
+        publish_light(bridge, "Light 1", color={"xy": {"x": 0.3, "y": 0.3}})
+        await asyncio.sleep(0.05)
+        assert snapshot.get() is first
+
+        publish_light(bridge, "Light 1", dimming={"brightness": 12.0})
+        await asyncio.sleep(0.05)
+        refreshed = snapshot.get()
+
+        assert refreshed is not first
+        [room] = refreshed.rooms.values()
+        assert room.lights["Light 1"].brightness == 12
+
+    @pytest.mark.asyncio
+    async def test_reports_active_scene_after_activation(
+        self, hue: Hueify, snapshot: HomeStateSnapshot
+    ) -> None:
+        room = hue.rooms.names[0]
+        scene = hue.rooms.scene_names(room)[0]
+
+        await hue.rooms.activate_scene(room, scene)
+        await asyncio.sleep(0.05)
+
+        assert snapshot.get().rooms[room].scene == scene
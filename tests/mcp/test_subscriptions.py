@@ -0,0 +1,142 @@
+import asyncio
+from collections.abc import Iterator
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("fastmcp")
+
+from mcp import types
+from mcp.server.subscriptions import ResourceUpdated
+
+from hueify import Hueify
+from hueify.mcp.subscriptions import (
+    HOME_URI,
+    ResourceUpdateNotifier,
+    SessionSubscriptions,
+    light_uri,
+    room_scenes_uri,
+    room_uri,
+)
+from hueify.testing import FakeHueBridge
+
+
+@pytest.fixture
+def published() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def notifier(hue: Hueify, published: list[str]) -> Iterator[ResourceUpdateNotifier]:
+    async def publish(uri: str) -> None:
+        published.append(uri)
+
+    notifier = ResourceUpdateNotifier(hue, publish, debounce_seconds=0.05)
+    notifier.start()
+    yield notifier
+    notifier.stop()
+
+
+def publish_light(bridge: FakeHueBridge, name: str, **fields: object) -> None:
+    light = bridge.find("light", name)
+    bridge.publish(
+        [{"id": light["id"], "type": "light", "owner": light["owner"], **fields}]
+    )
+
+
+class TestResourceUpdateNotifier:
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("notifier")
+    async def test_folds_a_burst_into_one_notification_per_resource(
+        self, hue: Hueify, bridge: FakeHueBridge, published: list[str]
+    ) -> None:
+        for brightness in (10.0, 20.0, 30.0):
+            publish_light(bridge, "Light 1", dimming={"brightness": brightness})
+        await asyncio.sleep(0.15)
+
+        [room] = hue.rooms.names
+        assert sorted(published) == sorted(
+            [HOME_URI, light_uri("Light 1"), room_uri(room)]
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("notifier")
+    async def test_ignores_changes_resources_do_not_show(
+        self, bridge: FakeHueBridge, published: list[str]
+    ) -> None:
+        publish_light(bridge, "Light 1", color={"xy": {"x": 0.3, "y": 0.3}})
+        await asyncio.sleep(0.15)
+
+        assert published == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("notifier")
+    async def test_notifies_room_scenes_on_scene_activation(
+        self, hue: Hueify, published: list[str]
+    ) -> None:
+        room = hue.rooms.names[0]
+
+        await hue.rooms.activate_scene(room, hue.rooms.scene_names(room)[0])
+        await asyncio.sleep(0.15)
+
+        assert room_scenes_uri(room) in published
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_pending_notifications(
+        self,
+        bridge: FakeHueBridge,
+        notifier: ResourceUpdateNotifier,
+        published: list[str],
+    ) -> None:
+        publish_light(bridge, "Light 1", dimming={"brightness": 10.0})
+        await asyncio.sleep(0.02)
+        notifier.stop()
+        await asyncio.sleep(0.1)
+
+        assert published == []
+
+    def test_rejects_negative_debounce(self, hue: Hueify) -> None:
+        async def publish(_: str) -> None: ...
+
+        with pytest.raises(ValueError):
+            ResourceUpdateNotifier(hue, publish, debounce_seconds=-1)
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.updated: list[str] = []
+
+    async def send_resource_updated(self, uri: str) -> None:
+        self.updated.append(uri)
+
+
+class TestSessionSubscriptions:
+    @pytest.mark.asyncio
+    async def test_sends_updates_only_to_subscribed_sessions(self) -> None:
+        subscriptions = SessionSubscriptions()
+        subscribed, other = FakeSession(), FakeSession()
+        uri = light_uri("Light 1")
+        await subscriptions.subscribe(
+            SimpleNamespace(session=subscribed), types.SubscribeRequestParams(uri=uri)
+        )
+
+        subscriptions.deliver(ResourceUpdated(uri))
+        subscriptions.deliver(ResourceUpdated(light_uri("Light 2")))
+        await asyncio.sleep(0)
+
+        assert subscribed.updated == [uri]
+        assert other.updated == []
+
+    @pytest.mark.asyncio
+    async def test_stops_sending_after_unsubscribe(self) -> None:
+        subscriptions = SessionSubscriptions()
+        session = FakeSession()
+        uri = light_uri("Light 1")
+        ctx = SimpleNamespace(session=session)
+        await subscriptions.subscribe(ctx, types.SubscribeRequestParams(uri=uri))
+        await subscriptions.unsubscribe(ctx, types.UnsubscribeRequestParams(uri=uri))
+
+        subscriptions.deliver(ResourceUpdated(uri))
+        await asyncio.sleep(0)
+
+        assert session.updated == []
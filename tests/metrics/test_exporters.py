@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from hueify.metrics import MetricsRegistry, OpenTelemetryExporter, render_prometheus
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+class TestRenderPrometheus:
+    def test_renders_counters_with_labels(self, registry: MetricsRegistry) -> None:
+        counter = registry.counter("requests_total", "Requests sent.", ("method",))
+        counter.inc(3, method="PUT")
+
+        text = render_prometheus(registry)
+
+        assert "# HELP requests_total Requests sent.\n" in text
+        assert "# TYPE requests_total counter\n" in text
+        assert 'requests_total{method="PUT"} 3\n' in text
+
+    def test_renders_cumulative_histogram_buckets(
+        self, registry: MetricsRegistry
+    ) -> None:
+        histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        lines = render_prometheus(registry).splitlines()
+
+        assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{le="1"} 2' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+        assert "latency_seconds_sum 5.55" in lines
+        assert "latency_seconds_count 3" in lines
+
+    def test_escapes_label_values(self, registry: MetricsRegistry) -> None:
+        registry.gauge("names", "Names.", ("name",)).set(1, name='a"b')
+
+        assert 'names{name="a\\"b"} 1' in render_prometheus(registry)
+
+
+class TestOpenTelemetryExporter:
+    def test_forwards_observations_to_meter_instruments(
+        self, registry: MetricsRegistry
+    ) -> None:
+        meter = MagicMock()
+        registry.add_exporter(OpenTelemetryExporter(meter))
+
+        registry.counter("requests_total", "Requests.").inc(2)
+        registry.histogram("latency_seconds", "Latency.", ("op",)).observe(0.2, op="x")
+
+        meter.create_counter.return_value.add.assert_called_once_with(2, attributes={})
+        meter.create_histogram.assert_called_once_with(
+            "latency_seconds", unit="s", description="Latency."
+        )
+        meter.create_histogram.return_value.record.assert_called_once_with(
+            0.2, attributes={"op": "x"}
+        )
+
+    def test_maps_gauges_to_up_down_counter_deltas(
+        self, registry: MetricsRegistry
+    ) -> None:
+        meter = MagicMock()
+        registry.add_exporter(OpenTelemetryExporter(meter))
+        gauge = registry.gauge("in_flight", "In flight.")
+
+        gauge.set(5)
+        gauge.set(3)
+
+        add = meter.create_up_down_counter.return_value.add
+        assert [call.args[0] for call in add.call_args_list] == [5, -2]
@@ -0,0 +1,134 @@
+import pytest
+
+from hueify.metrics import MetricsRegistry
+from hueify.metrics.instruments import EVENT_DISPATCH_DURATION, EVENT_HANDLER_ERRORS
+from hueify.sse import EventBus
+from hueify.sse.views import SceneEvent
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+class TestMetricsRegistry:
+    def test_returns_same_metric_for_same_name(self, registry: MetricsRegistry) -> None:
+        first = registry.counter("requests_total", "Requests.", ("method",))
+
+        assert registry.counter("requests_total", "Requests.", ("method",)) is first
+
+    def test_rejects_conflicting_redefinition(self, registry: MetricsRegistry) -> None:
+        registry.counter("requests_total", "Requests.")
+
+        with pytest.raises(ValueError):
+            registry.gauge("requests_total", "Requests.")
+
+    def test_clear_resets_values(self, registry: MetricsRegistry) -> None:
+        counter = registry.counter("requests_total", "Requests.")
+        counter.inc()
+
+        registry.clear()
+
+        assert counter.value() == 0
+
+
+class TestMetrics:
+    def test_counter_accumulates_per_label_set(self, registry: MetricsRegistry) -> None:
+        counter = registry.counter("requests_total", "Requests.", ("method",))
+
+        counter.inc(method="GET")
+        counter.inc(2, method="GET")
+        counter.inc(method="PUT")
+
+        assert counter.value(method="GET") == 3
+        assert counter.value(method="PUT") == 1
+
+    def test_counter_rejects_negative_increment(
+        self, registry: MetricsRegistry
+    ) -> None:
+        with pytest.raises(ValueError):
+            registry.counter("requests_total", "Requests.").inc(-1)
+
+    def test_rejects_wrong_labels(self, registry: MetricsRegistry) -> None:
+        counter = registry.counter("requests_total", "Requests.", ("method",))
+
+        with pytest.raises(ValueError):
+            counter.inc(endpoint="light")
+
+    def test_gauge_tracks_up_and_down(self, registry: MetricsRegistry) -> None:
+        gauge = registry.gauge("in_flight", "In flight.")
+
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        assert gauge.value() == 1
+
+    def test_histogram_counts_into_buckets(self, registry: MetricsRegistry) -> None:
+        histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        sample = histogram.samples()[()]
+        assert sample.bucket_counts == [2, 1]
+        assert sample.count == 4
+        assert sample.sum == pytest.approx(2.65)
+
+    def test_histogram_time_observes_block_duration(
+        self, registry: MetricsRegistry
+    ) -> None:
+        histogram = registry.histogram("latency_seconds", "Latency.", ("op",))
+
+        with histogram.time(op="x"):
+            pass
+
+        assert histogram.count(op="x") == 1
+
+
+class TestExporterHook:
+    def test_notifies_exporters_of_observations(
+        self, registry: MetricsRegistry
+    ) -> None:
+        observations = []
+
+        class Recorder:
+            def observe(self, metric, labels, value) -> None:
+                observations.append((metric.name, labels, value))
+
+        registry.add_exporter(Recorder())
+        registry.counter("requests_total", "Requests.", ("method",)).inc(method="PUT")
+
+        assert observations == [("requests_total", {"method": "PUT"}, 1.0)]
+
+
+class TestInstrumentation:
+    @pytest.mark.asyncio
+    async def test_event_bus_records_handler_latency_and_errors(self) -> None:
+        bus = EventBus()
+
+        async def failing_handler(event: SceneEvent) -> None:
+            raise RuntimeError("boom")
+
+        bus.subscribe(SceneEvent, failing_handler)
+        dispatches = EVENT_DISPATCH_DURATION.count(event_type="SceneEvent")
+        errors = EVENT_HANDLER_ERRORS.value(
+            event_type="SceneEvent", handler=failing_handler.__qualname__
+        )
+
+        await bus.dispatch(
+            SceneEvent.model_validate(
+                {
+                    "id": "7f0c8a6e-0c7a-4a43-9a0c-2f1d7b5e0e11",
+                    "status": {"active": "static"},
+                }
+            )
+        )
+
+        assert EVENT_DISPATCH_DURATION.count(event_type="SceneEvent") == dispatches + 1
+        assert (
+            EVENT_HANDLER_ERRORS.value(
+                event_type="SceneEvent", handler=failing_handler.__qualname__
+            )
+            == errors + 1
+        )
@@ -0,0 +1,179 @@
+import inspect
+from collections.abc import AsyncIterator, Callable
+
+import pytest
+import pytest_asyncio
+
+from hueify import Color, Hueify, MultiHueify
+from hueify.exceptions import ResourceNotFoundException
+from hueify.grouped_lights import BaseGroupNamespace
+from hueify.light import BaseLightNamespace
+from hueify.scenes import BaseSceneNamespace
+from hueify.testing import FakeHueBridge, generate_home
+
+
+@pytest_asyncio.fixture
+async def bridges() -> AsyncIterator[tuple[FakeHueBridge, FakeHueBridge]]:
+    async with (
+        FakeHueBridge(generate_home(lights=2, rooms=1, seed=1)) as upstairs,
+        FakeHueBridge(generate_home(lights=3, rooms=1, seed=2)) as downstairs,
+    ):
+        yield upstairs, downstairs
+
+
+@pytest_asyncio.fixture
+async def hue(
+    bridges: tuple[FakeHueBridge, FakeHueBridge],
+) -> AsyncIterator[MultiHueify]:
+    upstairs, downstairs = bridges
+    multi = MultiHueify(
+        {
+            "upstairs": Hueify(
+                upstairs.host, upstairs.app_key, bridge_url=upstairs.url
+            ),
+            "downstairs": Hueify(
+                downstairs.host, downstairs.app_key, bridge_url=downstairs.url
+            ),
+        }
+    )
+    async with multi:
+        yield multi
+
+
+class TestMultiHueify:
+    @pytest.mark.asyncio
+    async def test_qualifies_names_that_exist_on_several_bridges(
+        self, hue: MultiHueify
+    ) -> None:
+        assert sorted(hue.lights.names) == [
+            "Light 3",
+            "downstairs/Light 1",
+            "downstairs/Light 2",
+            "upstairs/Light 1",
+            "upstairs/Light 2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_routes_commands_to_the_owning_bridge(
+        self, hue: MultiHueify, bridges: tuple[FakeHueBridge, FakeHueBridge]
+    ) -> None:
+        upstairs, downstairs = bridges
+
+        await hue.lights.set_brightness("upstairs/Light 1", 42)
+        await hue.lights.set_brightness("Light 3", 42)
+
+        assert upstairs.request_counts["PUT light"] == 1
+        assert downstairs.request_counts["PUT light"] == 1
+        assert upstairs.find("light", "Light 1")["dimming"]["brightness"] == 42
+
+    @pytest.mark.asyncio
+    async def test_rejects_ambiguous_unqualified_name(self, hue: MultiHueify) -> None:
+        with pytest.raises(ResourceNotFoundException) as exc_info:
+            hue.lights.from_name("Light 1")
+
+        assert exc_info.value.suggested_names == [
+            "upstairs/Light 1",
+            "downstairs/Light 1",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_merges_rooms_and_finds_by_id(self, hue: MultiHueify) -> None:
+        group = hue.bridge("downstairs").rooms.groups[0]
+
+        assert len(hue.rooms.groups) == 2
+        assert (
+            hue.rooms.from_id(group.id).id
+            == hue.bridge("downstairs").rooms.from_id(group.id).id
+        )
+
+    @pytest.mark.asyncio
+    async def test_merges_light_infos(self, hue: MultiHueify) -> None:
+        infos = hue.lights.infos
+
+        assert len(infos) == 5
+        assert {info.id for info in infos} == {
+            info.id
+            for label in ("upstairs", "downstairs")
+            for info in hue.bridge(label).lights.infos
+        }
+
+    def test_rejects_labels_with_separator(self) -> None:
+        with pytest.raises(ValueError):
+            MultiHueify({"up/stairs": Hueify("192.168.1.2", "a" * 40)})
+
+
+def public_members(cls: type) -> set[str]:
+    return {name for name in dir(cls) if not name.startswith("_")}
+
+
+class TestMergedNamespaceSurface:
+    """Every public member of the shared namespace bases works when merged."""
+
+    @pytest.mark.asyncio
+    async def test_lights(self, hue: MultiHueify) -> None:
+        name = "Light 3"
+        light_id = hue.lights.from_name(name).id
+        calls = {
+            "names": lambda: hue.lights.names,
+            "infos": lambda: hue.lights.infos,
+            "from_name": lambda: hue.lights.from_name(name),
+            "from_id": lambda: hue.lights.from_id(light_id),
+            "get_brightness": lambda: hue.lights.get_brightness(name),
+            "turn_on": lambda: hue.lights.turn_on(name),
+            "turn_off": lambda: hue.lights.turn_off(name),
+            "set_brightness": lambda: hue.lights.set_brightness(name, 40),
+            "increase_brightness": lambda: hue.lights.increase_brightness(name, 10),
+            "decrease_brightness": lambda: hue.lights.decrease_brightness(name, 10),
+            "set_color_temperature": lambda: hue.lights.set_color_temperature(name, 50),
+            "set_color": lambda: hue.lights.set_color(name, 255, 0, 0),
+            "set_named_color": lambda: hue.lights.set_named_color(name, Color.BLUE),
+            "set_state": lambda: hue.lights.set_state(name, on=True, brightness=60),
+        }
+
+        assert set(calls) == public_members(BaseLightNamespace)
+        await call_all(calls)
+
+    @pytest.mark.asyncio
+    async def test_rooms(self, hue: MultiHueify) -> None:
+        name = hue.rooms.names[0]
+        room_id = hue.rooms.groups[0].id
+        scene = hue.rooms.scene_names(name)[0]
+        calls = {
+            "names": lambda: hue.rooms.names,
+            "groups": lambda: hue.rooms.groups,
+            "from_name": lambda: hue.rooms.from_name(name),
+            "from_id": lambda: hue.rooms.from_id(room_id),
+            "get_brightness": lambda: hue.rooms.get_brightness(name),
+            "scene_names": lambda: hue.rooms.scene_names(name),
+            "activate_scene": lambda: hue.rooms.activate_scene(name, scene),
+            "turn_on": lambda: hue.rooms.turn_on(name),
+            "turn_off": lambda: hue.rooms.turn_off(name),
+            "set_brightness": lambda: hue.rooms.set_brightness(name, 40),
+            "increase_brightness": lambda: hue.rooms.increase_brightness(name, 10),
+            "decrease_brightness": lambda: hue.rooms.decrease_brightness(name, 10),
+            "set_color_temperature": lambda: hue.rooms.set_color_temperature(name, 50),
+            "set_color": lambda: hue.rooms.set_color(name, 255, 0, 0),
+            "set_named_color": lambda: hue.rooms.set_named_color(name, Color.BLUE),
+            "set_state": lambda: hue.rooms.set_state(name, on=True, brightness=60),
+        }
+
+        assert set(calls) == public_members(BaseGroupNamespace)
+        await call_all(calls)
+
+    @pytest.mark.asyncio
+    async def test_scenes(self, hue: MultiHueify) -> None:
+        name = hue.scenes.names[0]
+        calls = {
+            "names": lambda: hue.scenes.names,
+            "from_name": lambda: hue.scenes.from_name(name),
+            "activate": lambda: hue.scenes.activate(name),
+        }
+
+        assert set(calls) == public_members(BaseSceneNamespace)
+        await call_all(calls)
+
+
+async def call_all(calls: dict[str, Callable[[], object]]) -> None:
+    for result in (call() for call in calls.values()):
+        if inspect.isawaitable(result):
+            await result
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from hueify.onboarding import BridgeCache, DiscoveredBridge
+
+
+def make_bridge(bridge_id: str, ip: str) -> DiscoveredBridge:
+    return DiscoveredBridge(id=bridge_id, internalipaddress=ip)
+
+
+class TestBridgeCache:
+    def test_persists_last_known_address_by_bridge_id(self, tmp_path: Path) -> None:
+        path = tmp_path / "bridges.json"
+        BridgeCache(path).remember([make_bridge("001788FFFE000001", "10.0.0.2")])
+
+        BridgeCache(path).remember([make_bridge("001788fffe000001", "10.0.0.9")])
+
+        cache = BridgeCache(path)
+        [known] = cache.bridges
+        assert known.id == "001788fffe000001"
+        assert known.internalipaddress == "10.0.0.9"
+        assert cache.get("001788FFFE000001") == known
+
+    def test_finds_bridge_by_last_known_address(self, tmp_path: Path) -> None:
+        cache = BridgeCache(tmp_path / "bridges.json")
+        cache.remember(
+            [
+                make_bridge("001788fffe000001", "10.0.0.2"),
+                make_bridge("001788fffe000002", "10.0.0.3"),
+            ]
+        )
+
+        assert cache.find_by_ip("10.0.0.3").id == "001788fffe000002"
+        assert cache.find_by_ip("10.0.0.4") is None
+
+    def test_reads_missing_or_corrupt_file_as_empty(self, tmp_path: Path) -> None:
+        corrupt = tmp_path / "corrupt.json"
+        corrupt.write_text("{not json", encoding="utf-8")
+
+        assert BridgeCache(tmp_path / "missing.json").bridges == []
+        assert BridgeCache(corrupt).bridges == []
+
+    def test_defaults_to_config_directory(self, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setenv("HUEIFY_CONFIG_FILE", str(tmp_path / "config.toml"))
+
+        assert BridgeCache().path == tmp_path / "bridges.json"
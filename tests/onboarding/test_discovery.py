@@ -0,0 +1,171 @@
+import asyncio
+import socket
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import pytest_asyncio
+
+from hueify.onboarding import (
+    BridgeCache,
+    discover_bridges_locally,
+    discover_bridges_mdns,
+    probe_bridges,
+)
+from hueify.onboarding.mdns import build_query, parse_response
+from hueify.testing import FakeHueBridge, FakeMdnsResponder
+
+BRIDGE_ID = "001788fffe000001"
+OTHER_ID = "001788fffe000002"
+
+
+@pytest_asyncio.fixture
+async def responder() -> AsyncIterator[FakeMdnsResponder]:
+    bridges = {BRIDGE_ID: "192.168.1.20", OTHER_ID: "192.168.1.21"}
+    async with FakeMdnsResponder(bridges) as responder:
+        yield responder
+
+
+@pytest.fixture
+def bridge_options() -> dict[str, Any]:
+    return {"bridge_id": BRIDGE_ID}
+
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestMdnsPackets:
+    def test_parses_records_of_a_bridge_announcement(self) -> None:
+        [packet] = FakeMdnsResponder({BRIDGE_ID: "10.0.0.7"}).responses()
+
+        records = parse_response(packet)
+
+        [instance] = records.pointers
+        assert records.texts[instance]["bridgeid"] == BRIDGE_ID
+        target, port = records.services[instance]
+        assert port == 443
+        assert records.addresses[target] == "10.0.0.7"
+
+    @pytest.mark.parametrize("packet", [b"", b"\x00" * 5, build_query()])
+    def test_rejects_malformed_or_non_response_packets(self, packet: bytes) -> None:
+        with pytest.raises(ValueError):
+            parse_response(packet)
+
+
+class TestDiscoverBridgesMdns:
+    @pytest.mark.asyncio
+    async def test_finds_every_announced_bridge(
+        self, responder: FakeMdnsResponder
+    ) -> None:
+        bridges = await discover_bridges_mdns(0.2, address=responder.address)
+
+        assert {(b.id, b.internalipaddress) for b in bridges} == {
+            (BRIDGE_ID, "192.168.1.20"),
+            (OTHER_ID, "192.168.1.21"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_returns_as_soon_as_the_wanted_bridge_answers(
+        self, responder: FakeMdnsResponder
+    ) -> None:
+        started_at = time.perf_counter()
+        bridges = await discover_bridges_mdns(
+            5.0, bridge_id=BRIDGE_ID.upper(), address=responder.address
+        )
+
+        assert time.perf_counter() - started_at < 1.0
+        assert BRIDGE_ID in [b.id for b in bridges]
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_when_nobody_answers(self) -> None:
+        bridges = await discover_bridges_mdns(0.1, address=("127.0.0.1", unused_port()))
+
+        assert bridges == []
+
+
+class TestProbeBridges:
+    @pytest.mark.asyncio
+    async def test_keeps_hosts_that_serve_a_bridge_config(
+        self, bridge: FakeHueBridge
+    ) -> None:
+        bridges = await probe_bridges([bridge.host], port=bridge.port, timeout=1.0)
+
+        [found] = bridges
+        assert found.id == BRIDGE_ID
+        assert found.internalipaddress == bridge.host
+
+    @pytest.mark.asyncio
+    async def test_skips_hosts_that_do_not_answer(self) -> None:
+        bridges = await probe_bridges(["127.0.0.1"], port=unused_port(), timeout=0.2)
+
+        assert bridges == []
+
+    @pytest.mark.asyncio
+    async def test_bounds_parallel_probes(self, bridge: FakeHueBridge) -> None:
+        bridge.latency = 0.05
+        in_flight = 0
+        peak = 0
+        original = bridge._handle_request
+
+        async def counting(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.05)
+                return await original(*args, **kwargs)
+            finally:
+                in_flight -= 1
+
+        bridge._handle_request = counting
+        await probe_bridges(
+            [bridge.host] * 8, port=bridge.port, concurrency=2, timeout=1.0
+        )
+
+        assert peak <= 2
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_concurrency(self) -> None:
+        with pytest.raises(ValueError):
+            await probe_bridges([], concurrency=0)
+
+
+class TestDiscoverBridgesLocally:
+    @pytest.mark.asyncio
+    async def test_merges_both_methods_and_records_them(
+        self, responder: FakeMdnsResponder, bridge: FakeHueBridge, tmp_path: Path
+    ) -> None:
+        cache = BridgeCache(tmp_path / "bridges.json")
+
+        bridges = await discover_bridges_locally(
+            0.2,
+            cache=cache,
+            mdns_address=responder.address,
+            hosts=[bridge.host],
+            port=bridge.port,
+        )
+
+        assert sorted(b.id for b in bridges) == [BRIDGE_ID, OTHER_ID]
+        assert BridgeCache(cache.path).get(OTHER_ID).internalipaddress == "192.168.1.21"
+
+    @pytest.mark.asyncio
+    async def test_finds_wanted_bridge_by_probe_without_mdns(
+        self, bridge: FakeHueBridge
+    ) -> None:
+        started_at = time.perf_counter()
+
+        bridges = await discover_bridges_locally(
+            5.0,
+            bridge_id=BRIDGE_ID,
+            mdns_address=("127.0.0.1", unused_port()),
+            hosts=[bridge.host],
+            port=bridge.port,
+        )
+
+        assert time.perf_counter() - started_at < 1.0
+        assert [b.id for b in bridges] == [BRIDGE_ID]
@@ -0,0 +1,103 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+import hueify.onboarding
+from hueify import BridgeNotFoundException, Hueify
+from hueify.onboarding import BridgeCache, DiscoveredBridge
+from hueify.testing import FakeHueBridge, generate_home
+
+BRIDGE_ID = "001788fffe000001"
+OTHER_ID = "001788fffe000002"
+
+
+@pytest.fixture(autouse=True)
+def config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("HUEIFY_CONFIG_FILE", str(tmp_path / "config.toml"))
+    monkeypatch.delenv("HUE_BRIDGE_ID", raising=False)
+    return tmp_path
+
+
+@pytest_asyncio.fixture
+async def old() -> AsyncIterator[FakeHueBridge]:
+    home = generate_home(lights=2, rooms=1, seed=1)
+    async with FakeHueBridge(home, bridge_id=BRIDGE_ID) as bridge:
+        yield bridge
+
+
+@pytest_asyncio.fixture
+async def moved() -> AsyncIterator[FakeHueBridge]:
+    home = generate_home(lights=2, rooms=1, seed=1)
+    async with FakeHueBridge(home, bridge_id=BRIDGE_ID) as bridge:
+        yield bridge
+
+
+def remember(bridge: FakeHueBridge, bridge_id: str = BRIDGE_ID) -> None:
+    BridgeCache().remember(
+        [
+            DiscoveredBridge(
+                id=bridge_id, internalipaddress=bridge.host, port=bridge.port
+            )
+        ]
+    )
+
+
+def fail_discovery(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def nothing(*args: object, **kwargs: object) -> list[DiscoveredBridge]:
+        return []
+
+    monkeypatch.setattr(hueify.onboarding, "discover_bridges_locally", nothing)
+    monkeypatch.setattr(hueify.onboarding, "discover_bridges", nothing)
+
+
+class TestReconnect:
+    @pytest.mark.asyncio
+    async def test_moves_to_last_known_address_keeping_handles(
+        self, old: FakeHueBridge, moved: FakeHueBridge, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        fail_discovery(monkeypatch)
+        remember(moved)
+
+        async with Hueify(
+            old.host, old.app_key, bridge_id=BRIDGE_ID, bridge_url=old.url
+        ) as hue:
+            light = hue.lights.from_name("Light 1")
+            old_state = dict(old.find("light", "Light 1")["on"])
+            namespace = hue.lights
+            await hue.reconnect()
+            await moved.wait_for_event_streams()
+
+            await light.turn_off()
+
+            assert hue.lights is namespace
+            assert moved.find("light", "Light 1")["on"]["on"] is False
+            assert old.find("light", "Light 1")["on"] == old_state
+
+    @pytest.mark.asyncio
+    async def test_identifies_the_bridge_by_its_cached_address(
+        self, old: FakeHueBridge, moved: FakeHueBridge, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        fail_discovery(monkeypatch)
+        remember(moved)
+
+        async with Hueify(old.host, old.app_key, bridge_url=old.url) as hue:
+            await hue.reconnect()
+
+            assert hue._credentials.hue_bridge_id == BRIDGE_ID
+
+    @pytest.mark.asyncio
+    async def test_never_switches_to_another_bridge(
+        self, old: FakeHueBridge, moved: FakeHueBridge, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        fail_discovery(monkeypatch)
+        remember(moved, OTHER_ID)
+
+        async with Hueify(
+            old.host, old.app_key, bridge_id=OTHER_ID, bridge_url=old.url
+        ) as hue:
+            with pytest.raises(BridgeNotFoundException) as raised:
+                await hue.reconnect()
+
+        assert raised.value.bridge_id == OTHER_ID
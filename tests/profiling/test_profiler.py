@@ -0,0 +1,157 @@
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from hueify.credentials import HueBridgeCredentials
+from hueify.profiling import (
+    EventProfiler,
+    active_profiler,
+    current_event_type,
+    event_scope,
+)
+from hueify.sse.bus import EventBus
+from hueify.sse.stream import ServerSentEventStream
+from hueify.sse.views import LightEvent
+
+
+def make_stream(bus: EventBus) -> ServerSentEventStream:
+    credentials = HueBridgeCredentials(
+        hue_bridge_ip="192.168.1.1", hue_app_key="a" * 20
+    )
+    return ServerSentEventStream(credentials=credentials, event_bus=bus)
+
+
+def make_sse(count: int = 1) -> MagicMock:
+    sse = MagicMock()
+    sse.data = json.dumps(
+        [
+            {
+                "data": [
+                    {
+                        "id": str(uuid4()),
+                        "type": "light",
+                        "owner": {"rid": str(uuid4()), "rtype": "device"},
+                    }
+                    for _ in range(count)
+                ]
+            }
+        ]
+    )
+    return sse
+
+
+@pytest.fixture
+def profiler():
+    profiler = EventProfiler(lag_interval=0.01)
+    yield profiler
+    profiler.stop()
+
+
+class TestEventProfiler:
+    @pytest.mark.asyncio
+    async def test_records_pipeline_stages_per_event_type(
+        self, profiler: EventProfiler
+    ) -> None:
+        bus = EventBus()
+
+        async def handler(event: LightEvent) -> None:
+            pass
+
+        bus.subscribe(LightEvent, handler)
+
+        with profiler:
+            await make_stream(bus)._handle_sse(make_sse(count=3))
+
+        report = profiler.report()
+        stages = {(s.stage, s.event_type): s.count for s in report.stages}
+        assert report.events == 3
+        assert stages == {
+            ("parse", "*"): 1,
+            ("validate", "LightEvent"): 3,
+            ("dispatch", "LightEvent"): 3,
+        }
+
+    @pytest.mark.asyncio
+    async def test_reports_slowest_handlers_first(
+        self, profiler: EventProfiler
+    ) -> None:
+        bus = EventBus()
+
+        async def fast_handler(event: LightEvent) -> None:
+            pass
+
+        async def slow_handler(event: LightEvent) -> None:
+            await asyncio.sleep(0.02)
+
+        bus.subscribe(LightEvent, fast_handler)
+        bus.subscribe(LightEvent, slow_handler)
+
+        with profiler:
+            await make_stream(bus)._handle_sse(make_sse())
+
+        handlers = profiler.report(top=1).slowest_handlers
+        assert len(handlers) == 1
+        assert handlers[0].handler.endswith("slow_handler")
+        assert handlers[0].event_type == "LightEvent"
+
+    @pytest.mark.asyncio
+    async def test_measures_event_loop_lag(self, profiler: EventProfiler) -> None:
+        with profiler:
+            await asyncio.sleep(0.02)
+            time.sleep(0.05)
+            await asyncio.sleep(0.02)
+
+        lag = profiler.report().loop_lag
+        assert lag.samples >= 1
+        assert lag.max_ms >= 30
+
+    @pytest.mark.asyncio
+    async def test_records_nothing_when_stopped(self, profiler: EventProfiler) -> None:
+        bus = EventBus()
+        bus.subscribe(LightEvent, MagicMock(side_effect=lambda e: asyncio.sleep(0)))
+
+        await make_stream(bus)._handle_sse(make_sse())
+
+        report = profiler.report()
+        assert active_profiler() is None
+        assert report.events == 0
+        assert report.stages == []
+
+    @pytest.mark.asyncio
+    async def test_only_one_profiler_runs_at_a_time(
+        self, profiler: EventProfiler
+    ) -> None:
+        with profiler, pytest.raises(RuntimeError):
+            EventProfiler().start()
+
+
+class TestEventScope:
+    def test_sets_and_restores_the_event_type(self) -> None:
+        with event_scope("LightEvent"):
+            with event_scope("ButtonEvent"):
+                assert current_event_type() == "ButtonEvent"
+            assert current_event_type() == "LightEvent"
+
+        assert current_event_type() == "*"
+
+    @pytest.mark.asyncio
+    async def test_handlers_see_the_dispatched_event_type(
+        self, profiler: EventProfiler
+    ) -> None:
+        seen = []
+
+        async def handler(event: LightEvent) -> None:
+            seen.append(current_event_type())
+
+        bus = EventBus()
+        bus.subscribe(LightEvent, handler)
+
+        with profiler:
+            await make_stream(bus)._handle_sse(make_sse())
+
+        assert seen == ["LightEvent"]
+        assert current_event_type() == "*"
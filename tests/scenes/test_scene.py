@@ -0,0 +1,35 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from hueify.scenes.schemas import SceneInfo
+from hueify.scenes.service import Scene
+
+
+def make_scene() -> tuple[Scene, AsyncMock]:
+    client = AsyncMock()
+    scene_info = SceneInfo.model_validate(
+        {
+            "id": str(uuid4()),
+            "metadata": {"name": "Relax"},
+            "group": {"rid": str(uuid4()), "rtype": "room"},
+        }
+    )
+    return Scene(scene_info=scene_info, client=client), client
+
+
+class TestActivate:
+    @pytest.mark.asyncio
+    async def test_recalls_scene_without_duration_by_default(self) -> None:
+        scene, client = make_scene()
+        await scene.activate()
+        request = client.put.call_args.kwargs["data"]
+        assert request.recall.duration is None
+
+    @pytest.mark.asyncio
+    async def test_forwards_transition_as_recall_duration(self) -> None:
+        scene, client = make_scene()
+        await scene.activate(transition_ms=4000)
+        request = client.put.call_args.kwargs["data"]
+        assert request.recall.duration == 4000
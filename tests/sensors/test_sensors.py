@@ -0,0 +1,124 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from hueify import Hueify
+from hueify.exceptions import ResourceNotFoundException
+from hueify.sse.views import BatteryState
+from hueify.testing import FakeHueBridge, generate_home
+from hueify.testing.home import RawResource
+
+
+def contact_sensor(name: str) -> list[RawResource]:
+    device_id, contact_id = str(uuid4()), str(uuid4())
+    return [
+        {
+            "id": device_id,
+            "type": "device",
+            "metadata": {"name": name, "archetype": "unknown_archetype"},
+            "services": [{"rid": contact_id, "rtype": "contact"}],
+        },
+        {
+            "id": contact_id,
+            "type": "contact",
+            "owner": {"rid": device_id, "rtype": "device"},
+            "enabled": True,
+            "contact_report": {"changed": "2026-01-01T00:00:00Z", "state": "contact"},
+        },
+    ]
+
+
+@pytest.fixture
+def home() -> list[RawResource]:
+    home = generate_home(lights=2, rooms=2, sensors=2, seed=3)
+    return [*home, *contact_sensor("Front door")]
+
+
+def service(bridge: FakeHueBridge, device_name: str, rtype: str) -> RawResource:
+    device = bridge.find("device", device_name)
+    [rid] = [s["rid"] for s in device["services"] if s["rtype"] == rtype]
+    return next(r for r in bridge.resources(rtype) if r["id"] == rid)
+
+
+async def wait_until(predicate, timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+
+class TestSensorNamespace:
+    @pytest.mark.asyncio
+    async def test_lists_only_devices_with_sensor_services(self, hue: Hueify) -> None:
+        assert hue.sensors.names == ["Front door", "Motion sensor 1", "Motion sensor 2"]
+
+    @pytest.mark.asyncio
+    async def test_reads_populated_state(
+        self, hue: Hueify, bridge: FakeHueBridge
+    ) -> None:
+        sensor = hue.sensors.from_name("Motion sensor 1")
+        temperature = service(bridge, "Motion sensor 1", "temperature")
+        power = service(bridge, "Motion sensor 1", "device_power")
+
+        assert sensor.motion is False
+        assert sensor.temperature == temperature["temperature"]["temperature"]
+        assert sensor.battery_level == power["power_state"]["battery_level"]
+        assert sensor.battery_state is BatteryState.NORMAL
+        assert sensor.contact is None
+        assert hue.sensors.from_name("Front door").contact is True
+
+    @pytest.mark.asyncio
+    async def test_handles_follow_events(
+        self, hue: Hueify, bridge: FakeHueBridge
+    ) -> None:
+        sensor = hue.sensors.from_name("Motion sensor 1")
+        motion = service(bridge, "Motion sensor 1", "motion")
+
+        bridge.publish(
+            [
+                {
+                    "id": motion["id"],
+                    "type": "motion",
+                    "owner": motion["owner"],
+                    "motion": {"motion": True, "motion_valid": True},
+                }
+            ]
+        )
+        await wait_until(lambda: sensor.motion is True)
+
+    @pytest.mark.asyncio
+    async def test_invalid_readings_read_as_none(
+        self, hue: Hueify, bridge: FakeHueBridge
+    ) -> None:
+        sensor = hue.sensors.from_name("Motion sensor 2")
+        light_level = service(bridge, "Motion sensor 2", "light_level")
+
+        bridge.publish(
+            [
+                {
+                    "id": light_level["id"],
+                    "type": "light_level",
+                    "owner": light_level["owner"],
+                    "light": {"light_level": 0, "light_level_valid": False},
+                }
+            ]
+        )
+        await wait_until(lambda: sensor.light_level is None)
+        assert sensor.lux is None
+
+    @pytest.mark.asyncio
+    async def test_indexes_sensors_by_room(self, hue: Hueify) -> None:
+        first, second = hue.rooms.names
+
+        [sensor] = hue.sensors.in_room(first)
+
+        assert sensor.room == first
+        assert [s.room for s in hue.sensors.in_room(second)] == [second]
+        assert hue.sensors.from_name("Front door").room is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_names_raise(self, hue: Hueify) -> None:
+        with pytest.raises(ResourceNotFoundException):
+            hue.sensors.from_name("Light 1")
+        with pytest.raises(ResourceNotFoundException):
+            hue.sensors.in_room("Attic")
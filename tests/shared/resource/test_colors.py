@@ -0,0 +1,92 @@
+import pytest
+
+from hueify.shared.resource.colors import (
+    _GAMUT_TRIANGLES,
+    Color,
+    clamp_xy_to_gamut,
+    resolve_color,
+    resolve_color_xy,
+    rgb_to_xy,
+)
+from hueify.shared.resource.views import GamutType
+
+# Reference values: the gamut corner points published by Signify. Fully
+# saturated primaries lie outside every bulb gamut and must land on (or next
+# to) the matching corner once clamped.
+PRIMARY_REFERENCES = [
+    ((255, 0, 0), GamutType.A, (0.7004, 0.2991)),
+    ((255, 0, 0), GamutType.B, (0.675, 0.322)),
+    ((255, 0, 0), GamutType.C, (0.6915, 0.3083)),
+    ((0, 255, 0), GamutType.A, (0.2151, 0.7106)),
+    ((0, 255, 0), GamutType.B, (0.409, 0.518)),
+    ((0, 255, 0), GamutType.C, (0.17, 0.7)),
+    ((0, 0, 255), GamutType.A, (0.138, 0.08)),
+    ((0, 0, 255), GamutType.B, (0.167, 0.04)),
+    ((0, 0, 255), GamutType.C, (0.1532, 0.0475)),
+]
+
+
+class TestRgbToXy:
+    def test_converts_white_to_d65_white_point(self) -> None:
+        assert rgb_to_xy(255, 255, 255) == (0.3227, 0.329)
+
+    def test_returns_origin_for_black_without_gamut(self) -> None:
+        assert rgb_to_xy(0, 0, 0) == (0.0, 0.0)
+
+    def test_leaves_unknown_gamut_unclamped(self) -> None:
+        assert rgb_to_xy(255, 0, 0, GamutType.OTHER) == rgb_to_xy(255, 0, 0)
+
+    @pytest.mark.parametrize(("rgb", "gamut_type", "expected"), PRIMARY_REFERENCES)
+    def test_clamps_primaries_to_gamut_reference(
+        self,
+        rgb: tuple[int, int, int],
+        gamut_type: GamutType,
+        expected: tuple[float, float],
+    ) -> None:
+        x, y = rgb_to_xy(*rgb, gamut_type)
+        assert x == pytest.approx(expected[0], abs=1e-4)
+        assert y == pytest.approx(expected[1], abs=1e-4)
+
+    @pytest.mark.parametrize("gamut_type", [GamutType.A, GamutType.B, GamutType.C])
+    def test_keeps_in_gamut_colors_unchanged(self, gamut_type: GamutType) -> None:
+        assert rgb_to_xy(255, 197, 143, gamut_type) == rgb_to_xy(255, 197, 143)
+
+    def test_memoizes_repeated_conversions(self) -> None:
+        rgb_to_xy.cache_clear()
+
+        rgb_to_xy(12, 34, 56, GamutType.C)
+        rgb_to_xy(12, 34, 56, GamutType.C)
+
+        assert rgb_to_xy.cache_info().hits == 1
+
+
+class TestClampXyToGamut:
+    def test_projects_point_outside_onto_nearest_edge(self) -> None:
+        red, green, _ = _GAMUT_TRIANGLES[GamutType.B]
+        midpoint = ((red[0] + green[0]) / 2, (red[1] + green[1]) / 2)
+        outward_normal = (green[1] - red[1], red[0] - green[0])
+
+        x, y = clamp_xy_to_gamut(
+            midpoint[0] + 0.1 * outward_normal[0],
+            midpoint[1] + 0.1 * outward_normal[1],
+            _GAMUT_TRIANGLES[GamutType.B],
+        )
+
+        assert (x, y) == pytest.approx(midpoint, abs=1e-3)
+
+    def test_returns_point_inside_unchanged(self) -> None:
+        assert clamp_xy_to_gamut(0.4, 0.4, _GAMUT_TRIANGLES[GamutType.A]) == (0.4, 0.4)
+
+
+class TestResolveColorXy:
+    @pytest.mark.parametrize("gamut_type", [*GamutType, None])
+    def test_matches_on_demand_conversion_for_every_named_color(
+        self, gamut_type: GamutType | None
+    ) -> None:
+        for color in Color:
+            assert resolve_color_xy(color, gamut_type) == rgb_to_xy(
+                *resolve_color(color), gamut_type
+            )
+
+    def test_defaults_to_unclamped_table(self) -> None:
+        assert resolve_color_xy(Color.RED) == rgb_to_xy(255, 0, 0)
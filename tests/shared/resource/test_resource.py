@@ -3,9 +3,11 @@ from uuid import UUID, uuid4
 
 import pytest
 
-from hueify.shared.resource import Resource
+from hueify.shared.resource import Color, Resource, WriteSuppression
 from hueify.shared.resource.views import (
     ColorTemperatureState,
+    ColorXY,
+    ColorXYState,
     DimmingState,
     LightOnState,
 )
@@ -231,3 +233,196 @@ class TestSetColorTemperature:
         await resource.set_color_temperature(100)
         state = client.put.call_args.kwargs["data"]
         assert state.color_temperature.mirek == 500
+
+
+class TestSetState:
+    @pytest.mark.asyncio
+    async def test_sends_all_fields_in_single_request(self) -> None:
+        resource, client = make_resource()
+        await resource.set_state(brightness=70, color=Color.RED, transition_ms=400)
+
+        client.put.assert_called_once()
+        state = client.put.call_args.kwargs["data"]
+        assert state.on.on is True
+        assert state.dimming.brightness == 70
+        assert state.color.xy is not None
+        assert state.dynamics.duration == 400
+
+    @pytest.mark.asyncio
+    async def test_accepts_rgb_triplet(self) -> None:
+        resource, client = make_resource()
+        await resource.set_state(color=(255, 255, 255))
+        state = client.put.call_args.kwargs["data"]
+        assert (state.color.xy.x, state.color.xy.y) == (0.3227, 0.329)
+
+    @pytest.mark.asyncio
+    async def test_reports_every_clamped_field(self) -> None:
+        resource, _ = make_resource()
+        result = await resource.set_state(brightness=150, mirek=90)
+
+        assert result.clamped is True
+        assert result.clamped_fields == ["brightness", "mirek"]
+        assert result.final_value["brightness"] == 100
+        assert result.final_value["mirek"] == 153
+
+    @pytest.mark.asyncio
+    async def test_keeps_explicit_off(self) -> None:
+        resource, client = make_resource()
+        result = await resource.set_state(on=False)
+        state = client.put.call_args.kwargs["data"]
+        assert state.on.on is False
+        assert state.dimming is None
+        assert result.clamped is False
+
+    @pytest.mark.asyncio
+    async def test_rejects_color_together_with_mirek(self) -> None:
+        resource, client = make_resource()
+        with pytest.raises(ValueError, match="cannot be set at the same time"):
+            await resource.set_state(color=Color.RED, mirek=300)
+        client.put.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejects_empty_update(self) -> None:
+        resource, _ = make_resource()
+        with pytest.raises(ValueError, match="at least one"):
+            await resource.set_state()
+
+
+class TestTransitions:
+    @pytest.mark.asyncio
+    async def test_omits_dynamics_by_default(self) -> None:
+        resource, client = make_resource()
+        await resource.set_brightness(40)
+        state = client.put.call_args.kwargs["data"]
+        assert state.dynamics is None
+
+    @pytest.mark.asyncio
+    async def test_forwards_transition_to_bridge(self) -> None:
+        resource, client = make_resource()
+        await resource.set_brightness(40, transition_ms=2000)
+        state = client.put.call_args.kwargs["data"]
+        assert state.dynamics.duration == 2000
+
+    @pytest.mark.asyncio
+    async def test_forwards_transition_when_turning_off(self) -> None:
+        resource, client = make_resource(on=True)
+        await resource.turn_off(transition_ms=1500)
+        state = client.put.call_args.kwargs["data"]
+        assert state.dynamics.duration == 1500
+
+    @pytest.mark.asyncio
+    async def test_forwards_transition_for_named_color(self) -> None:
+        resource, client = make_resource()
+        await resource.set_named_color(Color.OCEAN, transition_ms=300)
+        state = client.put.call_args.kwargs["data"]
+        assert state.dynamics.duration == 300
+
+
+def make_suppressing_resource(
+    on: bool = True,
+    brightness: float = 50.0,
+    mirek: int | None = 300,
+    xy: tuple[float, float] | None = None,
+    suppression: WriteSuppression | None = None,
+) -> tuple[ConcreteResource, AsyncMock]:
+    cached = make_light_info(on=on, brightness=brightness, mirek=mirek)
+    cached.color = ColorXYState(xy=ColorXY(x=xy[0], y=xy[1])) if xy else None
+    cache = MagicMock()
+    cache.get_by_id.return_value = cached
+    client = AsyncMock()
+    resource = ConcreteResource(
+        light_info=cached,
+        client=client,
+        cache=cache,
+        write_suppression=suppression or WriteSuppression(),
+    )
+    return resource, client
+
+
+class TestWriteSuppression:
+    @pytest.mark.asyncio
+    async def test_skips_brightness_within_tolerance(self) -> None:
+        resource, client = make_suppressing_resource(brightness=49.8)
+
+        result = await resource.set_brightness(50)
+
+        client.put.assert_not_called()
+        assert result.unchanged is True
+        assert result.final_value == 50
+
+    @pytest.mark.asyncio
+    async def test_sends_only_changed_fields(self) -> None:
+        resource, client = make_suppressing_resource(on=True, brightness=50.0)
+
+        result = await resource.set_brightness(70, transition_ms=400)
+
+        state = client.put.call_args.kwargs["data"]
+        assert state.on is None
+        assert state.dimming.brightness == 70
+        assert state.dynamics.duration == 400
+        assert result.unchanged is False
+
+    @pytest.mark.asyncio
+    async def test_turns_light_on_without_resending_brightness(self) -> None:
+        resource, client = make_suppressing_resource(on=False, brightness=50.0)
+
+        await resource.set_brightness(50)
+
+        state = client.put.call_args.kwargs["data"]
+        assert state.on.on is True
+        assert state.dimming is None
+
+    @pytest.mark.asyncio
+    async def test_skips_color_temperature_within_tolerance(self) -> None:
+        resource, client = make_suppressing_resource(mirek=327)
+
+        result = await resource.set_color_temperature(50)
+
+        client.put.assert_not_called()
+        assert result.unchanged is True
+
+    @pytest.mark.asyncio
+    async def test_skips_color_within_tolerance(self) -> None:
+        resource, client = make_suppressing_resource(xy=(0.7006, 0.2993))
+
+        result = await resource.set_color(255, 0, 0)
+
+        client.put.assert_not_called()
+        assert result.unchanged is True
+
+    @pytest.mark.asyncio
+    async def test_sends_color_outside_tolerance(self) -> None:
+        resource, client = make_suppressing_resource(xy=(0.3, 0.3))
+
+        await resource.set_named_color(Color.RED)
+
+        client.put.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_set_state_reports_unchanged(self) -> None:
+        resource, client = make_suppressing_resource(brightness=80.0, mirek=250)
+
+        result = await resource.set_state(brightness=80, mirek=250)
+
+        client.put.assert_not_called()
+        assert result.unchanged is True
+        assert result.message.startswith("State unchanged")
+
+    @pytest.mark.asyncio
+    async def test_disabled_suppression_always_sends(self) -> None:
+        resource, client = make_suppressing_resource(
+            brightness=50.0, suppression=WriteSuppression.disabled()
+        )
+
+        await resource.set_brightness(50)
+
+        client.put.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_sends_everything_without_cached_state(self) -> None:
+        resource, client = make_suppressing_resource(brightness=50.0)
+        resource._cache.get_by_id.return_value = None
+
+        await resource.set_brightness(50)
+
+        client.put.assert_called_once()
@@ -140,3 +140,19 @@ class TestCredentialsConfig:
 
         assert hue._credentials.hue_bridge_ip == CONFIG_IP
         assert hue._credentials.hue_app_key == VALID_APP_KEY
+
+    def test_save_credentials_config_pins_bridge_id(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HUEIFY_CONFIG_FILE", str(tmp_path / "config.toml"))
+        monkeypatch.delenv("HUE_BRIDGE_ID", raising=False)
+
+        save_credentials_config(CONFIG_IP, CONFIG_APP_KEY, "001788FFFE000001")
+        credentials = HueBridgeCredentials(_env_file=None)
+
+        assert credentials.hue_bridge_id == "001788fffe000001"
+
+    def test_bridge_id_is_optional(self):
+        credentials = HueBridgeCredentials(
+            HUE_BRIDGE_IP=VALID_IP, HUE_APP_KEY=VALID_APP_KEY, _env_file=None
+        )
+
+        assert credentials.hue_bridge_id is None
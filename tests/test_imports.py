@@ -0,0 +1,94 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+import hueify
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|(\s*)\S+")
+
+# Cumulative `python -X importtime` budget for `import hueify`. The package
+# itself only sets up lazy attributes; importing the client eagerly used to
+# take about 400 ms.
+IMPORT_BUDGET_SECONDS = 0.1
+
+HEAVY_MODULES = {"httpx", "httpx_sse", "pydantic", "pydantic_settings", "typer", "rich"}
+
+
+def import_seconds(statement: str) -> float:
+    """Cumulative ``-X importtime`` seconds of the top-level imports."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    seconds = 0.0
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match and len(match.group(2)) == 1:
+            seconds += int(match.group(1)) / 1e6
+    return seconds
+
+
+def loaded_modules(statement: str) -> set[str]:
+    """Every module in ``sys.modules`` after running ``statement`` afresh."""
+    completed = subprocess.run(
+        [sys.executable, "-c", f"{statement}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(completed.stdout.split())
+
+
+class TestImportCost:
+    def test_import_hueify_stays_within_budget(self) -> None:
+        seconds = min(import_seconds("import hueify") for _ in range(3))
+
+        assert seconds < IMPORT_BUDGET_SECONDS
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import hueify",
+            "import hueify.cli.client",
+            "from hueify.http import RetryPolicy, RateLimiter",
+            "from hueify.profiling import active_profiler",
+        ],
+    )
+    def test_does_not_load_heavy_dependencies(self, statement: str) -> None:
+        modules = loaded_modules(statement)
+
+        assert not modules & HEAVY_MODULES
+
+    def test_client_defers_optional_features(self) -> None:
+        modules = loaded_modules("from hueify import Hueify")
+
+        assert "hueify.hueify" in modules
+        assert not modules & {
+            "pydantic_settings",
+            "hueify.animation",
+            "hueify.entertainment",
+            "hueify.onboarding.discovery",
+            "hueify.profiling.views",
+        }
+
+    def test_cli_help_does_not_load_the_client(self) -> None:
+        modules = loaded_modules("import hueify.cli.server")
+
+        assert "typer" in modules
+        assert not modules & {"httpx", "hueify.hueify", "hueify.sse.views"}
+
+
+class TestLazyExports:
+    def test_resolves_to_the_defining_module(self) -> None:
+        from hueify.hueify import Hueify
+
+        assert hueify.Hueify is Hueify
+        assert set(hueify.__all__) <= set(dir(hueify))
+
+    def test_raises_attribute_error_for_unknown_names(self) -> None:
+        with pytest.raises(AttributeError, match="Nope"):
+            hueify.Nope  # noqa: B018
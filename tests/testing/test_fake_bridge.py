@@ -0,0 +1,132 @@
+import asyncio
+
+import httpx
+import pytest
+
+from hueify import Hueify
+from hueify.sse.views import LightEvent
+from hueify.testing import FakeHueBridge, generate_home
+
+
+def resource_url(bridge: FakeHueBridge, path: str) -> str:
+    return f"{bridge.url}/clip/v2/resource/{path}"
+
+
+class TestGenerateHome:
+    def test_generates_requested_resource_counts(self) -> None:
+        resources = generate_home(lights=7, rooms=3, scenes_per_room=2)
+
+        counts = {}
+        for resource in resources:
+            counts[resource["type"]] = counts.get(resource["type"], 0) + 1
+        assert counts == {
+            "device": 7,
+            "light": 7,
+            "room": 3,
+            "grouped_light": 3,
+            "scene": 6,
+        }
+
+    def test_is_deterministic_per_seed(self) -> None:
+        assert generate_home(seed=1) == generate_home(seed=1)
+        assert generate_home(seed=1) != generate_home(seed=2)
+
+    def test_rejects_more_rooms_than_lights(self) -> None:
+        with pytest.raises(ValueError):
+            generate_home(lights=1, rooms=2)
+
+
+class TestFakeHueBridge:
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_application_key(self, bridge: FakeHueBridge) -> None:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                resource_url(bridge, "light"), headers={"hue-application-key": "x"}
+            )
+
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_returns_404_for_unknown_resource(
+        self, bridge: FakeHueBridge
+    ) -> None:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                resource_url(bridge, "light/does-not-exist"),
+                headers={"hue-application-key": bridge.app_key},
+            )
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_throttles_light_writes_with_429(self) -> None:
+        async with FakeHueBridge.with_synthetic_home(
+            light_commands_per_second=2
+        ) as bridge:
+            light = bridge.resources("light")[0]
+            async with httpx.AsyncClient() as client:
+                statuses = [
+                    (
+                        await client.put(
+                            resource_url(bridge, f"light/{light['id']}"),
+                            headers={"hue-application-key": bridge.app_key},
+                            json={"on": {"on": True}},
+                        )
+                    ).status_code
+                    for _ in range(3)
+                ]
+
+        assert statuses == [200, 200, 429]
+        assert bridge.throttled_count == 1
+
+
+class TestHueifyAgainstFakeBridge:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "home_size",
+        [{"lights": 2, "rooms": 1}, {"lights": 40, "rooms": 8}],
+        indirect=True,
+    )
+    async def test_populates_caches_from_bridge(
+        self, hue: Hueify, home_size: dict[str, int]
+    ) -> None:
+        assert len(hue.lights.names) == home_size["lights"]
+        assert len(hue.rooms.names) == home_size["rooms"]
+
+    @pytest.mark.asyncio
+    async def test_put_mutates_state_and_emits_event(
+        self, bridge: FakeHueBridge, hue: Hueify
+    ) -> None:
+        received = asyncio.Event()
+
+        @hue.on(LightEvent)
+        async def on_light(event: LightEvent) -> None:
+            received.set()
+
+        await hue.lights.set_brightness("Light 1", 42)
+        await asyncio.wait_for(received.wait(), timeout=2)
+
+        assert bridge.find("light", "Light 1")["dimming"]["brightness"] == 42
+        assert hue.lights.get_brightness("Light 1") == 42
+
+    @pytest.mark.asyncio
+    async def test_scene_recall_applies_actions_to_lights(
+        self, bridge: FakeHueBridge, hue: Hueify
+    ) -> None:
+        room_name = hue.rooms.names[0]
+        scene = bridge.find("scene", hue.rooms.scene_names(room_name)[0])
+
+        await hue.rooms.activate_scene(room_name, scene["metadata"]["name"])
+
+        assert scene["status"]["active"] == "static"
+        for action in scene["actions"]:
+            assert bridge.get(action["target"]["rid"])["on"]["on"] is True
+
+    @pytest.mark.asyncio
+    async def test_event_stream_can_be_dropped(
+        self, bridge: FakeHueBridge, hue: Hueify
+    ) -> None:
+        bridge.drop_event_streams()
+        await asyncio.sleep(0.05)
+
+        assert bridge.event_stream_count == 0